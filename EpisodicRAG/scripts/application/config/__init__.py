@@ -27,10 +27,7 @@ from application.config.source_path_resolver import SourcePathResolver
 from application.config.threshold_provider import ThresholdProvider
 from domain.exceptions import ConfigError
 from domain.types import ConfigData
-from infrastructure.config import (
-    ConfigLoader,
-    PathResolver,
-)
+from infrastructure.config.config_snapshot import load_resolved_config
 from infrastructure.config.error_messages import initialization_failed_message
 from infrastructure.config.persistent_path import get_config_path
 
@@ -71,6 +68,9 @@ class DigestConfig:
         """
         初期化
 
+        config.json 横の解決済みスナップショットが有効であれば、
+        設定の読み込みとbase_dir/trusted_external_pathsの検証をスキップする。
+
         Raises:
             ConfigError: 設定の読み込みまたは初期化に失敗した場合
         """
@@ -78,12 +78,12 @@ class DigestConfig:
             # 永続化ディレクトリからconfig.jsonを読み込み
             self.config_file = get_config_path()
 
-            # ConfigLoader を使用して設定を読み込み
-            self._config_loader = ConfigLoader(self.config_file)
+            # ConfigLoader/PathResolver をスナップショット経由で取得
+            # （config.json が変更されていれば通常読み込み＋スナップショット更新）
+            self._config_loader, self._path_resolver = load_resolved_config(self.config_file)
             self.config = self._config_loader.load()
 
             # 各コンポーネントを即時初期化（軽量オブジェクトのため遅延不要）
-            self._path_resolver = PathResolver(self.config)
             self._threshold_provider = ThresholdProvider(self.config)
             self._level_path_service = LevelPathService(self._path_resolver.digests_path)
             self._source_path_resolver = SourcePathResolver(
@@ -133,6 +133,10 @@ class DigestConfig:
         """相対パスを絶対パスに解決（base_dir基準）"""
         return self._path_resolver.resolve_path(key)
 
+    def is_trusted_path(self, path: Path) -> bool:
+        """base_dir または trusted_external_paths 配下のパスか"""
+        return self._path_resolver.is_trusted(path)
+
     @property
     def loops_path(self) -> Path:
         """Loopファイル配置先"""
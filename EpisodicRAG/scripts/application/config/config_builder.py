@@ -44,6 +44,7 @@ from infrastructure.config import (
     ConfigLoader,
     PathResolver,
 )
+from infrastructure.config.config_snapshot import load_resolved_config
 from infrastructure.config.error_messages import initialization_failed_message
 from infrastructure.config.persistent_path import get_config_path
 
@@ -151,13 +152,16 @@ class DigestConfigBuilder:
 
             # ConfigLoader（カスタムまたはデフォルト）
             config_loader = self._config_loader
+            path_resolver = self._path_resolver
+            if config_loader is None and path_resolver is None:
+                # 注入なし: 解決済みスナップショットを使用（DigestConfig() と同じ）
+                config_loader, path_resolver = load_resolved_config(config_file)
             if config_loader is None:
                 config_loader = ConfigLoader(config_file)
 
             config = config_loader.load()
 
             # PathResolver（カスタムまたはデフォルト）
-            path_resolver = self._path_resolver
             if path_resolver is None:
                 path_resolver = PathResolver(config)
 
@@ -47,6 +47,7 @@ class ConfigValidator:
         "base_dir": str,
         "identity_file": str,
         "trusted_external_paths": list,
+        "federation": dict,
     }
 
     def __init__(
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Federation Package - Cross-store queries
+========================================
+
+複数のEpisodicRAGストアへの並列クエリ
+
+Components:
+    - StoreSpec: 検索対象ストアの設定
+    - FederatedQuery: 検索・タイムラインクエリのファンアウトと結果の統合
+    - load_store_specs: config.json の federation セクションからストア一覧を作成
+"""
+
+from .federated_query import FederatedQuery, FederatedResult, StoreSpec, load_store_specs
+
+__all__ = ["FederatedQuery", "FederatedResult", "StoreSpec", "load_store_specs"]
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Federated Query
+===============
+
+自分のストア（local）と config.json の federation.stores に設定した別ストアへ、
+検索・タイムラインクエリを並列に投げて結果をまとめるモジュール。
+
+各ストアは制限時間（timeout_seconds）内に応答しなければ "timeout" として除外され、
+遅いマウント先が1つあってもクエリ全体は制限時間で返る。
+別ストアのパスは base_dir または trusted_external_paths の配下でなければならない。
+
+config.json:
+    "federation": {
+      "timeout_seconds": 5,
+      "stores": [
+        {"name": "projA", "digests_dir": "/mnt/projA/data/Digests",
+         "index_dir": "/mnt/projA/.episodicrag", "timeout_seconds": 10}
+      ]
+    }
+
+Usage:
+    from application.federation import FederatedQuery, load_store_specs
+
+    query = FederatedQuery(load_store_specs(DigestConfig()))
+    query.search("MCPの設計", k=10).results
+    # [{'store': 'local', 'id': 'W0042', 'score': 1.0, 'raw_score': 0.41}, ...]
+"""
+
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from application.config import DigestConfig
+from application.finalize import DigestVectorRecorder
+from application.tracking import DigestTimesTracker, TimelineRecorder
+from domain.exceptions import ConfigError
+from domain.federation import merge_ranked, merge_term_stats
+from domain.types import as_dict
+from infrastructure import get_structured_logger
+from infrastructure.concurrency import run_with_timeouts
+from infrastructure.config.error_messages import config_invalid_value_message
+
+_logger = get_structured_logger(__name__)
+
+# 自分のストアの名前
+LOCAL_STORE_NAME = "local"
+
+# ストアごとの既定の制限時間（秒）
+DEFAULT_STORE_TIMEOUT = 5.0
+
+# ストアの応答状態（成功時）
+STORE_OK = "ok"
+
+
+@dataclass(frozen=True)
+class StoreSpec:
+    """
+    検索対象ストア
+
+    Attributes:
+        name: ストア名（結果の "store"）
+        digests_path: Digestsディレクトリ（digest_vectors を含む）
+        index_dir: timeline_index.json のあるディレクトリ（なければタイムライン対象外）
+        timeout: 制限時間（秒）
+    """
+
+    name: str
+    digests_path: Path
+    index_dir: Optional[Path]
+    timeout: float = DEFAULT_STORE_TIMEOUT
+
+
+@dataclass
+class FederatedResult:
+    """
+    フェデレーションクエリの結果
+
+    Attributes:
+        results: 統合した結果（search はランキング、timeline はストア名 → レベル別ID）
+        stores: ストア名 → "ok" / "timeout" / エラーメッセージ
+        elapsed: 経過時間（秒）
+    """
+
+    results: Any
+    stores: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+def _positive_timeout(value: Any, key: str, default: float) -> float:
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ConfigError(config_invalid_value_message(key, "positive number", value))
+    return float(value)
+
+
+def _trusted_dir(config: DigestConfig, value: Any, key: str) -> Path:
+    if not isinstance(value, str) or not Path(value).expanduser().is_absolute():
+        raise ConfigError(config_invalid_value_message(key, "absolute path", value))
+    path = Path(value).expanduser().resolve()
+    if not config.is_trusted_path(path):
+        raise ConfigError(
+            config_invalid_value_message(
+                key, "path within base_dir or trusted_external_paths", value
+            )
+        )
+    return path
+
+
+def load_store_specs(config: DigestConfig) -> List[StoreSpec]:
+    """
+    自分のストアと federation.stores の設定からストア一覧を作成
+
+    Raises:
+        ConfigError: 設定が不正な場合（相対パス、信頼されていないパス、名前の重複など）
+
+    Example:
+        >>> [spec.name for spec in load_store_specs(DigestConfig())]
+        ['local', 'projA']
+    """
+    federation = as_dict(config.config.get("federation") or {})
+    timeout = _positive_timeout(
+        federation.get("timeout_seconds"), "federation.timeout_seconds", DEFAULT_STORE_TIMEOUT
+    )
+    index_dir = DigestTimesTracker(config).last_digest_file.parent
+    specs = [StoreSpec(LOCAL_STORE_NAME, config.digests_path, index_dir, timeout)]
+
+    stores = federation.get("stores") or []
+    if not isinstance(stores, list):
+        raise ConfigError(config_invalid_value_message("federation.stores", "list", stores))
+    for i, entry in enumerate(stores):
+        key = f"federation.stores[{i}]"
+        if not isinstance(entry, dict):
+            raise ConfigError(config_invalid_value_message(key, "object", entry))
+        name = entry.get("name")
+        if not isinstance(name, str) or not name or name in {s.name for s in specs}:
+            raise ConfigError(config_invalid_value_message(f"{key}.name", "unique name", name))
+        store_index = entry.get("index_dir")
+        specs.append(
+            StoreSpec(
+                name=name,
+                digests_path=_trusted_dir(config, entry.get("digests_dir"), f"{key}.digests_dir"),
+                index_dir=(
+                    _trusted_dir(config, store_index, f"{key}.index_dir")
+                    if store_index is not None
+                    else None
+                ),
+                timeout=_positive_timeout(
+                    entry.get("timeout_seconds"), f"{key}.timeout_seconds", timeout
+                ),
+            )
+        )
+    return specs
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    """関数を実行し、(戻り値, 処理にかかった秒数) を返す"""
+    started = time.monotonic()
+    return fn(), time.monotonic() - started
+
+
+def _timeline_of(index_dir: Path, range_start: str, range_end: str) -> Dict[str, List[str]]:
+    return TimelineRecorder(index_dir).load().query(range_start, range_end)
+
+
+class FederatedQuery:
+    """
+    複数ストアへの並列クエリ
+
+    Example:
+        >>> query = FederatedQuery(load_store_specs(config))
+        >>> result = query.search("MCP", k=3)
+        >>> result.stores
+        {'local': 'ok', 'projA': 'timeout'}
+    """
+
+    def __init__(self, stores: Sequence[StoreSpec], max_workers: Optional[int] = None):
+        """
+        Args:
+            stores: 検索対象ストア
+            max_workers: 並列数（省略時はストア数、上限 MAX_POOL_WORKERS）
+        """
+        self.stores = list(stores)
+        self.max_workers = max_workers
+
+    def _run(
+        self,
+        tasks: Mapping[str, Callable[[], Any]],
+        timeouts: Mapping[str, float],
+        statuses: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """タスクを並列実行し、失敗・打ち切りを statuses に記録して成功分を返す"""
+        results, errors = run_with_timeouts(
+            {name: (fn, timeouts[name]) for name, fn in tasks.items()}, self.max_workers
+        )
+        statuses.update(errors)
+        for name in results:
+            statuses.setdefault(name, STORE_OK)
+        return results
+
+    def search(self, text: str, k: int = 10) -> FederatedResult:
+        """
+        全ストアを自由文で検索し、大域正規化したランキングを返す
+
+        1段目で各ストアの文書頻度を集めて合算し、2段目で合算したIDFのクエリで検索する。
+        制限時間はストアごとの処理時間（2段の合計）に適用する。
+        2段目の持ち時間はそのストア自身の1段目の処理時間だけを差し引くため、
+        他のストアが1段目で止まっても応答したストアは打ち切られない。
+
+        Args:
+            text: 検索文
+            k: 件数
+
+        Returns:
+            results が merge_ranked() のリストの FederatedResult
+        """
+        started = time.monotonic()
+        statuses: Dict[str, str] = {}
+        recorders = {spec.name: DigestVectorRecorder(spec.digests_path) for spec in self.stores}
+        timeouts = {spec.name: spec.timeout for spec in self.stores}
+
+        timed_stats: Dict[str, Tuple[Tuple[List[int], int], float]] = self._run(
+            {name: partial(_timed, recorder.term_stats) for name, recorder in recorders.items()},
+            timeouts,
+            statuses,
+        )
+        stats = {name: value for name, (value, _) in timed_stats.items()}
+        merged_stats = merge_term_stats(stats[name] for name in sorted(stats))
+
+        remaining = {
+            name: max(timeouts[name] - duration, 0.0) for name, (_, duration) in timed_stats.items()
+        }
+        ranked = self._run(
+            {name: partial(recorders[name].search, text, k, merged_stats) for name in stats},
+            remaining,
+            statuses,
+        )
+        result = FederatedResult(
+            merge_ranked(ranked, k), self._ordered(statuses), time.monotonic() - started
+        )
+        _logger.state("federated_search", stores=result.stores, hits=len(result.results))
+        return result
+
+    def timeline(self, range_start: str, range_end: str) -> FederatedResult:
+        """
+        全ストアのタイムラインを期間で検索
+
+        index_dir のないストアは "no index_dir" として除外する。
+
+        Returns:
+            results がストア名 → レベル別IDの FederatedResult
+        """
+        started = time.monotonic()
+        statuses: Dict[str, str] = {}
+        tasks: Dict[str, Callable[[], Any]] = {}
+        for spec in self.stores:
+            if spec.index_dir is None:
+                statuses[spec.name] = "no index_dir"
+                continue
+            tasks[spec.name] = partial(_timeline_of, spec.index_dir, range_start, range_end)
+        matches = self._run(tasks, {spec.name: spec.timeout for spec in self.stores}, statuses)
+        results = {spec.name: matches[spec.name] for spec in self.stores if spec.name in matches}
+        return FederatedResult(results, self._ordered(statuses), time.monotonic() - started)
+
+    def _ordered(self, statuses: Mapping[str, str]) -> Dict[str, str]:
+        """ストアの設定順に並べた状態"""
+        return {spec.name: statuses[spec.name] for spec in self.stores if spec.name in statuses}
+
+
+__all__ = [
+    "DEFAULT_STORE_TIMEOUT",
+    "LOCAL_STORE_NAME",
+    "FederatedQuery",
+    "FederatedResult",
+    "StoreSpec",
+    "load_store_specs",
+]
@@ -9,16 +9,28 @@ Components:
     - ProvisionalLoader: Provisional読み込みまたは自動生成
     - RegularDigestBuilder: RegularDigest構造の構築
     - DigestPersistence: 保存・更新・クリーンアップ処理
+    - HierarchyRecorder: ダイジェスト親子隣接インデックスの管理
+    - KeywordRollupRecorder: キーワード集計の管理
+    - DigestVectorRecorder: TF-IDFベクトルストアの管理
+    - SentenceIndexRecorder: 文境界オフセットの管理とスニペット抽出
 """
 
 from .digest_builder import RegularDigestBuilder
+from .hierarchy_recorder import HierarchyRecorder
+from .keyword_rollup_recorder import KeywordRollupRecorder
 from .persistence import DigestPersistence
 from .provisional_loader import ProvisionalLoader
+from .sentence_recorder import SentenceIndexRecorder
 from .shadow_validator import ShadowValidator
+from .vector_recorder import DigestVectorRecorder
 
 __all__ = [
     "ShadowValidator",
     "ProvisionalLoader",
     "RegularDigestBuilder",
     "DigestPersistence",
+    "HierarchyRecorder",
+    "KeywordRollupRecorder",
+    "DigestVectorRecorder",
+    "SentenceIndexRecorder",
 ]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Digest Corpus
+=============
+
+Digests配下の全レベルのRegularDigestを列挙するモジュール。
+
+派生インデックス（hierarchy / keyword_rollup / digest_vectors / .sentences）の
+rebuild() が共通で使う。読めないファイルはスキップする。
+
+Usage:
+    from application.finalize.digest_corpus import iter_digest_files, iter_digest_records
+
+    for level, digest_file in iter_digest_files(config.digests_path):
+        ...
+    for record in iter_digest_records(config.digests_path):
+        record.digest_id, record.source_ids()
+"""
+
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+from domain.constants import DIGEST_FILE_EXTENSION, DIGEST_LEVEL_NAMES, LEVEL_CONFIG
+from domain.digest_records import DigestRecord
+from infrastructure import try_load_json
+
+
+def iter_digest_files(digests_path: Path) -> Iterator[Tuple[str, Path]]:
+    """
+    全レベルのRegularDigestファイルを (level, パス) として列挙（レベル順・ファイル名順）
+
+    Example:
+        >>> next(iter_digest_files(config.digests_path))
+        ('weekly', PosixPath('Digests/1_Weekly/W0001_第1週.txt'))
+    """
+    for level in DIGEST_LEVEL_NAMES:
+        level_dir = digests_path / str(LEVEL_CONFIG[level]["dir"])
+        if not level_dir.is_dir():
+            continue
+        for digest_file in sorted(level_dir.glob(f"*{DIGEST_FILE_EXTENSION}")):
+            yield level, digest_file
+
+
+def _load_digest(digest_file: Path) -> Dict[str, Any]:
+    """DigestRecordの本文読み直し用loader（読めない場合は空）"""
+    return try_load_json(digest_file, default={}, log_on_error=False) or {}
+
+
+def iter_regular_digests(digests_path: Path) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    全レベルのRegularDigestを (level, ファイル名, データ) として列挙
+
+    コーパス全体を保持する処理には iter_digest_records() を使う。
+
+    Example:
+        >>> next(iter_regular_digests(config.digests_path))
+        ('weekly', 'W0001_第1週.txt', {...})
+    """
+    for level, digest_file in iter_digest_files(digests_path):
+        data = try_load_json(digest_file, log_on_error=False)
+        if data is not None:
+            yield level, digest_file.name, data
+
+
+def iter_digest_records(digests_path: Path, keep_text: bool = False) -> Iterator[DigestRecord]:
+    """
+    全レベルのRegularDigestを DigestRecord として列挙
+
+    レコードは abstract / impression を保持せず、参照したときにファイルから読み直す。
+    本文をすぐに全件使う場合は keep_text=True で読み込んだ本文を保持させ、
+    同じファイルを二度読まないようにする。
+
+    Example:
+        >>> record = next(iter_digest_records(config.digests_path))
+        >>> record.level, record.digest_id, record.overall.keywords
+        ('weekly', 'W0001', ('MCP', 'API'))
+    """
+    for level, digest_file in iter_digest_files(digests_path):
+        data = try_load_json(digest_file, log_on_error=False)
+        if data is None:
+            continue
+        if keep_text:
+            yield DigestRecord.from_dict(level, digest_file.name, data)
+        else:
+            yield DigestRecord.from_dict(
+                level, digest_file.name, data, loader=partial(_load_digest, digest_file)
+            )
+
+
+__all__ = ["iter_digest_files", "iter_digest_records", "iter_regular_digests"]
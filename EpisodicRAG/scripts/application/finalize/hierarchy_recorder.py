@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Hierarchy Recorder
+==================
+
+hierarchy_index.json（ダイジェストID ⇔ ソースID の隣接インデックス）の
+更新と走査を担当するモジュール。
+
+DigestPersistence.save_regular_digest（ダイジェスト確定時）から更新される。
+既存コーパスには rebuild() で一括構築できる。
+
+Usage:
+    from application.finalize import HierarchyRecorder
+
+    recorder = HierarchyRecorder(config.digests_path)
+    list(recorder.load().iter_ancestors("L01234"))  # ['W0042', 'M011', ...]
+"""
+
+from pathlib import Path
+from typing import Any, List, Mapping
+
+from application.finalize.digest_corpus import iter_digest_records
+from domain.file_constants import HIERARCHY_INDEX_FILENAME
+from domain.hierarchy_index import HierarchyIndex
+from domain.indexed_provisional import extract_source_base_key
+from domain.types import RegularDigestData
+from infrastructure import (
+    get_structured_logger,
+    save_json_if_changed,
+    try_load_json,
+    update_json_index,
+)
+
+_logger = get_structured_logger(__name__)
+
+
+def _source_ids(regular_digest: Mapping[str, Any]) -> List[str]:
+    """RegularDigestのsource_filesをベースキーのリストに変換"""
+    overall = regular_digest.get("overall_digest") or {}
+    return [extract_source_base_key(str(f)) for f in overall.get("source_files", [])]
+
+
+class HierarchyRecorder:
+    """hierarchy_index.json 管理クラス"""
+
+    def __init__(self, digests_path: Path):
+        """
+        Args:
+            digests_path: Digestsディレクトリ（インデックスは直下に配置）
+        """
+        self.digests_path = digests_path
+        self.index_file = digests_path / HIERARCHY_INDEX_FILENAME
+
+    def load(self) -> HierarchyIndex:
+        """
+        インデックスを読み込む（存在しない・壊れている場合は空）
+
+        Example:
+            >>> recorder.load().parents_of("W0042")
+            ['M011']
+        """
+        data = try_load_json(self.index_file, default={}) or {}
+        return HierarchyIndex.from_dict(data)
+
+    def record_digest(self, digest_name: str, regular_digest: RegularDigestData) -> None:
+        """
+        確定したダイジェストとそのソースのリンクを記録
+
+        Args:
+            digest_name: ダイジェスト名（例: "W0042_2025年11月第4週"）
+            regular_digest: 確定したRegularDigest
+
+        Example:
+            >>> recorder.record_digest("W0042_第4週", regular_digest)
+        """
+        digest_id = extract_source_base_key(digest_name)
+        source_ids = _source_ids(regular_digest)
+        index = update_json_index(
+            self.index_file, HierarchyIndex.from_dict, lambda i: i.link(digest_id, source_ids)
+        )
+        if index is None:
+            return
+        _logger.info(f"hierarchy_index.json更新: {digest_name}")
+
+    def rebuild(self) -> HierarchyIndex:
+        """
+        全レベルのRegularDigestを走査してインデックスを再構築
+
+        インデックス導入前に確定した既存ダイジェストの取り込みに使用する。
+        読めないファイルはスキップする。
+
+        Returns:
+            再構築したHierarchyIndex
+
+        Example:
+            >>> index = recorder.rebuild()
+            >>> list(index.iter_descendants("M011"))[:2]
+            ['W0042', 'W0043']
+        """
+        index = HierarchyIndex()
+        for record in iter_digest_records(self.digests_path):
+            index.link(record.digest_id, record.source_ids())
+        save_json_if_changed(self.index_file, index.to_dict())
+        return index
+
+
+__all__ = ["HierarchyRecorder"]
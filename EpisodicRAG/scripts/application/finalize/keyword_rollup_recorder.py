@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Keyword Rollup Recorder
+=======================
+
+keyword_rollup.json（レベル別・期間別のキーワード集計）の更新と読み込みを担当するモジュール。
+再確定時の差し引きに使うダイジェストごとの寄与は keyword_rollup_digests.json に分けて保存し、
+参照時（load()）には読まない。
+
+DigestPersistence.save_regular_digest（RegularDigestBuilderの出力を保存した直後）から
+増分更新される。
+既存コーパスには rebuild() で一括構築できる。
+
+Usage:
+    from application.finalize import KeywordRollupRecorder
+
+    recorder = KeywordRollupRecorder(config.digests_path)
+    recorder.load().trend("MCP", granularity="quarter")
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Mapping
+
+from application.finalize.digest_corpus import iter_digest_records
+from domain.digest_records import DigestRecord
+from domain.file_constants import KEYWORD_ROLLUP_DIGESTS_FILENAME, KEYWORD_ROLLUP_FILENAME
+from domain.keyword_rollup import KeywordRollup, period_of
+from infrastructure import (
+    DerivedUpdate,
+    get_structured_logger,
+    save_json_if_changed,
+    try_load_json,
+)
+
+_logger = get_structured_logger(__name__)
+
+
+def _record(rollup: KeywordRollup, record: DigestRecord) -> None:
+    """RegularDigestのoverall_digest.keywordsを集計に反映"""
+    timestamp = record.overall.timestamp or datetime.now().isoformat()
+    rollup.record(record.level, record.digest_id, period_of(timestamp), record.overall.keywords)
+
+
+class KeywordRollupRecorder:
+    """keyword_rollup.json 管理クラス"""
+
+    def __init__(self, digests_path: Path):
+        """
+        Args:
+            digests_path: Digestsディレクトリ（集計ファイルは直下に配置）
+        """
+        self.digests_path = digests_path
+        self.rollup_file = digests_path / KEYWORD_ROLLUP_FILENAME
+        self.digests_file = digests_path / KEYWORD_ROLLUP_DIGESTS_FILENAME
+
+    def load(self) -> KeywordRollup:
+        """
+        集計を読み込む（存在しない・壊れている場合は空）
+
+        Example:
+            >>> recorder.load().top_keywords(k=3)
+            [('MCP', 12), ('API', 9), ('設計', 7)]
+        """
+        data = try_load_json(self.rollup_file, default={}) or {}
+        return KeywordRollup.from_dict(data)
+
+    def _load_for_update(self) -> KeywordRollup:
+        """ダイジェストごとの寄与も含めて読み込む（更新用）"""
+        data = try_load_json(self.rollup_file, default={}) or {}
+        digests = try_load_json(self.digests_file, default={}) or {}
+        return KeywordRollup.from_dict(data, digests)
+
+    def _save(self, rollup: KeywordRollup) -> None:
+        save_json_if_changed(self.digests_file, rollup.digests_to_dict())
+        save_json_if_changed(self.rollup_file, rollup.to_dict())
+
+    def record_digest(
+        self, level: str, digest_name: str, regular_digest: Mapping[str, Any]
+    ) -> None:
+        """
+        確定したダイジェストのkeywordsを集計に反映
+
+        Args:
+            level: ダイジェストレベル
+            digest_name: ダイジェスト名（例: "W0042_2025年11月第4週"）
+            regular_digest: 確定したRegularDigest
+
+        Example:
+            >>> recorder.record_digest("weekly", "W0042_第4週", regular_digest)
+        """
+        with DerivedUpdate(KEYWORD_ROLLUP_FILENAME) as update:
+            rollup = self._load_for_update()
+            _record(rollup, DigestRecord.from_dict(level, digest_name, regular_digest))
+            self._save(rollup)
+        if update.failed:
+            return
+        _logger.info(f"keyword_rollup.json更新: {level} {digest_name}")
+
+    def rebuild(self) -> KeywordRollup:
+        """
+        全レベルのRegularDigestから集計を再構築
+
+        Example:
+            >>> recorder.rebuild().trend("MCP", level="weekly")
+            {'2025-02': 1, '2025-03': 3}
+        """
+        rollup = KeywordRollup()
+        for record in iter_digest_records(self.digests_path):
+            _record(rollup, record)
+        self._save(rollup)
+        return rollup
+
+
+__all__ = ["KeywordRollupRecorder"]
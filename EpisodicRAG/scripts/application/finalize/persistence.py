@@ -4,12 +4,21 @@ Digest Persistence
 ==================
 
 RegularDigestの保存、GrandDigest更新、カスケード処理を担当
+
+save_regular_digest は「ファイルの書き込み（write_regular_digest）」と
+「派生インデックスへの記録（record_indexes）」に分かれている。
+派生インデックスの記録は失敗しても警告のみのため、非同期の確定処理では
+GrandDigest更新以降の処理と並行して実行される。
 """
 
 from pathlib import Path
-from typing import Callable, Optional, cast
+from typing import Callable, List, Optional, cast
 
 from application.config import DigestConfig
+from application.finalize.hierarchy_recorder import HierarchyRecorder
+from application.finalize.keyword_rollup_recorder import KeywordRollupRecorder
+from application.finalize.sentence_recorder import SentenceIndexRecorder
+from application.finalize.vector_recorder import DigestVectorRecorder
 from application.grand import GrandDigestManager, ShadowGrandDigestManager
 from application.tracking import DigestTimesTracker
 from domain.constants import (
@@ -24,6 +33,7 @@ from domain.level_registry import get_level_registry
 from domain.types import OverallDigestData, RegularDigestData, as_dict
 from domain.validators import is_valid_dict
 from infrastructure import (
+    bump_corpus_generation,
     get_default_confirm_callback,
     get_structured_logger,
     log_debug,
@@ -59,13 +69,28 @@ class DigestPersistence:
         self.shadow_manager = shadow_manager
         self.times_tracker = times_tracker
         self.level_config = LEVEL_CONFIG
+        self.hierarchy = HierarchyRecorder(self.digests_path)
+        self.keyword_rollup = KeywordRollupRecorder(self.digests_path)
+        self.vectors = DigestVectorRecorder(self.digests_path)
+        self.sentences = SentenceIndexRecorder(self.digests_path, config.loops_path)
         self.confirm_callback = confirm_callback or get_default_confirm_callback()
 
-    def save_regular_digest(
+    def regular_digest_path(self, level: str, new_digest_name: str) -> Path:
+        """
+        RegularDigestの保存先パスを返す（ファイルは作成しない）
+
+        Example:
+            >>> persistence.regular_digest_path("weekly", "W0042_2025年11月第4週").name
+            'W0042_2025年11月第4週.txt'
+        """
+        config = self.level_config[level]
+        return self.digests_path / str(config["dir"]) / f"{new_digest_name}.txt"
+
+    def write_regular_digest(
         self, level: str, regular_digest: RegularDigestData, new_digest_name: str
     ) -> Path:
         """
-        RegularDigestをファイルに保存
+        RegularDigestをファイルに書き込む（派生インデックスには記録しない）
 
         Args:
             level: ダイジェストレベル
@@ -80,20 +105,16 @@ class DigestPersistence:
             ValidationError: ユーザーが上書きをキャンセルした場合
 
         Example:
-            >>> persistence = DigestPersistence(config, grand_manager, shadow_manager, tracker)
-            >>> path = persistence.save_regular_digest("weekly", regular_digest, "W0042_2025年11月第4週")
-            >>> path.name
-            'W0042_2025年11月第4週.txt'
+            >>> path = persistence.write_regular_digest("weekly", regular_digest, "W0042_第4週")
+            >>> persistence.record_indexes("weekly", "W0042_第4週", regular_digest)
         """
-        config = self.level_config[level]
-        target_dir = self.digests_path / str(config["dir"])
+        final_path = self.regular_digest_path(level, new_digest_name)
+        target_dir = final_path.parent
 
         log_debug(f"{LOG_PREFIX_FILE} save_regular_digest: target_dir={target_dir}")
         log_debug(f"{LOG_PREFIX_STATE} creating directory if needed")
 
         target_dir.mkdir(parents=True, exist_ok=True)
-        final_filename = f"{new_digest_name}.txt"
-        final_path = target_dir / final_filename
 
         log_debug(f"{LOG_PREFIX_FILE} final_path: {final_path}")
         log_debug(f"{LOG_PREFIX_FILE} file_exists: {final_path.exists()}")
@@ -116,6 +137,61 @@ class DigestPersistence:
         _logger.info(f"RegularDigest保存完了: {final_path}")
         return final_path
 
+    def record_indexes(
+        self, level: str, new_digest_name: str, regular_digest: RegularDigestData
+    ) -> None:
+        """
+        確定したダイジェストを派生インデックスに記録
+
+        timeline_index.json, hierarchy_index.json, keyword_rollup.json, digest_vectors,
+        .sentences/（書き込み済みのダイジェストファイルの文境界）。
+        各レコーダーは失敗しても警告を出すだけで例外を投げない。
+        記録の後にコーパスの世代を進め、キャッシュ済みのクエリ結果を無効にする。
+
+        Example:
+            >>> persistence.record_indexes("weekly", "W0042_第4週", regular_digest)
+        """
+        self.times_tracker.timeline.record_digest(level, new_digest_name, regular_digest)
+        self.hierarchy.record_digest(new_digest_name, regular_digest)
+        self.keyword_rollup.record_digest(level, new_digest_name, regular_digest)
+        self.vectors.record_digest(new_digest_name, regular_digest)
+        self.sentences.record_digest(
+            level, new_digest_name, regular_digest, self.regular_digest_path(level, new_digest_name)
+        )
+        bump_corpus_generation(self.config.essences_path)
+
+    def save_regular_digest(
+        self, level: str, regular_digest: RegularDigestData, new_digest_name: str
+    ) -> Path:
+        """
+        RegularDigestをファイルに保存
+
+        Args:
+            level: ダイジェストレベル
+            regular_digest: RegularDigest構造体
+            new_digest_name: 新しいダイジェスト名
+
+        Returns:
+            保存先のPath
+
+        Raises:
+            FileIOError: ファイルの保存に失敗した場合
+            ValidationError: ユーザーが上書きをキャンセルした場合
+
+        Note:
+            保存後、派生インデックス（timeline_index.json, hierarchy_index.json,
+            keyword_rollup.json, digest_vectors, .sentences/）にも記録する。
+
+        Example:
+            >>> persistence = DigestPersistence(config, grand_manager, shadow_manager, tracker)
+            >>> path = persistence.save_regular_digest("weekly", regular_digest, "W0042_2025年11月第4週")
+            >>> path.name
+            'W0042_2025年11月第4週.txt'
+        """
+        final_path = self.write_regular_digest(level, regular_digest, new_digest_name)
+        self.record_indexes(level, new_digest_name, regular_digest)
+        return final_path
+
     def update_grand_digest(
         self, level: str, regular_digest: RegularDigestData, new_digest_name: str
     ) -> None:
@@ -149,7 +225,10 @@ class DigestPersistence:
         )
 
     def _update_shadow_cascade(
-        self, level: str, finalized_digest: Optional[RegularDigestData] = None
+        self,
+        level: str,
+        finalized_digest: Optional[RegularDigestData] = None,
+        next_level_files: Optional[List[Path]] = None,
     ) -> None:
         """
         ShadowGrandDigestのカスケード更新を実行
@@ -159,6 +238,7 @@ class DigestPersistence:
         Args:
             level: ダイジェストレベル
             finalized_digest: 確定したRegularDigest（Provisional追加用）
+            next_level_files: 先読み済みの次レベルの新規ファイル（省略時はカスケード内で検出）
         """
         registry = get_level_registry()
         should_cascade = registry.should_cascade(level)
@@ -168,7 +248,12 @@ class DigestPersistence:
         if should_cascade:
             _logger.info("[Step 3] ShadowGrandDigestカスケード処理")
             log_debug(f"{LOG_PREFIX_STATE} starting cascade for level={level}")
-            self.shadow_manager.cascade_update_on_digest_finalize(level, finalized_digest)
+            if next_level_files is None:
+                self.shadow_manager.cascade_update_on_digest_finalize(level, finalized_digest)
+            else:
+                self.shadow_manager.cascade_update_on_digest_finalize(
+                    level, finalized_digest, next_level_files
+                )
         else:
             _logger.info(f"[Step 3] スキップ（{level}は最上位、カスケード不要）")
 
@@ -206,15 +291,21 @@ class DigestPersistence:
         digest_number: int,
         provisional_file_to_delete: Optional[Path],
         finalized_digest: Optional[RegularDigestData] = None,
+        next_level_files: Optional[List[Path]] = None,
     ) -> None:
         """
         カスケード処理とProvisional削除（オーケストレーター）
 
+        カスケード → last_digest_times更新 → Provisional削除 の順は変えない。
+        last_processed は次レベルの新規ファイル検出の閾値のため、
+        カスケードが成功するまで更新しない。
+
         Args:
             level: ダイジェストレベル
             digest_number: 確定したダイジェスト番号
             provisional_file_to_delete: 削除するProvisionalファイル
             finalized_digest: 確定したRegularDigest（次レベルProvisional追加用）
+            next_level_files: 先読み済みの次レベルの新規ファイル（省略時はカスケード内で検出）
 
         Example:
             >>> persistence = DigestPersistence(config, grand_manager, shadow_manager, tracker)
@@ -225,7 +316,7 @@ class DigestPersistence:
         log_debug(f"{LOG_PREFIX_STATE} digest_number: {digest_number}")
         log_debug(f"{LOG_PREFIX_FILE} provisional_to_delete: {provisional_file_to_delete}")
 
-        self._update_shadow_cascade(level, finalized_digest)
+        self._update_shadow_cascade(level, finalized_digest, next_level_files)
         self._update_digest_times(level, digest_number)
         self._cleanup_provisional_file(provisional_file_to_delete)
 
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Sentence Index Recorder
+=======================
+
+Digests/.sentences/（文書ごとの文境界オフセット）の更新と、
+クエリに合う箇所（スニペット）の抽出を担当するモジュール。
+
+DigestPersistence.save_regular_digest（ダイジェスト確定時）から、
+書き込んだダイジェストファイルの abstract / impression（long版）の文境界が記録される。
+Loopをソースとするレベル（weekly）の確定時には、ソースのLoopファイル本文も記録する。
+既存コーパスには rebuild() で一括構築できる。
+
+オフセットはファイル内のバイト位置で、ダイジェストでは JSON の文字列リテラルの中、
+Loop ではファイル本文そのものを指す。snippets() は署名で候補の文を選び、
+候補と返す範囲のバイト列だけを seek して読む（文書全体は読まない）。
+記録後にファイルのサイズか mtime が変わった文書は None を返す（呼び出し側は全文を読む）。
+
+パック済みLoop（infrastructure.loop_archive）もディスク上のLoopと同じように扱う。
+サイズと mtime はアーカイブのインデックスに残る元の値を使うため、
+パック前に記録したインデックスもそのまま使える。パック済みLoopは圧縮されているので、
+スニペットの抽出時はそのメンバーだけを伸長してから範囲を読む。
+
+行IDはベクトルストアと同じく、overall_digest がダイジェストのベースキー（例: "W0042"）、
+individual_digests が "<ダイジェスト>/<ソース>"（例: "W0042/L00186"）、Loop 本文が "L00186"。
+
+Usage:
+    from application.finalize import SentenceIndexRecorder
+
+    recorder = SentenceIndexRecorder(config.digests_path, config.loops_path)
+    recorder.snippets("W0042", "MCP 設計", k=2)
+    # [{'field': 'abstract', 'text': '...', 'highlights': [[4, 7]], ...}, ...]
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from application.finalize.digest_corpus import iter_digest_files
+from domain.constants import LEVEL_CONFIG, SOURCE_TYPE_LOOPS
+from domain.exceptions import CorruptedDataError, FileIOError
+from domain.file_constants import SENTENCE_INDEX_DIRNAME
+from domain.indexed_provisional import extract_source_base_key
+from domain.sentence_index import (
+    SENTENCE_INDEX_FORMAT_VERSION,
+    SentenceMap,
+    highlight_spans,
+    match_count,
+    query_terms,
+)
+from domain.text_utils import extract_long_value
+from infrastructure import (
+    DerivedUpdate,
+    get_structured_logger,
+    log_warning,
+    save_json,
+    try_load_json,
+)
+from infrastructure.json_repository import COMPACT
+from infrastructure.loop_archive import loop_stat, read_loop_bytes
+
+_logger = get_structured_logger(__name__)
+
+# スニペットにするフィールド（RegularDigestの各エントリ）
+SNIPPET_FIELDS = ("abstract", "impression")
+
+# Loop本文のフィールド名
+LOOP_FIELD = "text"
+
+# 返すスニペット1件あたり、署名で選んで実際に読む候補の文の数
+CANDIDATES_PER_SNIPPET = 4
+
+# 文書の種類（ファイルの符号化）
+KIND_DIGEST = "digest"
+KIND_LOOP = "loop"
+
+
+def _json_literal(text: str) -> str:
+    """ダイジェストファイル（ensure_ascii=False）での文字列リテラルの中身"""
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def _json_length(text: str) -> int:
+    return len(_json_literal(text).encode("utf-8"))
+
+
+def _utf8_length(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _decode(kind: str, chunk: bytes) -> str:
+    """インデックスしたバイト範囲を本文に戻す"""
+    if kind == KIND_DIGEST:
+        return str(json.loads(b'"' + chunk + b'"'))
+    return chunk.decode("utf-8")
+
+
+def _digest_fields(
+    digest_id: str, regular_digest: Mapping[str, Any]
+) -> Iterator[Tuple[str, str, str]]:
+    """RegularDigestの (行ID, フィールド, 本文) をファイル内の出現順に列挙"""
+    entries = [(digest_id, regular_digest.get("overall_digest") or {})]
+    for entry in regular_digest.get("individual_digests") or []:
+        source_id = extract_source_base_key(str(entry.get("source_file") or ""))
+        if source_id:
+            entries.append((f"{digest_id}/{source_id}", entry))
+    for row_id, entry in entries:
+        for field in SNIPPET_FIELDS:
+            text = extract_long_value(entry.get(field))
+            if text:
+                yield row_id, field, text
+
+
+def map_digest_fields(
+    data: bytes, digest_id: str, regular_digest: Mapping[str, Any]
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    ダイジェストファイルのバイト列から各フィールドの文境界を求める
+
+    フィールドの文字列リテラルをファイルの先頭から順に探し、
+    見つからないフィールド（手で編集されたファイルなど）は記録しない。
+
+    Returns:
+        {行ID: {フィールド: SentenceMap.to_dict()}}
+
+    Example:
+        >>> map_digest_fields(path.read_bytes(), "W0042", regular_digest)["W0042"]["abstract"]
+        {'b': [112, 160, 238], 's': ['8a0…', '1f4…']}
+    """
+    rows: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    cursor = 0
+    for row_id, field, text in _digest_fields(digest_id, regular_digest):
+        literal = b'"' + _json_literal(text).encode("utf-8") + b'"'
+        found = data.find(literal, cursor)
+        if found < 0:
+            found = data.find(literal)
+        if found < 0:
+            continue
+        cursor = found + len(literal)
+        sentence_map = SentenceMap.build(text, _json_length, offset=found + 1)
+        rows.setdefault(row_id, {})[field] = sentence_map.to_dict()
+    return rows
+
+
+def _window_text(handle: BinaryIO, kind: str, start: int, end: int) -> str:
+    handle.seek(start)
+    return _decode(kind, handle.read(end - start))
+
+
+class SentenceIndexRecorder:
+    """文境界オフセットのインデックス管理クラス"""
+
+    def __init__(self, digests_path: Path, loops_path: Optional[Path] = None):
+        """
+        Args:
+            digests_path: Digestsディレクトリ（インデックスは直下の .sentences/ に配置）
+            loops_path: Loopsディレクトリ（省略時はLoop本文を記録しない）
+        """
+        self.digests_path = digests_path
+        self.loops_path = loops_path
+        self.index_dir = digests_path / SENTENCE_INDEX_DIRNAME
+
+    def index_file(self, row_id: str) -> Path:
+        """
+        行IDの文書のインデックスファイル
+
+        Example:
+            >>> recorder.index_file("W0042/L00186").name
+            'W0042.json'
+        """
+        return self.index_dir / f"{extract_source_base_key(row_id.split('/')[0])}.json"
+
+    def _base_dir(self, kind: str) -> Optional[Path]:
+        """インデックスの path の基準ディレクトリ"""
+        return self.digests_path if kind == KIND_DIGEST else self.loops_path
+
+    @staticmethod
+    def _stat(kind: str, source: Path) -> Optional[Tuple[int, int]]:
+        """文書の (size, mtime_ns)（Loopはパック済みならアーカイブの値、ない場合はNone）"""
+        if kind == KIND_LOOP:
+            return loop_stat(source)
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _open(kind: str, source: Path) -> BinaryIO:
+        """文書を開く（ディスクにないLoopはパックから1件だけ伸長する）"""
+        if kind == KIND_LOOP and not source.is_file():
+            return io.BytesIO(read_loop_bytes(source))
+        return open(source, "rb")
+
+    def _save(
+        self,
+        key: str,
+        kind: str,
+        source: Path,
+        rows: Dict[str, Dict[str, Any]],
+        stat: Tuple[int, int],
+    ) -> None:
+        base_dir = self._base_dir(kind)
+        save_json(
+            self.index_dir / f"{key}.json",
+            {
+                "version": SENTENCE_INDEX_FORMAT_VERSION,
+                "kind": kind,
+                "path": os.path.relpath(source, base_dir) if base_dir else str(source),
+                "size": stat[0],
+                "mtime_ns": stat[1],
+                "rows": rows,
+            },
+            codec=COMPACT,
+        )
+
+    def record_digest(
+        self,
+        level: str,
+        digest_name: str,
+        regular_digest: Mapping[str, Any],
+        digest_file: Path,
+    ) -> None:
+        """
+        書き込んだダイジェストファイルの文境界を記録（Loopがソースならその本文も）
+
+        Args:
+            level: ダイジェストレベル
+            digest_name: ダイジェスト名（例: "W0042_2025年11月第4週"）
+            regular_digest: 確定したRegularDigest
+            digest_file: 書き込んだダイジェストファイル
+
+        Example:
+            >>> recorder.record_digest("weekly", "W0042_第4週", regular_digest, path)
+        """
+        digest_id = extract_source_base_key(digest_name)
+        with DerivedUpdate(f"文境界インデックス（{digest_name}）") as update:
+            stat = digest_file.stat()
+            rows = map_digest_fields(digest_file.read_bytes(), digest_id, regular_digest)
+            self._save(digest_id, KIND_DIGEST, digest_file, rows, (stat.st_size, stat.st_mtime_ns))
+        if update.failed:
+            return
+        loops = 0
+        if level in LEVEL_CONFIG and LEVEL_CONFIG[level]["source"] == SOURCE_TYPE_LOOPS:
+            overall = regular_digest.get("overall_digest") or {}
+            loops = sum(self.record_loop(str(f)) for f in overall.get("source_files") or [])
+        _logger.info(f"文境界インデックス更新: {digest_name} (Loop {loops}件)")
+
+    def record_loop(self, loop_file_name: str) -> bool:
+        """
+        Loopファイル本文の文境界を記録
+
+        パック済みLoopはパックから読む。ディスクにもパックにもないファイルは記録しない。
+
+        Returns:
+            記録した場合True
+
+        Example:
+            >>> recorder.record_loop("L00186_test.txt")
+            True
+        """
+        if self.loops_path is None:
+            return False
+        loop_file = self.loops_path / loop_file_name
+        loop_id = extract_source_base_key(loop_file_name)
+        stat = loop_stat(loop_file) if loop_id else None
+        if stat is None:
+            return False
+        with DerivedUpdate(
+            f"文境界インデックス（{loop_file_name}）", UnicodeDecodeError, CorruptedDataError
+        ) as update:
+            text = read_loop_bytes(loop_file).decode("utf-8")
+            rows = {loop_id: {LOOP_FIELD: SentenceMap.build(text, _utf8_length).to_dict()}}
+            self._save(loop_id, KIND_LOOP, loop_file, rows, stat)
+        return not update.failed
+
+    def _load_current(self, row_id: str) -> Optional[Tuple[Dict[str, Any], Path]]:
+        """インデックスと文書のパスを読み込む（ない・古い・壊れている場合はNone）"""
+        index = try_load_json(self.index_file(row_id), default=None, log_on_error=False)
+        if not isinstance(index, dict) or index.get("version") != SENTENCE_INDEX_FORMAT_VERSION:
+            return None
+        kind = str(index.get("kind"))
+        base_dir = self._base_dir(kind)
+        try:
+            source = (base_dir or Path()) / index["path"]
+        except (KeyError, TypeError):
+            return None
+        stat = self._stat(kind, source)
+        if stat is None or stat != (index.get("size"), index.get("mtime_ns")):
+            return None
+        return index, source
+
+    def snippets(
+        self, row_id: str, query: str, k: int = 3, context: int = 0
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        クエリに最も合う箇所を最大k件返す
+
+        署名で候補の文を選び、候補の文を読んで実際の一致数で並べ替え、
+        上位の文の前後 context 文を含む範囲（重ならないもの）を返す。
+
+        Args:
+            row_id: 行ID（"W0042", "W0042/L00186", "L00186"）またはダイジェスト名
+            query: 検索文
+            k: 件数
+            context: 一致した文の前後に含める文の数
+
+        Returns:
+            スニペットのリスト（一致の多い順）。各要素は
+            field, start, end（ファイル内のバイト範囲）, text,
+            highlights（text 内でクエリの語が現れる [開始, 終了] の文字範囲）, score（一致した語の数）。
+            インデックスがない・ファイルが変わっている場合はNone
+
+        Example:
+            >>> recorder.snippets("W0042", "MCP 設計", k=1)
+            [{'field': 'abstract', 'start': 1840, 'end': 1933, 'text': '...',
+              'highlights': [[0, 3], [9, 11]], 'score': 2}]
+        """
+        if "/" not in row_id:
+            row_id = extract_source_base_key(row_id)
+        loaded = self._load_current(row_id)
+        if loaded is None:
+            return None
+        index, source = loaded
+        fields = (index.get("rows") or {}).get(row_id)
+        if fields is None:
+            return None
+        terms = query_terms(query)
+        if not terms or k <= 0:
+            return []
+        maps = {field: SentenceMap.from_dict(data) for field, data in fields.items()}
+        kind = str(index.get("kind"))
+        try:
+            with self._open(kind, source) as handle:
+                return self._read_snippets(handle, kind, maps, terms, k, max(context, 0))
+        except (OSError, UnicodeDecodeError, ValueError, FileIOError, CorruptedDataError) as e:
+            log_warning(f"スニペットの読み込みに失敗: {row_id}: {e}")
+            return None
+
+    def _read_snippets(
+        self,
+        handle: BinaryIO,
+        kind: str,
+        maps: Dict[str, SentenceMap],
+        terms: List[str],
+        k: int,
+        context: int,
+    ) -> List[Dict[str, Any]]:
+        candidates = [
+            (estimate, field, i)
+            for field, sentence_map in maps.items()
+            for i, estimate in sentence_map.candidates(terms, k * CANDIDATES_PER_SNIPPET)
+        ]
+        candidates.sort(key=lambda item: -item[0])
+        scored = []
+        for _estimate, field, i in candidates[: k * CANDIDATES_PER_SNIPPET]:
+            start, end = maps[field].byte_range(i, i)
+            score = match_count(_window_text(handle, kind, start, end), terms)
+            if score:
+                scored.append((score, field, i))
+        scored.sort(key=lambda item: -item[0])
+
+        results: List[Dict[str, Any]] = []
+        taken: List[Tuple[str, int, int]] = []
+        for score, field, i in scored:
+            sentence_map = maps[field]
+            first, last = max(i - context, 0), min(i + context, len(sentence_map) - 1)
+            if any(
+                f == field and first <= t_last and t_first <= last for f, t_first, t_last in taken
+            ):
+                continue
+            taken.append((field, first, last))
+            start, end = sentence_map.byte_range(first, last)
+            text = _window_text(handle, kind, start, end)
+            results.append(
+                {
+                    "field": field,
+                    "start": start,
+                    "end": end,
+                    "text": text,
+                    "highlights": [list(span) for span in highlight_spans(text, terms)],
+                    "score": score,
+                }
+            )
+            if len(results) >= k:
+                break
+        return results
+
+    def rebuild(self) -> int:
+        """
+        全レベルのRegularDigest（とweeklyのソースのLoop）の文境界を記録し直す
+
+        インデックス導入前に確定した既存ダイジェストの取り込みに使用する。
+
+        Returns:
+            記録したダイジェスト数
+
+        Example:
+            >>> recorder.rebuild()
+            128
+        """
+        count = 0
+        for level, digest_file in iter_digest_files(self.digests_path):
+            data = try_load_json(digest_file, log_on_error=False)
+            if data is None:
+                continue
+            self.record_digest(level, digest_file.stem, data, digest_file)
+            count += 1
+        return count
+
+
+__all__ = ["SentenceIndexRecorder", "map_digest_fields"]
@@ -11,6 +11,7 @@ Design:
     - FileNumberValidator: ファイル番号の検証（SRP分離）
 """
 
+from array import array
 from typing import Any, Callable, List, Optional, Tuple
 
 from application.finalize.validators import CollectionValidator, FileNumberValidator
@@ -76,7 +77,7 @@ class ShadowValidator:
 
     def _collect_validation_errors(
         self, level: str, source_files: List[str]
-    ) -> Tuple[List[str], List[str], List[int]]:
+    ) -> Tuple[List[str], List[str], "array[int]"]:
         """
         検証エラーを1パスで収集
 
@@ -88,11 +89,11 @@ class ShadowValidator:
             (fatal_errors, warnings, numbers) のタプル
             - fatal_errors: 致命的エラー（処理続行不可）
             - warnings: 警告（ユーザー確認で続行可能）
-            - numbers: 抽出されたファイル番号リスト
+            - numbers: 抽出されたファイル番号の array（source_filesの順）
         """
         fatal_errors: List[str] = []
         warnings: List[str] = []
-        numbers: List[int] = []
+        numbers: "array[int]" = array("q")
 
         # 1. 型チェックと空チェック（CollectionValidatorに委譲）
         type_errors = self.collection_validator.validate_list(source_files, "source_files")
@@ -105,8 +106,8 @@ class ShadowValidator:
         if empty_errors:
             return empty_errors, warnings, numbers
 
-        # 2. ファイル名検証と番号抽出（FileNumberValidatorに委譲）
-        numbers, extraction_errors = self.file_number_validator.extract_numbers(source_files)
+        # 2. ファイル名検証と番号抽出（FileNumberValidatorに委譲、1パスで一括抽出）
+        numbers, extraction_errors = self.file_number_validator.extract_number_array(source_files)
         if extraction_errors:
             return extraction_errors, warnings, numbers
 
@@ -116,12 +117,9 @@ class ShadowValidator:
         )
         warnings.extend(consecutive_warnings)
 
-        # numbersをソート
-        numbers.sort()
-
         return fatal_errors, warnings, numbers
 
-    def validate_shadow_content(self, level: str, source_files: List[str]) -> None:
+    def validate_shadow_content(self, level: str, source_files: List[str]) -> "array[int]":
         """
         ShadowGrandDigestの内容が妥当かチェック
 
@@ -129,12 +127,16 @@ class ShadowValidator:
         - source_filesが空でないこと
         - ファイル名が連番になっていること（警告のみ、継続可能）
 
+        Returns:
+            抽出したファイル番号の array（source_filesの順）。
+            DigestTimesTracker.save(numbers=...) に渡せば再パースせずに済む
+
         Raises:
             ValidationError: source_filesの形式が不正な場合
 
         Example:
             >>> validator.validate_shadow_content("weekly", ["L00186.txt", "L00187.txt"])
-            # ValidationError if invalid
+            array('q', [186, 187])
         """
         fatal_errors, warnings, numbers = self._collect_validation_errors(level, source_files)
 
@@ -151,8 +153,10 @@ class ShadowValidator:
                 raise ValidationError("User cancelled due to non-consecutive files")
 
         _logger.info(
-            f"Shadow validation passed: {len(source_files)} file(s), range: {numbers[0]}-{numbers[-1]}"
+            f"Shadow validation passed: {len(source_files)} file(s), "
+            f"range: {min(numbers)}-{max(numbers)}"
         )
+        return numbers
 
     def _validate_title(self, weave_title: str) -> None:
         """
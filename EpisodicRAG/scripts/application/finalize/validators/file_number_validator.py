@@ -4,12 +4,16 @@ File Number Validator
 =====================
 
 ファイル番号の抽出と連番チェックを担当するバリデータ
+
+番号はコンパイル済みの正規表現で1パス抽出し（extract_number_array）、
+連番判定は隣接差分で行う（NumPyが利用可能ならベクトル化）。
 """
 
+from array import array
 from typing import List, Optional, Sequence, Tuple
 
 from domain.error_formatter import CompositeErrorFormatter, get_error_formatter
-from domain.file_naming import extract_file_number
+from domain.file_naming import extract_number_array, is_consecutive_numbers
 from domain.protocols import LevelRegistryProtocol
 
 
@@ -42,9 +46,9 @@ class FileNumberValidator:
             self._formatter = get_error_formatter()
         return self._formatter
 
-    def extract_numbers(self, filenames: Sequence[object]) -> Tuple[List[int], List[str]]:
+    def extract_number_array(self, filenames: Sequence[object]) -> Tuple["array[int]", List[str]]:
         """
-        ファイル名リストから番号を抽出
+        ファイル名リストから番号を一括抽出（array で返す）
 
         Args:
             filenames: ファイル名のリスト
@@ -52,18 +56,20 @@ class FileNumberValidator:
 
         Returns:
             (numbers, errors) のタプル
-            - numbers: 抽出に成功した番号のリスト
-            - errors: 抽出に失敗したファイルのエラーメッセージリスト
+            - numbers: 抽出に成功した番号の array（入力順）
+            - errors: 抽出に失敗したファイルのエラーメッセージリスト（入力順）
 
         Example:
             >>> validator = FileNumberValidator()
-            >>> validator.extract_numbers(["L00186.txt", "L00187.txt"])
+            >>> numbers, errors = validator.extract_number_array(["L00186.txt", "L00187.txt"])
+            >>> numbers.tolist(), errors
             ([186, 187], [])
         """
-        numbers: List[int] = []
-        errors: List[str] = []
+        numbers, invalid_indices = extract_number_array(filenames, registry=self._registry)
 
-        for i, filename in enumerate(filenames):
+        errors: List[str] = []
+        for i in invalid_indices:
+            filename = filenames[i]
             # 型チェック（防御的プログラミング - ランタイムで非strが渡される可能性）
             if not isinstance(filename, str):
                 errors.append(
@@ -71,18 +77,33 @@ class FileNumberValidator:
                         f"filename at index {i}", "str", filename
                     )
                 )
-                continue
-
-            # 番号抽出
-            result = extract_file_number(filename, registry=self._registry)
-            if result:
-                numbers.append(result[1])
             else:
                 errors.append(f"Invalid filename format: {filename}")
 
         return numbers, errors
 
-    def check_consecutive(self, numbers: List[int]) -> bool:
+    def extract_numbers(self, filenames: Sequence[object]) -> Tuple[List[int], List[str]]:
+        """
+        ファイル名リストから番号を抽出
+
+        Args:
+            filenames: ファイル名のリスト
+                       非str要素はエラーとして報告（防御的プログラミング）
+
+        Returns:
+            (numbers, errors) のタプル
+            - numbers: 抽出に成功した番号のリスト
+            - errors: 抽出に失敗したファイルのエラーメッセージリスト
+
+        Example:
+            >>> validator = FileNumberValidator()
+            >>> validator.extract_numbers(["L00186.txt", "L00187.txt"])
+            ([186, 187], [])
+        """
+        numbers, errors = self.extract_number_array(filenames)
+        return numbers.tolist(), errors
+
+    def check_consecutive(self, numbers: Sequence[int]) -> bool:
         """
         番号リストが連番かをチェック
 
@@ -99,16 +120,11 @@ class FileNumberValidator:
             >>> validator.check_consecutive([1, 3, 5])
             False
         """
-        if len(numbers) <= 1:
-            return True
-
-        sorted_nums = sorted(numbers)
-        for i in range(len(sorted_nums) - 1):
-            if sorted_nums[i + 1] != sorted_nums[i] + 1:
-                return False
-        return True
+        return is_consecutive_numbers(numbers)
 
-    def validate_consecutive(self, numbers: List[int], source_files: List[str]) -> List[str]:
+    def validate_consecutive(
+        self, numbers: Sequence[int], source_files: Sequence[str]
+    ) -> List[str]:
         """
         番号が連番かを検証し、連番でない場合は警告メッセージを返す
 
@@ -129,7 +145,7 @@ class FileNumberValidator:
         if not numbers:
             return []
 
-        sorted_nums = sorted(numbers)
-        if not self.check_consecutive(sorted_nums):
-            return [f"Non-consecutive files detected: {sorted_nums}"]
+        # 並べ替えは警告メッセージを作るときだけ行う
+        if not self.check_consecutive(numbers):
+            return [f"Non-consecutive files detected: {sorted(numbers)}"]
         return []
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Digest Vector Recorder
+======================
+
+digest_vectors.f32 / .json（ダイジェストのTF-IDFベクトルストア）の更新と類似検索を担当するモジュール。
+
+DigestPersistence.save_regular_digest（ダイジェスト確定時）から
+overall_digest と各 individual_digests の行が追記される。
+既存コーパスには rebuild()、置き換えで残った墓標行の削除には compact() を使う。
+
+行にはTFベクトルだけを保存し、IDFは検索時にストアの最新の文書頻度から掛ける。
+そのため後から追記したダイジェストで文書頻度が変わっても、古い行の重みは古くならない。
+IDFを掛けた各行のノルムは追記・コンパクション・再構築のたびに保存し直し、
+related() / search() ではクエリの非ゼロ成分の列だけを読む。
+
+行IDは overall_digest がダイジェストのベースキー（例: "W0042"）、
+individual_digests が "<ダイジェスト>/<ソース>"（例: "W0042/L00186"）。
+
+Usage:
+    from application.finalize import DigestVectorRecorder
+
+    recorder = DigestVectorRecorder(config.digests_path)
+    recorder.related("W0042", k=5)  # [('W0038', 0.71), ('M011/W0038', 0.64), ...]
+"""
+
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from application.finalize.digest_corpus import iter_digest_records
+from domain.digest_records import DigestRecord
+from domain.file_constants import DIGEST_VECTORS_FILENAME
+from domain.indexed_provisional import extract_source_base_key
+from domain.tfidf import VECTOR_DIM, idf_weights, term_buckets, tf_vector, tfidf_vector
+from infrastructure import DerivedUpdate, get_structured_logger
+from infrastructure.vector_store import VectorStore
+
+_logger = get_structured_logger(__name__)
+
+
+def _entry_text(keywords: Tuple[str, ...], abstract: str, impression: str) -> str:
+    """keywords・abstract・impression を連結した本文"""
+    return "\n".join(part for part in (" ".join(keywords), abstract, impression) if part)
+
+
+def record_documents(record: DigestRecord) -> List[Tuple[str, str]]:
+    """
+    DigestRecordを (行ID, 本文) のリストに展開
+
+    本文を読み込んだレコードは展開後に本文を解放する。
+
+    Example:
+        >>> record_documents(record)[:2]
+        [('W0042', 'MCP API\\n...'), ('W0042/L00186', '...')]
+    """
+    digest_id = record.digest_id
+    overall = record.overall
+    documents = [(digest_id, _entry_text(overall.keywords, overall.abstract, overall.impression))]
+    for entry in record.individuals:
+        source_id = extract_source_base_key(entry.source_file)
+        if source_id:
+            text = _entry_text(entry.keywords, entry.abstract, entry.impression)
+            documents.append((f"{digest_id}/{source_id}", text))
+    record.release_text()
+    return [(row_id, text) for row_id, text in documents if text]
+
+
+def digest_documents(digest_name: str, regular_digest: Mapping[str, Any]) -> List[Tuple[str, str]]:
+    """
+    RegularDigestを (行ID, 本文) のリストに展開
+
+    Example:
+        >>> digest_documents("W0042_第4週", regular_digest)[:2]
+        [('W0042', 'MCP API\\n...'), ('W0042/L00186', '...')]
+    """
+    return record_documents(DigestRecord.from_dict("", digest_name, regular_digest))
+
+
+class DigestVectorRecorder:
+    """ダイジェストベクトルストア管理クラス"""
+
+    def __init__(self, digests_path: Path):
+        """
+        Args:
+            digests_path: Digestsディレクトリ（ストアは直下に配置）
+        """
+        self.digests_path = digests_path
+        self.store_path = digests_path / DIGEST_VECTORS_FILENAME
+
+    def load(self) -> VectorStore:
+        """
+        ストアを開く（存在しない・壊れている場合は空）
+
+        Example:
+            >>> len(recorder.load())
+            1280
+        """
+        return VectorStore(self.store_path, VECTOR_DIM)
+
+    @staticmethod
+    def _refresh_norms(store: VectorStore) -> None:
+        """最新のIDFで各行のノルムを保存し直す（検索時に全行を計算し直さないため）"""
+        store.refresh_norms(idf_weights(store.df, store.n_docs))
+
+    @staticmethod
+    def _vectorize(documents: List[Tuple[str, str]]) -> Dict[str, List[float]]:
+        """保存用のTFベクトルを作成（IDFは検索時に掛ける）"""
+        return {row_id: tf_vector(term_buckets(text)) for row_id, text in documents}
+
+    def record_digest(self, digest_name: str, regular_digest: Mapping[str, Any]) -> None:
+        """
+        確定したダイジェストの行を追記（同じIDの既存行は置き換え）
+
+        Args:
+            digest_name: ダイジェスト名（例: "W0042_2025年11月第4週"）
+            regular_digest: 確定したRegularDigest
+
+        Example:
+            >>> recorder.record_digest("W0042_第4週", regular_digest)
+        """
+        documents = digest_documents(digest_name, regular_digest)
+        if not documents:
+            return
+        with DerivedUpdate(DIGEST_VECTORS_FILENAME) as update:
+            store = self.load()
+            store.append(self._vectorize(documents))
+            self._refresh_norms(store)
+        if update.failed:
+            return
+        _logger.info(f"digest_vectors更新: {digest_name} ({len(documents)}行)")
+
+    def contains(self, row_id: str) -> bool:
+        """
+        行IDまたはダイジェスト名の行がストアにあるか
+
+        Example:
+            >>> recorder.contains("W0042_第4週")
+            True
+        """
+        if "/" not in row_id:
+            row_id = extract_source_base_key(row_id)
+        return row_id in self.load()
+
+    def related(self, row_id: str, k: int = 10) -> Optional[List[Tuple[str, float]]]:
+        """
+        指定した行に似たダイジェストの上位k件
+
+        Args:
+            row_id: 行ID（"W0042", "W0042/L00186"）またはダイジェスト名
+            k: 件数
+
+        Returns:
+            (行ID, コサイン類似度) のリスト（行IDが見つからない場合はNone）
+
+        Example:
+            >>> recorder.related("W0042", k=2)
+            [('W0038', 0.71), ('M011/W0038', 0.64)]
+        """
+        if "/" not in row_id:
+            row_id = extract_source_base_key(row_id)
+        store = self.load()
+        row = store.vector_of(row_id)
+        if row is None:
+            return None
+        weights = idf_weights(store.df, store.n_docs)
+        query = [t * w for t, w in zip(row, weights)]
+        norm = math.sqrt(sum(v * v for v in query))
+        if norm == 0:
+            return []
+        query = [v / norm for v in query]
+        return store.search(query, k=k, exclude={row_id}, weights=weights)
+
+    def term_stats(self) -> Tuple[List[int], int]:
+        """
+        ストアの (バケットごとの文書頻度, 文書数)（フェデレーション検索のIDF合算用）
+        """
+        store = self.load()
+        return store.df, store.n_docs
+
+    def search(
+        self,
+        text: str,
+        k: int = 10,
+        term_stats: Optional[Tuple[Sequence[int], int]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        自由文に似たダイジェストの上位k件
+
+        Args:
+            text: 検索文
+            k: 件数
+            term_stats: クエリと各行のIDFに使う (文書頻度, 文書数)。
+                省略時はこのストアの統計（フェデレーション検索では全ストアの合算を渡す）
+
+        Returns:
+            (行ID, コサイン類似度) のリスト
+
+        Example:
+            >>> recorder.search("MCPの設計", k=2)
+            [('W0042', 0.41), ('W0042/L00186', 0.37)]
+        """
+        store = self.load()
+        df, n_docs = term_stats if term_stats is not None else (store.df, store.n_docs)
+        query = tfidf_vector(term_buckets(text), df, n_docs)
+        if not any(query):
+            return []
+        weights = idf_weights(df, n_docs)
+        results = store.search(query, k=k, weights=weights)
+        return [(row_id, score) for row_id, score in results if score > 0]
+
+    def compact(self) -> int:
+        """
+        置き換えで残った墓標行を取り除く
+
+        Returns:
+            取り除いた行数
+        """
+        store = self.load()
+        removed = store.compact()
+        if removed:
+            self._refresh_norms(store)
+        return removed
+
+    def rebuild(self) -> VectorStore:
+        """
+        全レベルのRegularDigestからストアを再構築
+
+        行はTFだけを保存するため、IDFの更新のための再構築は要らない。
+        既存コーパスの取り込みや、形式の更新後に使う。
+
+        Example:
+            >>> len(recorder.rebuild())
+            1280
+        """
+        documents: List[Tuple[str, str]] = []
+        for record in iter_digest_records(self.digests_path, keep_text=True):
+            documents.extend(record_documents(record))
+        store = self.load()
+        store.clear()
+        store.append(self._vectorize(documents))
+        self._refresh_norms(store)
+        return store
+
+
+__all__ = ["DigestVectorRecorder", "digest_documents", "record_documents"]
@@ -7,13 +7,16 @@ GrandDigest管理コンポーネント群
 
 Components:
     - GrandDigestManager: GrandDigest.txt管理
+    - GrandHistoryRecorder: GrandDigest.history.jsonl（版履歴）の記録と復元
     - ShadowGrandDigestManager: ShadowGrandDigest管理（Facade）
 """
 
 from .grand_digest import GrandDigestManager
+from .grand_history import GrandHistoryRecorder
 from .shadow_grand_digest import ShadowGrandDigestManager
 
 __all__ = [
     "GrandDigestManager",
+    "GrandHistoryRecorder",
     "ShadowGrandDigestManager",
 ]
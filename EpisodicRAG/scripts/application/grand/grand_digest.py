@@ -22,12 +22,16 @@ Usage:
     # 特定レベルの更新
     manager.update_digest("weekly", "W0001", overall_digest_data)
 
+    # 過去の版（GrandDigest.history.jsonl から復元）
+    manager.history.at("2025-06-01")
+
 Design Pattern:
     - Repository Pattern: ファイルI/Oを抽象化
     - Template Method: テンプレート生成の標準化
 
 Related Modules:
     - application.grand.shadow_grand_digest: Shadow版の管理
+    - application.grand.grand_history: 版履歴の記録と復元
     - infrastructure.json_repository: JSON I/O操作
     - domain.types: GrandDigestData型定義
 
@@ -40,6 +44,7 @@ from datetime import datetime
 from typing import cast
 
 from application.config import DigestConfig
+from application.grand.grand_history import GrandHistoryRecorder
 from domain.constants import (
     DIGEST_LEVEL_NAMES,
     LOG_PREFIX_STATE,
@@ -47,11 +52,18 @@ from domain.constants import (
 )
 from domain.error_formatter import get_error_formatter
 from domain.exceptions import DigestError
-from domain.file_constants import GRAND_DIGEST_FILENAME
+from domain.file_constants import GRAND_DIGEST_FILENAME, GRAND_HISTORY_FILENAME
 from domain.types import GrandDigestData, OverallDigestData, as_dict
 from domain.validators import is_valid_dict
 from domain.version import DIGEST_FORMAT_VERSION
-from infrastructure import get_structured_logger, load_json_with_template, log_debug, save_json
+from infrastructure import (
+    file_lock,
+    get_structured_logger,
+    load_json_with_template,
+    log_debug,
+    save_json_if_changed,
+    save_json_stamped,
+)
 
 _logger = get_structured_logger(__name__)
 
@@ -66,6 +78,7 @@ class GrandDigestManager:
     Attributes:
         config: DigestConfig インスタンス
         grand_digest_file: GrandDigest.txt のパス
+        history: GrandDigest.history.jsonl の記録・復元
 
     Example:
         >>> from application.grand import GrandDigestManager
@@ -82,6 +95,7 @@ class GrandDigestManager:
     def __init__(self, config: DigestConfig):
         self.config = config
         self.grand_digest_file = config.essences_path / GRAND_DIGEST_FILENAME
+        self.history = GrandHistoryRecorder(config.essences_path / GRAND_HISTORY_FILENAME)
 
     def get_template(self) -> GrandDigestData:
         """
@@ -128,13 +142,16 @@ class GrandDigestManager:
             log_message="GrandDigest.txt not found. Creating new file.",
         )
 
-    def save(self, data: GrandDigestData) -> None:
+    def save(self, data: GrandDigestData) -> bool:
         """
-        GrandDigest.txtを保存
+        GrandDigest.txtを保存（既存ファイルと内容が同じなら書き込まない）
 
         Args:
             data: 保存するGrandDigestデータ
 
+        Returns:
+            書き込んだ場合True
+
         Raises:
             FileIOError: ファイル書き込みに失敗した場合
 
@@ -142,8 +159,9 @@ class GrandDigestManager:
             >>> manager = GrandDigestManager(config)
             >>> data = manager.load_or_create()
             >>> manager.save(data)
+            False
         """
-        save_json(self.grand_digest_file, as_dict(data))
+        return save_json_if_changed(self.grand_digest_file, as_dict(data))
 
     def update_digest(
         self, level: str, digest_name: str, overall_digest: OverallDigestData
@@ -151,6 +169,9 @@ class GrandDigestManager:
         """
         指定レベルのダイジェストを更新
 
+        GrandDigest.txt を書き換えた場合は GrandDigest.history.jsonl にも1行追記する。
+        読み込みから保存・履歴の追記までは GrandDigest.txt の排他ロック内で行う。
+
         Args:
             level: ダイジェストレベル
             digest_name: ダイジェスト名
@@ -158,12 +179,20 @@ class GrandDigestManager:
 
         Raises:
             DigestError: GrandDigest.txtのフォーマットが不正、またはレベルが無効な場合
+            FileIOError: ロックを取れなかった場合
 
         Example:
             >>> manager = GrandDigestManager(config)
             >>> manager.update_digest("weekly", "W0042", overall_digest)
             # GrandDigest.txt の weeklyセクションが更新される
         """
+        with file_lock(self.grand_digest_file):
+            self._update_digest(level, digest_name, overall_digest)
+
+    def _update_digest(
+        self, level: str, digest_name: str, overall_digest: OverallDigestData
+    ) -> None:
+        """update_digest の本体（GrandDigest.txt のロック内で実行）"""
         grand_data = self.load_or_create()
 
         log_debug(f"{LOG_PREFIX_STATE} update_digest: level={level}, digest_name={digest_name}")
@@ -185,15 +214,19 @@ class GrandDigestManager:
         if level not in grand_data["major_digests"]:
             raise DigestError(formatter.config.unknown_level(level))
 
+        # 履歴の差分用に更新前のレベルを複製（他のレベルは書き換えないので共有でよい）
+        previous = dict(grand_data["major_digests"])
+        previous[level] = dict(grand_data["major_digests"][level])
+
         # overall_digestを更新（完全なオブジェクトとして保存）
         log_debug(f"{LOG_PREFIX_STATE} updating overall_digest for level={level}")
         log_debug(f"{LOG_PREFIX_VALIDATE} overall_digest_keys: {list(overall_digest.keys())}")
         grand_data["major_digests"][level]["overall_digest"] = overall_digest
 
-        # メタデータを更新
-        grand_data["metadata"]["last_updated"] = datetime.now().isoformat()
+        # 内容が変わった場合のみ metadata.last_updated を更新して保存
+        if not save_json_stamped(self.grand_digest_file, as_dict(grand_data)):
+            _logger.info(f"GrandDigest.txt変更なし: レベル {level}")
+            return
         log_debug(f"{LOG_PREFIX_STATE} updated_timestamp: {grand_data['metadata']['last_updated']}")
-
-        # 保存
-        self.save(cast(GrandDigestData, grand_data))
+        self.history.record(previous, cast(GrandDigestData, grand_data))
         _logger.info(f"GrandDigest.txt更新完了: レベル {level}")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+GrandDigest History Recorder
+============================
+
+GrandDigest.history.jsonl（GrandDigestの版履歴）の追記と復元を担当するモジュール。
+
+GrandDigestManager.update_digest が GrandDigest.txt を書き換えるたびに1行追記する。
+各行はキーフレーム（major_digests 全体）または直前の版からの差分
+（変わったレベルと、その overall_digest の変わったフィールド）。
+形式は domain.grand_history を参照。
+
+    {"t":"2025-06-01T10:00:00","k":"key","h":"…","n":0,"v":1,"metadata":{…},"major_digests":{…}}
+    {"t":"2025-06-08T10:00:00","k":"delta","h":"…","n":1,"levels":{"weekly":{"set":{…}}}}
+
+各行の先頭は時刻（t）と種類（k）で、復元時はこの部分だけを文字列として照合し、
+パースするのは最寄りのキーフレームとそれ以降の差分だけにする。
+
+Usage:
+    from application.grand import GrandDigestManager
+
+    manager = GrandDigestManager(config)
+    manager.history.at("2025-06-01")  # 2025-06-01 の終わり時点の GrandDigest
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from domain.exceptions import CorruptedDataError
+from domain.grand_history import (
+    HISTORY_FORMAT_VERSION,
+    KEYFRAME_INTERVAL,
+    RECORD_DELTA,
+    RECORD_KEYFRAME,
+    apply_level_deltas,
+    diff_major_digests,
+    state_hash,
+)
+from domain.timeline_index import normalize_range_end
+from domain.types import GrandDigestData
+from infrastructure import DerivedUpdate, get_structured_logger
+from infrastructure.json_repository.codec import COMPACT, loads
+
+_logger = get_structured_logger(__name__)
+
+# 各行の先頭（"t" と "k" がこの順で先頭に来るように書く）
+_TIME_PREFIX = '{"t":"'
+_KEYFRAME_MARKER = f'","k":"{RECORD_KEYFRAME}"'
+
+# 最後の行を探すときに末尾から読む単位（バイト）
+_TAIL_CHUNK = 64 * 1024
+
+
+def _line_time(line: str) -> Optional[str]:
+    """行の先頭から時刻を取り出す（パースしない）。形式が違う行はNone"""
+    if not line.startswith(_TIME_PREFIX):
+        return None
+    end = line.find('"', len(_TIME_PREFIX))
+    return line[len(_TIME_PREFIX) : end] if end > 0 else None
+
+
+def _is_keyframe(line: str, time_text: str) -> bool:
+    return line.startswith(_KEYFRAME_MARKER, len(_TIME_PREFIX) + len(time_text))
+
+
+def _read_last_line(path: Path) -> Optional[str]:
+    """ファイルの最後の行を末尾から読み出す（ファイル全体は読まない）"""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            tail = b""
+            while position > 0:
+                step = min(_TAIL_CHUNK, position)
+                position -= step
+                f.seek(position)
+                tail = f.read(step) + tail
+                newline = tail.rfind(b"\n", 0, len(tail) - 1)
+                if newline >= 0:
+                    return tail[newline + 1 :].decode("utf-8").strip() or None
+            return tail.decode("utf-8").strip() or None
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class GrandHistoryRecorder:
+    """GrandDigest.history.jsonl 管理クラス"""
+
+    def __init__(self, history_file: Path, keyframe_interval: int = KEYFRAME_INTERVAL):
+        """
+        Args:
+            history_file: 履歴ファイルのパス（GrandDigest.txt と同じEssencesディレクトリ）
+            keyframe_interval: キーフレームを挟む間隔（差分の件数）
+        """
+        self.history_file = history_file
+        self.keyframe_interval = keyframe_interval
+
+    def record(self, previous: Dict[str, Any], current: GrandDigestData) -> None:
+        """
+        GrandDigest の更新を1行追記（呼び出し側が GrandDigest.txt のロックを持つこと）
+
+        直前の版が最後の記録と一致しない（履歴の外で書き換えられた）場合や、
+        直前のキーフレームから keyframe_interval 件たった場合はキーフレームを書く。
+
+        Args:
+            previous: 更新前の major_digests
+            current: 更新後の GrandDigest（metadata.last_updated を記録時刻にする）
+
+        Example:
+            >>> recorder.record(previous_major_digests, grand_data)
+        """
+        major_digests = current["major_digests"]
+        metadata = current.get("metadata", {})
+        header = self._last_header()
+        keyframe = (
+            header is None
+            or header.get("h") != state_hash(previous)
+            or int(header.get("n", 0)) + 1 >= self.keyframe_interval
+        )
+        record: Dict[str, Any] = {
+            "t": metadata.get("last_updated", ""),
+            "k": RECORD_KEYFRAME if keyframe else RECORD_DELTA,
+            "h": state_hash(dict(major_digests)),
+            "n": 0 if keyframe or header is None else int(header.get("n", 0)) + 1,
+        }
+        if keyframe:
+            record["v"] = HISTORY_FORMAT_VERSION
+            record["metadata"] = metadata
+            record["major_digests"] = major_digests
+        else:
+            record["levels"] = diff_major_digests(previous, dict(major_digests))
+        with DerivedUpdate("GrandDigest履歴") as update:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, "a", encoding="utf-8") as f:
+                f.write(COMPACT.dumps(record) + "\n")
+        if update.failed:
+            return
+        _logger.info(f"GrandDigest履歴に記録: {record['k']} {record['t']}")
+
+    def _last_header(self) -> Optional[Dict[str, Any]]:
+        """最後の記録（読めなければNone）"""
+        line = _read_last_line(self.history_file)
+        if line is None:
+            return None
+        try:
+            parsed = loads(line)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    def _read_lines(self) -> List[str]:
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as f:
+                return f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+    def at(self, timestamp: str) -> Optional[GrandDigestData]:
+        """
+        指定時刻の GrandDigest を復元
+
+        その時刻以前で最後の記録を探し、それより前で最寄りのキーフレームから
+        差分を記録順に適用する。行のパースはキーフレーム以降の分だけ。
+
+        Args:
+            timestamp: ISO形式の時刻（日付のみならその日の終わり時点）
+
+        Returns:
+            復元した GrandDigest（metadata.last_updated はその版の時刻）。
+            指定時刻以前の記録がなければNone
+
+        Raises:
+            CorruptedDataError: 復元に使う行が壊れている場合
+
+        Example:
+            >>> grand = manager.history.at("2025-06-01")
+            >>> grand["major_digests"]["weekly"]["overall_digest"]["name"]
+            'W0022_…'
+        """
+        bound = normalize_range_end(timestamp)
+        lines = self._read_lines()
+        target = keyframe = last_keyframe = -1
+        for i, line in enumerate(lines):
+            time_text = _line_time(line)
+            if time_text is None:
+                continue
+            if _is_keyframe(line, time_text):
+                last_keyframe = i
+            if time_text <= bound:
+                target, keyframe = i, last_keyframe
+        if target < 0 or keyframe < 0:
+            return None
+        return self._replay(lines[keyframe : target + 1])
+
+    def _replay(self, lines: List[str]) -> GrandDigestData:
+        """キーフレームの行から始まる行を順に適用"""
+        try:
+            base = loads(lines[0])
+            major_digests: Dict[str, Any] = base["major_digests"]
+            version_time = base["t"]
+            for line in lines[1:]:
+                if _line_time(line) is None:
+                    continue
+                record = loads(line)
+                apply_level_deltas(major_digests, record["levels"])
+                version_time = record["t"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise CorruptedDataError(f"Corrupted history: {self.history_file} ({e})") from e
+        metadata = dict(base.get("metadata") or {})
+        metadata["last_updated"] = version_time
+        return cast(GrandDigestData, {"metadata": metadata, "major_digests": major_digests})
+
+    def versions(self) -> List[Tuple[str, str, List[str]]]:
+        """
+        記録の一覧を返す
+
+        Returns:
+            (時刻, 種類, 変わったレベル) のリスト（キーフレームは全レベル）
+
+        Example:
+            >>> manager.history.versions()[:2]
+            [('2025-06-01T10:00:00', 'key', ['weekly', ...]),
+             ('2025-06-08T10:00:00', 'delta', ['weekly'])]
+        """
+        result: List[Tuple[str, str, List[str]]] = []
+        for line in self._read_lines():
+            if _line_time(line) is None:
+                continue
+            record = loads(line)
+            levels = record.get("major_digests") if record["k"] == RECORD_KEYFRAME else None
+            result.append((record["t"], record["k"], list(levels or record.get("levels", {}))))
+        return result
+
+
+__all__ = ["GrandHistoryRecorder"]
@@ -21,7 +21,7 @@ GrandDigest更新後に作成された新しいコンテンツを保持し、
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 # Plugin版: application.configをインポート
 from application.config import DigestConfig
@@ -166,8 +166,29 @@ class ShadowGrandDigestManager:
         """
         self._updater.update_shadow_for_new_loops()
 
+    def find_new_files(self, level: str, pending: Sequence[Path] = ()) -> List[Path]:
+        """
+        指定レベルの新規ソースファイルを検出
+
+        Args:
+            level: 対象レベル（"weekly", "monthly"等）
+            pending: 書き込み中のファイル（存在するものとして扱う）
+
+        Note:
+            FileDetector.find_new_files() に委譲。
+            確定処理がカスケードの検出を先読みするときに使う。
+
+        Example:
+            >>> manager.find_new_files("monthly", pending=[weekly_dir / "W0042_xxx.txt"])
+            [Path('.../1_Weekly/W0041_xxx.txt'), Path('.../1_Weekly/W0042_xxx.txt')]
+        """
+        return self._detector.find_new_files(level, pending)
+
     def cascade_update_on_digest_finalize(
-        self, level: str, finalized_digest: Optional[RegularDigestData] = None
+        self,
+        level: str,
+        finalized_digest: Optional[RegularDigestData] = None,
+        new_files: Optional[List[Path]] = None,
     ) -> None:
         """
         ダイジェスト確定時のカスケード処理
@@ -175,6 +196,7 @@ class ShadowGrandDigestManager:
         Args:
             level: 確定したレベル（"weekly", "monthly"等）
             finalized_digest: 確定したRegularDigest（次レベルProvisional追加用）
+            new_files: 先読み済みの次レベルの新規ファイル（省略時はカスケード内で検出）
 
         Note:
             ShadowUpdater.cascade_update_on_digest_finalize() に委譲。
@@ -184,7 +206,7 @@ class ShadowGrandDigestManager:
         Example:
             >>> manager.cascade_update_on_digest_finalize("weekly", finalized_digest)
         """
-        self._updater.cascade_update_on_digest_finalize(level, finalized_digest)
+        self._updater.cascade_update_on_digest_finalize(level, finalized_digest, new_files)
 
 
 def main() -> None:
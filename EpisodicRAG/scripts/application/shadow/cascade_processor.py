@@ -41,7 +41,8 @@ Note:
     4. 現在レベルのShadowをクリア
 """
 
-from typing import TYPE_CHECKING, Dict, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 __all__ = ["CascadeProcessor"]
 
@@ -178,14 +179,15 @@ class CascadeProcessor:
             >>> processor.clear_shadow_level("weekly")
             # ShadowGrandDigestのweeklyセクションがリセットされる
         """
-        shadow_data = self.shadow_io.load_or_create()
+        with self.shadow_io.locked():
+            shadow_data = self.shadow_io.load_or_create()
 
-        # overall_digestを空のプレースホルダーにリセット
-        shadow_data["latest_digests"][level]["overall_digest"] = (
-            self.template.create_empty_overall_digest()
-        )
+            # overall_digestを空のプレースホルダーにリセット
+            shadow_data["latest_digests"][level]["overall_digest"] = (
+                self.template.create_empty_overall_digest()
+            )
 
-        self.shadow_io.save(shadow_data)
+            self.shadow_io.save(shadow_data)
         _logger.info(f"ShadowGrandDigestクリア完了: レベル {level}")
 
     def _append_to_next_provisional(
@@ -208,7 +210,10 @@ class CascadeProcessor:
         self.provisional_appender.append_to_next_provisional(level, finalized_digest)
 
     def cascade_update_on_digest_finalize(
-        self, level: str, finalized_digest: Optional[RegularDigestData] = None
+        self,
+        level: str,
+        finalized_digest: Optional[RegularDigestData] = None,
+        new_files: Optional[List[Path]] = None,
     ) -> None:
         """
         ダイジェスト確定時のカスケード処理（処理3）
@@ -223,6 +228,7 @@ class CascadeProcessor:
         Args:
             level: レベル名
             finalized_digest: 確定したRegularDigest（オプション、Provisional追加用）
+            new_files: 先読み済みの次レベルの新規ファイル（省略時はここで検出）
 
         Example:
             >>> processor.cascade_update_on_digest_finalize("weekly", finalized_digest)
@@ -239,7 +245,8 @@ class CascadeProcessor:
         _logger.decision("next_level", level=next_level)
 
         if next_level:
-            new_files = self.file_detector.find_new_files(next_level)
+            if new_files is None:
+                new_files = self.file_detector.find_new_files(next_level)
             _logger.file_op(f"find_new_files({next_level})", found=len(new_files))
 
             if new_files:
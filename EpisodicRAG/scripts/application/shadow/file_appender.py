@@ -181,31 +181,33 @@ class FileAppender:
             >>> appender.add_files_to_shadow("weekly", [Path("L00186.txt")])
             # shadow["weekly"]["source_files"]に"L00186.txt"が追加される
         """
-        shadow_data = self.shadow_io.load_or_create()
-        overall_digest = self._ensure_overall_digest_initialized(shadow_data, level)
-
-        existing_files = set(overall_digest["source_files"])
-        source_type = self.level_hierarchy[level]["source"]
-
-        _logger.state(
-            "add_files_to_shadow",
-            level=level,
-            new_files_count=len(new_files),
-            existing_files_count=len(existing_files),
-            source_type=source_type,
-        )
+        # 他セッションの追加を失わないよう、読み込みから保存までShadowを排他ロック
+        with self.shadow_io.locked():
+            shadow_data = self.shadow_io.load_or_create()
+            overall_digest = self._ensure_overall_digest_initialized(shadow_data, level)
+
+            existing_files = set(overall_digest["source_files"])
+            source_type = self.level_hierarchy[level]["source"]
+
+            _logger.state(
+                "add_files_to_shadow",
+                level=level,
+                new_files_count=len(new_files),
+                existing_files_count=len(existing_files),
+                source_type=source_type,
+            )
 
-        # ファイル追加
-        added_count = self._add_new_files_to_digest(overall_digest, new_files, existing_files)
+            # ファイル追加
+            added_count = self._add_new_files_to_digest(overall_digest, new_files, existing_files)
 
-        # ログ出力（Monthly以上）
-        self._log_digest_contents_for_level(new_files, existing_files, level, source_type)
+            # ログ出力（Monthly以上）
+            self._log_digest_contents_for_level(new_files, existing_files, level, source_type)
 
-        _logger.state("files_added", count=added_count)
+            _logger.state("files_added", count=added_count)
 
-        # PLACEHOLDERの更新または既存分析の保持
-        total_files = len(overall_digest["source_files"])
-        _logger.state("total_files_after_add", total=total_files)
-        self.placeholder_manager.update_or_preserve(overall_digest, total_files)
+            # PLACEHOLDERの更新または既存分析の保持
+            total_files = len(overall_digest["source_files"])
+            _logger.state("total_files_after_add", total=total_files)
+            self.placeholder_manager.update_or_preserve(overall_digest, total_files)
 
-        self.shadow_io.save(shadow_data)
+            self.shadow_io.save(shadow_data)
@@ -4,16 +4,23 @@ File Detector for Shadow Updates
 ================================
 
 GrandDigest更新後に作成された新しいファイルを検出
+
+record_signatures=True で作成した場合（監視モードの IndexWarmer）は、新規Loopの検出時に
+類似度スケッチを登録し、既存Loopとの近似重複を記録する（loop_signatures.json）。
+対話的な /digest の検出ではLoop本文を読まない。
+パック済みLoop（Loops/.archive）もディスク上のLoopと同様に検出対象になる。
 """
 
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from application.config import DigestConfig
-from application.tracking import DigestTimesTracker
+from application.shadow.loop_signatures import LoopSignatureRecorder
+from application.tracking import DigestTimesTracker, LoopManifestRecorder
 from domain.constants import LEVEL_CONFIG, SOURCE_TYPE_LOOPS, SOURCE_TYPE_RAW, build_level_hierarchy
 from domain.file_naming import filter_files_after
-from infrastructure import get_structured_logger
+from infrastructure import get_structured_logger, log_warning, scan_files
 
 # 構造化ロガー
 _logger = get_structured_logger(__name__)
@@ -22,17 +29,29 @@ _logger = get_structured_logger(__name__)
 class FileDetector:
     """新規ファイル検出クラス"""
 
-    def __init__(self, config: DigestConfig, times_tracker: DigestTimesTracker):
+    def __init__(
+        self,
+        config: DigestConfig,
+        times_tracker: DigestTimesTracker,
+        record_signatures: bool = False,
+    ):
         """
         初期化
 
         Args:
             config: DigestConfig インスタンス
             times_tracker: DigestTimesTracker インスタンス
+            record_signatures: 新規Loop検出時に類似度スケッチを登録するか
+                （Loop本文を読むため、監視モードなどバックグラウンドの検出でのみ有効にする）
         """
         self.config = config
         self.times_tracker = times_tracker
         self.level_config = LEVEL_CONFIG
+        self.record_signatures = record_signatures
+        # 類似度スケッチは last_digest_times.json と同じ永続化ディレクトリに保存
+        self.signatures = LoopSignatureRecorder(times_tracker.last_digest_file.parent)
+        # 処理済みLoopのマニフェスト（処理後の変更検出用）
+        self.loop_manifest = LoopManifestRecorder(times_tracker.last_digest_file.parent)
 
         # レベル階層情報を構築（SSoT関数を使用）
         self.level_hierarchy = build_level_hierarchy()
@@ -113,12 +132,15 @@ class FileDetector:
         # 統一メソッドを使用
         return self.config.get_source_dir(level)
 
-    def find_new_files(self, level: str) -> List[Path]:
+    def find_new_files(self, level: str, pending: Sequence[Path] = ()) -> List[Path]:
         """
         GrandDigest更新後に作成された新しいファイルを検出
 
         Args:
             level: レベル名
+            pending: 書き込み中のファイル（まだ存在しなくても存在するものとして扱う）。
+                     確定処理が RegularDigest の書き込みと並行して次レベルの検出を
+                     先読みするときに使う
 
         Returns:
             新しいファイルのPathリスト
@@ -145,19 +167,52 @@ class FileDetector:
         source_dir = self.config.get_source_dir(level)
         pattern = self.config.get_source_pattern(level)
 
-        if not source_dir.exists():
+        if not source_dir.exists() and not pending:
             _logger.file_op("found", count=0, reason="source_dir_not_exists")
             return []
 
-        # ファイルを検出
-        all_files = sorted(source_dir.glob(pattern))
+        # ファイルを検出（書き込み中のファイルは書き込みの進み具合によらず含める）
+        all_files = scan_files(source_dir, pattern, include_archived=detection_level == "loop")
+        if pending:
+            all_files = self._merge_pending(all_files, source_dir, pattern, pending)
 
         if max_file_number is None:
             # 初回は全ファイルを検出
             _logger.file_op("found", count=len(all_files), filter="none_initial")
-            return all_files
-
-        # 統一関数を使用してフィルタリング
-        result = filter_files_after(all_files, max_file_number)
-        _logger.file_op("found", count=len(result), filtered_from=len(all_files))
+            result = all_files
+        else:
+            # 統一関数を使用してフィルタリング
+            result = filter_files_after(all_files, max_file_number)
+            _logger.file_op("found", count=len(result), filtered_from=len(all_files))
+
+        if self.record_signatures and detection_level == "loop" and result:
+            self._record_loop_signatures(result)
         return result
+
+    def _merge_pending(
+        self, files: List[Path], source_dir: Path, pattern: str, pending: Sequence[Path]
+    ) -> List[Path]:
+        """スキャン結果に、ソースディレクトリのパターンに合う書き込み中ファイルを加える"""
+        names = {f.name for f in files}
+        extra = [
+            f
+            for f in pending
+            if f.parent == source_dir and fnmatch(f.name, pattern) and f.name not in names
+        ]
+        return sorted(files + extra) if extra else files
+
+    def _record_loop_signatures(self, loop_files: List[Path]) -> None:
+        """
+        新規Loopの類似度スケッチを登録し、近似重複を警告
+
+        登録に失敗しても検出結果には影響させない。
+
+        Args:
+            loop_files: 新規Loopファイルのリスト
+        """
+        duplicates = self.signatures.record_loops(loop_files)
+        for loop_id, matches in duplicates.items():
+            log_warning(
+                f"{loop_id} は既存Loop {matches[0]['duplicate_of']} とほぼ同じ内容です"
+                f"（類似度 {matches[0]['similarity']}）"
+            )
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Loop Signature Recorder
+=======================
+
+loop_signatures.json（Loop本文の類似度スケッチと近似重複）の更新と検索を担当するモジュール。
+
+監視モードの新規Loop検出（FileDetector(record_signatures=True)）と、
+DigestAutoAnalyzer の近似重複の診断から更新される。
+登録済みのLoopはスケッチを計算し直さないため、一度計算したスケッチは次回以降も再利用される。
+
+Usage:
+    from application.shadow.loop_signatures import LoopSignatureRecorder
+
+    recorder = LoopSignatureRecorder(persistent_config_dir)
+    recorder.record_loops(new_files)  # {'L00186': [{'duplicate_of': 'L00120', ...}]}
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from domain.exceptions import EpisodicRAGError
+from domain.file_constants import LOOP_SIGNATURES_FILENAME
+from domain.indexed_provisional import extract_source_base_key
+from domain.near_duplicate import NearDuplicateIndex, compute_sketch
+from infrastructure import (
+    DerivedUpdate,
+    get_structured_logger,
+    log_warning,
+    save_json,
+    try_load_json,
+)
+from infrastructure.loop_archive import read_loop_bytes
+
+_logger = get_structured_logger(__name__)
+
+
+def sketch_loop_file(loop_file: Path) -> Optional[Tuple[int, List[int]]]:
+    """
+    Loopファイルの (SimHash, MinHash) を計算（読めない・空の場合はNone）
+
+    パック済みLoop（infrastructure.loop_archive）はパックから読む。
+
+    Example:
+        >>> simhash, minhash = sketch_loop_file(Path("Loops/L00186_test.txt"))
+    """
+    try:
+        text = read_loop_bytes(loop_file).decode("utf-8", errors="replace")
+    except (OSError, EpisodicRAGError) as e:
+        log_warning(f"Loopファイルを読み込めません: {loop_file.name}: {e}")
+        return None
+    if not text.strip():
+        return None
+    return compute_sketch(text)
+
+
+class LoopSignatureRecorder:
+    """loop_signatures.json 管理クラス"""
+
+    def __init__(self, index_dir: Path):
+        """
+        Args:
+            index_dir: loop_signatures.json を配置するディレクトリ
+                （last_digest_times.json と同じ永続化ディレクトリ）
+        """
+        self.index_file = index_dir / LOOP_SIGNATURES_FILENAME
+
+    def load(self) -> NearDuplicateIndex:
+        """
+        索引を読み込む（存在しない・壊れている場合は空）
+
+        Example:
+            >>> recorder.load().duplicates()
+            {'L00186': [{'duplicate_of': 'L00120', 'similarity': 0.92, ...}]}
+        """
+        data = try_load_json(self.index_file, default={}) or {}
+        return NearDuplicateIndex.from_dict(data)
+
+    def _register(
+        self, loop_files: Iterable[Path]
+    ) -> Tuple[NearDuplicateIndex, Dict[str, List[Dict[str, Any]]]]:
+        """未登録のLoopのスケッチを計算して索引に追加・保存し、(索引, 新規分の一致) を返す"""
+        index = self.load()
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        added = 0
+        for loop_file in loop_files:
+            loop_id = extract_source_base_key(loop_file.name)
+            if loop_id in index:
+                continue
+            sketch = sketch_loop_file(loop_file)
+            if sketch is None:
+                continue
+            matches = index.add(loop_id, *sketch)
+            added += 1
+            if matches:
+                found[loop_id] = matches
+        if not added:
+            return index, found
+        with DerivedUpdate(LOOP_SIGNATURES_FILENAME):
+            save_json(self.index_file, index.to_dict())
+        _logger.file_op("loop_signatures", added=added, near_duplicates=len(found))
+        return index, found
+
+    def record_loops(self, loop_files: Iterable[Path]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        新規Loopのスケッチを登録し、既存Loopとの近似重複を返す
+
+        登録済みのLoopは計算し直さない。
+
+        Args:
+            loop_files: Loopファイルのリスト
+
+        Returns:
+            Loop ID → 一致リスト（今回登録したLoopのうち重複が見つかったもののみ）
+
+        Example:
+            >>> recorder.record_loops([Path("Loops/L00186_test.txt")])
+            {'L00186': [{'duplicate_of': 'L00120', 'similarity': 0.92, 'simhash_distance': 2}]}
+        """
+        return self._register(loop_files)[1]
+
+    def check_loops(self, loop_files: Iterable[Path]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Loopの近似重複を返す（未登録のLoopはスケッチを計算して登録する）
+
+        登録済みのLoopは記録済みの結果を返す。計算したスケッチは保存するため、
+        同じLoopを次に診断するときは本文を読まない。
+
+        Example:
+            >>> recorder.check_loops(unprocessed_files)
+            {'L00187': [{'duplicate_of': 'L00186', 'similarity': 1.0, ...}]}
+        """
+        loop_files = list(loop_files)
+        index, _ = self._register(loop_files)
+        recorded = index.duplicates()
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        for loop_file in loop_files:
+            loop_id = extract_source_base_key(loop_file.name)
+            if recorded.get(loop_id):
+                found[loop_id] = recorded[loop_id]
+        return found
+
+
+__all__ = ["LoopSignatureRecorder", "sketch_loop_file"]
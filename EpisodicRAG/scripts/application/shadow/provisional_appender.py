@@ -23,12 +23,13 @@ Related Modules:
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from application.config import DigestConfig
 from domain.constants import LEVEL_CONFIG
+from domain.indexed_provisional import IndexedProvisional
 from domain.types import LevelConfigData, LevelHierarchyEntry, RegularDigestData
-from infrastructure import get_structured_logger, save_json, try_read_json_from_file
+from infrastructure import get_structured_logger, level_lock, save_json, try_read_json_from_file
 
 __all__ = ["ProvisionalAppender"]
 
@@ -62,6 +63,9 @@ class ProvisionalAppender:
         self.config = config
         self.level_hierarchy = level_hierarchy
         self.level_config = LEVEL_CONFIG
+        # 最後に保存したProvisionalごとの (保存後の stat, データ, 索引)。
+        # 連続したカスケードでファイルの再読み込みと索引の再構築を省く
+        self._cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any], IndexedProvisional]] = {}
 
     def _get_next_level(self, level: str) -> Optional[str]:
         """
@@ -155,6 +159,30 @@ class ProvisionalAppender:
             "individual_digests": [],
         }
 
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+        """ファイルの (mtime_ns, size)（存在しない場合はNone）"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_with_index(
+        self, provisional_path: Path, next_level: str
+    ) -> Tuple[Dict[str, Any], IndexedProvisional]:
+        """
+        Provisionalデータと索引を取得
+
+        前回このインスタンスが保存した後にファイルが変わっていなければ、
+        保持しているデータと索引をそのまま使う。
+        """
+        cached = self._cache.get(provisional_path)
+        if cached is not None and cached[0] == self._stat_key(provisional_path):
+            return cached[1], cached[2]
+        data = self._load_or_create_provisional(provisional_path, next_level)
+        return data, IndexedProvisional(data.get("individual_digests", []))
+
     def _build_individual_entry(self, finalized_digest: RegularDigestData) -> Dict[str, Any]:
         """
         確定ダイジェストから個別エントリを構築
@@ -190,31 +218,6 @@ class ProvisionalAppender:
             "impression": overall.get("impression", ""),
         }
 
-    def _is_duplicate(
-        self, individual_digests: List[Dict[str, Any]], new_entry: Dict[str, Any]
-    ) -> bool:
-        """
-        重複チェック
-
-        Args:
-            individual_digests: 既存のindividual_digestsリスト
-            new_entry: 追加しようとする新エントリ
-
-        Returns:
-            重複していればTrue
-        """
-        new_source_file = new_entry.get("source_file", "")
-        # プレフィックス+番号でマッチング (e.g., "W0053" の部分)
-        new_base = new_source_file.split("_")[0].replace(".txt", "")
-
-        for existing in individual_digests:
-            # 既存データは filename または source_file のどちらかを持つ可能性がある
-            existing_source_file = existing.get("source_file") or existing.get("filename", "")
-            existing_base = existing_source_file.split("_")[0].replace(".txt", "")
-            if new_base == existing_base:
-                return True
-        return False
-
     def append_to_next_provisional(self, level: str, finalized_digest: RegularDigestData) -> None:
         """
         次レベルのProvisionalに確定ダイジェストを追加
@@ -237,30 +240,36 @@ class ProvisionalAppender:
 
         _logger.info(f"次レベルProvisionalへの追加開始: {level} → {next_level}")
 
+        # 次レベルのProvisionalを更新する他の処理（save_provisional_digest等）と直列化
+        with level_lock(self.config.digests_path, next_level):
+            self._append_entry(next_level, finalized_digest)
+
+    def _append_entry(self, next_level: str, finalized_digest: RegularDigestData) -> None:
+        """次レベルのProvisionalに個別エントリを追加（レベルロックの中で呼ぶ）"""
         # Provisionalファイルのパスを取得
         provisional_path = self._find_or_create_provisional_path(next_level)
         _logger.info(f"Provisionalファイル: {provisional_path.name}")
 
-        # Provisionalデータを読み込みまたは作成
-        provisional_data = self._load_or_create_provisional(provisional_path, next_level)
+        # Provisionalデータと索引を読み込みまたは作成（前回保存から変わっていなければ再利用）
+        provisional_data, index = self._load_with_index(provisional_path, next_level)
 
         # 個別エントリを構築
         new_entry = self._build_individual_entry(finalized_digest)
         _logger.info(f"追加エントリ: {new_entry.get('filename', 'unknown')}")
 
-        # 重複チェック
-        individual_digests = provisional_data.get("individual_digests", [])
-        if self._is_duplicate(individual_digests, new_entry):
+        # 重複チェックと追加（ベースキー索引でO(1)判定）
+        if not index.append(new_entry):
             _logger.info(f"重複のためスキップ: {new_entry.get('filename', 'unknown')}")
             return
 
-        # 追加
-        individual_digests.append(new_entry)
-        provisional_data["individual_digests"] = individual_digests
+        provisional_data["individual_digests"] = index.to_list()
 
         # メタデータ更新
         provisional_data["metadata"]["last_updated"] = datetime.now().isoformat()
 
         # 保存
         save_json(provisional_path, provisional_data)
+        stat_key = self._stat_key(provisional_path)
+        if stat_key is not None:
+            self._cache[provisional_path] = (stat_key, provisional_data, index)
         _logger.info(f"Provisional追加完了: {provisional_path.name}")
@@ -24,9 +24,15 @@ Usage:
     # 読み込み（存在しなければ自動作成）
     data = shadow_io.load_or_create()
 
-    # 保存（タイムスタンプ自動更新）
+    # 保存（内容が変わった場合のみタイムスタンプを更新して書き込む）
     shadow_io.save(data)
 
+    # 読み込み → 変更 → 保存 は排他ロックの中で行う（他セッションの更新を失わない）
+    with shadow_io.locked():
+        data = shadow_io.load_or_create()
+        data["latest_digests"]["weekly"]["overall_digest"]["source_files"].append("x.txt")
+        shadow_io.save(data)
+
 Design Pattern:
     - Repository Pattern: ファイルI/Oの抽象化
     - Factory Pattern: テンプレート生成の遅延評価
@@ -41,13 +47,12 @@ Note:
     これにより循環参照を回避しつつ、必要時にのみテンプレートを生成。
 """
 
-from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Callable, ContextManager
 
 from domain.constants import LOG_PREFIX_FILE, LOG_PREFIX_STATE, LOG_PREFIX_VALIDATE
 from domain.types import ShadowDigestData, as_dict
-from infrastructure import load_json_with_template, log_debug, save_json
+from infrastructure import file_lock, load_json_with_template, log_debug, save_json_stamped
 
 
 class ShadowIO:
@@ -68,7 +73,11 @@ class ShadowIO:
         >>> shadow_io.save(data)
 
     Note:
-        save()時にmetadata.last_updatedが自動更新される。
+        save()は内容が変わった場合のみmetadata.last_updatedを更新して書き込む。
+        変更がなければファイルに触れない（git同期で差分が出ない）。
+
+        load_or_create()は共有ロック、save()は排他ロックの中で行う。
+        読み込みから保存までを1つの更新にするときは locked() の中で呼ぶ。
     """
 
     def __init__(self, shadow_digest_file: Path, template_factory: Callable[[], ShadowDigestData]):
@@ -98,32 +107,55 @@ class ShadowIO:
         log_debug(f"{LOG_PREFIX_FILE} load_or_create: {self.shadow_digest_file}")
         log_debug(f"{LOG_PREFIX_FILE} file_exists: {self.shadow_digest_file.exists()}")
 
-        result = load_json_with_template(
-            target_file=self.shadow_digest_file,
-            default_factory=self.template_factory,
-            log_message="ShadowGrandDigest.txt not found. Creating new file.",
-        )
+        # 存在しなければテンプレートから作成する（書き込む）ため排他ロック
+        with file_lock(self.shadow_digest_file, shared=self.shadow_digest_file.exists()):
+            result = load_json_with_template(
+                target_file=self.shadow_digest_file,
+                default_factory=self.template_factory,
+                log_message="ShadowGrandDigest.txt not found. Creating new file.",
+            )
 
         log_debug(f"{LOG_PREFIX_VALIDATE} loaded_data: keys={list(result.keys())}")
         return result
 
-    def save(self, data: ShadowDigestData) -> None:
+    def save(self, data: ShadowDigestData) -> bool:
         """
-        ShadowGrandDigestを保存
+        ShadowGrandDigestを保存（内容が変わった場合のみ）
 
         Args:
             data: 保存するデータ
 
+        Returns:
+            書き込んだ場合True（内容が同じならFalse、last_updatedも据え置き）
+
         Example:
             >>> data = shadow_io.load_or_create()
             >>> data["latest_digests"]["weekly"]["source_files"].append("new.txt")
-            >>> shadow_io.save(data)  # metadata.last_updatedが自動更新される
+            >>> shadow_io.save(data)  # metadata.last_updatedが更新される
+            True
         """
         log_debug(f"{LOG_PREFIX_FILE} save: {self.shadow_digest_file}")
         log_debug(f"{LOG_PREFIX_VALIDATE} data_keys: {list(data.keys())}")
 
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        log_debug(f"{LOG_PREFIX_STATE} updated_timestamp: {data['metadata']['last_updated']}")
-
         # Cast TypedDict to Dict for infrastructure compatibility
-        save_json(self.shadow_digest_file, as_dict(data))
+        with file_lock(self.shadow_digest_file):
+            written = save_json_stamped(self.shadow_digest_file, as_dict(data))
+        log_debug(
+            f"{LOG_PREFIX_STATE} written={written}, last_updated={data['metadata']['last_updated']}"
+        )
+        return written
+
+    def locked(self) -> ContextManager[None]:
+        """
+        ShadowGrandDigest.txt の排他ロック（読み込み → 変更 → 保存 を1つの更新にする）
+
+        Raises:
+            FileIOError: 制限時間内にロックを取れなかった場合
+
+        Example:
+            >>> with shadow_io.locked():
+            ...     data = shadow_io.load_or_create()
+            ...     data["latest_digests"]["weekly"]["source_files"].append("new.txt")
+            ...     shadow_io.save(data)
+        """
+        return file_lock(self.shadow_digest_file)
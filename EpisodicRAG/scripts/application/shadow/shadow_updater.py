@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from domain.types import LevelHierarchyEntry, OverallDigestData, RegularDigestData
-from infrastructure import get_structured_logger
+from infrastructure import bump_corpus_generation, get_structured_logger, level_lock
 
 from .cascade_processor import CascadeProcessor
 from .file_appender import FileAppender
@@ -184,11 +184,20 @@ class ShadowUpdater:
             - Shadowファイルが存在しない場合は自動作成
             - 追加後、Claude分析待ちのプレースホルダーが設定される
             - loop.last_processed が更新される（重複検出を防止）
+            - 処理時点のLoop内容のハッシュが loop_manifest.json に記録される
+            - weeklyのレベルロックの中で行う（weeklyの確定処理と直列化）
+            - 追加した場合はコーパスの世代を進める（クエリ結果キャッシュの無効化）
 
         Example:
             >>> updater.update_shadow_for_new_loops()
             # 新規Loopファイルがweekly Shadowに追加される
         """
+        # weeklyの確定処理（Shadowのクリア）と交錯して追加分を失わないよう直列化
+        with level_lock(self.file_detector.config.digests_path, "weekly"):
+            self._add_new_loops()
+
+    def _add_new_loops(self) -> None:
+        """新規Loopファイルをweekly Shadowに追加（weeklyのレベルロックの中で呼ぶ）"""
         # Shadowファイルを読み込み（存在しなければ作成）
         self.shadow_io.load_or_create()
 
@@ -206,9 +215,16 @@ class ShadowUpdater:
         # loop レベルの last_processed を更新（重複検出を防止）
         file_names = [f.name for f in new_files]
         self.file_detector.times_tracker.save("loop", file_names)
+        # 処理時点の内容を記録（処理後の編集を検出するため）
+        self.file_detector.loop_manifest.record_digested(new_files)
+        # タイムラインのLoopが増えたため、キャッシュ済みのクエリ結果を無効にする
+        bump_corpus_generation(self.file_detector.config.essences_path)
 
     def cascade_update_on_digest_finalize(
-        self, level: str, finalized_digest: Optional[RegularDigestData] = None
+        self,
+        level: str,
+        finalized_digest: Optional[RegularDigestData] = None,
+        new_files: Optional[List[Path]] = None,
     ) -> None:
         """
         ダイジェスト確定時のカスケード処理
@@ -219,6 +235,7 @@ class ShadowUpdater:
         Args:
             level: 確定したレベル（"weekly", "monthly"等）
             finalized_digest: 確定したRegularDigest（次レベルProvisional追加用）
+            new_files: 先読み済みの次レベルの新規ファイル（省略時はカスケード内で検出）
 
         Note:
             - 確定レベルのShadowはクリアされる
@@ -231,4 +248,6 @@ class ShadowUpdater:
             >>> updater.cascade_update_on_digest_finalize("weekly", finalized_digest)
             # weekly Shadowがクリアされ、W0042.txt が monthly Shadow/Provisional に追加される
         """
-        return self._cascade_processor.cascade_update_on_digest_finalize(level, finalized_digest)
+        return self._cascade_processor.cascade_update_on_digest_finalize(
+            level, finalized_digest, new_files
+        )
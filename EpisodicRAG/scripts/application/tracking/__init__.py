@@ -7,10 +7,19 @@ Tracking Package - Time tracking components
 
 Components:
     - DigestTimesTracker: last_digest_times.json 管理
+    - TimelineRecorder: timeline_index.json 管理
+    - LoopManifestRecorder: loop_manifest.json 管理
+    - PendingLoopsRecorder: pending_loops.json 管理
 """
 
 from .digest_times import DigestTimesTracker
+from .loop_manifest import LoopManifestRecorder
+from .pending_loops import PendingLoopsRecorder
+from .timeline import TimelineRecorder
 
 __all__ = [
     "DigestTimesTracker",
+    "TimelineRecorder",
+    "LoopManifestRecorder",
+    "PendingLoopsRecorder",
 ]
@@ -8,15 +8,26 @@ finalize_from_shadow.py から分離。
 """
 
 from datetime import datetime
-from typing import List, Optional, Union, cast
+from typing import List, Optional, Sequence, Union, cast
 
 from application.config import DigestConfig
+from application.tracking.timeline import TimelineRecorder
 from domain.constants import LEVEL_NAMES
 from domain.file_constants import DIGEST_TIMES_FILENAME, DIGEST_TIMES_TEMPLATE
-from domain.file_naming import extract_number_only, extract_numbers_formatted
+from domain.file_naming import (
+    extract_number_array,
+    extract_number_only,
+    extract_numbers_formatted,
+)
 from domain.types import DigestTimesData
 from domain.validators import is_valid_list
-from infrastructure import get_structured_logger, load_json_with_template, log_warning, save_json
+from infrastructure import (
+    file_lock,
+    get_structured_logger,
+    load_json_with_template,
+    log_warning,
+    save_json,
+)
 from infrastructure.config import get_persistent_config_dir
 from infrastructure.config.persistent_path import get_template_dir
 
@@ -30,6 +41,8 @@ class DigestTimesTracker:
         self.config = config
         # 永続化ディレクトリに保存（auto-update対象外）
         self.last_digest_file = get_persistent_config_dir() / DIGEST_TIMES_FILENAME
+        # タイムラインインデックスも同じ永続化ディレクトリに保存
+        self.timeline = TimelineRecorder(self.last_digest_file.parent)
         # テンプレートは.claude-plugin/ディレクトリから取得
         template_dir = get_template_dir()
         self.template_file = template_dir / DIGEST_TIMES_TEMPLATE if template_dir else None
@@ -48,12 +61,14 @@ class DigestTimesTracker:
             >>> "weekly" in data
             True
         """
-        return load_json_with_template(
-            target_file=self.last_digest_file,
-            template_file=self.template_file,
-            default_factory=self._get_default_template,
-            log_message="Initialized last_digest_times.json from template",
-        )
+        # 存在しなければテンプレートから作成する（書き込む）ため排他ロック
+        with file_lock(self.last_digest_file, shared=self.last_digest_file.exists()):
+            return load_json_with_template(
+                target_file=self.last_digest_file,
+                template_file=self.template_file,
+                default_factory=self._get_default_template,
+                log_message="Initialized last_digest_times.json from template",
+            )
 
     def extract_file_numbers(self, level: str, input_files: Optional[List[str]]) -> List[str]:
         """
@@ -96,44 +111,76 @@ class DigestTimesTracker:
         last_file_str = file_numbers[-1]
         return extract_number_only(last_file_str)
 
-    def _save_level_data(self, level: str, last_processed: Optional[int]) -> None:
+    def _extract_number_array(self, input_files: Optional[List[str]]) -> Sequence[int]:
+        """
+        ファイル名リストから番号を一括抽出（無効な入力は空）
+
+        Args:
+            input_files: ファイル名のリスト
+
+        Returns:
+            抽出できた番号の array（無効な入力は空リスト）
+        """
+        if not input_files or not is_valid_list(input_files):
+            if input_files is not None and not is_valid_list(input_files):
+                log_warning(f"input_files is not a list: {type(input_files).__name__}")
+            return []
+        return extract_number_array(input_files)[0]
+
+    def _save_level_data(self, level: str, last_processed: Optional[int]) -> str:
         """
         共通保存ロジック（内部用）
 
         Args:
             level: ダイジェストレベル
             last_processed: 最後に処理した番号（Noneも許容）
-        """
-        times = self.load_or_create()
-        times[level] = {
-            "timestamp": datetime.now().isoformat(),
-            "last_processed": last_processed,
-        }
-        save_json(self.last_digest_file, times)
 
-    def save(self, level: str, input_files: Optional[List[str]] = None) -> None:
+        Returns:
+            記録したタイムスタンプ（ISO形式）
+        """
+        timestamp = datetime.now().isoformat()
+        # 他セッションが更新した別レベルの値を失わないよう、読み込みから保存まで排他ロック
+        with file_lock(self.last_digest_file):
+            times = self.load_or_create()
+            times[level] = {
+                "timestamp": timestamp,
+                "last_processed": last_processed,
+            }
+            save_json(self.last_digest_file, times)
+        return timestamp
+
+    def save(
+        self,
+        level: str,
+        input_files: Optional[List[str]] = None,
+        numbers: Optional[Sequence[int]] = None,
+    ) -> None:
         """
         最終ダイジェスト生成時刻と最新処理済みファイル番号を保存
 
         Args:
             level: ダイジェストレベル
             input_files: 処理したファイル名のリスト（オプション）
+            numbers: input_files から抽出済みの番号（ShadowValidator.validate_shadow_content の
+                     戻り値など）。指定時はファイル名を再パースせずに最大値を記録する
 
         Example:
             >>> tracker = DigestTimesTracker(config)
-            >>> tracker.save("weekly", ["L00186.txt", "L00187.txt"])
-            # last_digest_times.json が更新される
+            >>> tracker.save("loop", ["L00186.txt", "L00187.txt"])
+            # last_digest_times.json と timeline_index.json が更新される
         """
         # 空リスト警告
         if input_files is not None and len(input_files) == 0:
             log_warning(f"入力ファイルリストが空です: レベル {level}")
 
-        # 連番抽出と最終番号取得
-        file_numbers = self.extract_file_numbers(level, input_files or [])
-        last_processed = self._extract_last_processed(file_numbers)
+        # 最終番号取得（抽出済みの番号がなければ1パスで一括抽出）
+        if numbers is None:
+            numbers = self._extract_number_array(input_files)
+        last_processed = max(numbers) if numbers else None
 
-        # 共通ロジックで保存
-        self._save_level_data(level, last_processed)
+        # 共通ロジックで保存し、同じ時刻でタイムラインにも記録
+        timestamp = self._save_level_data(level, last_processed)
+        self.timeline.record_sources(level, input_files or [], timestamp)
 
         _logger.info(f"last_digest_times.json更新完了: レベル {level}")
         if last_processed:
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Loop Manifest Recorder
+======================
+
+loop_manifest.json（Loopごとの stat・ハッシュ・処理時点のハッシュ）の更新と変更検出を担当するモジュール。
+
+ShadowUpdater がLoopを処理済みにした時点で record_digested() が呼ばれ、
+DigestAutoAnalyzer が毎回 find_modified() で処理後に編集されたLoopを調べる。
+stat が変わっていないLoopは読み込まないため、変更がなければファイルを開かずに終わる。
+パック済みLoop（Loops/.archive）はアーカイブのインデックスに保存された stat を使う。
+
+Usage:
+    from application.tracking import LoopManifestRecorder
+
+    recorder = LoopManifestRecorder(persistent_config_dir)
+    recorder.record_digested(new_loop_files)
+    recorder.find_modified(processed_loop_files)  # ['L00186_test.txt']
+"""
+
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from domain.exceptions import EpisodicRAGError
+from domain.file_constants import LOOP_MANIFEST_FILENAME
+from domain.loop_manifest import LoopManifest
+from infrastructure import DerivedUpdate, get_structured_logger, save_json, try_load_json
+from infrastructure.file_hashing import hash_bytes, hash_files
+from infrastructure.loop_archive import loop_stat, read_loop_bytes
+
+_logger = get_structured_logger(__name__)
+
+
+def _hash_archived(loop_file: Path) -> Optional[str]:
+    """ディスク上にないLoopをパックから読んでハッシュ（読めない場合はNone）"""
+    try:
+        return hash_bytes(read_loop_bytes(loop_file))
+    except (OSError, EpisodicRAGError):
+        return None
+
+
+class LoopManifestRecorder:
+    """loop_manifest.json 管理クラス"""
+
+    def __init__(self, index_dir: Path):
+        """
+        Args:
+            index_dir: loop_manifest.json を配置するディレクトリ
+                （last_digest_times.json と同じ永続化ディレクトリ）
+        """
+        self.manifest_file = index_dir / LOOP_MANIFEST_FILENAME
+
+    def load(self) -> LoopManifest:
+        """
+        マニフェストを読み込む（存在しない・壊れている場合は空）
+
+        Example:
+            >>> recorder.load().modified()
+            ['L00186_test.txt']
+        """
+        data = try_load_json(self.manifest_file, default={}) or {}
+        return LoopManifest.from_dict(data)
+
+    def _save(self, manifest: LoopManifest) -> None:
+        with DerivedUpdate(LOOP_MANIFEST_FILENAME):
+            save_json(self.manifest_file, manifest.to_dict())
+
+    def _refresh(self, manifest: LoopManifest, loop_files: Iterable[Path]) -> Tuple[int, int]:
+        """
+        stat が変わったLoopだけを並列に再ハッシュしてマニフェストに反映
+
+        Returns:
+            (確認したLoop数, 再ハッシュしたLoop数)
+        """
+        stale: List[Tuple[Path, int, int]] = []
+        checked = 0
+        for loop_file in loop_files:
+            stat = loop_stat(loop_file)
+            if stat is None:
+                continue
+            checked += 1
+            if manifest.needs_hash(loop_file.name, *stat):
+                stale.append((loop_file, *stat))
+        if not stale:
+            return checked, 0
+
+        hashed_at_ns = time.time_ns()
+        hashes = hash_files(path for path, _size, _mtime in stale)
+        for path, size, mtime_ns in stale:
+            content_hash = hashes.get(path) or _hash_archived(path)
+            if content_hash is not None:
+                manifest.update(path.name, size, mtime_ns, content_hash, hashed_at_ns)
+        return checked, len(stale)
+
+    def record_digested(self, loop_files: Iterable[Path]) -> None:
+        """
+        処理済みにしたLoopの現在の内容を基準として記録
+
+        Args:
+            loop_files: 処理済みにしたLoopファイル
+
+        Example:
+            >>> recorder.record_digested([Path("Loops/L00186_test.txt")])
+        """
+        files = list(loop_files)
+        if not files:
+            return
+        manifest = self.load()
+        self._refresh(manifest, files)
+        manifest.mark_digested(f.name for f in files)
+        self._save(manifest)
+
+    def prime(self, loop_files: Iterable[Path]) -> int:
+        """
+        未処理Loopの stat とハッシュを先に記録（処理時点の基準は変えない）
+
+        監視モードが新規Loopの到着時に呼び、record_digested() での再ハッシュを省く。
+
+        Returns:
+            ハッシュしたLoop数
+
+        Example:
+            >>> recorder.prime([Path("Loops/L00187_test.txt")])
+            1
+        """
+        files = list(loop_files)
+        if not files:
+            return 0
+        manifest = self.load()
+        _checked, rehashed = self._refresh(manifest, files)
+        if rehashed:
+            self._save(manifest)
+        return rehashed
+
+    def find_modified(
+        self, processed_files: Iterable[Path], pending_files: Iterable[Path] = ()
+    ) -> List[str]:
+        """
+        処理後に内容が変わったLoopを検出
+
+        stat が変わったLoopのみ再ハッシュする。マニフェスト導入前に処理された
+        Loop（基準が未記録）は現在の内容を基準として取り込む。
+        処理済み・未処理のどちらにもないLoopのエントリは削除する
+        （prime() で先に記録した未処理Loopのエントリは残る）。
+
+        Args:
+            processed_files: 処理済みのLoopファイル
+            pending_files: 未処理のLoopファイル（エントリを削除しない対象）
+
+        Returns:
+            変更されたLoopのファイル名（昇順）
+
+        Example:
+            >>> recorder.find_modified(sorted(loops_path.glob("L*.txt")))
+            ['L00186_test.txt']
+        """
+        files = list(processed_files)
+        manifest = self.load()
+        checked, rehashed = self._refresh(manifest, files)
+        adopted = manifest.mark_digested((f.name for f in files), only_missing=True)
+        existing = {f.name for f in files}
+        existing.update(f.name for f in pending_files)
+        pruned = manifest.prune(existing)
+        if rehashed or adopted or pruned:
+            self._save(manifest)
+        _logger.file_op("loop_manifest", checked=checked, rehashed=rehashed, adopted=len(adopted))
+        return manifest.modified()
+
+
+__all__ = ["LoopManifestRecorder"]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Pending Loops Recorder
+======================
+
+pending_loops.json（監視モードが準備した新規Loop検出結果）の保存と鮮度確認を担当するモジュール。
+
+IndexWarmer が新規Loopの到着時に検出結果を保存し、
+/digest Pattern 1（digest_entry）は結果が新しければLoopsディレクトリを走査せずに返す。
+
+結果は次の条件をすべて満たすときだけ使う（満たさなければ通常の検出にフォールバック）:
+
+- Loopsディレクトリのパスと mtime が保存時と同じ（Loopの追加・削除・改名・パックで変わる）
+- loop.last_processed が保存時と同じ（/digest で処理が進むと変わる）
+- ディレクトリの mtime が保存時刻より RACY_WINDOW_NS 以上前
+  （同じ mtime の刻みの中で追加されたLoopを見落とさないため）
+
+新規Loopの到着直後に保存した結果は3つ目の条件を満たさないため、
+IndexWarmer はその時間が過ぎた後に検出し直して保存し直す。
+
+Usage:
+    from application.tracking import PendingLoopsRecorder
+
+    recorder = PendingLoopsRecorder(persistent_config_dir)
+    recorder.fresh(loops_path, last_processed=186)  # ['L00187_test.txt'] or None
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from domain.file_constants import PENDING_LOOPS_FILENAME
+from domain.loop_manifest import RACY_WINDOW_NS
+from infrastructure import DerivedUpdate, get_structured_logger, save_json, try_load_json
+
+_logger = get_structured_logger(__name__)
+
+# 永続化形式のバージョン
+PENDING_LOOPS_FORMAT_VERSION = 1
+
+
+def _dir_mtime_ns(loops_path: Path) -> Optional[int]:
+    try:
+        return loops_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class PendingLoopsRecorder:
+    """pending_loops.json 管理クラス"""
+
+    def __init__(self, index_dir: Path):
+        """
+        Args:
+            index_dir: pending_loops.json を配置するディレクトリ
+                （last_digest_times.json と同じ永続化ディレクトリ）
+        """
+        self.pending_file = index_dir / PENDING_LOOPS_FILENAME
+
+    def save(
+        self,
+        loops_path: Path,
+        last_processed: Optional[int],
+        new_loops: List[str],
+        dir_mtime_ns: Optional[int],
+    ) -> None:
+        """
+        検出結果を保存
+
+        Args:
+            loops_path: Loopsディレクトリ
+            last_processed: 検出時の loop.last_processed
+            new_loops: 新規Loopのファイル名
+            dir_mtime_ns: 走査前に取得したLoopsディレクトリの mtime
+                （走査中の変更で結果が古くならないよう、走査の前に取得する）
+        """
+        data: Dict[str, Any] = {
+            "format_version": PENDING_LOOPS_FORMAT_VERSION,
+            "loops_path": str(loops_path),
+            "dir_mtime_ns": dir_mtime_ns,
+            "last_processed": last_processed,
+            "prepared_at_ns": time.time_ns(),
+            "new_loops": new_loops,
+        }
+        with DerivedUpdate(PENDING_LOOPS_FILENAME):
+            save_json(self.pending_file, data)
+
+    def fresh(self, loops_path: Path, last_processed: Optional[int]) -> Optional[List[str]]:
+        """
+        保存済みの検出結果が現在も有効なら返す
+
+        Args:
+            loops_path: Loopsディレクトリ
+            last_processed: 現在の loop.last_processed
+
+        Returns:
+            新規Loopのファイル名（結果がない・古い場合はNone）
+
+        Example:
+            >>> recorder.fresh(config.loops_path, last_processed=186)
+            ['L00187_test.txt']
+        """
+        data = try_load_json(self.pending_file, default={}, log_on_error=False) or {}
+        if data.get("format_version") != PENDING_LOOPS_FORMAT_VERSION:
+            return None
+        mtime_ns = _dir_mtime_ns(loops_path)
+        stale = (
+            data.get("loops_path") != str(loops_path)
+            or data.get("last_processed") != last_processed
+            or mtime_ns is None
+            or data.get("dir_mtime_ns") != mtime_ns
+            or mtime_ns >= int(data.get("prepared_at_ns", 0)) - RACY_WINDOW_NS
+        )
+        if stale:
+            _logger.decision("pending_loops", fresh=False)
+            return None
+        _logger.decision("pending_loops", fresh=True, count=len(data.get("new_loops", [])))
+        return [str(name) for name in data.get("new_loops", [])]
+
+
+__all__ = ["PENDING_LOOPS_FORMAT_VERSION", "PendingLoopsRecorder"]
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Timeline Recorder
+=================
+
+timeline_index.json（時刻 → Loop/ダイジェスト）の更新と検索を担当するモジュール。
+
+DigestTimesTracker.save（Loop追加時）と
+DigestPersistence.save_regular_digest（ダイジェスト確定時）から更新される。
+
+Usage:
+    from application.tracking import DigestTimesTracker
+
+    tracker = DigestTimesTracker(config)
+    tracker.timeline.query("2025-03-01", "2025-03-31")
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from domain.constants import LEVEL_CONFIG, SOURCE_TYPE_LOOPS
+from domain.file_constants import TIMELINE_INDEX_FILENAME
+from domain.indexed_provisional import extract_source_base_key
+from domain.timeline_index import TimelineIndex
+from domain.types import RegularDigestData
+from infrastructure import get_structured_logger, try_load_json, update_json_index
+
+_logger = get_structured_logger(__name__)
+
+
+class TimelineRecorder:
+    """timeline_index.json 管理クラス"""
+
+    def __init__(self, index_dir: Path):
+        """
+        Args:
+            index_dir: timeline_index.json を配置するディレクトリ
+                （last_digest_times.json と同じ永続化ディレクトリ）
+        """
+        self.index_file = index_dir / TIMELINE_INDEX_FILENAME
+
+    def load(self) -> TimelineIndex:
+        """
+        インデックスを読み込む（存在しない・壊れている場合は空）
+
+        Example:
+            >>> recorder.load().query("2025-03-01", "2025-03-31")
+            {'loop': ['L00186', 'L00187'], 'weekly': ['W0042']}
+        """
+        data = try_load_json(self.index_file, default={}) or {}
+        return TimelineIndex.from_dict(data)
+
+    def record_sources(
+        self, level: str, file_names: List[str], timestamp: Optional[str] = None
+    ) -> None:
+        """
+        ソースファイル（通常はLoop）を記録
+
+        Args:
+            level: レベル名（loop等）
+            file_names: ファイル名のリスト（例: ["L00186_タイトル.txt"]）
+            timestamp: 記録時刻（省略時は現在時刻）
+
+        Example:
+            >>> recorder.record_sources("loop", ["L00186.txt", "L00187.txt"])
+        """
+        if not file_names:
+            return
+        recorded_at = timestamp or datetime.now().isoformat()
+
+        def record(index: TimelineIndex) -> None:
+            for file_name in file_names:
+                index.record(level, extract_source_base_key(file_name), recorded_at)
+
+        update_json_index(self.index_file, TimelineIndex.from_dict, record)
+
+    def record_digest(
+        self, level: str, digest_name: str, regular_digest: RegularDigestData
+    ) -> None:
+        """
+        確定したダイジェストを記録
+
+        期間の開始はソースファイルの最も早い開始時刻、終了は確定時刻。
+
+        Args:
+            level: ダイジェストレベル
+            digest_name: ダイジェスト名（例: "W0042_2025年11月第4週"）
+            regular_digest: 確定したRegularDigest
+
+        Example:
+            >>> recorder.record_digest("weekly", "W0042_第4週", regular_digest)
+        """
+        overall = regular_digest.get("overall_digest") or {}
+        timestamp = str(overall.get("timestamp") or datetime.now().isoformat())
+        source_level = str(LEVEL_CONFIG[level]["source"])
+        if source_level == SOURCE_TYPE_LOOPS:
+            source_level = "loop"
+        source_ids = [extract_source_base_key(str(f)) for f in overall.get("source_files", [])]
+        digest_id = extract_source_base_key(digest_name)
+
+        def record(index: TimelineIndex) -> None:
+            start = index.earliest_start(source_level, source_ids)
+            index.record(level, digest_id, timestamp, start=start)
+
+        if update_json_index(self.index_file, TimelineIndex.from_dict, record) is None:
+            return
+        _logger.info(f"timeline_index.json更新: {level} {digest_name}")
+
+    def query(self, range_start: str, range_end: str) -> Dict[str, List[str]]:
+        """
+        期間と重なるLoop/ダイジェストをレベル別に取得
+
+        Args:
+            range_start: 期間開始（例: "2025-03-01"）
+            range_end: 期間終了（例: "2025-03-31"、日付のみならその日を含む）
+
+        Returns:
+            レベル名 → IDリスト
+
+        Example:
+            >>> recorder.query("2025-03-01", "2025-03-31")
+            {'loop': ['L00186', 'L00187'], 'weekly': ['W0042']}
+        """
+        return self.load().query(range_start, range_end)
+
+
+__all__ = ["TimelineRecorder"]
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Watch Package - Background index warming
+========================================
+
+監視モード（interfaces.digest_watch）でLoops・Digestsの変化を派生インデックスに反映する
+コンポーネント
+
+Components:
+    - IndexWarmer: 変化したファイルに応じた検出結果・インデックスの事前更新
+"""
+
+from .index_warmer import IndexWarmer
+
+__all__ = ["IndexWarmer"]
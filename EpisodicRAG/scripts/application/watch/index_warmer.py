@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Index Warmer
+============
+
+Loops・Digests の変化を受けて、/digest 実行前に派生データを更新しておくモジュール。
+
+新規Loopが届いたとき:
+    - FileDetector.find_new_files("weekly") で検出し、類似度スケッチを登録
+    - loop_manifest.json に stat とハッシュを記録（LoopManifestRecorder.prime）
+    - 検出結果を pending_loops.json に保存（/digest Pattern 1 が走査せずに返す）
+    - Loopsディレクトリの mtime が RACY_WINDOW_NS 以内だった結果は信頼されないため、
+      その時間が過ぎたら検出し直す（rewarm_delay() / rewarm_if_due()）
+
+RegularDigestが書き込まれたとき:
+    - hierarchy_index.json / keyword_rollup.json に反映（内容が同じなら書き込まない）
+    - digest_vectors にまだ行がないダイジェストだけベクトル化
+      （確定時に記録済みの行を置き換えて墓標を増やさないため）
+    - 反映したダイジェストがあればコーパス世代を進め、キャッシュ済みのクエリ結果を無効にする
+
+どの更新も失敗は各Recorderの警告のみで、監視は止めない（infrastructure.derived_data）。
+
+Usage:
+    from application.watch import IndexWarmer
+
+    warmer = IndexWarmer(DigestConfig())
+    warmer.handle({config.loops_path / "L00187_test.txt"})
+    # {'new_loops': ['L00187_test.txt'], 'digests': []}
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, cast
+
+from application.config import DigestConfig
+from application.finalize import DigestVectorRecorder, HierarchyRecorder, KeywordRollupRecorder
+from application.shadow import FileDetector
+from application.tracking import DigestTimesTracker, PendingLoopsRecorder
+from domain.constants import DIGEST_FILE_EXTENSION, DIGEST_LEVEL_NAMES
+from domain.indexed_provisional import extract_source_base_key
+from domain.loop_manifest import RACY_WINDOW_NS
+from domain.types import RegularDigestData
+from infrastructure import bump_corpus_generation, get_structured_logger, try_load_json
+
+_logger = get_structured_logger(__name__)
+
+
+class IndexWarmer:
+    """監視モードの事前更新処理"""
+
+    def __init__(self, config: DigestConfig):
+        """
+        Args:
+            config: DigestConfig インスタンス
+        """
+        self.config = config
+        times_tracker = DigestTimesTracker(config)
+        # 類似度スケッチは監視プロセスで先に計算しておく（/digest の検出では計算しない）
+        self.detector = FileDetector(config, times_tracker, record_signatures=True)
+        self.pending = PendingLoopsRecorder(times_tracker.last_digest_file.parent)
+        self.hierarchy = HierarchyRecorder(config.digests_path)
+        self.keyword_rollup = KeywordRollupRecorder(config.digests_path)
+        self.vectors = DigestVectorRecorder(config.digests_path)
+        self._level_dirs: Dict[Path, str] = {
+            config.get_level_dir(level): level for level in DIGEST_LEVEL_NAMES
+        }
+        # 保存した検出結果が信頼できるようになる時刻（time.time_ns()、不要ならNone）
+        self._rewarm_at_ns: Optional[int] = None
+
+    @property
+    def watch_roots(self) -> List[Path]:
+        """監視対象のディレクトリ（Loops と Digests）"""
+        return [self.config.loops_path, self.config.digests_path]
+
+    def warm_loops(self) -> List[str]:
+        """
+        新規Loopを検出し、スケッチ・マニフェスト・検出結果を更新
+
+        Returns:
+            新規Loopのファイル名
+        """
+        loops_path = self.config.loops_path
+        try:
+            dir_mtime_ns: Optional[int] = loops_path.stat().st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+        last_processed = self.detector.get_max_file_number("loop")
+        new_files = self.detector.find_new_files("weekly")
+        self.detector.loop_manifest.prime(new_files)
+        new_loops = [f.name for f in new_files]
+        # 保存時刻（prepared_at_ns）より前に取得し、保存した結果が信頼されない場合を漏らさない
+        saved_at_ns = time.time_ns()
+        self.pending.save(loops_path, last_processed, new_loops, dir_mtime_ns)
+        if dir_mtime_ns is not None and dir_mtime_ns >= saved_at_ns - RACY_WINDOW_NS:
+            self._rewarm_at_ns = dir_mtime_ns + RACY_WINDOW_NS + 1
+        else:
+            self._rewarm_at_ns = None
+        return new_loops
+
+    def rewarm_delay(self) -> Optional[float]:
+        """
+        検出し直すまでの秒数（不要ならNone）
+
+        直前の検出がLoopsディレクトリの変更直後だった場合、
+        pending_loops.json は RACY_WINDOW_NS が過ぎるまで使われないため、
+        その後に検出し直して信頼できる結果に置き換える。
+
+        Example:
+            >>> warmer.rewarm_delay()
+            1.84
+        """
+        if self._rewarm_at_ns is None:
+            return None
+        return max(self._rewarm_at_ns - time.time_ns(), 0) / 1e9
+
+    def rewarm_if_due(self) -> Optional[List[str]]:
+        """
+        検出し直す時刻を過ぎていれば warm_loops() を実行
+
+        Returns:
+            新規Loopのファイル名（まだ時刻前・不要の場合はNone）
+        """
+        delay = self.rewarm_delay()
+        if delay is None or delay > 0:
+            return None
+        return self.warm_loops()
+
+    def _digest_level(self, path: Path) -> Optional[str]:
+        if path.suffix != DIGEST_FILE_EXTENSION:
+            return None
+        return self._level_dirs.get(path.parent)
+
+    def warm_digests(self, digest_files: Iterable[Path]) -> List[str]:
+        """
+        RegularDigestを派生インデックスに反映
+
+        Args:
+            digest_files: 変化したファイル（レベルディレクトリ直下の .txt 以外は無視）
+
+        Returns:
+            反映したダイジェストのファイル名
+        """
+        warmed = []
+        store = None
+        for path in sorted(digest_files):
+            level = self._digest_level(path)
+            if level is None:
+                continue
+            data = try_load_json(path, log_on_error=False)
+            if not isinstance(data, dict):
+                continue
+            self.hierarchy.record_digest(path.name, cast(RegularDigestData, data))
+            self.keyword_rollup.record_digest(level, path.name, data)
+            if store is None:
+                store = self.vectors.load()
+            if store.vector_of(extract_source_base_key(path.name)) is None:
+                self.vectors.record_digest(path.name, data)
+            warmed.append(path.name)
+        if warmed:
+            bump_corpus_generation(self.config.essences_path)
+        return warmed
+
+    def _all_digest_files(self) -> List[Path]:
+        return [
+            path
+            for level_dir in self._level_dirs
+            if level_dir.is_dir()
+            for path in level_dir.glob(f"*{DIGEST_FILE_EXTENSION}")
+        ]
+
+    def handle(self, changed: Iterable[Path]) -> Dict[str, List[str]]:
+        """
+        変化したパスに応じて事前更新を実行
+
+        監視ルート自体が含まれる場合（イベント溢れ）はルート全体を対象にする。
+
+        Args:
+            changed: 変化したパス（DirectoryWatcher.poll の結果）
+
+        Returns:
+            {"new_loops": 新規Loop, "digests": 反映したダイジェスト}
+        """
+        loops_path = self.config.loops_path
+        digests_path = self.config.digests_path
+        loops_changed = False
+        digest_files: List[Path] = []
+        for path in changed:
+            if path == loops_path or loops_path in path.parents:
+                loops_changed = True
+            elif path == digests_path:
+                digest_files.extend(self._all_digest_files())
+            elif digests_path in path.parents:
+                digest_files.append(path)
+
+        result: Dict[str, List[str]] = {"new_loops": [], "digests": []}
+        if loops_changed:
+            result["new_loops"] = self.warm_loops()
+        if digest_files:
+            result["digests"] = self.warm_digests(set(digest_files))
+        if loops_changed or result["digests"]:
+            _logger.state(
+                "index_warmer",
+                new_loops=len(result["new_loops"]),
+                digests=len(result["digests"]),
+            )
+        return result
+
+    def warm_all(self) -> Dict[str, List[str]]:
+        """
+        Loops・Digests 全体を対象に事前更新を実行（監視開始時・--once 用）
+        """
+        return self.handle(self.watch_roots)
+
+
+__all__ = ["IndexWarmer"]
@@ -86,13 +86,18 @@ from domain.file_constants import (
 # File naming utilities
 from domain.file_naming import (
     extract_file_number,
+    extract_number_array,
     extract_number_only,
     extract_numbers_formatted,
     filter_files_after,
     find_max_number,
     format_digest_number,
+    is_consecutive_numbers,
 )
 
+# Indexed provisional model
+from domain.indexed_provisional import IndexedProvisional, extract_source_base_key
+
 # Level registry (Strategy pattern for OCP)
 # Note: LevelMetadata and LevelBehavior are defined in separate files for SRP
 # but re-exported from level_registry for backward compatibility
@@ -202,6 +207,11 @@ __all__ = [
     "find_max_number",
     "filter_files_after",
     "extract_numbers_formatted",
+    "extract_number_array",
+    "is_consecutive_numbers",
+    # Indexed provisional model
+    "IndexedProvisional",
+    "extract_source_base_key",
     # Types - Metadata
     "BaseMetadata",
     "DigestMetadata",
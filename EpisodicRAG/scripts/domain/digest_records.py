@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Digest Records
+==============
+
+コーパス全体を走査する処理向けの、省メモリなRegularDigest読み取りモデル。
+
+## 設計意図
+
+派生インデックスの再構築や検索インデックス作成では全RegularDigestを読むが、
+dictのまま保持すると、ダイジェストごとにフィールド名のキーと
+同じキーワード文字列の複製が並び、ディスク上のサイズを大きく超えてメモリを使う。
+
+- OverallRecord / IndividualRecord は __slots__ のクラスでインスタンスdictを持たない
+- keywords と digest_type は sys.intern で共有し、同じ文字列を1つにまとめる
+- abstract / impression の長文は遅延読み込み。loader を渡して作ったレコードは
+  本文を保持せず、初めて参照したときに loader で読み直す（release_text() で再び解放）
+
+domain/types の TypedDict（OverallDigestData / IndividualDigestData）は
+ファイル形式の定義として引き続き使い、このモデルは読み取り専用のビューに限る。
+abstract / impression は long 版のみを保持する（extract_long_value と同じ値）。
+
+Usage:
+    from domain.digest_records import DigestRecord
+
+    record = DigestRecord.from_dict("weekly", "W0042_第4週.txt", data)
+    record.overall.keywords  # ('MCP', 'API')
+    record.overall.abstract  # '...'
+"""
+
+import sys
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+from domain.indexed_provisional import extract_source_base_key
+from domain.text_utils import extract_long_value
+
+# 遅延読み込み用のloader（RegularDigest全体を返す）
+DigestLoader = Callable[[], Mapping[str, Any]]
+
+# (abstract, impression)
+_Text = Tuple[str, str]
+
+
+def intern_keywords(keywords: Optional[Iterable[Any]]) -> Tuple[str, ...]:
+    """
+    キーワードを intern した文字列のタプルに変換
+
+    Example:
+        >>> intern_keywords(["MCP", "API"])
+        ('MCP', 'API')
+    """
+    return tuple(sys.intern(str(k)) for k in keywords or ())
+
+
+def _entry_text(entry: Mapping[str, Any]) -> _Text:
+    return (
+        extract_long_value(entry.get("abstract")),
+        extract_long_value(entry.get("impression")),
+    )
+
+
+class _EntryRecord:
+    """OverallRecord / IndividualRecord 共通の本文アクセス"""
+
+    __slots__ = ("digest_type", "keywords", "_text", "_owner")
+
+    def __init__(self, owner: "DigestRecord", entry: Mapping[str, Any], keep_text: bool):
+        self._owner = owner
+        self.digest_type = sys.intern(str(entry.get("digest_type") or ""))
+        self.keywords = intern_keywords(entry.get("keywords"))
+        self._text: Optional[_Text] = _entry_text(entry) if keep_text else None
+
+    def _materialized(self) -> _Text:
+        if self._text is None:
+            self._owner.materialize()
+        return self._text or ("", "")
+
+    @property
+    def abstract(self) -> str:
+        """abstract（long版）"""
+        return self._materialized()[0]
+
+    @property
+    def impression(self) -> str:
+        """impression（long版）"""
+        return self._materialized()[1]
+
+    @property
+    def text_loaded(self) -> bool:
+        """本文が読み込み済みか"""
+        return self._text is not None
+
+
+class OverallRecord(_EntryRecord):
+    """
+    overall_digest の読み取りモデル
+
+    Attributes:
+        timestamp: 確定時刻（ISO形式、未設定なら空文字）
+        source_files: ソースファイル名のタプル
+        digest_type / keywords: intern 済みの文字列
+    """
+
+    __slots__ = ("timestamp", "source_files")
+
+    def __init__(self, owner: "DigestRecord", entry: Mapping[str, Any], keep_text: bool):
+        super().__init__(owner, entry, keep_text)
+        self.timestamp = str(entry.get("timestamp") or "")
+        self.source_files = tuple(str(f) for f in entry.get("source_files") or ())
+
+
+class IndividualRecord(_EntryRecord):
+    """
+    individual_digests の各要素の読み取りモデル
+
+    Attributes:
+        source_file: ソースファイル名
+        digest_type / keywords: intern 済みの文字列
+    """
+
+    __slots__ = ("source_file",)
+
+    def __init__(self, owner: "DigestRecord", entry: Mapping[str, Any], keep_text: bool):
+        super().__init__(owner, entry, keep_text)
+        self.source_file = str(entry.get("source_file") or "")
+
+
+class DigestRecord:
+    """
+    RegularDigest 1件の読み取りモデル
+
+    Example:
+        >>> record = DigestRecord.from_dict("weekly", "W0001_a.txt", {
+        ...     "overall_digest": {"keywords": ["MCP"], "abstract": "要約"},
+        ...     "individual_digests": [{"source_file": "L00001_x.txt"}],
+        ... })
+        >>> record.digest_id, record.overall.keywords, record.overall.abstract
+        ('W0001', ('MCP',), '要約')
+        >>> record.source_ids()
+        []
+    """
+
+    __slots__ = ("level", "name", "overall", "individuals", "_loader")
+
+    def __init__(self, level: str, name: str, loader: Optional[DigestLoader] = None):
+        self.level = sys.intern(level)
+        self.name = name
+        self._loader = loader
+        self.overall: OverallRecord
+        self.individuals: Tuple[IndividualRecord, ...] = ()
+
+    @classmethod
+    def from_dict(
+        cls,
+        level: str,
+        name: str,
+        data: Mapping[str, Any],
+        loader: Optional[DigestLoader] = None,
+    ) -> "DigestRecord":
+        """
+        RegularDigestのdictからレコードを作成
+
+        Args:
+            level: ダイジェストレベル
+            name: ダイジェストのファイル名またはダイジェスト名
+            data: RegularDigest
+            loader: 本文の遅延読み込みに使う関数。指定した場合、本文は保持しない
+        """
+        record = cls(level, name, loader)
+        keep_text = loader is None
+        record.overall = OverallRecord(record, data.get("overall_digest") or {}, keep_text)
+        record.individuals = tuple(
+            IndividualRecord(record, entry, keep_text)
+            for entry in data.get("individual_digests") or []
+        )
+        return record
+
+    @property
+    def digest_id(self) -> str:
+        """ダイジェストのベースキー（例: "W0042"）"""
+        return extract_source_base_key(self.name)
+
+    def source_ids(self) -> List[str]:
+        """overall_digest.source_files のベースキーのリスト"""
+        return [extract_source_base_key(f) for f in self.overall.source_files]
+
+    def entries(self) -> Iterable[_EntryRecord]:
+        """overall → individuals の順に全エントリを列挙"""
+        yield self.overall
+        yield from self.individuals
+
+    def materialize(self) -> None:
+        """
+        loader で本文を読み直し、全エントリの abstract / impression を埋める
+
+        読み直したダイジェストの individual_digests は source_file で対応付ける。
+        loader がない場合、または対応する要素がない場合は空文字になる。
+        """
+        data: Mapping[str, Any] = self._loader() if self._loader is not None else {}
+        self.overall._text = _entry_text(data.get("overall_digest") or {})
+        by_source = {
+            str(entry.get("source_file") or ""): entry
+            for entry in data.get("individual_digests") or []
+        }
+        for individual in self.individuals:
+            individual._text = _entry_text(by_source.get(individual.source_file, {}))
+
+    def release_text(self) -> None:
+        """読み込んだ本文を解放（loader がない場合は何もしない）"""
+        if self._loader is None:
+            return
+        for entry in self.entries():
+            entry._text = None
+
+
+__all__ = [
+    "DigestLoader",
+    "DigestRecord",
+    "IndividualRecord",
+    "OverallRecord",
+    "intern_keywords",
+]
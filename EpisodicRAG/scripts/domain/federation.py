@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Federation
+==========
+
+複数のEpisodicRAGストアにまたがる検索結果の統合（スコアの大域正規化とマージ）。
+
+## 設計意図
+
+各ストアのTF-IDFは自分のコーパスの文書頻度でIDFを決めるため、
+ストアごとに作ったクエリベクトルのコサイン類似度はそのまま比べられない
+（小さいストアほど珍しい語のIDFが高くなり、スコアが膨らむ）。
+
+フェデレーション検索は2段階で行う:
+
+1. 各ストアの文書頻度と文書数を集め、merge_term_stats() で合算する
+2. 合算した統計で作った同じクエリベクトルで各ストアを検索し、
+   merge_ranked() で全ストアの最大スコアを1.0とする尺度にそろえて順位付けする
+
+Usage:
+    from domain.federation import merge_ranked, merge_term_stats
+
+    df, n_docs = merge_term_stats([(df_a, 120), (df_b, 40)])
+    merge_ranked({"local": [("W0042", 0.61)], "projA": [("W0007", 0.43)]}, k=10)
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+
+def merge_term_stats(stats: Iterable[Tuple[Sequence[int], int]]) -> Tuple[List[int], int]:
+    """
+    ストアごとの (文書頻度, 文書数) を合算
+
+    Example:
+        >>> merge_term_stats([([1, 0, 2], 3), ([0, 1, 1], 2)])
+        ([1, 1, 3], 5)
+    """
+    merged: List[int] = []
+    n_docs = 0
+    for df, count in stats:
+        if len(merged) < len(df):
+            merged.extend([0] * (len(df) - len(merged)))
+        for i, value in enumerate(df):
+            merged[i] += value
+        n_docs += count
+    return merged, n_docs
+
+
+def merge_ranked(
+    per_store: Mapping[str, Sequence[Tuple[str, float]]], k: int
+) -> List[Dict[str, Any]]:
+    """
+    ストアごとの (ID, スコア) を大域正規化して上位k件にまとめる
+
+    score は全ストアを通じた最大スコアを1.0とした値、raw_score は元のコサイン類似度。
+    同点はストア名・ID の順。
+
+    Example:
+        >>> merge_ranked({"local": [("W1", 0.6)], "projA": [("W7", 0.3)]}, k=2)
+        [{'store': 'local', 'id': 'W1', 'score': 1.0, 'raw_score': 0.6},
+         {'store': 'projA', 'id': 'W7', 'score': 0.5, 'raw_score': 0.3}]
+    """
+    hits = [
+        (store, row_id, score)
+        for store, ranked in per_store.items()
+        for row_id, score in ranked
+        if score > 0
+    ]
+    if not hits or k <= 0:
+        return []
+    top_score = max(score for _store, _row_id, score in hits)
+    hits.sort(key=lambda hit: (-hit[2], hit[0], hit[1]))
+    return [
+        {
+            "store": store,
+            "id": row_id,
+            "score": round(score / top_score, 6),
+            "raw_score": score,
+        }
+        for store, row_id, score in hits[:k]
+    ]
+
+
+__all__ = ["merge_ranked", "merge_term_stats"]
@@ -52,6 +52,45 @@ CONFIG_FILENAME = "config.json"
 DIGEST_TIMES_FILENAME = "last_digest_times.json"
 """ダイジェスト生成時刻記録ファイル名"""
 
+CONFIG_SNAPSHOT_FILENAME = "config.snapshot.json"
+"""解決済み設定スナップショット（キャッシュ）ファイル名"""
+
+TIMELINE_INDEX_FILENAME = "timeline_index.json"
+"""時刻 → Loop/ダイジェストのタイムラインインデックスファイル名"""
+
+HIERARCHY_INDEX_FILENAME = "hierarchy_index.json"
+"""ダイジェスト親子隣接インデックスファイル名（Digestsディレクトリ直下）"""
+
+KEYWORD_ROLLUP_FILENAME = "keyword_rollup.json"
+"""キーワード集計ファイル名（Digestsディレクトリ直下）"""
+
+KEYWORD_ROLLUP_DIGESTS_FILENAME = "keyword_rollup_digests.json"
+"""キーワード集計に使ったダイジェストごとの寄与（再確定時の差し引き用、Digestsディレクトリ直下）"""
+
+LOOP_SIGNATURES_FILENAME = "loop_signatures.json"
+"""Loop類似度スケッチ（近似重複検出用）ファイル名"""
+
+LOOP_MANIFEST_FILENAME = "loop_manifest.json"
+"""Loopごとの stat・内容ハッシュのマニフェスト（処理後の変更検出用）ファイル名"""
+
+DIGEST_VECTORS_FILENAME = "digest_vectors.f32"
+"""ダイジェストTF-IDFベクトル行列ファイル名（Digestsディレクトリ直下、行 → IDは同名の.json）"""
+
+PENDING_LOOPS_FILENAME = "pending_loops.json"
+"""監視モードが準備した新規Loop検出結果（/digest Pattern 1 用）ファイル名"""
+
+GRAND_HISTORY_FILENAME = "GrandDigest.history.jsonl"
+"""GrandDigestの版履歴（キーフレーム + 差分の追記専用ログ、Essencesディレクトリ直下）ファイル名"""
+
+CORPUS_GENERATION_FILENAME = "corpus_generation.json"
+"""コーパスの世代カウンタ（書き込みのたびに増える、Essencesディレクトリ直下）ファイル名"""
+
+QUERY_CACHE_FILENAME = "query_cache.json"
+"""クエリ結果キャッシュの永続化層（Essencesディレクトリ直下）ファイル名"""
+
+SENTENCE_INDEX_DIRNAME = ".sentences"
+"""文境界オフセットのインデックス（文書ごとに1ファイル、Digestsディレクトリ直下）ディレクトリ名"""
+
 
 # =============================================================================
 # ディレクトリ名
@@ -69,6 +108,12 @@ ESSENCES_DIR_NAME = "Essences"
 LOOPS_DIR_NAME = "Loops"
 """Loops（会話ログ格納）ディレクトリ名"""
 
+LOOP_ARCHIVE_DIR_NAME = ".archive"
+"""古いLoopを格納するパックファイルのディレクトリ名（Loopsディレクトリ直下）"""
+
+LOOP_ARCHIVE_INDEX_FILENAME = "index.json"
+"""Loopファイル名 → パック内オフセットの中央インデックスファイル名（アーカイブディレクトリ直下）"""
+
 PROVISIONALS_SUBDIR = "Provisionals"
 """仮ダイジェスト格納サブディレクトリ名"""
 
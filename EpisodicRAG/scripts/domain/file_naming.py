@@ -23,9 +23,16 @@ pytest使用時はconftest.pyのreset_all_singletons() fixtureが自動的にリ
     from domain.file_naming import reset_registry
     reset_registry()
 
+## 一括抽出
+
+多数のsource_filesを検証する場合は extract_number_array() を使う。
+プレフィックスの正規表現はコンパイル済みのものを使い回し、
+番号は array に詰めて返す（NumPyが利用可能なら連番判定をベクトル化する）。
+
 Usage:
     from domain.file_naming import extract_file_number, format_digest_number
     from domain.file_naming import find_max_number, filter_files_after
+    from domain.file_naming import extract_number_array, is_consecutive_numbers
 
 Note:
     このモジュールはLevelRegistryProtocolを使用してOCP (Open/Closed Principle) を実現。
@@ -33,12 +40,22 @@ Note:
     Protocol経由の依存関係逆転により、循環インポートを解消。
 """
 
+import functools
 import re
+from array import array
 from pathlib import Path
 from typing import List, Optional, Sequence, Tuple, Union
 
 from domain.protocols import LevelRegistryProtocol
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+# 一括抽出した番号を格納する array の型コード（64bit符号付き整数）
+NUMBER_ARRAY_TYPECODE = "q"
+
 # Registry インスタンス（set_registry()で設定、未設定時は遅延インポートでフォールバック）
 _registry_instance: Optional[LevelRegistryProtocol] = None
 
@@ -100,6 +117,12 @@ def _get_registry() -> LevelRegistryProtocol:
     return get_level_registry()
 
 
+@functools.lru_cache(maxsize=32)
+def _number_regex(prefix_pattern: str) -> "re.Pattern[str]":
+    """プレフィックスパターンから番号抽出用の正規表現をコンパイル（パターンごとに1回）"""
+    return re.compile(rf"({prefix_pattern})(\d+)")
+
+
 def extract_file_number(
     filename: object,
     registry: Optional[LevelRegistryProtocol] = None,
@@ -132,9 +155,7 @@ def extract_file_number(
 
     # Registry経由で動的にプレフィックスパターンを取得
     reg = registry if registry is not None else _get_registry()
-    pattern = reg.build_prefix_pattern()
-
-    match = re.search(rf"({pattern})(\d+)", filename)
+    match = _number_regex(reg.build_prefix_pattern()).search(filename)
     if match:
         return (match.group(1), int(match.group(2)))
 
@@ -317,8 +338,90 @@ def extract_numbers_formatted(
     return sorted(numbers)
 
 
+def extract_number_array(
+    files: Sequence[object],
+    registry: Optional[LevelRegistryProtocol] = None,
+) -> Tuple["array[int]", List[int]]:
+    """
+    ファイル名リストから番号を1パスで一括抽出
+
+    プレフィックスの正規表現はレジストリから1回だけ組み立て、
+    全ファイル名に同じコンパイル済みパターンを適用する。
+
+    Args:
+        files: ファイル名のリスト（非str要素は抽出失敗として扱う）
+        registry: オプショナルなLevelRegistryProtocol（DIによるテスト容易化）
+                  未指定時はグローバルシングルトンを使用
+
+    Returns:
+        (numbers, invalid_indices) のタプル
+        - numbers: 抽出できた番号の array（入力順、型コード NUMBER_ARRAY_TYPECODE）
+        - invalid_indices: 抽出できなかった要素のインデックス（昇順）
+
+    Examples:
+        >>> numbers, invalid = extract_number_array(["L00186_a.txt", "x.txt", "L00187_b.txt"])
+        >>> numbers.tolist(), invalid
+        ([186, 187], [1])
+    """
+    reg = registry if registry is not None else _get_registry()
+    search = _number_regex(reg.build_prefix_pattern()).search
+
+    numbers: "array[int]" = array(NUMBER_ARRAY_TYPECODE)
+    append = numbers.append
+    invalid_indices: List[int] = []
+    for i, filename in enumerate(files):
+        match = search(filename) if isinstance(filename, str) else None
+        if match is None:
+            invalid_indices.append(i)
+        else:
+            append(int(match.group(2)))
+    return numbers, invalid_indices
+
+
+def is_consecutive_numbers(numbers: Sequence[int]) -> bool:
+    """
+    番号列が（並べ替えたときに）重複なしの連番かを判定
+
+    NumPyが利用可能なら隣接差分をベクトル化して計算し、
+    入力が既に昇順なら並べ替えを省略する。
+    未インストール環境では最小値・最大値・重複の有無から判定する。
+
+    Args:
+        numbers: 番号列（ソート済みである必要はない）
+
+    Returns:
+        連番の場合True（要素数1以下もTrue）
+
+    Examples:
+        >>> is_consecutive_numbers(array("q", [3, 1, 2]))
+        True
+        >>> is_consecutive_numbers([1, 2, 2, 3])
+        False
+    """
+    count = len(numbers)
+    if count <= 1:
+        return True
+
+    if np is not None:
+        if isinstance(numbers, array) and numbers.typecode == NUMBER_ARRAY_TYPECODE:
+            values = np.frombuffer(numbers, dtype=np.int64)
+        else:
+            values = np.asarray(numbers, dtype=np.int64)
+        steps = np.diff(values)
+        if bool((steps == 1).all()):
+            return True
+        if bool((steps > 0).all()):
+            return False  # 昇順だが欠番がある
+        return bool((np.diff(np.sort(values)) == 1).all())
+
+    return max(numbers) - min(numbers) == count - 1 and len(set(numbers)) == count
+
+
 __all__ = [
+    "NUMBER_ARRAY_TYPECODE",
     "extract_file_number",
+    "extract_number_array",
+    "is_consecutive_numbers",
     "extract_number_only",
     "format_digest_number",
     "find_max_number",
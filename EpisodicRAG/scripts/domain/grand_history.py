@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Grand History
+=============
+
+GrandDigest.txt の major_digests の版を、キーフレームと差分の列として扱うドメインモデル。
+
+## 設計意図
+
+GrandDigestManager.update_digest は各レベルの overall_digest をその場で
+上書きするため、過去の最上位記憶は git の履歴を遡らないと見られなかった。
+
+履歴は追記専用の記録の列で、各記録は次のどちらか:
+
+- キーフレーム: その時点の major_digests 全体
+- 差分: 直前の版から変わったレベルと、その overall_digest の変わったフィールド
+
+過去の版は、その時刻以前で最も近いキーフレームから差分を順に適用して復元する。
+キーフレームは KEYFRAME_INTERVAL 件ごとに挟むため、復元で適用する差分は高々その件数。
+
+各記録は適用後の状態のハッシュを持つ。GrandDigest.txt が履歴の外で
+書き換えられた（手編集・git pull 等）場合、直前の版のハッシュが最後の記録と
+一致しないため、差分ではなくキーフレームを書いて履歴を合わせ直す。
+
+Usage:
+    from domain.grand_history import apply_level_deltas, diff_major_digests
+
+    delta = diff_major_digests(previous, current)
+    # {'weekly': {'set': {'name': 'W0002_...', 'keywords': [...]}}}
+    apply_level_deltas(previous, delta)  # previous == current
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any, Dict
+
+# 履歴の記録形式のバージョン
+HISTORY_FORMAT_VERSION = 1
+
+# キーフレームを挟む間隔（直前のキーフレームからの差分の件数）
+KEYFRAME_INTERVAL = 32
+
+# 記録の種類
+RECORD_KEYFRAME = "key"
+RECORD_DELTA = "delta"
+
+# レベル1件分の差分（キー: set / unset / entry / drop）
+LevelDelta = Dict[str, Any]
+
+
+def state_hash(major_digests: Dict[str, Any]) -> str:
+    """
+    major_digests の内容のハッシュ（キーの順序によらない）
+
+    Example:
+        >>> state_hash({"weekly": {"overall_digest": None}})
+        '6bc3264b10df0dcc'
+    """
+    canonical = json.dumps(major_digests, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _diff_entry(previous: Any, current: Any) -> LevelDelta:
+    """レベルのエントリ1件の差分（overall_digest 同士ならフィールド単位）"""
+    if (
+        isinstance(previous, dict)
+        and isinstance(current, dict)
+        and previous.keys() == current.keys() == {"overall_digest"}
+        and isinstance(previous["overall_digest"], dict)
+        and isinstance(current["overall_digest"], dict)
+    ):
+        old, new = previous["overall_digest"], current["overall_digest"]
+        delta: LevelDelta = {}
+        changed = {key: value for key, value in new.items() if old.get(key, ...) != value}
+        removed = [key for key in old if key not in new]
+        if changed:
+            delta["set"] = changed
+        if removed:
+            delta["unset"] = removed
+        return delta
+    return {"entry": current}
+
+
+def diff_major_digests(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, LevelDelta]:
+    """
+    2つの major_digests の差分を、変わったレベルだけについて返す
+
+    Args:
+        previous: 直前の major_digests
+        current: 新しい major_digests
+
+    Returns:
+        レベル名 → 差分。overall_digest 同士の変更は
+        {"set": {フィールド: 新しい値}, "unset": [消えたフィールド]}、
+        それ以外（None からの初回確定など）は {"entry": 新しいエントリ}、
+        レベルが消えた場合は {"drop": True}
+
+    Example:
+        >>> diff_major_digests(
+        ...     {"weekly": {"overall_digest": {"name": "W0001", "keywords": ["a"]}}},
+        ...     {"weekly": {"overall_digest": {"name": "W0002", "keywords": ["a"]}}},
+        ... )
+        {'weekly': {'set': {'name': 'W0002'}}}
+    """
+    delta: Dict[str, LevelDelta] = {}
+    for level, entry in current.items():
+        if level not in previous:
+            delta[level] = {"entry": entry}
+        elif previous[level] != entry:
+            delta[level] = _diff_entry(previous[level], entry)
+    for level in previous:
+        if level not in current:
+            delta[level] = {"drop": True}
+    return delta
+
+
+def apply_level_deltas(major_digests: Dict[str, Any], delta: Dict[str, LevelDelta]) -> None:
+    """
+    差分を major_digests に適用（その場で書き換える）
+
+    差分に含まれる値は複製してから入れるため、適用後に差分を書き換えても影響しない。
+
+    Example:
+        >>> state = {"weekly": {"overall_digest": {"name": "W0001"}}}
+        >>> apply_level_deltas(state, {"weekly": {"set": {"name": "W0002"}}})
+        >>> state
+        {'weekly': {'overall_digest': {'name': 'W0002'}}}
+    """
+    for level, change in delta.items():
+        if change.get("drop"):
+            major_digests.pop(level, None)
+        elif "entry" in change:
+            major_digests[level] = copy.deepcopy(change["entry"])
+        else:
+            overall = dict(major_digests[level]["overall_digest"])
+            overall.update(copy.deepcopy(change.get("set", {})))
+            for key in change.get("unset", []):
+                overall.pop(key, None)
+            major_digests[level] = {"overall_digest": overall}
+
+
+__all__ = [
+    "HISTORY_FORMAT_VERSION",
+    "KEYFRAME_INTERVAL",
+    "LevelDelta",
+    "RECORD_DELTA",
+    "RECORD_KEYFRAME",
+    "apply_level_deltas",
+    "diff_major_digests",
+    "state_hash",
+]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Hierarchy Index
+===============
+
+ダイジェスト階層の親子隣接インデックス（ダイジェストID → ソースID、およびその逆）。
+
+## 設計意図
+
+上位ダイジェスト（Centurial, Decadal等）から元のLoopまで辿るには、
+各レベルのRegularDigestを開いて source_files を再帰的に読む必要があった。
+
+このモデルは確定時に親 → 子と子 → 親の両方向のマップを維持し、
+「L01234を含むMonthly/Quarterly/Annualはどれか」を
+ファイルを開かずに辿れるようにする。走査はジェネレータで遅延評価する。
+
+IDはファイル名のベースキー（例: "L01234", "W0042", "M012"）。
+
+Usage:
+    from domain.hierarchy_index import HierarchyIndex
+
+    index = HierarchyIndex.from_dict(data)
+    index.link("W0042", ["L01234", "L01235"])
+    list(index.iter_ancestors("L01234"))  # ['W0042', 'M011', ...]
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Set
+
+# 永続化形式のバージョン
+HIERARCHY_FORMAT_VERSION = 1
+
+
+class HierarchyIndex:
+    """
+    親子隣接インデックス
+
+    Example:
+        >>> index = HierarchyIndex()
+        >>> index.link("W0001", ["L00001", "L00002"])
+        >>> index.link("M001", ["W0001"])
+        >>> index.parents_of("L00001")
+        ['W0001']
+        >>> list(index.iter_ancestors("L00001"))
+        ['W0001', 'M001']
+        >>> list(index.iter_descendants("M001"))
+        ['W0001', 'L00001', 'L00002']
+    """
+
+    def __init__(self) -> None:
+        self._children: Dict[str, List[str]] = {}
+        self._parents: Dict[str, List[str]] = {}
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._children or node_id in self._parents
+
+    def link(self, parent_id: str, child_ids: Iterable[str]) -> None:
+        """
+        親の子リストを設定（既存のリンクは置き換え）
+
+        同じダイジェストを再確定した場合に古い逆リンクが残らないよう、
+        以前の子から親への参照を先に取り除く。
+
+        Args:
+            parent_id: ダイジェストID（例: "W0042"）
+            child_ids: ソースID（例: ["L01234", "L01235"]）
+        """
+        for old_child in self._children.get(parent_id, []):
+            parents = self._parents.get(old_child, [])
+            if parent_id in parents:
+                parents.remove(parent_id)
+                if not parents:
+                    del self._parents[old_child]
+
+        children = list(dict.fromkeys(child_ids))
+        self._children[parent_id] = children
+        for child in children:
+            self._parents.setdefault(child, []).append(parent_id)
+
+    def children_of(self, node_id: str) -> List[str]:
+        """
+        直接の子（ソース）IDを取得
+
+        Example:
+            >>> index.children_of("W0001")
+            ['L00001', 'L00002']
+        """
+        return list(self._children.get(node_id, []))
+
+    def parents_of(self, node_id: str) -> List[str]:
+        """
+        直接の親（このIDをソースに含むダイジェスト）IDを取得
+
+        Example:
+            >>> index.parents_of("W0001")
+            ['M001']
+        """
+        return list(self._parents.get(node_id, []))
+
+    def _walk(self, start: str, edges: Dict[str, List[str]]) -> Iterator[str]:
+        """幅優先で遅延走査（開始ノード自身は含まない、各ノードは1回のみ）"""
+        seen: Set[str] = {start}
+        queue: Deque[str] = deque(edges.get(start, []))
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            yield node
+            queue.extend(edges.get(node, []))
+
+    def iter_ancestors(self, node_id: str) -> Iterator[str]:
+        """
+        祖先（上位ダイジェスト）を近い順に遅延列挙
+
+        Example:
+            >>> next(index.iter_ancestors("L00001"))
+            'W0001'
+        """
+        return self._walk(node_id, self._parents)
+
+    def iter_descendants(self, node_id: str) -> Iterator[str]:
+        """
+        子孫（下位ダイジェスト・Loop）を近い順に遅延列挙
+
+        Example:
+            >>> [d for d in index.iter_descendants("M001") if d.startswith("L")]
+            ['L00001', 'L00002']
+        """
+        return self._walk(node_id, self._children)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """永続化用の辞書に変換（逆方向は読み込み時に再構築）"""
+        return {"format_version": HIERARCHY_FORMAT_VERSION, "children": self._children}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HierarchyIndex":
+        """
+        永続化された辞書から復元（形式が合わない場合は空のインデックス）
+        """
+        index = cls()
+        if data.get("format_version") != HIERARCHY_FORMAT_VERSION:
+            return index
+        for parent_id, child_ids in data.get("children", {}).items():
+            if isinstance(child_ids, list):
+                index.link(parent_id, [str(c) for c in child_ids])
+        return index
+
+
+__all__ = [
+    "HierarchyIndex",
+    "HIERARCHY_FORMAT_VERSION",
+]
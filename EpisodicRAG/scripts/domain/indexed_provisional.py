@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Indexed Provisional Model
+=========================
+
+Provisionalのindividual_digestsを、source_fileのベースキー → 位置 の
+インデックス付きで保持するドメインモデル。
+
+## 設計意図
+
+ProvisionalAppender._is_duplicate と DigestMerger.merge は、
+追加のたびに全エントリを走査・再検証していたため、
+エントリ数が数百件に達する上位レベルでは追加処理が二乗オーダーになる。
+
+このモデルはキー → 位置のマップを増分的に維持し、
+重複判定・置換をO(1)で行う。検証は呼び出し側が新規エントリにのみ適用する。
+
+Usage:
+    from domain.indexed_provisional import IndexedProvisional
+
+    index = IndexedProvisional(existing_digests)
+    if index.append(new_entry):
+        save(index.to_list())
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from domain.constants import DIGEST_FILE_EXTENSION
+
+# エントリからキーを導出する関数の型
+KeyFunc = Callable[[Dict[str, Any]], str]
+
+# 新規エントリ検証関数の型（entry, index）
+EntryValidator = Callable[[Any, int], None]
+
+
+def get_entry_source_file(entry: Dict[str, Any]) -> str:
+    """
+    エントリのソースファイル名を取得
+
+    既存データは source_file または filename のどちらかを持つ可能性がある。
+
+    Args:
+        entry: individual_digestエントリ
+
+    Returns:
+        ソースファイル名（どちらもなければ空文字列）
+
+    Example:
+        >>> get_entry_source_file({"filename": "W0053_タイトル.txt"})
+        'W0053_タイトル.txt'
+    """
+    return str(entry.get("source_file") or entry.get("filename", ""))
+
+
+def extract_source_base_key(source_file: str) -> str:
+    """
+    source_fileからベースキー（プレフィックス+番号）を抽出
+
+    タイトル部分や拡張子の違いを無視して同一ソースを判定するために使用。
+
+    Args:
+        source_file: ソースファイル名（例: "W0053_タイトル.txt"）
+
+    Returns:
+        ベースキー（例: "W0053"）
+
+    Example:
+        >>> extract_source_base_key("W0053_タイトル.txt")
+        'W0053'
+        >>> extract_source_base_key("L00186.txt")
+        'L00186'
+    """
+    return source_file.split("_")[0].replace(DIGEST_FILE_EXTENSION, "")
+
+
+def source_base_key(entry: Dict[str, Any]) -> str:
+    """
+    エントリのベースキーを取得（デフォルトのキー関数）
+
+    Example:
+        >>> source_base_key({"source_file": "L00186_test.txt"})
+        'L00186'
+    """
+    return extract_source_base_key(get_entry_source_file(entry))
+
+
+class IndexedProvisional:
+    """
+    キー → 位置インデックス付きのindividual_digestsコンテナ
+
+    エントリの順序を保持しつつ、重複判定と置換を定数時間で行う。
+    同一キーのエントリが既存リスト内に複数ある場合は、最初の位置を採用する。
+
+    Attributes:
+        key_func: エントリからキーを導出する関数
+
+    Example:
+        >>> index = IndexedProvisional([{"source_file": "W0001_a.txt"}])
+        >>> index.contains({"source_file": "W0001_b.txt"})
+        True
+        >>> index.append({"source_file": "W0002_c.txt"})
+        True
+        >>> len(index)
+        2
+    """
+
+    def __init__(
+        self,
+        entries: Optional[Iterable[Dict[str, Any]]] = None,
+        key_func: KeyFunc = source_base_key,
+    ) -> None:
+        """
+        Args:
+            entries: 初期エントリ（既存Provisionalのindividual_digests）
+            key_func: エントリからキーを導出する関数（デフォルト: ベースキー）
+        """
+        self.key_func = key_func
+        self._entries: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        for entry in entries or []:
+            self._entries.append(entry)
+            self._positions.setdefault(self.key_func(entry), len(self._entries) - 1)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._entries)
+
+    def position_of(self, key: str) -> Optional[int]:
+        """
+        キーに対応するエントリの位置を取得
+
+        Example:
+            >>> IndexedProvisional([{"source_file": "L00001.txt"}]).position_of("L00001")
+            0
+        """
+        return self._positions.get(key)
+
+    def contains(self, entry: Dict[str, Any]) -> bool:
+        """
+        同一キーのエントリが既に存在するか判定
+
+        Example:
+            >>> index.contains({"source_file": "W0053_別タイトル.txt"})
+            True
+        """
+        return self.key_func(entry) in self._positions
+
+    def append(self, entry: Dict[str, Any]) -> bool:
+        """
+        エントリを追加（同一キーが存在する場合はスキップ）
+
+        Returns:
+            追加した場合True、重複でスキップした場合False
+
+        Example:
+            >>> index.append({"source_file": "W0054_タイトル.txt"})
+            True
+        """
+        key = self.key_func(entry)
+        if key in self._positions:
+            return False
+        self._positions[key] = len(self._entries)
+        self._entries.append(entry)
+        return True
+
+    def upsert(self, entry: Dict[str, Any]) -> bool:
+        """
+        エントリを追加、同一キーが存在する場合は同じ位置で置換
+
+        Returns:
+            既存エントリを置換した場合True、新規追加の場合False
+
+        Example:
+            >>> index.upsert({"source_file": "L00001.txt", "keywords": ["new"]})
+            True
+        """
+        key = self.key_func(entry)
+        position = self._positions.get(key)
+        if position is None:
+            self._positions[key] = len(self._entries)
+            self._entries.append(entry)
+            return False
+        self._entries[position] = entry
+        return True
+
+    def upsert_all(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        validator: Optional[EntryValidator] = None,
+    ) -> List[str]:
+        """
+        複数エントリを順にupsert（検証は新規エントリにのみ適用）
+
+        Args:
+            entries: 追加するエントリ
+            validator: 各エントリに適用する検証関数（entry, index）
+
+        Returns:
+            置換されたエントリのキーのリスト
+
+        Raises:
+            ValidationError: validatorが検証失敗を報告した場合
+
+        Example:
+            >>> index.upsert_all(new_digests, validator=validate_individual_digest)
+            ['L00001']
+        """
+        replaced: List[str] = []
+        for i, entry in enumerate(entries):
+            if validator is not None:
+                validator(entry, i)
+            if self.upsert(entry):
+                replaced.append(self.key_func(entry))
+        return replaced
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        エントリのリストを返す（挿入順を保持したコピー）
+
+        Example:
+            >>> index.to_list()
+            [{"source_file": "W0001_a.txt"}, ...]
+        """
+        return list(self._entries)
+
+
+__all__ = [
+    "IndexedProvisional",
+    "extract_source_base_key",
+    "get_entry_source_file",
+    "source_base_key",
+]
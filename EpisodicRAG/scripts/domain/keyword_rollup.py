@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Keyword Rollup
+==============
+
+確定済みダイジェストのkeywordsを、レベル別・期間別に集計した
+マテリアライズドビュー（キーワード出現数と共起数）。
+
+## 設計意図
+
+「トピックXが四半期ごとに何回出てきたか」に答えるには、
+全RegularDigestを開いてkeywordsを数える必要があった。
+
+このモデルはダイジェスト確定ごとに増分更新され、
+クエリは集計済みの数値だけを参照する。
+
+- counts: keyword → level → 月（YYYY-MM）→ そのキーワードを含むダイジェスト数
+- pairs: keyword → 共起keyword → 同じダイジェストに現れた回数（キーワードごとに上位
+  MAX_COOCCURRING 件まで）
+- digests: ダイジェストID → 集計に使った (level, period, keywords)
+
+to_dict() は参照用のビュー（counts と pairs）だけを返し、
+digests は digests_to_dict() で別に永続化する（クエリ時には読まない）。
+digests を渡して復元すれば、同じダイジェストを再確定しても
+前回分を差し引いてから加算でき、二重計上しない。
+期間は月単位で保持し、四半期・年への集約はクエリ時に行う。
+
+共起数はキーワードごとに MAX_COOCCURRING 件までの Space-Saving で保持する。
+共起キーワードがその件数以下なら正確な値、超えた場合は最小のものを置き換え、
+新しいキーワードは置き換えた値 + 1 から数える（過大評価の上限は置き換えた値）。
+集計ファイルの大きさはダイジェスト数ではなくキーワード数に比例する。
+
+Usage:
+    from domain.keyword_rollup import KeywordRollup
+
+    rollup = KeywordRollup.from_dict(data)
+    rollup.record("weekly", "W0042", "2025-03", ["MCP", "API"])
+    rollup.trend("MCP", granularity="quarter")  # {'2025-Q1': 1}
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 永続化形式のバージョン（2: 共起数を上位のみ保持し、digests を別ファイルへ分離）
+KEYWORD_ROLLUP_FORMAT_VERSION = 2
+
+# キーワードごとに保持する共起キーワードの上限
+MAX_COOCCURRING = 50
+
+# 期間の集約単位
+GRANULARITIES = ("month", "quarter", "year")
+
+
+def period_of(timestamp: str) -> str:
+    """
+    ISO形式のタイムスタンプから月単位の期間キーを取得
+
+    Example:
+        >>> period_of("2025-03-15T10:00:00")
+        '2025-03'
+    """
+    return timestamp[:7]
+
+
+def bucket_period(period: str, granularity: str) -> str:
+    """
+    月単位の期間キーを指定粒度に集約
+
+    Example:
+        >>> bucket_period("2025-03", "quarter")
+        '2025-Q1'
+        >>> bucket_period("2025-03", "year")
+        '2025'
+    """
+    if granularity == "year":
+        return period[:4]
+    if granularity == "quarter":
+        month = int(period[5:7]) if period[5:7].isdigit() else 1
+        return f"{period[:4]}-Q{(month - 1) // 3 + 1}"
+    return period
+
+
+def _normalize_keywords(keywords: Iterable[Any]) -> List[str]:
+    """空要素を除き、前後の空白を落として重複を除去（順序保持）"""
+    cleaned = (str(k).strip() for k in keywords if k is not None)
+    return list(dict.fromkeys(k for k in cleaned if k))
+
+
+def _add_partner(partners: Dict[str, int], other: str) -> None:
+    """共起数を1加算（上限に達していれば最小の共起キーワードを置き換える）"""
+    if other in partners or len(partners) < MAX_COOCCURRING:
+        partners[other] = partners.get(other, 0) + 1
+        return
+    victim = min(partners, key=lambda name: (partners[name], name))
+    partners[other] = partners.pop(victim) + 1
+
+
+def _remove_partner(partners: Dict[str, int], other: str) -> None:
+    """共起数を1減算（置き換え済みで保持していない場合は何もしない）"""
+    if other not in partners:
+        return
+    partners[other] -= 1
+    if partners[other] <= 0:
+        del partners[other]
+
+
+class KeywordRollup:
+    """
+    キーワード集計ビュー
+
+    Example:
+        >>> rollup = KeywordRollup()
+        >>> rollup.record("weekly", "W0001", "2025-01", ["MCP", "API"])
+        >>> rollup.record("weekly", "W0002", "2025-04", ["MCP"])
+        >>> rollup.trend("MCP", granularity="quarter")
+        {'2025-Q1': 1, '2025-Q2': 1}
+        >>> rollup.cooccurring("MCP")
+        [('API', 1)]
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[str, Dict[str, Any]] = {}
+        self._counts: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._pairs: Dict[str, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def _apply(self, level: str, period: str, keywords: List[str], delta: int) -> None:
+        """1ダイジェスト分の寄与を加算（delta=1）または減算（delta=-1）"""
+        for keyword in keywords:
+            by_period = self._counts.setdefault(keyword, {}).setdefault(level, {})
+            by_period[period] = by_period.get(period, 0) + delta
+            if by_period[period] <= 0:
+                del by_period[period]
+                if not by_period:
+                    del self._counts[keyword][level]
+                    if not self._counts[keyword]:
+                        del self._counts[keyword]
+            partners = self._pairs.setdefault(keyword, {})
+            for other in keywords:
+                if other == keyword:
+                    continue
+                if delta > 0:
+                    _add_partner(partners, other)
+                else:
+                    _remove_partner(partners, other)
+            if not partners:
+                del self._pairs[keyword]
+
+    def record(self, level: str, digest_id: str, period: str, keywords: Iterable[Any]) -> None:
+        """
+        ダイジェストのkeywordsを集計に反映（同一IDの前回分は置き換え）
+
+        Args:
+            level: ダイジェストレベル
+            digest_id: ダイジェストID（例: "W0042"）
+            period: 月単位の期間キー（例: "2025-03"）
+            keywords: ダイジェストのkeywords
+        """
+        previous = self._digests.pop(digest_id, None)
+        if previous is not None:
+            self._apply(previous["level"], previous["period"], previous["keywords"], -1)
+
+        normalized = _normalize_keywords(keywords)
+        self._digests[digest_id] = {"level": level, "period": period, "keywords": normalized}
+        self._apply(level, period, normalized, 1)
+
+    def trend(
+        self, keyword: str, level: Optional[str] = None, granularity: str = "month"
+    ) -> Dict[str, int]:
+        """
+        キーワードの期間別出現数（期間昇順）
+
+        Args:
+            keyword: 対象キーワード
+            level: 対象レベル（Noneなら全レベル合計）
+            granularity: 集約単位（month, quarter, year）
+
+        Returns:
+            期間キー → そのキーワードを含むダイジェスト数
+        """
+        totals: Dict[str, int] = {}
+        for lvl, by_period in self._counts.get(keyword.strip(), {}).items():
+            if level is not None and lvl != level:
+                continue
+            for period, count in by_period.items():
+                bucket = bucket_period(period, granularity)
+                totals[bucket] = totals.get(bucket, 0) + count
+        return dict(sorted(totals.items()))
+
+    def top_keywords(self, level: Optional[str] = None, k: int = 10) -> List[Tuple[str, int]]:
+        """
+        出現数上位のキーワード（同数はキーワード昇順）
+
+        Example:
+            >>> rollup.top_keywords(level="weekly", k=1)
+            [('MCP', 2)]
+        """
+        totals: List[Tuple[str, int]] = []
+        for keyword, by_level in self._counts.items():
+            count = sum(
+                sum(by_period.values())
+                for lvl, by_period in by_level.items()
+                if level is None or lvl == level
+            )
+            if count > 0:
+                totals.append((keyword, count))
+        return heapq.nsmallest(k, totals, key=lambda t: (-t[1], t[0]))
+
+    def cooccurring(self, keyword: str, k: int = 10) -> List[Tuple[str, int]]:
+        """
+        同じダイジェストに現れたキーワードの上位k件
+
+        Example:
+            >>> rollup.cooccurring("MCP", k=5)
+            [('API', 1)]
+        """
+        partners = self._pairs.get(keyword.strip(), {})
+        return heapq.nsmallest(k, partners.items(), key=lambda t: (-t[1], t[0]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """参照用のビュー（counts と pairs）を永続化用の辞書に変換"""
+        return {
+            "format_version": KEYWORD_ROLLUP_FORMAT_VERSION,
+            "counts": self._counts,
+            "pairs": self._pairs,
+        }
+
+    def digests_to_dict(self) -> Dict[str, Any]:
+        """ダイジェストごとの寄与を永続化用の辞書に変換（ビューとは別に保存する）"""
+        return {"format_version": KEYWORD_ROLLUP_FORMAT_VERSION, "digests": self._digests}
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], digests: Optional[Dict[str, Any]] = None
+    ) -> "KeywordRollup":
+        """
+        永続化された辞書から復元（形式が合わない場合は空の集計）
+
+        Args:
+            data: to_dict() の結果
+            digests: digests_to_dict() の結果（record() で再確定を差し引く場合に渡す）
+        """
+        rollup = cls()
+        if data.get("format_version") != KEYWORD_ROLLUP_FORMAT_VERSION:
+            return rollup
+        rollup._counts = dict(data.get("counts", {}))
+        rollup._pairs = dict(data.get("pairs", {}))
+        if digests and digests.get("format_version") == KEYWORD_ROLLUP_FORMAT_VERSION:
+            rollup._digests = dict(digests.get("digests", {}))
+        return rollup
+
+
+__all__ = [
+    "KeywordRollup",
+    "KEYWORD_ROLLUP_FORMAT_VERSION",
+    "MAX_COOCCURRING",
+    "GRANULARITIES",
+    "bucket_period",
+    "period_of",
+]
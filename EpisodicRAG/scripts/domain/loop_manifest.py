@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Loop Manifest
+=============
+
+Loopファイルごとの (size, mtime_ns, ハッシュ) と、ダイジェスト処理時点のハッシュを持つマニフェスト。
+
+## 設計意図
+
+FileDetector は last_processed より後の番号しか見ないため、
+処理済みLoopが後から編集されても気づけなかった。
+気づくには全Loopを読み直してハッシュを比べる必要があった。
+
+このモデルはLoopごとに最後に確認した stat とハッシュを保持し、
+size と mtime_ns が変わったLoopだけを再ハッシュの対象にする。
+処理時点のハッシュ（digested_hash）と現在のハッシュが異なるLoopが
+「ダイジェスト後に変更されたLoop」になる。
+
+mtime の分解能より短い間隔で書き換えられると stat が一致したまま内容が変わりうるため、
+ハッシュ計算時刻から RACY_WINDOW_NS 以内の mtime を持つエントリは次回も再ハッシュする。
+
+Usage:
+    from domain.loop_manifest import LoopManifest
+
+    manifest = LoopManifest.from_dict(data)
+    manifest.needs_hash("L00186_test.txt", size, mtime_ns)
+    manifest.modified()  # ['L00186_test.txt']
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+# 永続化形式のバージョン
+LOOP_MANIFEST_FORMAT_VERSION = 1
+
+# mtimeが信用できない（書き換えと同じ刻みに入りうる）期間（ナノ秒）
+# stat で変更を判定するキャッシュ・索引はすべてこの値を使う
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class LoopManifest:
+    """
+    Loopファイルのマニフェスト
+
+    Example:
+        >>> manifest = LoopManifest()
+        >>> manifest.update("L00001.txt", 120, 1_000, "aa", hashed_at_ns=5_000_000_000)
+        >>> manifest.mark_digested(["L00001.txt"])
+        ['L00001.txt']
+        >>> manifest.needs_hash("L00001.txt", 120, 1_000)
+        False
+        >>> manifest.update("L00001.txt", 130, 9_000, "bb", hashed_at_ns=9_000_000_000)
+        >>> manifest.modified()
+        ['L00001.txt']
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_name: str) -> bool:
+        return file_name in self._entries
+
+    def get(self, file_name: str) -> Optional[Dict[str, Any]]:
+        """エントリを取得（存在しない場合はNone）"""
+        entry = self._entries.get(file_name)
+        return dict(entry) if entry is not None else None
+
+    def needs_hash(self, file_name: str, size: int, mtime_ns: int) -> bool:
+        """
+        再ハッシュが必要か（未登録・stat変化・mtimeが信用できない場合）
+
+        Args:
+            file_name: Loopファイル名
+            size: 現在のファイルサイズ
+            mtime_ns: 現在の更新時刻（ナノ秒）
+        """
+        entry = self._entries.get(file_name)
+        if entry is None or entry.get("hash") is None:
+            return True
+        if entry.get("size") != size or entry.get("mtime_ns") != mtime_ns:
+            return True
+        return bool(mtime_ns >= int(entry.get("hashed_at_ns", 0)) - RACY_WINDOW_NS)
+
+    def update(
+        self, file_name: str, size: int, mtime_ns: int, content_hash: str, hashed_at_ns: int
+    ) -> None:
+        """
+        現在の stat とハッシュを記録（digested_hash は保持）
+
+        Args:
+            file_name: Loopファイル名
+            size: ファイルサイズ
+            mtime_ns: 更新時刻（ナノ秒）
+            content_hash: 内容のハッシュ
+            hashed_at_ns: ハッシュを計算した時刻（ナノ秒）
+        """
+        entry = self._entries.setdefault(file_name, {})
+        entry.update(
+            {"size": size, "mtime_ns": mtime_ns, "hash": content_hash, "hashed_at_ns": hashed_at_ns}
+        )
+
+    def mark_digested(self, file_names: Iterable[str], only_missing: bool = False) -> List[str]:
+        """
+        現在のハッシュをダイジェスト処理時点のハッシュとして記録
+
+        Args:
+            file_names: 処理したLoopファイル名
+            only_missing: Trueなら digested_hash 未記録のエントリのみ（既存Loopの基準化）
+
+        Returns:
+            記録したファイル名
+        """
+        marked = []
+        for file_name in file_names:
+            entry = self._entries.get(file_name)
+            if entry is None or entry.get("hash") is None:
+                continue
+            if only_missing and entry.get("digested_hash") is not None:
+                continue
+            entry["digested_hash"] = entry["hash"]
+            marked.append(file_name)
+        return marked
+
+    def modified(self) -> List[str]:
+        """
+        ダイジェスト処理後に内容が変わったLoop（ファイル名昇順）
+        """
+        return sorted(
+            name
+            for name, entry in self._entries.items()
+            if entry.get("digested_hash") not in (None, entry.get("hash"))
+        )
+
+    def prune(self, existing: Iterable[str]) -> List[str]:
+        """
+        存在しないLoopのエントリを削除
+
+        Returns:
+            削除したファイル名
+        """
+        keep = set(existing)
+        removed = [name for name in self._entries if name not in keep]
+        for name in removed:
+            del self._entries[name]
+        return removed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """永続化用の辞書に変換"""
+        return {"format_version": LOOP_MANIFEST_FORMAT_VERSION, "loops": self._entries}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoopManifest":
+        """
+        永続化された辞書から復元（形式が合わない場合は空のマニフェスト）
+        """
+        manifest = cls()
+        if data.get("format_version") != LOOP_MANIFEST_FORMAT_VERSION:
+            return manifest
+        manifest._entries = {
+            name: dict(entry)
+            for name, entry in data.get("loops", {}).items()
+            if isinstance(entry, dict)
+        }
+        return manifest
+
+
+__all__ = [
+    "LoopManifest",
+    "LOOP_MANIFEST_FORMAT_VERSION",
+    "RACY_WINDOW_NS",
+]
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Near Duplicate Index
+====================
+
+Loop本文の類似度スケッチ（64bit SimHash と MinHash）と、
+LSHバンディングによる近似重複検索のモデル。
+
+## 設計意図
+
+同じ会話を二重に保存したLoopや、ほぼ同じ内容のLoopを見つけるには、
+新しいLoopを既存の全Loopと1件ずつ比較する必要があった（O(n)回の全文比較）。
+
+このモデルはLoopごとに固定長のスケッチだけを保持し、
+スケッチをバンドに分割したバケットで候補を引く（LSH）。
+新規Loop1件あたりの比較対象は同じバケットに入った候補だけになる。
+
+- MinHash: 文字シングル集合のJaccard係数を推定（16バンド × 4行）
+- SimHash: 64bitを16bit × 4に分割（ハミング距離3以下は必ずどれかのバンドが一致）
+
+候補はMinHashの推定類似度またはSimHashのハミング距離で最終判定する。
+バケットは永続化せず、読み込み時にスケッチから再構築する。
+
+MinHash は One Permutation Hashing（シングルハッシュの下位ビットで NUM_PERM 個のビンに
+振り分け、ビンごとの最小値を取る。空のビンは右隣の空でないビンの値を借りる）で、
+シングル1つあたりハッシュ1回で計算する。NumPyなしでも 60k 字の Loop を数十msで処理できる。
+
+Usage:
+    from domain.near_duplicate import NearDuplicateIndex, compute_sketch
+
+    index = NearDuplicateIndex.from_dict(data)
+    simhash, minhash = compute_sketch(text)
+    index.add("L00186", simhash, minhash)  # [{'duplicate_of': 'L00120', ...}]
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# 永続化形式のバージョン（2: One Permutation Hashing の MinHash）
+NEAR_DUPLICATE_FORMAT_VERSION = 2
+
+# 文字シングルの長さ（日本語は空白で区切れないため文字n-gram）
+SHINGLE_SIZE = 5
+
+# MinHashのビン数とLSHバンド構成（NUM_PERM = BANDS × ROWS）
+NUM_PERM = 64
+MINHASH_BANDS = 16
+MINHASH_ROWS = NUM_PERM // MINHASH_BANDS
+
+# SimHashのバンド構成（64bit = 4 × 16bit）
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = 64 // SIMHASH_BANDS
+
+# 近似重複とみなす閾値
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+DEFAULT_SIMHASH_DISTANCE = 3
+
+_MAX_HASH = (1 << 32) - 1
+_BIN_BITS = (NUM_PERM - 1).bit_length()
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> Counter:
+    """
+    空白を正規化した本文の文字シングルを64bitハッシュにして数える
+
+    Returns:
+        シングルハッシュ → 出現回数
+
+    Example:
+        >>> len(shingle_hashes("abcdef", size=5))
+        2
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip()
+    if not normalized:
+        return Counter()
+    if len(normalized) <= size:
+        grams: Iterable[str] = [normalized]
+    else:
+        grams = (normalized[i : i + size] for i in range(len(normalized) - size + 1))
+    return Counter(
+        int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little")
+        for g in grams
+    )
+
+
+def simhash64(weights: Counter) -> int:
+    """
+    シングルハッシュの出現回数で重み付けした64bit SimHash
+
+    ハッシュを出現回数分並べたバイト列を作り、バイト位置ごとの値の出現数を
+    Counter（C実装）で数えてからビットを集計する。
+
+    Example:
+        >>> simhash64(shingle_hashes("同じ本文")) == simhash64(shingle_hashes("同じ本文"))
+        True
+    """
+    if not weights:
+        return 0
+    total = sum(weights.values())
+    packed = b"".join(value.to_bytes(8, "little") * count for value, count in weights.items())
+    result = 0
+    for byte in range(8):
+        byte_counts = Counter(packed[byte::8])
+        for bit in range(8):
+            mask = 1 << bit
+            ones = sum(c for v, c in byte_counts.items() if v & mask)
+            if 2 * ones > total:
+                result |= 1 << (8 * byte + bit)
+    return result
+
+
+def minhash_signature(hashes: Iterable[int]) -> List[int]:
+    """
+    シングルハッシュ集合のMinHash（NUM_PERM 個のビンごとの32bit最小値）
+
+    下位ビットでビンを選び、残りのビットの最小値をビンごとに取る（One Permutation Hashing）。
+    空のビンは右隣（末尾の次は先頭）の空でないビンの値を使う。
+
+    Example:
+        >>> len(minhash_signature(shingle_hashes("本文")))
+        64
+    """
+    empty = _MAX_HASH + 1
+    bins = [empty] * NUM_PERM
+    for h in hashes:
+        index = h % NUM_PERM
+        value = (h >> _BIN_BITS) & _MAX_HASH
+        if value < bins[index]:
+            bins[index] = value
+    if all(value == empty for value in bins):
+        return [_MAX_HASH] * NUM_PERM
+    for i in range(NUM_PERM):
+        j = i
+        while bins[j] == empty:
+            j = (j + 1) % NUM_PERM
+        if j != i:
+            bins[i] = bins[j]
+    return bins
+
+
+def compute_sketch(text: str) -> Tuple[int, List[int]]:
+    """
+    本文から (SimHash, MinHash) を計算
+
+    Example:
+        >>> simhash, minhash = compute_sketch("Loop本文...")
+    """
+    weights = shingle_hashes(text)
+    return simhash64(weights), minhash_signature(weights.keys())
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """
+    64bit値のハミング距離
+
+    Example:
+        >>> hamming_distance(0b1011, 0b0001)
+        2
+    """
+    return bin(a ^ b).count("1")
+
+
+def estimate_jaccard(a: List[int], b: List[int]) -> float:
+    """
+    2つのMinHashからJaccard係数を推定
+
+    Example:
+        >>> estimate_jaccard([1, 2, 3, 4], [1, 2, 0, 4])
+        0.75
+    """
+    if not a or len(a) != len(b):
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def _band_keys(simhash: int, minhash: List[int]) -> List[Hashable]:
+    """LSHバケットのキー（MinHashバンドとSimHashバンド）"""
+    keys: List[Hashable] = [
+        ("m", band, tuple(minhash[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS]))
+        for band in range(MINHASH_BANDS)
+    ]
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+    keys.extend(
+        ("s", band, (simhash >> (band * SIMHASH_BAND_BITS)) & mask) for band in range(SIMHASH_BANDS)
+    )
+    return keys
+
+
+class NearDuplicateIndex:
+    """
+    Loopスケッチと近似重複の索引
+
+    Example:
+        >>> index = NearDuplicateIndex()
+        >>> index.add("L00001", *compute_sketch("今日はMCPの設計について話した。" * 5))
+        []
+        >>> index.add("L00002", *compute_sketch("今日はMCPの設計について話した。" * 5))
+        [{'duplicate_of': 'L00001', 'similarity': 1.0, 'simhash_distance': 0}]
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_simhash_distance: int = DEFAULT_SIMHASH_DISTANCE,
+    ) -> None:
+        self.similarity_threshold = similarity_threshold
+        self.max_simhash_distance = max_simhash_distance
+        self._sketches: Dict[str, Tuple[int, List[int]]] = {}
+        self._buckets: Dict[Hashable, List[str]] = {}
+        self._duplicates: Dict[str, List[Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._sketches)
+
+    def __contains__(self, loop_id: str) -> bool:
+        return loop_id in self._sketches
+
+    def _insert(self, loop_id: str, simhash: int, minhash: List[int]) -> None:
+        """スケッチを登録してバケットに追加"""
+        self._sketches[loop_id] = (simhash, list(minhash))
+        for key in _band_keys(simhash, minhash):
+            self._buckets.setdefault(key, []).append(loop_id)
+
+    def find(
+        self, simhash: int, minhash: List[int], exclude: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        登録済みLoopから近似重複を検索（バケットが一致した候補のみ比較）
+
+        Args:
+            simhash: 検索対象のSimHash
+            minhash: 検索対象のMinHash
+            exclude: 結果から除くLoop ID（自分自身）
+
+        Returns:
+            類似度降順の一致リスト（duplicate_of, similarity, simhash_distance）
+        """
+        candidates: Set[str] = set()
+        for key in _band_keys(simhash, minhash):
+            candidates.update(self._buckets.get(key, ()))
+        candidates.discard(exclude or "")
+
+        matches: List[Dict[str, Any]] = []
+        for candidate in candidates:
+            other_simhash, other_minhash = self._sketches[candidate]
+            similarity = estimate_jaccard(minhash, other_minhash)
+            distance = hamming_distance(simhash, other_simhash)
+            if similarity >= self.similarity_threshold or distance <= self.max_simhash_distance:
+                matches.append(
+                    {
+                        "duplicate_of": candidate,
+                        "similarity": round(similarity, 4),
+                        "simhash_distance": distance,
+                    }
+                )
+        matches.sort(key=lambda m: (-m["similarity"], m["simhash_distance"], m["duplicate_of"]))
+        return matches
+
+    def add(self, loop_id: str, simhash: int, minhash: List[int]) -> List[Dict[str, Any]]:
+        """
+        Loopを登録し、既存Loopとの近似重複を返す（登録済みIDは何もしない）
+
+        見つかった重複は索引に保持され、duplicates() で参照できる。
+
+        Example:
+            >>> index.add("L00186", simhash, minhash)
+            [{'duplicate_of': 'L00120', 'similarity': 0.92, 'simhash_distance': 2}]
+        """
+        if loop_id in self._sketches:
+            return list(self._duplicates.get(loop_id, []))
+        matches = self.find(simhash, minhash, exclude=loop_id)
+        self._insert(loop_id, simhash, minhash)
+        if matches:
+            self._duplicates[loop_id] = matches
+        return matches
+
+    def duplicates(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        登録時に見つかった近似重複（Loop ID → 一致リスト）
+
+        Example:
+            >>> index.duplicates()
+            {'L00186': [{'duplicate_of': 'L00120', 'similarity': 0.92, ...}]}
+        """
+        return {k: list(v) for k, v in self._duplicates.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """永続化用の辞書に変換（バケットは読み込み時に再構築）"""
+        return {
+            "format_version": NEAR_DUPLICATE_FORMAT_VERSION,
+            "sketches": {
+                loop_id: {"simhash": f"{simhash:016x}", "minhash": minhash}
+                for loop_id, (simhash, minhash) in self._sketches.items()
+            },
+            "duplicates": self._duplicates,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NearDuplicateIndex":
+        """
+        永続化された辞書から復元（形式が合わない場合は空の索引）
+        """
+        index = cls()
+        if data.get("format_version") != NEAR_DUPLICATE_FORMAT_VERSION:
+            return index
+        for loop_id, sketch in data.get("sketches", {}).items():
+            try:
+                simhash = int(sketch["simhash"], 16)
+                minhash = [int(v) for v in sketch["minhash"]]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if len(minhash) == NUM_PERM:
+                index._insert(loop_id, simhash, minhash)
+        index._duplicates = {
+            loop_id: list(matches)
+            for loop_id, matches in data.get("duplicates", {}).items()
+            if loop_id in index._sketches and isinstance(matches, list)
+        }
+        return index
+
+
+__all__ = [
+    "NearDuplicateIndex",
+    "NEAR_DUPLICATE_FORMAT_VERSION",
+    "compute_sketch",
+    "estimate_jaccard",
+    "hamming_distance",
+    "minhash_signature",
+    "shingle_hashes",
+    "simhash64",
+]
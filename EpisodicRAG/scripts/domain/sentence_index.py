@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Sentence Index
+==============
+
+文書の文境界（バイトオフセット）と文ごとの語の署名を保持し、
+クエリに合う文だけをファイルから読み出すためのドメインモデル。
+
+## 設計意図
+
+検索でヒットしたダイジェストの abstract（2400字）や Loop（数万トークン）を
+丸ごとエージェントのコンテキストに読み込むと、ヒットした1文のために
+文書全体のトークンを払うことになる。
+
+インデックス作成時（ダイジェスト確定時）に各フィールドを文に分け、
+文ごとに次の2つを記録する:
+
+- 境界: ファイル内のバイトオフセット（文 i は boundaries[i]〜boundaries[i+1]）
+- 署名: 文に含まれる語（domain.tfidf.tokenize）を SIGNATURE_BITS ビットに落とした
+  ビット集合（Bloom フィルタと同じく、偽陽性はあるが偽陰性はない）
+
+クエリ時は署名だけで候補の文を絞り、候補のバイト範囲だけを読んで
+実際の一致数を数える。文書の残りは読まない。
+
+## 文境界
+
+日本語の「。．！？」、ASCIIの「!?」、空白または末尾が続く「.」、改行で区切る。
+直後の閉じ括弧・引用符と空白は前の文に含める。
+句読点のない長い行（コードやログ）は MAX_SENTENCE_CHARS で切る。
+
+Usage:
+    from domain.sentence_index import SentenceMap, split_sentences
+
+    split_sentences("設計を見直した。MCPは良い！")  # [0, 8, 15]
+    sentence_map = SentenceMap.build(text, encoded_length=utf8_length)
+    sentence_map.candidates(query_terms("MCP 設計"), limit=6)  # [(文番号, 推定一致数), ...]
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from domain.tfidf import tokenize
+
+# 永続化形式のバージョン
+SENTENCE_INDEX_FORMAT_VERSION = 1
+
+# 文ごとの語の署名のビット数
+SIGNATURE_BITS = 256
+
+# 句読点がない場合に文を切る長さ（文字数）
+MAX_SENTENCE_CHARS = 400
+
+# 文末（句読点の連続・空白または末尾が続くピリオド・改行）と、直後の閉じ括弧・空白
+_SENTENCE_END = re.compile(r"(?:[。．！？!?]+|\.(?=\s|$)|\n+)[」』）)\]\"'”’]*[ \t　]*\n*")
+
+_WORD = re.compile(r"[a-z0-9_]+")
+
+
+def split_sentences(text: str) -> List[int]:
+    """
+    文の境界（文字オフセット）を返す（先頭の0と末尾の len(text) を含む）
+
+    Example:
+        >>> split_sentences("設計を見直した。MCPは良い！")
+        [0, 8, 15]
+        >>> split_sentences("It works. Version 1.2 is out")
+        [0, 10, 28]
+    """
+    boundaries = [0]
+    for match in _SENTENCE_END.finditer(text):
+        end = match.end()
+        if end > boundaries[-1]:
+            _append_capped(boundaries, end)
+    if boundaries[-1] < len(text):
+        _append_capped(boundaries, len(text))
+    return boundaries
+
+
+def _append_capped(boundaries: List[int], end: int) -> None:
+    """長すぎる文を MAX_SENTENCE_CHARS ごとに切ってから境界を追加"""
+    while end - boundaries[-1] > MAX_SENTENCE_CHARS:
+        boundaries.append(boundaries[-1] + MAX_SENTENCE_CHARS)
+    boundaries.append(end)
+
+
+def _bit(term: str) -> int:
+    digest = hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest()
+    return 1 << (int.from_bytes(digest, "little") % SIGNATURE_BITS)
+
+
+def term_signature(text: str) -> int:
+    """
+    文に含まれる語のビット集合
+
+    Example:
+        >>> term_signature("MCP") & term_signature("MCPの設計") == term_signature("MCP")
+        True
+    """
+    signature = 0
+    for term in tokenize(text):
+        signature |= _bit(term)
+    return signature
+
+
+def query_terms(query: str) -> List[str]:
+    """
+    クエリの語（重複なし、出現順）
+
+    Example:
+        >>> query_terms("MCP 設計 MCP")
+        ['mcp', '設計']
+    """
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def match_count(text: str, terms: Sequence[str]) -> int:
+    """
+    文に含まれるクエリの語の数
+
+    Example:
+        >>> match_count("MCPサーバーの設計", query_terms("MCP 設計"))
+        2
+    """
+    present = set(tokenize(text))
+    return sum(1 for term in terms if term in present)
+
+
+def highlight_spans(text: str, terms: Sequence[str]) -> List[Tuple[int, int]]:
+    """
+    text 内でクエリの語が現れる範囲（文字オフセット、重なりは結合）
+
+    英数字の語は単語単位、それ以外（日本語の文字バイグラム）は部分一致で探す。
+
+    Example:
+        >>> highlight_spans("MCPサーバーの設計", query_terms("MCP 設計"))
+        [(0, 3), (8, 10)]
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):  # 小文字化で長さが変わる文字を含む場合
+        lowered = text
+    spans: List[Tuple[int, int]] = []
+    for term in terms:
+        if term.isascii():
+            spans.extend(match.span() for match in _WORD.finditer(lowered) if match.group() == term)
+            continue
+        start = lowered.find(term)
+        while start >= 0:
+            spans.append((start, start + len(term)))
+            start = lowered.find(term, start + 1)
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@dataclass
+class SentenceMap:
+    """
+    1フィールド分の文境界（ファイル内のバイトオフセット）と文ごとの署名
+
+    Attributes:
+        boundaries: 文 i のバイト範囲は boundaries[i]〜boundaries[i+1]
+        signatures: 文ごとの term_signature()
+    """
+
+    boundaries: List[int]
+    signatures: List[int]
+
+    @classmethod
+    def build(
+        cls, text: str, encoded_length: Callable[[str], int], offset: int = 0
+    ) -> "SentenceMap":
+        """
+        本文から作成
+
+        Args:
+            text: フィールドの本文
+            encoded_length: 本文の一部がファイル上で占めるバイト数
+                （プレーンテキストなら UTF-8 の長さ、JSONならエスケープ後の長さ）
+            offset: 本文の先頭のファイル内バイトオフセット
+
+        Example:
+            >>> SentenceMap.build("a. b.", lambda s: len(s.encode("utf-8")), offset=10).boundaries
+            [10, 13, 15]
+        """
+        chars = split_sentences(text)
+        boundaries = [offset]
+        signatures = []
+        for start, end in zip(chars, chars[1:]):
+            sentence = text[start:end]
+            boundaries.append(boundaries[-1] + encoded_length(sentence))
+            signatures.append(term_signature(sentence))
+        return cls(boundaries, signatures)
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def byte_range(self, first: int, last: int) -> Tuple[int, int]:
+        """文 first〜last（両端を含む）のバイト範囲"""
+        return self.boundaries[first], self.boundaries[last + 1]
+
+    def candidates(self, terms: Sequence[str], limit: int) -> List[Tuple[int, int]]:
+        """
+        署名から一致しそうな文を推定一致数の多い順に返す（ファイルは読まない）
+
+        Returns:
+            (文番号, 署名上で一致した語の数) のリスト（一致0の文は含まない）
+        """
+        bits = [_bit(term) for term in terms]
+        scored = []
+        for i, signature in enumerate(self.signatures):
+            estimate = sum(1 for bit in bits if signature & bit)
+            if estimate:
+                scored.append((i, estimate))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """永続化用の辞書（署名は16進文字列）"""
+        return {"b": self.boundaries, "s": [format(s, "x") for s in self.signatures]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SentenceMap":
+        """to_dict() の形式から復元"""
+        return cls(list(data.get("b", [0])), [int(s, 16) for s in data.get("s", [])])
+
+
+__all__ = [
+    "MAX_SENTENCE_CHARS",
+    "SENTENCE_INDEX_FORMAT_VERSION",
+    "SIGNATURE_BITS",
+    "SentenceMap",
+    "highlight_spans",
+    "match_count",
+    "query_terms",
+    "split_sentences",
+    "term_signature",
+]
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Hashed TF-IDF
+=============
+
+ダイジェスト本文を固定次元のTF-IDFベクトルに変換するモデル（特徴ハッシング）。
+
+## 設計意図
+
+「このダイジェストに似たダイジェスト」を探すには、
+外部の埋め込みサービスなしに比較できるベクトルが必要になる。
+
+語彙辞書を持たず、トークンをハッシュで固定次元（VECTOR_DIM）のバケットに落とすため、
+ダイジェストが増えてもベクトルの形は変わらず、行列に追記していける。
+
+- トークン: 英数字は単語単位、それ以外（日本語など）は文字バイグラム
+- TF: 1 + log(出現回数)
+- IDF: log((1 + 文書数) / (1 + 文書頻度)) + 1（バケット単位）
+- ベクトルはL2正規化するため、内積がそのままコサイン類似度になる
+- ストアの行はTFだけを保存し（tf_vector）、IDFは検索時に最新の文書頻度から掛ける
+
+Usage:
+    from domain.tfidf import term_buckets, tfidf_vector
+
+    counts = term_buckets("MCPサーバーの設計")
+    vector = tfidf_vector(counts, df, n_docs)
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterator, List, Sequence
+
+# ベクトル次元（float32で1行2KB）
+VECTOR_DIM = 512
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+|[^\sa-z0-9_]+")
+_SYMBOLS = re.compile(r"^[\W_]+$")
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """
+    英数字は単語、それ以外は文字バイグラムに分割
+
+    Example:
+        >>> list(tokenize("MCPの設計"))
+        ['mcp', 'の設', '設計']
+    """
+    for run in _TOKEN_PATTERN.findall(text.lower()):
+        if run[0].isascii():
+            yield run
+            continue
+        chars = [c for c in run if not _SYMBOLS.match(c)]
+        if len(chars) == 1:
+            yield chars[0]
+        for i in range(len(chars) - 1):
+            yield chars[i] + chars[i + 1]
+
+
+def _bucket(token: str, dim: int) -> int:
+    """トークンのハッシュバケット"""
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % dim
+
+
+def term_buckets(text: str, dim: int = VECTOR_DIM) -> Dict[int, int]:
+    """
+    本文のトークンをバケットごとに数える
+
+    Returns:
+        バケット番号 → 出現回数
+
+    Example:
+        >>> sum(term_buckets("MCPの設計").values())
+        3
+    """
+    return dict(Counter(_bucket(token, dim) for token in tokenize(text)))
+
+
+def idf(df: int, n_docs: int) -> float:
+    """
+    平滑化したIDF
+
+    Example:
+        >>> idf(0, 0)
+        1.0
+    """
+    return math.log((1 + n_docs) / (1 + df)) + 1.0
+
+
+def idf_weights(df: Sequence[int], n_docs: int) -> List[float]:
+    """
+    バケットごとのIDF（検索時に文書のTFベクトルへ掛ける重み）
+
+    Example:
+        >>> idf_weights([0, 1], 1)[1]
+        1.0
+    """
+    return [idf(count, n_docs) for count in df]
+
+
+def tf_vector(counts: Dict[int, int], dim: int = VECTOR_DIM) -> List[float]:
+    """
+    バケット出現回数からTFベクトル（1 + log(出現回数)、IDF・正規化なし）を作成
+
+    ストアにはこのベクトルを保存し、IDFは検索時に最新の文書頻度から掛ける。
+    文書が増えても既存行の重みが古くならない。
+
+    Example:
+        >>> tf_vector({1: 1}, dim=3)
+        [0.0, 1.0, 0.0]
+    """
+    vector = [0.0] * dim
+    for bucket, count in counts.items():
+        vector[bucket] = 1.0 + math.log(count)
+    return vector
+
+
+def tfidf_vector(
+    counts: Dict[int, int], df: Sequence[int], n_docs: int, dim: int = VECTOR_DIM
+) -> List[float]:
+    """
+    バケット出現回数からL2正規化済みのTF-IDFベクトルを作成
+
+    Args:
+        counts: term_buckets() の結果
+        df: バケットごとの文書頻度（長さdim）
+        n_docs: 文書数
+        dim: ベクトル次元
+
+    Returns:
+        長さdimのベクトル（空の本文はゼロベクトル）
+
+    Example:
+        >>> vector = tfidf_vector(term_buckets("MCP"), [0] * VECTOR_DIM, 0)
+        >>> round(sum(v * v for v in vector), 6)
+        1.0
+    """
+    vector = [0.0] * dim
+    for bucket, count in counts.items():
+        vector[bucket] = (1.0 + math.log(count)) * idf(df[bucket], n_docs)
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm > 0:
+        vector = [v / norm for v in vector]
+    return vector
+
+
+__all__ = [
+    "VECTOR_DIM",
+    "idf",
+    "idf_weights",
+    "term_buckets",
+    "tf_vector",
+    "tfidf_vector",
+    "tokenize",
+]
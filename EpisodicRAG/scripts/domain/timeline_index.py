@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Timeline Index
+==============
+
+時刻 → Loop番号 / ダイジェストID の対応をレベルごとのソート済み配列で保持する
+ドメインモデル。
+
+## 設計意図
+
+「2025年3月に何をしていたか」に答えるには、各ダイジェストの
+metadataを全件開いて時刻を確認する必要があった。
+
+このモデルはレベルごとに (start, end, id) を end 昇順の並列配列で保持し、
+期間クエリを bisect による二分探索で絞り込む。
+
+- loop: start = end = Shadowに追加された時刻
+- 各ダイジェスト: start = ソースの最も早いstart、end = 確定時刻
+
+開始時刻側は「以降のエントリの最も早い開始時刻」の配列を二分探索して打ち切る。
+同一レベルのエントリが時系列に並ぶ（後のダイジェストが前のダイジェストより
+前に始まらない）通常の場合は O(log n + 該当件数)、順序が崩れていても結果は正しい。
+記録は O(1)（時系列どおりの追加以外は次のクエリでまとめて並べ直す）。
+
+タイムスタンプは datetime.isoformat() 形式の文字列で保持し、
+文字列比較で時刻順を判定する。
+
+Usage:
+    from domain.timeline_index import TimelineIndex
+
+    index = TimelineIndex.from_dict(data)
+    index.record("loop", "L00186", "2025-03-01T10:00:00")
+    index.query("2025-03-01", "2025-03-31T23:59:59.999999")
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+# 永続化形式のバージョン
+TIMELINE_FORMAT_VERSION = 1
+
+# 日付のみ指定された終端を日末に補完するためのサフィックス
+_END_OF_DAY_SUFFIX = "T23:59:59.999999"
+
+
+def normalize_range_end(value: str) -> str:
+    """
+    期間終端を正規化（日付のみの場合はその日の終わりまでを含める）
+
+    Example:
+        >>> normalize_range_end("2025-03-31")
+        '2025-03-31T23:59:59.999999'
+        >>> normalize_range_end("2025-03-31T12:00:00")
+        '2025-03-31T12:00:00'
+    """
+    return value + _END_OF_DAY_SUFFIX if "T" not in value else value
+
+
+class _LevelTimeline:
+    """
+    1レベル分のタイムライン
+
+    ID → (start, end) の辞書を正とし、期間クエリ用の end 昇順の並列配列と
+    開始時刻の接尾最小値（starts[i:] の最小値、i について単調非減少）を持つ。
+    末尾への追加（時系列どおりの記録）は配列に直接足し、
+    それ以外の置き換え・途中への挿入は次のクエリ時にまとめて並べ直す。
+    """
+
+    __slots__ = ("starts", "ends", "ids", "_spans", "_sorted", "_min_starts")
+
+    def __init__(self) -> None:
+        self.starts: List[str] = []
+        self.ends: List[str] = []
+        self.ids: List[str] = []
+        self._spans: Dict[str, Tuple[str, str]] = {}
+        self._sorted = True
+        self._min_starts: List[str] = []
+
+    @classmethod
+    def from_arrays(cls, starts: List[str], ends: List[str], ids: List[str]) -> "_LevelTimeline":
+        timeline = cls()
+        timeline._spans = dict(zip(ids, zip(starts, ends)))
+        timeline._sorted = False
+        return timeline
+
+    def put(self, entry_id: str, start: str, end: str) -> None:
+        replaced = entry_id in self._spans
+        self._spans[entry_id] = (start, end)
+        if not self._sorted:
+            return
+        if replaced or (self.ends and end < self.ends[-1]):
+            self._sorted = False
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.ids.append(entry_id)
+        if self._min_starts and start < self._min_starts[-1]:
+            # 接尾最小値が前方まで変わる場合は並べ直しと一緒に作り直す
+            self._sorted = False
+        else:
+            self._min_starts.append(start)
+
+    def ensure_sorted(self) -> None:
+        if self._sorted:
+            return
+        entries = sorted(self._spans.items(), key=lambda item: item[1][1])
+        self.ids = [entry_id for entry_id, _ in entries]
+        self.starts = [span[0] for _, span in entries]
+        self.ends = [span[1] for _, span in entries]
+        min_starts = list(self.starts)
+        for i in range(len(min_starts) - 2, -1, -1):
+            if min_starts[i + 1] < min_starts[i]:
+                min_starts[i] = min_starts[i + 1]
+        self._min_starts = min_starts
+        self._sorted = True
+
+    def span(self, entry_id: str) -> Optional[Tuple[str, str]]:
+        return self._spans.get(entry_id)
+
+    def overlapping(self, range_start: str, range_end: str) -> List[str]:
+        self.ensure_sorted()
+        first = bisect_left(self.ends, range_start)
+        # これ以降のエントリはすべて range_end より後に始まる
+        last = bisect_right(self._min_starts, range_end, lo=first)
+        return [self.ids[i] for i in range(first, last) if self.starts[i] <= range_end]
+
+
+class TimelineIndex:
+    """
+    レベル別タイムラインインデックス
+
+    Example:
+        >>> index = TimelineIndex()
+        >>> index.record("loop", "L00001", "2025-03-02T10:00:00")
+        >>> index.record("weekly", "W0001_第1週", "2025-03-08T10:00:00", start="2025-03-02T10:00:00")
+        >>> index.query("2025-03-01", "2025-03-03")
+        {'loop': ['L00001'], 'weekly': ['W0001_第1週']}
+    """
+
+    def __init__(self) -> None:
+        self._levels: Dict[str, _LevelTimeline] = {}
+
+    def record(
+        self, level: str, entry_id: str, timestamp: str, start: Optional[str] = None
+    ) -> None:
+        """
+        エントリを記録（同一IDが既にあれば置き換え）
+
+        Args:
+            level: レベル名（loop, weekly, ...）
+            entry_id: Loop番号（例: "L00186"）またはダイジェスト名
+            timestamp: 記録時刻（ISO形式）
+            start: 対象期間の開始時刻（省略時はtimestamp）
+        """
+        timeline = self._levels.setdefault(level, _LevelTimeline())
+        begin = start if start is not None and start < timestamp else timestamp
+        timeline.put(entry_id, begin, timestamp)
+
+    def span_of(self, level: str, entry_id: str) -> Optional[Tuple[str, str]]:
+        """
+        エントリの (start, end) を取得
+
+        Example:
+            >>> index.span_of("loop", "L00001")
+            ('2025-03-02T10:00:00', '2025-03-02T10:00:00')
+        """
+        timeline = self._levels.get(level)
+        return timeline.span(entry_id) if timeline else None
+
+    def earliest_start(self, level: str, entry_ids: List[str]) -> Optional[str]:
+        """
+        指定エントリ群の最も早い開始時刻（未記録のIDは無視）
+
+        Example:
+            >>> index.earliest_start("loop", ["L00001", "L09999"])
+            '2025-03-02T10:00:00'
+        """
+        starts = [span[0] for span in (self.span_of(level, i) for i in entry_ids) if span]
+        return min(starts) if starts else None
+
+    def query(self, range_start: str, range_end: str) -> Dict[str, List[str]]:
+        """
+        期間と重なるエントリをレベル別に取得
+
+        各レベルの結果は期間をカバーする最小の連続区間（時系列順）。
+
+        Args:
+            range_start: 期間開始（ISO形式、日付のみ可）
+            range_end: 期間終了（ISO形式、日付のみの場合はその日を含む）
+
+        Returns:
+            レベル名 → IDリスト（該当なしのレベルは含まない）
+        """
+        range_end = normalize_range_end(range_end)
+        result: Dict[str, List[str]] = {}
+        for level, timeline in self._levels.items():
+            ids = timeline.overlapping(range_start, range_end)
+            if ids:
+                result[level] = ids
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """永続化用の辞書に変換"""
+        for timeline in self._levels.values():
+            timeline.ensure_sorted()
+        return {
+            "format_version": TIMELINE_FORMAT_VERSION,
+            "levels": {
+                level: {"starts": t.starts, "ends": t.ends, "ids": t.ids}
+                for level, t in self._levels.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimelineIndex":
+        """
+        永続化された辞書から復元（形式が合わない場合は空のインデックス）
+        """
+        index = cls()
+        if data.get("format_version") != TIMELINE_FORMAT_VERSION:
+            return index
+        for level, raw in data.get("levels", {}).items():
+            starts, ends, ids = raw.get("starts", []), raw.get("ends", []), raw.get("ids", [])
+            if len(starts) == len(ends) == len(ids):
+                index._levels[level] = _LevelTimeline.from_arrays(starts, ends, ids)
+        return index
+
+
+__all__ = [
+    "TimelineIndex",
+    "TIMELINE_FORMAT_VERSION",
+    "normalize_range_end",
+]
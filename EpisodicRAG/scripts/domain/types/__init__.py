@@ -20,6 +20,8 @@ from domain.types.config import (
     ConfigData,
     DigestTimeData,
     DigestTimesData,
+    FederatedStoreData,
+    FederationConfigData,
     LevelsConfigData,
     PathsConfigData,
 )
@@ -72,6 +74,12 @@ from domain.types.metadata import (
     DigestMetadataComplete,
 )
 
+# Schema compilation
+from domain.types.schema import (
+    SchemaChecker,
+    compile_schema,
+)
+
 # Text types
 from domain.types.text import (
     LongShortText,
@@ -104,6 +112,8 @@ __all__ = [
     "PathsConfigData",
     "LevelsConfigData",
     "ConfigData",
+    "FederatedStoreData",
+    "FederationConfigData",
     "DigestTimeData",
     "DigestTimesData",
     # Entry (Provisional)
@@ -116,6 +126,9 @@ __all__ = [
     "is_level_config_data",
     "is_shadow_digest_data",
     "is_long_short_text",
+    # Schema
+    "SchemaChecker",
+    "compile_schema",
     # Literal types
     "LevelName",
     "AllLevelName",
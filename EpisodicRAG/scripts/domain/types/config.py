@@ -35,6 +35,26 @@ class LevelsConfigData(TypedDict, total=False):
     centurial_threshold: int
 
 
+class FederatedStoreData(TypedDict, total=False):
+    """
+    config.json の federation.stores の各要素（検索対象の別ストア）
+    """
+
+    name: str
+    digests_dir: str
+    index_dir: str
+    timeout_seconds: float
+
+
+class FederationConfigData(TypedDict, total=False):
+    """
+    config.json の federation セクション
+    """
+
+    stores: List[FederatedStoreData]
+    timeout_seconds: float
+
+
 class ConfigData(TypedDict, total=False):
     """
     config.json の全体構造
@@ -44,6 +64,7 @@ class ConfigData(TypedDict, total=False):
     paths: PathsConfigData
     levels: LevelsConfigData
     trusted_external_paths: List[str]
+    federation: FederationConfigData
 
 
 # =============================================================================
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+EpisodicRAG スキーマ検証
+========================
+
+TypedDict の型定義を、実行時の構造検証関数にコンパイルする。
+
+型ヒントの解釈（get_type_hints・必須キーの判定）はコンパイル時に1回だけ行い、
+検証関数は「キー・必須か・許容する型」の平坦な表を上から照合するだけにする。
+str のフィールドは isinstance 1回で判定し、
+エラーがあったときだけパス文字列（"individual_digests[3].keywords"）を組み立てる。
+
+Note:
+    LongShortText のフィールドは文字列も受け付ける。
+    RegularDigestBuilder は確定ダイジェストの abstract / impression を
+    文字列に正規化して保存し、読み取り側（extract_long_value 等）も両形式に対応するため。
+
+Usage:
+    from domain.types import RegularDigestData
+    from domain.types.schema import compile_schema
+
+    check = compile_schema(RegularDigestData)
+    check(data)  # ['overall_digest.keywords[1]: expected str, got int']
+"""
+
+import functools
+from typing import (
+    Any,
+    Callable,
+    List,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from domain.types.text import LongShortText
+
+# 値を検証し、エラーメッセージのリストを返す関数
+SchemaChecker = Callable[[Any], List[str]]
+
+# (値, パス, エラー出力先) を受け取る内部の検証関数
+_Check = Callable[[Any, str, List[str]], None]
+
+_LEAF_TYPES = (str, int, float, bool)
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+def _type_error(path: str, expected: str, value: Any) -> str:
+    return f"{path or '$'}: expected {expected}, got {type(value).__name__}"
+
+
+def _compile_leaf(tp: type) -> _Check:
+    # float は int も受け付ける。int / float に bool は含めない
+    types: Tuple[type, ...] = (int, float) if tp is float else (tp,)
+    reject_bool = tp in (int, float)
+    name = tp.__name__
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, types) or (reject_bool and isinstance(value, bool)):
+            errors.append(_type_error(path, name, value))
+
+    return check
+
+
+def _compile_list(item_check: _Check, str_items: bool) -> _Check:
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, list):
+            errors.append(_type_error(path, "list", value))
+            return
+        # List[str] はまず一括で判定し、違反があるときだけ位置を特定する
+        if str_items and all(isinstance(item, str) for item in value):
+            return
+        for i, item in enumerate(value):
+            item_check(item, f"{path}[{i}]", errors)
+
+    return check
+
+
+def _compile_dict(value_check: _Check) -> _Check:
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, dict):
+            errors.append(_type_error(path, "object", value))
+            return
+        for key, item in value.items():
+            value_check(item, _join(path, str(key)), errors)
+
+    return check
+
+
+def _compile_optional(inner: _Check) -> _Check:
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if value is not None:
+            inner(value, path, errors)
+
+    return check
+
+
+def _compile_text(object_check: _Check) -> _Check:
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, str):
+            object_check(value, path, errors)
+
+    return check
+
+
+def _accept(value: Any, path: str, errors: List[str]) -> None:
+    return None
+
+
+def _compile_type(tp: Any) -> _Check:
+    """型ヒント1つを検証関数に変換"""
+    if tp is Any:
+        return _accept
+    if is_typeddict(tp):
+        object_check = _compile_typeddict(tp)
+        return _compile_text(object_check) if tp is LongShortText else object_check
+    if tp in _LEAF_TYPES:
+        return _compile_leaf(tp)
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is list:
+        item_type = args[0] if args else Any
+        return _compile_list(_compile_type(item_type), item_type is str)
+    if origin is dict:
+        return _compile_dict(_compile_type(args[1] if args else Any))
+    if origin is Union:
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1:
+            return _compile_optional(_compile_type(non_none[0]))
+    raise TypeError(f"unsupported schema type: {tp!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_typeddict(schema: type) -> _Check:
+    """TypedDict をキーの平坦な表と、それを照合する検証関数に変換"""
+    hints = get_type_hints(schema)
+    required = getattr(schema, "__required_keys__", frozenset(hints))
+    # str のフィールドは isinstance を直接照合し、それ以外は検証関数を呼ぶ
+    leaves: List[Tuple[str, bool]] = []
+    nested: List[Tuple[str, bool, _Check]] = []
+    for key, tp in hints.items():
+        if tp is str:
+            leaves.append((key, key in required))
+        else:
+            nested.append((key, key in required, _compile_type(tp)))
+    leaf_table = tuple(leaves)
+    nested_table = tuple(nested)
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, dict):
+            errors.append(_type_error(path, "object", value))
+            return
+        for key, is_required in leaf_table:
+            if key in value:
+                if not isinstance(value[key], str):
+                    errors.append(_type_error(_join(path, key), "str", value[key]))
+            elif is_required:
+                errors.append(f"{_join(path, key)}: missing")
+        for key, is_required, field_check in nested_table:
+            if key in value:
+                field_check(value[key], _join(path, key), errors)
+            elif is_required:
+                errors.append(f"{_join(path, key)}: missing")
+
+    return check
+
+
+@functools.lru_cache(maxsize=None)
+def compile_schema(schema: type) -> SchemaChecker:
+    """
+    TypedDict を検証関数にコンパイル（同じ型は1回だけコンパイル）
+
+    対応する型: str / int / float / bool / Any / List[X] / Dict[str, X] /
+    Optional[X] / ネストした TypedDict。TypedDict にないキーは検証しない。
+
+    Args:
+        schema: TypedDict クラス
+
+    Returns:
+        値を受け取り、エラーメッセージのリストを返す関数（空なら適合）
+
+    Raises:
+        TypeError: TypedDict でない、または対応していない型ヒントを含む場合
+
+    Example:
+        >>> check = compile_schema(IndividualDigestData)
+        >>> check({"source_file": "L00001.txt", "digest_type": "開発",
+        ...        "keywords": ["MCP", 1], "abstract": "要約"})
+        ['keywords[1]: expected str, got int', 'impression: missing']
+    """
+    if not is_typeddict(schema):
+        raise TypeError(f"not a TypedDict: {schema!r}")
+    check = _compile_typeddict(schema)
+
+    def run(value: Any) -> List[str]:
+        errors: List[str] = []
+        check(value, "", errors)
+        return errors
+
+    return run
+
+
+__all__ = ["SchemaChecker", "compile_schema"]
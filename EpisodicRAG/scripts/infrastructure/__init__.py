@@ -32,11 +32,16 @@ Usage:
 # JSON Repository
 # File Scanner
 # Error Handling
+# Derived Data
+from infrastructure.derived_data import DerivedUpdate, update_json_index
 from infrastructure.error_handling import (
     safe_cleanup,
     safe_file_operation,
     with_error_context,
 )
+
+# File Lock
+from infrastructure.file_lock import file_lock, level_lock
 from infrastructure.file_scanner import (
     count_files,
     filter_files_after_number,
@@ -51,6 +56,8 @@ from infrastructure.json_repository import (
     load_json,
     load_json_with_template,
     save_json,
+    save_json_if_changed,
+    save_json_stamped,
     try_load_json,
     try_read_json_from_file,
 )
@@ -65,6 +72,9 @@ from infrastructure.logging_config import (
     setup_logging,
 )
 
+# Query Result Cache
+from infrastructure.query_cache import bump_corpus_generation, get_query_cache
+
 # Structured Logging
 from infrastructure.structured_logging import (
     StructuredLogger,
@@ -78,6 +88,8 @@ __all__ = [
     # JSON Repository
     "load_json",
     "save_json",
+    "save_json_if_changed",
+    "save_json_stamped",
     "load_json_with_template",
     "file_exists",
     "ensure_directory",
@@ -102,6 +114,15 @@ __all__ = [
     "get_structured_logger",
     # User Interaction
     "get_default_confirm_callback",
+    # File Lock
+    "file_lock",
+    "level_lock",
+    # Query Result Cache
+    "bump_corpus_generation",
+    "get_query_cache",
+    # Derived Data
+    "DerivedUpdate",
+    "update_json_index",
     # Error Handling
     "safe_file_operation",
     "safe_cleanup",
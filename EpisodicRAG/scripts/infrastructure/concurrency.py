@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Concurrency
+===========
+
+名前付きタスクをスレッドプールで並列実行し、タスクごとの制限時間で打ち切る。
+
+## 設計意図
+
+フェデレーション検索では、マウントが遅いストア1つのために全体の応答が止まってはならない。
+concurrent.futures.ThreadPoolExecutor のワーカーは非デーモンスレッドで、
+終了時に join されるため、ハングした read() がプロセス終了まで巻き込む。
+
+ここではデーモンスレッドのワーカーを使い、制限時間を過ぎたタスクは結果を待たずに
+"timeout" として扱う（スレッドは処理が戻った時点で静かに終わる）。
+制限時間はワーカーがタスクを取り出して開始した時点から数えるため、
+前のタスクの完了を待って列に並んでいたタスクが待ち時間だけで打ち切られることはない。
+打ち切ったタスクのワーカーは戻ってこない可能性があるため、代わりのワーカーを起動して
+残りのタスクの処理を続ける。
+
+Usage:
+    from infrastructure.concurrency import run_with_timeouts
+
+    results, errors = run_with_timeouts({"local": (fn, 5.0), "nas": (fn2, 2.0)})
+    # results={'local': ...}, errors={'nas': 'timeout'}
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# 並列数の上限
+MAX_POOL_WORKERS = 16
+
+# タスクが制限時間内に終わらなかったときのエラー値
+TIMEOUT_ERROR = "timeout"
+
+# ワーカーから届くイベントの種類
+_STARTED = "started"
+_FINISHED = "finished"
+_FAILED = "failed"
+
+
+def run_with_timeouts(
+    tasks: Mapping[str, Tuple[Callable[[], Any], float]],
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    タスクを並列実行し、制限時間内に終わった結果とエラーを返す
+
+    Args:
+        tasks: タスク名 → (引数なしの関数, 制限時間（秒、開始時点から）)
+        max_workers: 並列数（省略時は min(タスク数, MAX_POOL_WORKERS)）
+
+    Returns:
+        (タスク名 → 戻り値, タスク名 → エラーメッセージ)
+        制限時間を過ぎたタスクのエラーは TIMEOUT_ERROR
+
+    Example:
+        >>> run_with_timeouts({"a": (lambda: 1, 1.0), "b": (lambda: 1 / 0, 1.0)})
+        ({'a': 1}, {'b': 'division by zero'})
+    """
+    if not tasks:
+        return {}, {}
+    pending: "queue.Queue[str]" = queue.Queue()
+    events: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+    for name in tasks:
+        pending.put(name)
+
+    def worker() -> None:
+        while True:
+            try:
+                name = pending.get_nowait()
+            except queue.Empty:
+                return
+            events.put((name, _STARTED, time.monotonic()))
+            try:
+                events.put((name, _FINISHED, tasks[name][0]()))
+            except Exception as e:  # タスクの失敗は呼び出し側へ文字列で返す
+                events.put((name, _FAILED, str(e) or type(e).__name__))
+
+    spawned = 0
+
+    def spawn_worker() -> None:
+        nonlocal spawned
+        threading.Thread(target=worker, name=f"episodicrag-pool-{spawned}", daemon=True).start()
+        spawned += 1
+
+    for _ in range(min(max_workers or MAX_POOL_WORKERS, len(tasks))):
+        spawn_worker()
+
+    started: Dict[str, float] = {}
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    while len(results) + len(errors) < len(tasks):
+        now = time.monotonic()
+        running = {
+            name: start + tasks[name][1]
+            for name, start in started.items()
+            if name not in results and name not in errors
+        }
+        for name, deadline in running.items():
+            if now >= deadline:
+                errors[name] = TIMEOUT_ERROR
+                spawn_worker()  # 戻らないかもしれないワーカーの代わり
+        if len(results) + len(errors) == len(tasks):
+            break
+        open_deadlines = [deadline for name, deadline in running.items() if name not in errors]
+        wait = max(min(open_deadlines) - now, 0.0) if open_deadlines else None
+        try:
+            name, kind, payload = events.get(timeout=wait)
+        except queue.Empty:
+            continue
+        if name in errors:
+            continue  # 打ち切り後に届いた結果は捨てる
+        if kind == _STARTED:
+            started[name] = payload
+        elif kind == _FINISHED:
+            results[name] = payload
+        else:
+            errors[name] = payload
+    return results, errors
+
+
+__all__ = ["MAX_POOL_WORKERS", "TIMEOUT_ERROR", "run_with_timeouts"]
@@ -50,6 +50,29 @@ class ConfigLoader:
         self.config_file = config_file
         self._config: Optional[ConfigData] = None
 
+    @classmethod
+    def from_data(cls, config_file: Path, config: ConfigData) -> "ConfigLoader":
+        """
+        読み込み済みの設定データで初期化（ファイル読み込みをスキップ）
+
+        reload() を呼ぶと通常どおりファイルから再読み込みする。
+
+        Args:
+            config_file: 設定ファイルのパス
+            config: 設定データ（スナップショット等から復元済み）
+
+        Returns:
+            ConfigLoader
+
+        Example:
+            >>> loader = ConfigLoader.from_data(Path("config.json"), snapshot_config)
+            >>> loader.is_loaded
+            True
+        """
+        loader = cls(config_file)
+        loader._config = config
+        return loader
+
     def load(self) -> ConfigData:
         """
         設定ファイルを読み込む
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Config Snapshot
+===============
+
+解決済み設定（config.json の内容・base_dir・各パスの絶対パス）を
+プロセス間で共有するためのスナップショットキャッシュ。
+
+## 設計意図
+
+各CLIはDigestConfig構築時に config.json の読み込み、
+trusted_external_paths / base_dir の検証、各パスのresolve()を毎回実行する。
+解決結果を config.json と同じディレクトリにキャッシュし、
+config.json が変更されていない限り1回の読み込みで復元する。
+
+## キャッシュキー
+
+- config.json の (st_mtime_ns, st_size) が一致すれば、ファイルを読まずにヒット
+- mtimeがスナップショット書き込み時刻に近い場合（racy）や
+  stat が一致しない場合は、blake2bハッシュで内容を比較
+- SNAPSHOT_FORMAT_VERSION が異なるスナップショットは無視
+
+Usage:
+    from infrastructure.config.config_snapshot import load_resolved_config
+
+    loader, resolver = load_resolved_config(config_file)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from domain.file_constants import CONFIG_SNAPSHOT_FILENAME
+from domain.loop_manifest import RACY_WINDOW_NS
+from domain.types import ConfigData
+from infrastructure.config.config_loader import ConfigLoader
+from infrastructure.config.path_resolver import PathResolver
+
+# モジュールロガー
+logger = logging.getLogger("episodic_rag")
+
+# スナップショット形式のバージョン（フィールド追加時にインクリメント）
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    解決済み設定のスナップショット
+
+    Attributes:
+        config: config.json の内容
+        base_dir: 解決済みbase_dir（絶対パス）
+        trusted_external_paths: 正規化済みの信頼済み外部パス
+        paths: pathsキー → 解決済み絶対パス
+    """
+
+    config: Dict[str, Any]
+    base_dir: str
+    trusted_external_paths: List[str] = field(default_factory=list)
+    paths: Dict[str, str] = field(default_factory=dict)
+
+
+def snapshot_from_resolver(resolver: PathResolver) -> ConfigSnapshot:
+    """
+    検証済みPathResolverからスナップショットを作成
+
+    paths セクションの全キーを解決して保持する。
+
+    Args:
+        resolver: 通常の初期化（検証込み）を経たPathResolver
+
+    Returns:
+        ConfigSnapshot
+
+    Example:
+        >>> snapshot = snapshot_from_resolver(PathResolver(config))
+        >>> snapshot.paths["digests_dir"]
+        '/data/Digests'
+    """
+    raw_paths = resolver.config.get("paths", {})
+    return ConfigSnapshot(
+        config=dict(resolver.config),
+        base_dir=str(resolver.base_dir),
+        trusted_external_paths=[str(p) for p in resolver.trusted_external_paths],
+        paths={
+            key: str(resolver.resolve_path(key))
+            for key, value in raw_paths.items()
+            if isinstance(value, str)
+        },
+    )
+
+
+def resolver_from_snapshot(snapshot: ConfigSnapshot) -> PathResolver:
+    """
+    スナップショットからPathResolverを復元（パス検証をスキップ）
+
+    Example:
+        >>> resolver = resolver_from_snapshot(snapshot)
+        >>> resolver.loops_path
+        Path('/data/Loops')
+    """
+    return PathResolver.from_resolved(
+        cast(ConfigData, snapshot.config),
+        base_dir=Path(snapshot.base_dir),
+        trusted_external_paths=[Path(p) for p in snapshot.trusted_external_paths],
+        resolved_paths={key: Path(value) for key, value in snapshot.paths.items()},
+    )
+
+
+def get_snapshot_path(config_file: Path) -> Path:
+    """
+    config.json に対応するスナップショットファイルのパスを返す
+
+    Example:
+        >>> get_snapshot_path(Path("/cfg/config.json"))
+        Path('/cfg/config.snapshot.json')
+    """
+    return config_file.with_name(CONFIG_SNAPSHOT_FILENAME)
+
+
+def _hash_file(file_path: Path) -> str:
+    """ファイル内容のblake2bハッシュ（hex）を返す"""
+    return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+
+
+def load_config_snapshot(config_file: Path) -> Optional[ConfigSnapshot]:
+    """
+    有効なスナップショットを読み込む
+
+    Args:
+        config_file: config.json のパス
+
+    Returns:
+        config.json が変更されていなければConfigSnapshot、それ以外はNone
+
+    Example:
+        >>> snapshot = load_config_snapshot(config_file)
+        >>> snapshot.paths["loops_dir"] if snapshot else None
+        '/data/Loops'
+    """
+    snapshot_file = get_snapshot_path(config_file)
+    try:
+        stat = config_file.stat()
+        with open(snapshot_file, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(raw, dict) or raw.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+
+    key = raw.get("key", {})
+    stat_matches = key.get("mtime_ns") == stat.st_mtime_ns and key.get("size") == stat.st_size
+    racy = key.get("written_at_ns", 0) - stat.st_mtime_ns < RACY_WINDOW_NS
+
+    if not stat_matches or racy:
+        try:
+            if _hash_file(config_file) != key.get("hash"):
+                logger.debug(f"Config snapshot stale: {snapshot_file}")
+                return None
+        except OSError:
+            return None
+
+    try:
+        return ConfigSnapshot(**raw["snapshot"])
+    except (KeyError, TypeError):
+        return None
+
+
+def save_config_snapshot(config_file: Path, snapshot: ConfigSnapshot) -> None:
+    """
+    スナップショットを保存（失敗してもエラーにしない）
+
+    キャッシュは最適化のためだけに存在するので、書き込みに失敗しても
+    設定の構築自体は成功させる。一時ファイル経由で置き換えるため、
+    並行プロセスが書きかけのスナップショットを読むことはない。
+
+    Args:
+        config_file: config.json のパス
+        snapshot: 保存するスナップショット
+
+    Example:
+        >>> save_config_snapshot(config_file, snapshot)
+    """
+    snapshot_file = get_snapshot_path(config_file)
+    try:
+        stat = config_file.stat()
+        payload = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "key": {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": _hash_file(config_file),
+                "written_at_ns": time.time_ns(),
+            },
+            "snapshot": asdict(snapshot),
+        }
+        tmp_file = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_file, snapshot_file)
+    except OSError as e:
+        logger.debug(f"Failed to write config snapshot {snapshot_file}: {e}")
+
+
+def invalidate_config_snapshot(config_file: Path) -> None:
+    """
+    スナップショットを削除
+
+    Example:
+        >>> invalidate_config_snapshot(config_file)
+    """
+    try:
+        get_snapshot_path(config_file).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Failed to remove config snapshot: {e}")
+
+
+def load_resolved_config(config_file: Path) -> Tuple[ConfigLoader, PathResolver]:
+    """
+    スナップショット経由でConfigLoaderとPathResolverを取得
+
+    有効なスナップショットがあれば config.json を読まずに復元し、
+    なければ通常どおり読み込み・検証してスナップショットを保存する。
+
+    Args:
+        config_file: config.json のパス
+
+    Returns:
+        (ConfigLoader, PathResolver) のタプル
+
+    Raises:
+        ConfigError: スナップショットが無効で、通常の読み込み・検証に失敗した場合
+
+    Example:
+        >>> loader, resolver = load_resolved_config(get_config_path())
+        >>> resolver.digests_path
+        Path('/data/Digests')
+    """
+    snapshot = load_config_snapshot(config_file)
+    if snapshot is not None:
+        resolver = resolver_from_snapshot(snapshot)
+        return ConfigLoader.from_data(config_file, resolver.config), resolver
+
+    loader = ConfigLoader(config_file)
+    resolver = PathResolver(loader.load())
+    save_config_snapshot(config_file, snapshot_from_resolver(resolver))
+    return loader, resolver
+
+
+__all__ = [
+    "ConfigSnapshot",
+    "SNAPSHOT_FORMAT_VERSION",
+    "get_snapshot_path",
+    "snapshot_from_resolver",
+    "resolver_from_snapshot",
+    "load_config_snapshot",
+    "save_config_snapshot",
+    "invalidate_config_snapshot",
+    "load_resolved_config",
+]
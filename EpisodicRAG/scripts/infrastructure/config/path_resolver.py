@@ -7,7 +7,7 @@ base_dir基準のパス解決
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from domain.exceptions import ConfigError
 from domain.types import ConfigData, as_dict
@@ -36,6 +36,50 @@ class PathResolver:
         self.config = config
         self._trusted_external_paths = self._parse_trusted_paths()
         self.base_dir = self._resolve_base_dir()
+        self._resolved_paths: Dict[str, Path] = {}
+
+    @classmethod
+    def from_resolved(
+        cls,
+        config: ConfigData,
+        base_dir: Path,
+        trusted_external_paths: List[Path],
+        resolved_paths: Dict[str, Path],
+    ) -> "PathResolver":
+        """
+        解決済みの値から構築（base_dir・trusted_external_pathsの検証をスキップ）
+
+        config.json が変更されていないことを確認済みのスナップショットから
+        復元する場合にのみ使用する。resolved_paths に含まれるキーは
+        resolve_path() で再解決せずにそのまま返す。
+
+        Args:
+            config: 設定辞書
+            base_dir: 検証済みの基準ディレクトリ
+            trusted_external_paths: 正規化済みの信頼済み外部パス
+            resolved_paths: pathsキー → 解決済み絶対パス
+
+        Returns:
+            PathResolver
+
+        Example:
+            >>> resolver = PathResolver.from_resolved(
+            ...     config, Path("/data"), [], {"loops_dir": Path("/data/Loops")}
+            ... )
+            >>> resolver.loops_path
+            Path('/data/Loops')
+        """
+        instance = cls.__new__(cls)
+        instance.config = config
+        instance._trusted_external_paths = list(trusted_external_paths)
+        instance.base_dir = base_dir
+        instance._resolved_paths = dict(resolved_paths)
+        return instance
+
+    @property
+    def trusted_external_paths(self) -> List[Path]:
+        """正規化済みの信頼済み外部パス"""
+        return list(self._trusted_external_paths)
 
     def _parse_trusted_paths(self) -> List[Path]:
         """
@@ -91,6 +135,26 @@ class PathResolver:
                 continue
         return False
 
+    def is_trusted(self, path: Path) -> bool:
+        """
+        パスが base_dir または trusted_external_paths の配下にあるか
+
+        フェデレーション検索の対象ストアなど、base_dir 外を読む設定の検証に使う。
+
+        Args:
+            path: 絶対パス（解決してから判定する）
+
+        Example:
+            >>> resolver.is_trusted(Path("/data/Digests"))
+            True
+        """
+        resolved = path.expanduser().resolve()
+        try:
+            resolved.relative_to(self.base_dir)
+            return True
+        except ValueError:
+            return self._is_within_trusted_paths(resolved)
+
     def _resolve_base_dir(self) -> Path:
         """
         base_dir設定を解釈して基準ディレクトリを返す
@@ -161,6 +225,9 @@ class PathResolver:
             >>> resolver.resolve_path("loops_dir")
             Path("/data/Loops")
         """
+        cached = self._resolved_paths.get(key)
+        if cached is not None:
+            return cached
         if "paths" not in self.config:
             raise ConfigError(config_section_missing_message("paths"))
         paths = as_dict(self.config["paths"])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Derived Data
+============
+
+派生データ（インデックス・ベクトルストア・マニフェスト・履歴など）の更新ヘルパー。
+
+派生データは正本（Loop・ダイジェスト・GrandDigest.txt）から rebuild() で作り直せるため、
+更新に失敗しても警告を出すだけで本処理（確定・検出・監視）は止めない。
+各Recorderはこの方針を個別に実装せず、DerivedUpdate / update_json_index を通して更新する。
+
+Usage:
+    from infrastructure.derived_data import DerivedUpdate, update_json_index
+
+    index = update_json_index(index_file, HierarchyIndex.from_dict, lambda i: i.link(...))
+    if index is None:
+        return  # 警告済み
+
+    with DerivedUpdate("digest_vectors") as update:
+        store.append(vectors)
+    if update.failed:
+        return
+"""
+
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple, Type, TypeVar
+
+from domain.exceptions import FileIOError
+from infrastructure.json_repository import save_json_if_changed, try_load_json
+from infrastructure.logging_config import log_warning
+
+__all__ = ["DerivedUpdate", "update_json_index"]
+
+
+class _JsonIndex(Protocol):
+    def to_dict(self) -> Dict[str, Any]: ...
+
+
+T = TypeVar("T", bound=_JsonIndex)
+
+
+class DerivedUpdate:
+    """
+    派生データの更新を囲むコンテキストマネージャ
+
+    ブロック内の FileIOError / OSError（と追加で指定した例外）を
+    「<label>の更新に失敗: ...」の警告にして握りつぶし、failed を True にする。
+
+    Example:
+        >>> with DerivedUpdate("loop_manifest.json"):
+        ...     save_json(manifest_file, manifest.to_dict())
+    """
+
+    def __init__(self, label: str, *errors: Type[BaseException]):
+        """
+        Args:
+            label: 警告に出す対象名（例: "timeline_index.json"）
+            errors: FileIOError / OSError のほかに警告扱いにする例外
+        """
+        self.label = label
+        self.errors: Tuple[Type[BaseException], ...] = (FileIOError, OSError, *errors)
+        self.failed = False
+
+    def __enter__(self) -> "DerivedUpdate":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        if exc is None or not isinstance(exc, self.errors):
+            return False
+        log_warning(f"{self.label}の更新に失敗: {exc}")
+        self.failed = True
+        return True
+
+
+def update_json_index(
+    path: Path, from_dict: Callable[[Dict[str, Any]], T], mutate: Callable[[T], None]
+) -> Optional[T]:
+    """
+    JSONインデックスを読み込み → 変更 → 保存（内容が変わらなければ書き込まない）
+
+    Args:
+        path: インデックスファイル（存在しない・壊れている場合は空から始める）
+        from_dict: 読み込んだdictからインデックスを作る関数
+        mutate: インデックスを変更する関数
+
+    Returns:
+        更新後のインデックス（更新に失敗した場合は警告してNone）
+
+    Example:
+        >>> update_json_index(path, TimelineIndex.from_dict, lambda i: i.record("loop", "L00186", t))
+    """
+    with DerivedUpdate(path.name) as update:
+        index = from_dict(try_load_json(path, default={}) or {})
+        mutate(index)
+        save_json_if_changed(path, index.to_dict())
+    return None if update.failed else index
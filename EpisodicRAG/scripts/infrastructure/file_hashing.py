@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+File Hashing
+============
+
+ファイル内容のblake2bハッシュをチャンク単位のストリーミングで計算する。
+
+大きなLoopファイル（数十万文字）を一度にメモリへ読み込まないよう、
+固定サイズのチャンクで読み進める。hashlib はチャンク処理中にGILを解放するため、
+複数ファイルはスレッドプールで並列に計算できる。
+
+Usage:
+    from infrastructure.file_hashing import hash_file, hash_files
+
+    hash_file(Path("Loops/L00186_test.txt"))  # '3f2a...'
+    hash_files([path1, path2])  # {path1: '3f2a...', path2: None}
+    hash_bytes(b"...")  # 読み込み済みの内容（パック済みLoopなど）
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# 読み込みチャンクサイズ（1MB）
+HASH_CHUNK_SIZE = 1 << 20
+
+# ハッシュ長（バイト）
+HASH_DIGEST_SIZE = 16
+
+# 並列数の上限
+MAX_HASH_WORKERS = 8
+
+
+def hash_file(file_path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    ファイル内容のblake2bハッシュ（hex）をストリーミングで計算
+
+    Raises:
+        OSError: ファイルを読めない場合
+
+    Example:
+        >>> hash_file(Path("Loops/L00186_test.txt"))
+        '3f2a9c...'
+    """
+    hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_bytes(data: bytes) -> str:
+    """
+    メモリ上の内容のハッシュ（hash_file と同じアルゴリズム・長さ）
+
+    Example:
+        >>> hash_bytes(Path("Loops/L00186_test.txt").read_bytes()) == hash_file(...)
+        True
+    """
+    return hashlib.blake2b(data, digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+
+def _try_hash(file_path: Path) -> Optional[str]:
+    try:
+        return hash_file(file_path)
+    except OSError:
+        return None
+
+
+def hash_files(
+    file_paths: Iterable[Path], max_workers: Optional[int] = None
+) -> Dict[Path, Optional[str]]:
+    """
+    複数ファイルのハッシュをスレッドプールで並列計算
+
+    Args:
+        file_paths: 対象ファイル
+        max_workers: 並列数（省略時は min(MAX_HASH_WORKERS, CPU数)）
+
+    Returns:
+        パス → ハッシュ（読めないファイルはNone）
+
+    Example:
+        >>> hash_files([Path("L00001.txt"), Path("missing.txt")])
+        {PosixPath('L00001.txt'): '3f2a...', PosixPath('missing.txt'): None}
+    """
+    paths = list(file_paths)
+    if len(paths) <= 1:
+        return {path: _try_hash(path) for path in paths}
+    workers = max_workers or min(MAX_HASH_WORKERS, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return dict(zip(paths, executor.map(_try_hash, paths)))
+
+
+__all__ = ["HASH_CHUNK_SIZE", "hash_bytes", "hash_file", "hash_files"]
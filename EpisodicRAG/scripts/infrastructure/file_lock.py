@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+File Lock
+=========
+
+fcntl.flock によるファイル単位・レベル単位のプロセス間ロック。
+
+## 設計意図
+
+同じ EpisodicRAG のデータを複数のセッションが共有すると、
+ShadowGrandDigest.txt や last_digest_times.json の「読み込み → 変更 → 保存」が
+交錯し、片方の更新が失われる。全体を1つのロックで直列化すると、
+weekly の save_provisional_digest が monthly の準備状況チェックまで止めてしまう。
+
+- ファイルロック（file_lock）: 対象ファイルごと。読み込みは共有、書き込みは排他
+- レベルロック（level_lock）: ダイジェストレベルごと。Provisional の追記や
+  確定処理など、複数ファイルにまたがるレベル単位の処理を直列化する
+
+ロックファイルは対象と同じディレクトリの LOCK_DIRNAME 配下に置く
+（データと同じファイルシステム上でロックする）。保存は書き込み先を直接
+書き換えるため、対象ファイル自体ではなく別のロックファイルをロックする。
+
+## 入れ子と順序
+
+- 同じスレッドの中では再入できる（排他ロック中の共有ロックも可）。
+  共有ロック中の排他ロック（昇格）はデッドロックの原因になるため RuntimeError
+- flock はオープンしたファイルごとのロックなので、同じプロセスの別スレッドとも排他になる
+- 複数のレベルロックを取るときは下位レベルから順に取る（weekly → monthly）
+
+fcntl がない環境（Windows）ではロックは何もしない。
+
+Usage:
+    from infrastructure.file_lock import file_lock, level_lock
+
+    with file_lock(shadow_path):  # 排他（読み込み → 変更 → 保存）
+        data = load_json(shadow_path)
+        save_json(shadow_path, data)
+
+    with file_lock(shadow_path, shared=True):  # 共有（読み込みのみ）
+        data = load_json(shadow_path)
+
+    with level_lock(digests_path, "weekly"):
+        ...  # weekly の Provisional 追記
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ContextManager, Dict, Iterator, Optional
+
+from domain.exceptions import FileIOError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is POSIX only
+    fcntl = None  # type: ignore[assignment]
+
+# fcntl がない環境（Windows）ではロックを取らずに素通しする
+_LOCKING_SUPPORTED: bool = fcntl is not None
+
+# ロックファイルを置くディレクトリ名（対象と同じディレクトリに作る）
+LOCK_DIRNAME = ".locks"
+
+# ロックを待つ時間の既定値（秒）
+DEFAULT_LOCK_TIMEOUT = 30.0
+
+# ロックの空きを確認する間隔（秒、待つほど伸ばす）
+_POLL_INITIAL = 0.005
+_POLL_MAX = 0.1
+
+
+@dataclass
+class _Held:
+    fd: int
+    shared: bool
+    depth: int
+
+
+class LockManager:
+    """
+    ロックファイルに対する共有・排他ロックを管理する
+
+    保持中のロックはスレッドごとに記録し、同じスレッドからの再入は
+    ロックを取り直さずに深さだけを数える。
+
+    Example:
+        >>> manager = LockManager()
+        >>> with manager.acquire(Path("Essences/.locks/ShadowGrandDigest.txt.lock")):
+        ...     ...
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _held(self) -> Dict[str, _Held]:
+        held = getattr(self._local, "held", None)
+        if held is None:
+            held = self._local.held = {}
+        return held
+
+    @contextmanager
+    def acquire(
+        self, lock_path: Path, shared: bool = False, timeout: Optional[float] = None
+    ) -> Iterator[None]:
+        """
+        ロックファイルをロックする（with ブロックの終わりで解放）
+
+        Args:
+            lock_path: ロックファイルのパス（親ディレクトリは自動作成）
+            shared: True なら共有ロック（読み込み用）、False なら排他ロック
+            timeout: 待つ時間の上限（秒、省略時は DEFAULT_LOCK_TIMEOUT）
+
+        Raises:
+            FileIOError: 制限時間内にロックを取れなかった、またはロックファイルを開けない場合
+            RuntimeError: 同じスレッドが共有ロック中に排他ロックを取ろうとした場合
+
+        Example:
+            >>> with manager.acquire(lock_path, shared=True):
+            ...     data = load_json(path)
+        """
+        if not _LOCKING_SUPPORTED:  # pragma: no cover - fcntl is POSIX only
+            yield
+            return
+
+        key = os.path.abspath(lock_path)
+        held = self._held()
+        entry = held.get(key)
+        if entry is not None:
+            if entry.shared and not shared:
+                raise RuntimeError(f"cannot upgrade a shared lock to exclusive: {key}")
+            entry.depth += 1
+            try:
+                yield
+            finally:
+                entry.depth -= 1
+            return
+
+        fd = self._open(key)
+        try:
+            self._lock(fd, key, shared, DEFAULT_LOCK_TIMEOUT if timeout is None else timeout)
+        except BaseException:
+            os.close(fd)
+            raise
+        held[key] = _Held(fd, shared, 1)
+        try:
+            yield
+        finally:
+            del held[key]
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _open(key: str) -> int:
+        try:
+            os.makedirs(os.path.dirname(key), exist_ok=True)
+            return os.open(key, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            raise FileIOError(f"Cannot open lock file: {key} ({e})") from e
+
+    @staticmethod
+    def _lock(fd: int, key: str, shared: bool, timeout: float) -> None:
+        operation = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+        deadline = time.monotonic() + timeout
+        delay = _POLL_INITIAL
+        while True:
+            try:
+                fcntl.flock(fd, operation)
+                return
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                raise FileIOError(f"Cannot lock file: {key} ({e})") from e
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                mode = "shared" if shared else "exclusive"
+                raise FileIOError(f"Timed out after {timeout:.1f}s waiting for {mode} lock: {key}")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX)
+
+
+def lock_path_for(file_path: Path) -> Path:
+    """
+    対象ファイルのロックファイルのパスを返す
+
+    Example:
+        >>> lock_path_for(Path("Essences/ShadowGrandDigest.txt"))
+        PosixPath('Essences/.locks/ShadowGrandDigest.txt.lock')
+    """
+    return file_path.parent / LOCK_DIRNAME / f"{file_path.name}.lock"
+
+
+def level_lock_path(base_dir: Path, level: str) -> Path:
+    """
+    レベルロックのロックファイルのパスを返す
+
+    Example:
+        >>> level_lock_path(Path("Digests"), "weekly")
+        PosixPath('Digests/.locks/level-weekly.lock')
+    """
+    return base_dir / LOCK_DIRNAME / f"level-{level}.lock"
+
+
+_manager_instance: Optional[LockManager] = None
+
+
+def get_lock_manager() -> LockManager:
+    """
+    プロセス全体で共有するロックマネージャーを取得
+
+    Example:
+        >>> get_lock_manager() is get_lock_manager()
+        True
+    """
+    global _manager_instance
+    if _manager_instance is None:
+        _manager_instance = LockManager()
+    return _manager_instance
+
+
+def reset_lock_manager() -> None:
+    """
+    共有ロックマネージャーをリセット（テスト用）
+
+    Example:
+        >>> reset_lock_manager()
+    """
+    global _manager_instance
+    _manager_instance = None
+
+
+def file_lock(
+    file_path: Path, shared: bool = False, timeout: Optional[float] = None
+) -> ContextManager[None]:
+    """
+    ファイル単位のロック（読み込みは shared=True、読み込み → 変更 → 保存は排他）
+
+    Args:
+        file_path: ロックする対象ファイル（存在しなくてもよい）
+        shared: True なら共有ロック
+        timeout: 待つ時間の上限（秒、省略時は DEFAULT_LOCK_TIMEOUT）
+
+    Raises:
+        FileIOError: 制限時間内にロックを取れなかった場合
+
+    Example:
+        >>> with file_lock(times_path):
+        ...     times = load_json(times_path)
+        ...     times["weekly"]["last_processed"] = 3
+        ...     save_json(times_path, times)
+    """
+    return get_lock_manager().acquire(lock_path_for(file_path), shared, timeout)
+
+
+def level_lock(
+    base_dir: Path, level: str, shared: bool = False, timeout: Optional[float] = None
+) -> ContextManager[None]:
+    """
+    ダイジェストレベル単位のロック（同じ base_dir の同じレベル同士だけが排他）
+
+    Args:
+        base_dir: ロックの範囲を決めるディレクトリ（通常は digests_path）
+        level: ダイジェストレベル名
+        shared: True なら共有ロック
+        timeout: 待つ時間の上限（秒、省略時は DEFAULT_LOCK_TIMEOUT）
+
+    Raises:
+        FileIOError: 制限時間内にロックを取れなかった場合
+
+    Example:
+        >>> with level_lock(config.digests_path, "weekly"):
+        ...     saver.save_provisional("weekly", digests, append=True)
+    """
+    return get_lock_manager().acquire(level_lock_path(base_dir, level), shared, timeout)
+
+
+__all__ = [
+    "DEFAULT_LOCK_TIMEOUT",
+    "LOCK_DIRNAME",
+    "LockManager",
+    "file_lock",
+    "get_lock_manager",
+    "level_lock",
+    "level_lock_path",
+    "lock_path_for",
+    "reset_lock_manager",
+]
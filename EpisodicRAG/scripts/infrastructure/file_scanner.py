@@ -6,6 +6,11 @@ File Scanner
 ファイルシステムスキャンを担当するインフラストラクチャ層。
 ディレクトリ内のファイル検出、パターンマッチングを提供。
 
+Loopsディレクトリをスキャンする呼び出し側は include_archived=True を渡し、
+パック済みLoop（infrastructure.loop_archive）もディスク上のファイルと同様に数える
+（パスは存在しないため、内容は read_loop_bytes() で読む）。
+それ以外のディレクトリではアーカイブのインデックスを参照しない。
+
 Usage:
     from infrastructure.file_scanner import scan_files, get_files_by_pattern
 """
@@ -13,8 +18,17 @@ Usage:
 from pathlib import Path
 from typing import Callable, List, Optional
 
+from infrastructure.loop_archive import LoopArchive
+
+
+def _archived_files(directory: Path, pattern: str) -> List[Path]:
+    """パック済みLoopのうちパターンにマッチするもの（ディレクトリ直下のパスとして）"""
+    return [directory / name for name in LoopArchive.open(directory).names(pattern)]
 
-def scan_files(directory: Path, pattern: str = "*.txt", sort: bool = True) -> List[Path]:
+
+def scan_files(
+    directory: Path, pattern: str = "*.txt", sort: bool = True, include_archived: bool = False
+) -> List[Path]:
     """
     指定ディレクトリ内のファイルをスキャン
 
@@ -22,6 +36,8 @@ def scan_files(directory: Path, pattern: str = "*.txt", sort: bool = True) -> Li
         directory: スキャンするディレクトリ
         pattern: ファイルパターン（glob形式）
         sort: ソートするかどうか（デフォルト: True）
+        include_archived: パック済みLoopも含めるか（Loopsディレクトリ用、
+            返すパスはディスク上に存在しない）
 
     Returns:
         マッチしたファイルのPathリスト
@@ -34,6 +50,9 @@ def scan_files(directory: Path, pattern: str = "*.txt", sort: bool = True) -> Li
         return []
 
     files = list(directory.glob(pattern))
+    if include_archived:
+        on_disk = {f.name for f in files}
+        files.extend(f for f in _archived_files(directory, pattern) if f.name not in on_disk)
 
     if sort:
         files = sorted(files)
@@ -68,7 +87,9 @@ def get_files_by_pattern(
 
 
 def get_max_numbered_file(
-    directory: Path, pattern: str, number_extractor: Callable[[str], Optional[int]]
+    directory: Path,
+    pattern: str,
+    number_extractor: Callable[[str], Optional[int]],
 ) -> Optional[int]:
     """
     ディレクトリ内の最大番号を取得
@@ -91,7 +112,7 @@ def get_max_numbered_file(
 
     max_num = None
 
-    for file in directory.glob(pattern):
+    for file in scan_files(directory, pattern, sort=False):
         num = number_extractor(file.name)
         if num is not None:
             if max_num is None or num > max_num:
@@ -129,13 +150,14 @@ def filter_files_after_number(
     return result
 
 
-def count_files(directory: Path, pattern: str = "*.txt") -> int:
+def count_files(directory: Path, pattern: str = "*.txt", include_archived: bool = False) -> int:
     """
     パターンにマッチするファイル数をカウント
 
     Args:
         directory: スキャンするディレクトリ
         pattern: ファイルパターン（glob形式）
+        include_archived: パック済みLoopも含めるか（Loopsディレクトリ用）
 
     Returns:
         マッチしたファイル数
@@ -147,4 +169,4 @@ def count_files(directory: Path, pattern: str = "*.txt") -> int:
     if not directory.exists():
         return 0
 
-    return len(list(directory.glob(pattern)))
+    return len(scan_files(directory, pattern, sort=False, include_archived=include_archived))
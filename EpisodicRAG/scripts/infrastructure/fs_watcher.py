@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Filesystem Watcher
+==================
+
+ディレクトリ配下のファイル作成・書き込み・削除・移動を監視する。
+
+Linux では ctypes 経由で inotify を使い、使えない環境（macOS / Windows /
+inotify の上限到達など）では一定間隔で stat を比較するポーリングに切り替える。
+どちらも poll() で「変化したパスの集合」を返すだけで、
+変化をどう扱うかは呼び出し側（IndexWarmer）が決める。
+
+イベントキューが溢れた場合（IN_Q_OVERFLOW）は、監視ルート自体を変化として返す。
+呼び出し側はルート全体を再走査する。
+
+Usage:
+    from infrastructure.fs_watcher import create_watcher
+
+    with create_watcher([loops_path, digests_path]) as watcher:
+        changed = watcher.poll(timeout=5.0)  # {Path('Loops/L00187_x.txt')}
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from infrastructure.structured_logging import get_structured_logger
+
+_logger = get_structured_logger(__name__)
+
+# ポーリングの既定間隔（秒）
+DEFAULT_POLL_INTERVAL = 2.0
+
+# 監視バックエンド名
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+
+# inotify のイベントマスク（<sys/inotify.h>）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class DirectoryWatcher(ABC):
+    """監視バックエンドの共通インターフェース"""
+
+    backend = ""
+
+    def __init__(self, roots: Iterable[Path]):
+        self.roots = [Path(root) for root in roots]
+
+    @abstractmethod
+    def poll(self, timeout: float) -> Set[Path]:
+        """
+        変化を最大 timeout 秒待ち、変化したパスの集合を返す（変化がなければ空）
+        """
+
+    def close(self) -> None:
+        """監視を終了"""
+
+    def __enter__(self) -> "DirectoryWatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _iter_dirs(root: Path) -> Iterable[Path]:
+    """root とその配下のディレクトリ（存在しない場合は何も返さない）"""
+    if not root.is_dir():
+        return
+    yield root
+    for dir_path, dir_names, _file_names in os.walk(root):
+        for name in dir_names:
+            yield Path(dir_path) / name
+
+
+class PollingWatcher(DirectoryWatcher):
+    """
+    stat のスナップショットを比較するポーリング監視
+
+    Example:
+        >>> watcher = PollingWatcher([loops_path], interval=1.0)
+        >>> watcher.poll(timeout=3.0)
+        {PosixPath('Loops/L00187_x.txt')}
+    """
+
+    backend = "poll"
+
+    def __init__(self, roots: Iterable[Path], interval: float = DEFAULT_POLL_INTERVAL):
+        super().__init__(roots)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for root in self.roots:
+            for dir_path in _iter_dirs(root):
+                try:
+                    entries = list(os.scandir(dir_path))
+                except OSError:
+                    continue
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            snapshot[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue
+        return snapshot
+
+    def poll(self, timeout: float) -> Set[Path]:
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+def inotify_available() -> bool:
+    """この環境で inotify を使えるか"""
+    return _load_libc() is not None
+
+
+class InotifyWatcher(DirectoryWatcher):
+    """
+    inotify（ctypes経由）によるイベント監視
+
+    監視ルート配下のディレクトリを再帰的に登録し、
+    後から作成されたディレクトリも自動で登録する。
+
+    Raises:
+        OSError: inotify を使えない、または監視を登録できない場合
+    """
+
+    backend = "inotify"
+
+    def __init__(self, roots: Iterable[Path]):
+        super().__init__(roots)
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self._dirs: Dict[int, Path] = {}
+        try:
+            for root in self.roots:
+                for dir_path in _iter_dirs(root):
+                    self._add_watch(dir_path)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, dir_path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}", str(dir_path))
+        self._dirs[wd] = dir_path
+
+    def _read_events(self) -> List[Tuple[int, int, str]]:
+        events: List[Tuple[int, int, str]] = []
+        while True:
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                events.append((wd, mask, os.fsdecode(raw_name)))
+
+    def poll(self, timeout: float) -> Set[Path]:
+        if self._fd < 0:
+            return set()
+        readable, _w, _x = select.select([self._fd], [], [], max(timeout, 0.0))
+        if not readable:
+            return set()
+        changed: Set[Path] = set()
+        for wd, mask, name in self._read_events():
+            if mask & IN_Q_OVERFLOW:
+                _logger.state("inotify_overflow", roots=len(self.roots))
+                changed.update(self.roots)
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            dir_path = self._dirs.get(wd)
+            if dir_path is None:
+                continue
+            path = dir_path / name if name else dir_path
+            changed.add(path)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                for sub_dir in _iter_dirs(path):
+                    try:
+                        self._add_watch(sub_dir)
+                    except OSError:
+                        continue
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(
+    roots: Iterable[Path], backend: str = "auto", interval: float = DEFAULT_POLL_INTERVAL
+) -> DirectoryWatcher:
+    """
+    監視バックエンドを作成
+
+    Args:
+        roots: 監視するディレクトリ
+        backend: "auto"（inotify、使えなければポーリング）/ "inotify" / "poll"
+        interval: ポーリング間隔（秒）
+
+    Raises:
+        ValueError: 不明なバックエンド名の場合
+        OSError: backend="inotify" で inotify を使えない場合
+
+    Example:
+        >>> create_watcher([loops_path]).backend
+        'inotify'
+    """
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(f"unknown watch backend: {backend}")
+    roots = list(roots)
+    if backend == "inotify":
+        return InotifyWatcher(roots)
+    if backend == "auto" and inotify_available():
+        try:
+            return InotifyWatcher(roots)
+        except OSError as e:
+            _logger.state("inotify_unavailable", error=str(e))
+    return PollingWatcher(roots, interval)
+
+
+__all__ = [
+    "DEFAULT_POLL_INTERVAL",
+    "WATCH_BACKENDS",
+    "DirectoryWatcher",
+    "InotifyWatcher",
+    "PollingWatcher",
+    "create_watcher",
+    "inotify_available",
+]
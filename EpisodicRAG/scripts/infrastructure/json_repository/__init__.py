@@ -12,6 +12,8 @@ JSONファイルの読み書きを担当するインフラストラクチャ層
 json_repository/
 ├── __init__.py        # 公開API
 ├── operations.py      # 基本操作（load_json, save_json等）
+├── cache.py           # (パス, mtime_ns, size) をキーにした読み込みキャッシュ
+├── codec.py           # 書き出し形式（整形/コンパクト）とパーサーの選択
 ├── load_strategy.py   # Strategy Pattern実装
 └── chained_loader.py  # Chain of Responsibility
 ```
@@ -46,7 +48,15 @@ import logging
 from pathlib import Path
 from typing import Any, Callable, Mapping, Optional, TypeVar
 
+from infrastructure.json_repository.cache import JsonFileCache, get_json_cache, reset_json_cache
 from infrastructure.json_repository.chained_loader import ChainedLoader
+from infrastructure.json_repository.codec import (
+    COMPACT,
+    PRETTY,
+    JsonCodec,
+    codec_for,
+    register_codec,
+)
 from infrastructure.json_repository.load_strategy import (
     DefaultLoadStrategy,
     FactoryLoadStrategy,
@@ -62,6 +72,8 @@ from infrastructure.json_repository.operations import (
     load_json,
     safe_read_json,
     save_json,
+    save_json_if_changed,
+    save_json_stamped,
     try_load_json,
     try_read_json_from_file,
 )
@@ -147,6 +159,8 @@ __all__ = [
     # 基本操作
     "load_json",
     "save_json",
+    "save_json_if_changed",
+    "save_json_stamped",
     "load_json_with_template",
     "file_exists",
     "ensure_directory",
@@ -155,6 +169,16 @@ __all__ = [
     "try_read_json_from_file",
     # 低レベルAPI（上級者向け）
     "safe_read_json",
+    # 読み込みキャッシュ
+    "JsonFileCache",
+    "get_json_cache",
+    "reset_json_cache",
+    # Codec（書き出し形式）
+    "JsonCodec",
+    "PRETTY",
+    "COMPACT",
+    "codec_for",
+    "register_codec",
     # Strategy Pattern（拡張用）
     "LoadStrategy",
     "LoadContext",
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+JSON File Cache - 世代スタンプ付きの読み込みキャッシュ
+=====================================================
+
+(パス, st_mtime_ns, st_size) をキーにした、プロセス全体で共有するJSON読み込みキャッシュ。
+
+## 設計意図
+
+GrandDigestManager.update_digest の load_or_create、
+DigestTimesTracker._save_level_data の再読み込み、
+FileDetector.get_max_file_number のレベルごとの読み込みなど、
+変更されていない同じファイルを何度もパースしていた。
+
+- 読み込み: stat 1回でキーを照合し、一致すればパースせずに返す
+- 書き込み: save_json 系が書いた内容でエントリをその場で更新する
+- 受け渡し: キャッシュ内の値は呼び出し側に渡さず、dict / list だけを複製して渡す
+  （呼び出し側が書き換えてもキャッシュは変わらない。文字列・数値は共有）
+
+## racy なエントリ
+
+mtime の分解能が粗いファイルシステムでは、同じ時刻刻みの中で同じサイズに
+書き換えられると stat では変更を検出できない（git の racy-git と同じ問題）。
+mtime が記録時刻から RACY_WINDOW_NS 以内のエントリは本文も保持し、
+照合時にファイルの内容と比較する。窓を過ぎて一致を確認できたら本文は捨てる。
+
+Usage:
+    from infrastructure.json_repository.cache import get_json_cache
+
+    cache = get_json_cache()
+    data = cache.load(path, loads)  # 変更がなければパースしない
+    cache.put(path, data, text)  # 書き込みの直後に記録
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from domain.loop_manifest import RACY_WINDOW_NS
+
+# キャッシュするファイル数の上限（超えたら最も古く使われたものから捨てる）
+MAX_CACHED_FILES = 256
+
+
+def _key(file_path: Path) -> str:
+    return os.path.abspath(file_path)
+
+
+def _copy_json(value: Any) -> Any:
+    """JSON値の dict / list だけを複製（文字列・数値などの不変値は共有）"""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _is_plain_json(value: Any) -> bool:
+    """JSONとして書いて読み直すと同じ値に戻るか（タプル・非文字列キー等を含まないか）"""
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_plain_json(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(_is_plain_json(item) for item in value)
+    return value is None or isinstance(value, (str, int, float))
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    data: Dict[str, Any]
+    # racy なエントリだけが持つファイル本文（窓を過ぎて確認できたら None）
+    text: Optional[str]
+
+
+class JsonFileCache:
+    """
+    (パス, st_mtime_ns, st_size) をキーにしたJSON読み込みキャッシュ
+
+    スレッドセーフ（フェデレーション検索などのスレッドから同時に使われる）。
+
+    Example:
+        >>> cache = JsonFileCache()
+        >>> cache.load(path, loads)
+        {'a': 1}
+        >>> cache.load(path, loads)  # 変更がなければ stat のみ
+        {'a': 1}
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_FILES) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, file_path: Path, parse: Callable[[str], Any]) -> Any:
+        """
+        ファイルを読み込む（変更されていなければパースせずにキャッシュから返す）
+
+        stat はファイルを読む前に取るため、読み込み中に書き換えられたファイルは
+        次回の照合でキーが一致せず、読み直される。
+
+        Args:
+            file_path: JSONファイルのパス
+            parse: JSON文字列をパースする関数（codec.loads など）
+
+        Returns:
+            パースした値（dict はキャッシュとは別の複製）
+
+        Raises:
+            OSError: stat・読み込みに失敗した場合（エントリは捨てる）
+            json.JSONDecodeError など: parse が送出した例外（エントリは捨てる）
+
+        Example:
+            >>> cache.load(Path("GrandDigest.txt"), loads)  # 1回目はパース
+            {'major_digests': {...}, 'metadata': {...}}
+            >>> cache.load(Path("GrandDigest.txt"), loads)  # 2回目は stat のみ
+            {'major_digests': {...}, 'metadata': {...}}
+        """
+        key = _key(file_path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self.discard(file_path)
+            raise
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if (
+            entry is not None
+            and stat.st_mtime_ns == entry.mtime_ns
+            and stat.st_size == entry.size
+            and (entry.text is None or self._confirm_racy(key, entry))
+        ):
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            return _copy_json(entry.data)
+
+        with self._lock:
+            self.misses += 1
+        try:
+            with open(key, "r", encoding="utf-8") as f:
+                text = f.read()
+            data = parse(text)
+        except Exception:
+            self.discard(file_path)
+            raise
+        if isinstance(data, dict):
+            self._store(key, stat, _copy_json(data), text, time.time_ns())
+        else:
+            self.discard(file_path)
+        return data
+
+    def _confirm_racy(self, key: str, entry: _Entry) -> bool:
+        """racy なエントリをファイルの内容と照合（窓を過ぎていれば以後は stat だけで判定）"""
+        checked_at = time.time_ns()
+        try:
+            with open(key, "r", encoding="utf-8") as f:
+                if f.read() != entry.text:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            return False
+        if checked_at - entry.mtime_ns > RACY_WINDOW_NS:
+            entry.text = None
+        return True
+
+    def _store(
+        self, key: str, stat: os.stat_result, data: Dict[str, Any], text: str, recorded_at: int
+    ) -> None:
+        racy = recorded_at - stat.st_mtime_ns <= RACY_WINDOW_NS
+        entry = _Entry(stat.st_mtime_ns, stat.st_size, data, text if racy else None)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def put(self, file_path: Path, data: Any, text: str) -> None:
+        """
+        書き込んだ内容でエントリを更新（save_json 系が書き込み直後に呼ぶ）
+
+        JSONとして書いて読み直すと値が変わるデータ（タプル・非文字列キー等）や
+        dict でないデータは記録せず、既存のエントリも捨てる。
+
+        Args:
+            file_path: 書き込んだJSONファイルのパス
+            data: 書き込んだ値（複製して保持する）
+            text: 書き込んだ本文
+
+        Example:
+            >>> cache.put(path, {"a": 1}, '{"a":1}')
+        """
+        if not isinstance(data, dict) or not _is_plain_json(data):
+            self.discard(file_path)
+            return
+        key = _key(file_path)
+        recorded_at = time.time_ns()
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self.discard(file_path)
+            return
+        self._store(key, stat, _copy_json(data), text, recorded_at)
+
+    def discard(self, file_path: Path) -> None:
+        """
+        ファイルのエントリを捨てる（なければ何もしない）
+
+        Example:
+            >>> cache.discard(path)
+        """
+        with self._lock:
+            self._entries.pop(_key(file_path), None)
+
+    def clear(self) -> None:
+        """
+        全エントリと統計を捨てる
+
+        Example:
+            >>> cache.clear()
+            >>> len(cache)
+            0
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache_instance: Optional[JsonFileCache] = None
+
+
+def get_json_cache() -> JsonFileCache:
+    """
+    プロセス全体で共有するキャッシュを取得
+
+    Example:
+        >>> get_json_cache() is get_json_cache()
+        True
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = JsonFileCache()
+    return _cache_instance
+
+
+def reset_json_cache() -> None:
+    """
+    共有キャッシュをリセット（テスト用）
+
+    Example:
+        >>> reset_json_cache()
+    """
+    global _cache_instance
+    _cache_instance = None
+
+
+__all__ = [
+    "JsonFileCache",
+    "MAX_CACHED_FILES",
+    "get_json_cache",
+    "reset_json_cache",
+]
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+JSON Codec - シリアライズ形式の切り替え
+======================================
+
+JSONの書き出し形式（整形 / コンパクト）と読み込みパーサーをまとめた codec。
+
+## 設計意図
+
+GrandDigest や ShadowGrandDigest は人やClaudeが直接読むため indent=2 で書くが、
+last_digest_times.json や派生インデックスなど機械だけが読むファイルに
+インデントは不要で、サイズと書き出し時間が増えるだけだった。
+
+- 書き出し形式はファイル名ごとに codec_for() で決まる（save_json 系が参照）
+- 読み込みは形式によらず同じ。orjson がインポートできればそれを使い、
+  なければ標準ライブラリの json を使う（結果は同じ dict）
+- 書き出しは常に標準ライブラリの json。バックエンドによって出力バイト列が変わると
+  save_json_if_changed の比較が不安定になるため
+
+Usage:
+    from infrastructure.json_repository.codec import COMPACT, PRETTY, codec_for
+
+    codec_for(Path("last_digest_times.json"))  # COMPACT
+    codec_for(Path("GrandDigest.txt"))  # PRETTY
+    COMPACT.dumps({"a": [1, 2]})  # '{"a":[1,2]}'
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from domain.file_constants import (
+    CONFIG_SNAPSHOT_FILENAME,
+    CORPUS_GENERATION_FILENAME,
+    DIGEST_TIMES_FILENAME,
+    LOOP_MANIFEST_FILENAME,
+    LOOP_SIGNATURES_FILENAME,
+    PENDING_LOOPS_FILENAME,
+    QUERY_CACHE_FILENAME,
+    TIMELINE_INDEX_FILENAME,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+
+# 読み込みに使うパーサー名
+PARSER_NAME = "orjson" if orjson is not None else "json"
+
+
+def loads(text: str) -> Any:
+    """
+    利用可能な最速のパーサーでJSON文字列をパース
+
+    orjson が受け付けない入力（NaN など）は標準ライブラリで読み直すため、
+    結果とエラーは標準ライブラリの json.loads と同じになる。
+
+    Raises:
+        json.JSONDecodeError: JSONとして不正な場合
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """
+    JSONの書き出し形式
+
+    Attributes:
+        name: 形式名（"pretty" / "compact"）
+        indent: インデント幅（Noneなら改行なし）
+        separators: (項目区切り, キー区切り)
+
+    Example:
+        >>> PRETTY.dumps({"a": 1})
+        '{\\n  "a": 1\\n}'
+        >>> COMPACT.loads('{"a":1}')
+        {'a': 1}
+    """
+
+    name: str
+    indent: Optional[int]
+    separators: Tuple[str, str]
+
+    def dumps(self, data: Any) -> str:
+        """dataをこの形式の文字列にシリアライズ（キーは挿入順、ensure_ascii=False）"""
+        return json.dumps(data, ensure_ascii=False, indent=self.indent, separators=self.separators)
+
+    def loads(self, text: str) -> Any:
+        """JSON文字列をパース（形式によらず loads() と同じ）"""
+        return loads(text)
+
+
+def pretty(indent: int = 2) -> JsonCodec:
+    """指定インデント幅の整形codec"""
+    return JsonCodec("pretty", indent, (",", ": "))
+
+
+PRETTY = pretty(2)
+"""人が読むファイル用（indent=2、save_json の従来形式）"""
+
+COMPACT = JsonCodec("compact", None, (",", ":"))
+"""機械だけが読むファイル用（空白・改行なし）"""
+
+# ファイル名 → codec（登録のないファイルは save_json の indent に従う）
+_CODECS: Dict[str, JsonCodec] = {
+    name: COMPACT
+    for name in (
+        DIGEST_TIMES_FILENAME,
+        CONFIG_SNAPSHOT_FILENAME,
+        TIMELINE_INDEX_FILENAME,
+        LOOP_SIGNATURES_FILENAME,
+        LOOP_MANIFEST_FILENAME,
+        PENDING_LOOPS_FILENAME,
+        CORPUS_GENERATION_FILENAME,
+        QUERY_CACHE_FILENAME,
+    )
+}
+
+
+def register_codec(file_name: str, codec: JsonCodec) -> None:
+    """
+    ファイル名に codec を割り当てる
+
+    Example:
+        >>> register_codec("my_cache.json", COMPACT)
+    """
+    _CODECS[file_name] = codec
+
+
+def codec_for(file_path: Path, indent: int = 2) -> JsonCodec:
+    """
+    ファイルの書き出しに使う codec（登録がなければ indent 幅の整形codec）
+
+    Example:
+        >>> codec_for(Path("last_digest_times.json")).name
+        'compact'
+        >>> codec_for(Path("GrandDigest.txt")).name
+        'pretty'
+    """
+    codec = _CODECS.get(file_path.name)
+    if codec is not None:
+        return codec
+    return PRETTY if indent == 2 else pretty(indent)
+
+
+__all__ = [
+    "JsonCodec",
+    "PRETTY",
+    "COMPACT",
+    "PARSER_NAME",
+    "pretty",
+    "register_codec",
+    "codec_for",
+    "loads",
+]
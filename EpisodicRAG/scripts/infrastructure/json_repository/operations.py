@@ -17,22 +17,30 @@ JSON操作のプリミティブをこのモジュールに集約し、
 |------|------|
 | safe_read_json | JSONファイルを安全に読み込む（共通ヘルパー） |
 | load_json | 必須ファイルの読み込み（エラーは例外） |
-| save_json | ファイル保存（親ディレクトリ自動作成） |
+| save_json | ファイル保存（親ディレクトリ自動作成、形式は codec_for で決定） |
+| save_json_if_changed | 内容が変わった場合のみ保存（git同期向け） |
+| save_json_stamped | stamp以外が変わった場合のみ stamp を更新して保存 |
 | try_load_json | オプショナルファイル読み込み（エラーはdefault） |
 | try_read_json_from_file | バッチ処理向け読み込み（拡張子チェック付き） |
 | file_exists | ファイル存在チェック |
 | ensure_directory | ディレクトリ保証 |
 | confirm_file_overwrite | 上書き確認 |
+
+読み込みは cache.py のプロセス共有キャッシュを通る（変更のないファイルは stat のみ）。
+save_json 系は書いた内容でキャッシュのエントリを更新する。
 """
 
 import json
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
 from domain.constants import DIGEST_FILE_EXTENSION
 from domain.error_formatter import get_error_formatter
 from domain.exceptions import FileIOError
+from infrastructure.json_repository.cache import get_json_cache
+from infrastructure.json_repository.codec import JsonCodec, codec_for, loads
 
 # モジュールロガー
 logger = logging.getLogger("episodic_rag")
@@ -42,6 +50,9 @@ def safe_read_json(file_path: Path, raise_on_error: bool = True) -> Optional[Dic
     """
     JSONファイルを安全に読み込む共通ヘルパー
 
+    前回の読み込み・書き込みからファイルが変わっていなければ、
+    パースせずにキャッシュの複製を返す（get_json_cache()）。
+
     Args:
         file_path: 読み込むJSONファイルのパス
         raise_on_error: エラー時に例外を発生させるか（Falseの場合はNoneを返す）
@@ -60,9 +71,8 @@ def safe_read_json(file_path: Path, raise_on_error: bool = True) -> Optional[Dic
     """
     formatter = get_error_formatter()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            result: Dict[str, Any] = json.load(f)
-            return result
+        result: Dict[str, Any] = get_json_cache().load(file_path, loads)
+        return result
     except json.JSONDecodeError as e:
         if raise_on_error:
             raise FileIOError(formatter.file.invalid_json(file_path, e)) from e
@@ -102,14 +112,20 @@ def load_json(file_path: Path) -> Dict[str, Any]:
     return cast(Dict[str, Any], result)
 
 
-def save_json(file_path: Path, data: Dict[str, Any], indent: int = 2) -> None:
+def save_json(
+    file_path: Path, data: Dict[str, Any], indent: int = 2, codec: Optional[JsonCodec] = None
+) -> None:
     """
     dictをJSONファイルに保存（親ディレクトリ自動作成）
 
+    機械だけが読むファイル（last_digest_times.json など）は codec_for() により
+    コンパクト形式で書かれる。
+
     Args:
         file_path: 保存先のパス
         data: 保存するdict
-        indent: インデント幅（デフォルト: 2）
+        indent: インデント幅（デフォルト: 2、codecが登録されたファイルでは無視）
+        codec: 書き出し形式（省略時は codec_for(file_path, indent)）
 
     Raises:
         FileIOError: ファイルの書き込みに失敗した場合
@@ -118,13 +134,108 @@ def save_json(file_path: Path, data: Dict[str, Any], indent: int = 2) -> None:
         >>> save_json(Path("output/result.json"), {"status": "success", "count": 42})
         # output/result.json が作成される（親ディレクトリも自動作成）
     """
+    _write_json_text(file_path, (codec or codec_for(file_path, indent)).dumps(data), data)
+
+
+def _write_json_text(file_path: Path, text: str, data: Any) -> None:
+    """シリアライズ済みのJSONを書き込み、キャッシュを更新する（親ディレクトリ自動作成）"""
     formatter = get_error_formatter()
+    cache = get_json_cache()
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.write(text)
     except IOError as e:
+        cache.discard(file_path)
         raise FileIOError(formatter.file.file_io_error("write", file_path, e)) from e
+    cache.put(file_path, data, text)
+
+
+def save_json_if_changed(
+    file_path: Path, data: Dict[str, Any], indent: int = 2, codec: Optional[JsonCodec] = None
+) -> bool:
+    """
+    シリアライズ結果が既存ファイルと異なる場合のみ保存
+
+    save_json と同じ形式（キーは挿入順、ensure_ascii=False）でシリアライズし、
+    既存ファイルの内容と一致すればファイルに触れない（mtimeもgitの差分も変わらない）。
+
+    Args:
+        file_path: 保存先のパス
+        data: 保存するdict
+        indent: インデント幅（デフォルト: 2）
+        codec: 書き出し形式（省略時は codec_for(file_path, indent)）
+
+    Returns:
+        書き込んだ場合True、内容が同じで書き込まなかった場合False
+
+    Raises:
+        FileIOError: ファイルの書き込みに失敗した場合
+
+    Example:
+        >>> save_json_if_changed(Path("index.json"), {"count": 1})
+        True
+        >>> save_json_if_changed(Path("index.json"), {"count": 1})
+        False
+    """
+    text = (codec or codec_for(file_path, indent)).dumps(data)
+    try:
+        if file_path.read_text(encoding='utf-8') == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    _write_json_text(file_path, text, data)
+    return True
+
+
+def save_json_stamped(
+    file_path: Path,
+    data: Dict[str, Any],
+    section: str = "metadata",
+    stamp_key: str = "last_updated",
+    indent: int = 2,
+) -> bool:
+    """
+    stamp（既定: metadata.last_updated）以外の内容が変わった場合のみ、stampを更新して保存
+
+    内容が既存ファイルと同じなら既存のstampを data に戻し、書き込まない。
+    これにより変更のない保存でGrandDigest/Shadowのgit差分が生じない。
+
+    Args:
+        file_path: 保存先のパス
+        data: 保存するdict（data[section][stamp_key] が更新される）
+        section: stampを持つセクション名
+        stamp_key: stampのキー名
+        indent: インデント幅（デフォルト: 2）
+
+    Returns:
+        書き込んだ場合True
+
+    Raises:
+        FileIOError: ファイルの書き込みに失敗した場合
+
+    Example:
+        >>> data = load_json(path)
+        >>> save_json_stamped(path, data)  # 変更なし → stampも据え置き
+        False
+        >>> data["latest_digests"]["weekly"]["source_files"].append("L00187.txt")
+        >>> save_json_stamped(path, data)  # last_updatedを更新して保存
+        True
+    """
+    meta = data.get(section)
+    if not isinstance(meta, dict):
+        return save_json_if_changed(file_path, data, indent)
+
+    previous = try_load_json(file_path, log_on_error=False)
+    previous_meta = previous.get(section) if previous else None
+    if isinstance(previous_meta, dict) and stamp_key in previous_meta:
+        previous_stamp = previous_meta[stamp_key]
+        if {**data, section: {**meta, stamp_key: previous_stamp}} == previous:
+            meta[stamp_key] = previous_stamp
+            return save_json_if_changed(file_path, data, indent)
+
+    meta[stamp_key] = datetime.now().isoformat()
+    return save_json_if_changed(file_path, data, indent)
 
 
 def try_load_json(
@@ -261,6 +372,8 @@ __all__ = [
     "safe_read_json",
     "load_json",
     "save_json",
+    "save_json_if_changed",
+    "save_json_stamped",
     "try_load_json",
     "try_read_json_from_file",
     "file_exists",
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Loop Archive
+============
+
+古いLoopファイルを圧縮パック（Loops/.archive/pack-NNNN.zip）へ移し、
+中央インデックス（Loops/.archive/index.json）経由で1件ずつ読み出す。
+
+## 設計意図
+
+Loopファイルは数千件・1件数万トークンあり、ディレクトリサイズとgit同期時間の大半を占める。
+処理済みの古いLoopはほとんど読まれないため、パックにまとめて圧縮する。
+
+- パックは標準のzip（DEFLATE）形式。外部ツールでもそのまま展開できる
+- インデックスはファイル名 → (パック, データ開始オフセット, 圧縮後サイズ, CRC) を持つ。
+  読み出しは辞書引き1回 + seek + 1メンバー分の伸長のみで、
+  パック全体やzipの中央ディレクトリは読まない
+- インデックスには元ファイルの size と mtime_ns も保持し、stat の代わりに使う
+
+loop_stat() / read_loop_bytes() は、ディスク上のLoopとパック済みLoopを区別せずに扱うための入口
+（ファイル一覧は infrastructure.file_scanner がパック済みLoopも含めて返す）。
+
+Usage:
+    from infrastructure.loop_archive import LoopArchive, read_loop_bytes
+
+    archive = LoopArchive(loops_path)
+    archive.pack([loops_path / "L00001_test.txt"])
+    archive.read_bytes("L00001_test.txt")
+    read_loop_bytes(loops_path / "L00001_test.txt")  # ディスク → パックの順に探す
+"""
+
+import fnmatch
+import os
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from domain.error_formatter import get_error_formatter
+from domain.exceptions import CorruptedDataError, FileIOError
+from domain.file_constants import LOOP_ARCHIVE_DIR_NAME, LOOP_ARCHIVE_INDEX_FILENAME
+from infrastructure.json_repository import COMPACT, save_json, try_load_json
+
+# 永続化形式のバージョン
+LOOP_ARCHIVE_FORMAT_VERSION = 1
+
+# DEFLATE圧縮レベル（パックは一度書いたら変更しないため最大圧縮）
+PACK_COMPRESS_LEVEL = 9
+
+# zipローカルファイルヘッダ（固定長30バイト）
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# LoopArchive.open() のキャッシュ: loops_path → (インデックスのstat, LoopArchive)
+_ARCHIVE_CACHE: Dict[Path, Tuple[Optional[Tuple[int, int]], "LoopArchive"]] = {}
+
+
+class LoopArchive:
+    """
+    Loopパックとオフセットインデックスの管理クラス
+
+    Example:
+        >>> archive = LoopArchive(Path("Loops"))
+        >>> archive.pack([Path("Loops/L00001_test.txt")])
+        ['L00001_test.txt']
+        >>> "L00001_test.txt" in archive
+        True
+        >>> archive.read_text("L00001_test.txt")[:10]
+        '# Loop 1 ...'
+    """
+
+    def __init__(self, loops_path: Path):
+        """
+        Args:
+            loops_path: Loopsディレクトリ（パックは直下の .archive に置く）
+        """
+        self.loops_path = loops_path
+        self.archive_dir = loops_path / LOOP_ARCHIVE_DIR_NAME
+        self.index_file = self.archive_dir / LOOP_ARCHIVE_INDEX_FILENAME
+        self._members: Dict[str, Dict[str, Any]] = self._load_members()
+
+    @classmethod
+    def open(cls, loops_path: Path) -> "LoopArchive":
+        """
+        インデックスが変わっていなければキャッシュ済みのインスタンスを返す
+
+        Example:
+            >>> LoopArchive.open(loops_path) is LoopArchive.open(loops_path)
+            True
+        """
+        key = _index_stat(loops_path / LOOP_ARCHIVE_DIR_NAME / LOOP_ARCHIVE_INDEX_FILENAME)
+        cached = _ARCHIVE_CACHE.get(loops_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        archive = cls(loops_path)
+        _ARCHIVE_CACHE[loops_path] = (key, archive)
+        return archive
+
+    def _load_members(self) -> Dict[str, Dict[str, Any]]:
+        data = try_load_json(self.index_file, default={}) or {}
+        if data.get("format_version") != LOOP_ARCHIVE_FORMAT_VERSION:
+            return {}
+        members = data.get("members", {})
+        return {name: dict(m) for name, m in members.items() if isinstance(m, dict)}
+
+    def _save_index(self) -> None:
+        save_json(
+            self.index_file,
+            {"format_version": LOOP_ARCHIVE_FORMAT_VERSION, "members": self._members},
+            codec=COMPACT,
+        )
+        _ARCHIVE_CACHE.pop(self.loops_path, None)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, file_name: str) -> bool:
+        return file_name in self._members
+
+    def names(self, pattern: Optional[str] = None) -> List[str]:
+        """
+        パック済みLoopのファイル名（昇順）
+
+        Args:
+            pattern: globパターン（例: "L*.txt"、省略時は全件）
+        """
+        names = sorted(self._members)
+        if pattern is None:
+            return names
+        return [name for name in names if fnmatch.fnmatchcase(name, pattern)]
+
+    def stat(self, file_name: str) -> Optional[Tuple[int, int]]:
+        """
+        パック前の (size, mtime_ns)（パックにない場合はNone）
+        """
+        member = self._members.get(file_name)
+        if member is None:
+            return None
+        return int(member["size"]), int(member["mtime_ns"])
+
+    def totals(self) -> Dict[str, int]:
+        """
+        パック済みLoopの件数と、元のサイズ・圧縮後サイズの合計（バイト）
+
+        Example:
+            >>> archive.totals()
+            {'files': 2, 'size': 81234, 'compress_size': 20480}
+        """
+        members = self._members.values()
+        return {
+            "files": len(self._members),
+            "size": sum(int(m["size"]) for m in members),
+            "compress_size": sum(int(m["compress_size"]) for m in members),
+        }
+
+    def pack_files(self) -> List[Path]:
+        """存在するパックファイル（昇順）"""
+        return sorted(self.archive_dir.glob("pack-*.zip"))
+
+    def _next_pack_path(self) -> Path:
+        numbers = [int(p.stem.split("-")[1]) for p in self.pack_files() if p.stem[5:].isdigit()]
+        return self.archive_dir / f"pack-{max(numbers, default=0) + 1:04d}.zip"
+
+    def read_bytes(self, file_name: str) -> bytes:
+        """
+        パック済みLoopの内容をオフセット指定で1件だけ読み出す
+
+        Raises:
+            FileIOError: パックにない、またはパックを読めない場合
+            CorruptedDataError: 読み出した内容のCRC・サイズが一致しない場合
+
+        Example:
+            >>> archive.read_bytes("L00001_test.txt")[:4]
+            b'# Lo'
+        """
+        formatter = get_error_formatter()
+        member = self._members.get(file_name)
+        if member is None:
+            raise FileIOError(formatter.file.file_not_found(self.loops_path / file_name))
+        pack_path = self.archive_dir / member["pack"]
+        try:
+            data = _read_member(pack_path, member)
+        except OSError as e:
+            raise FileIOError(formatter.file.file_io_error("read", pack_path, e)) from e
+        if len(data) != member["size"] or zlib.crc32(data) != member["crc"]:
+            raise CorruptedDataError(f"Corrupted archive member {file_name}: CRC mismatch")
+        return data
+
+    def read_text(self, file_name: str, errors: str = "strict") -> str:
+        """パック済みLoopの内容をUTF-8文字列として読み出す"""
+        return self.read_bytes(file_name).decode("utf-8", errors=errors)
+
+    def pack(self, files: Iterable[Path]) -> List[str]:
+        """
+        Loopファイルを新しいパックへ移す
+
+        パックを一時ファイルに書き、全メンバーを読み戻して検証してから確定する。
+        インデックスを保存した後で元ファイルを削除するため、
+        途中で失敗しても元ファイルは残る。パック済みのファイル名は無視する。
+
+        Args:
+            files: パックするLoopファイル（Loopsディレクトリ直下）
+
+        Returns:
+            パックしたファイル名（昇順）
+
+        Raises:
+            FileIOError: パックまたはインデックスの書き込みに失敗した場合
+
+        Example:
+            >>> archive.pack(sorted(loops_path.glob("L0000*.txt")))
+            ['L00001_test.txt', 'L00002_test.txt']
+        """
+        targets = sorted(
+            {f for f in files if f.name not in self._members and f.is_file()}, key=lambda f: f.name
+        )
+        if not targets:
+            return []
+
+        formatter = get_error_formatter()
+        pack_path = self._next_pack_path()
+        tmp_path = pack_path.with_name(pack_path.name + ".tmp")
+        stats: Dict[str, os.stat_result] = {}
+        try:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            with zipfile.ZipFile(
+                tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=PACK_COMPRESS_LEVEL
+            ) as zf:
+                for loop_file in targets:
+                    stats[loop_file.name] = loop_file.stat()
+                    zf.write(loop_file, arcname=loop_file.name)
+            entries = _member_offsets(tmp_path, pack_path.name, stats)
+            for loop_file in targets:
+                if _read_member(tmp_path, entries[loop_file.name]) != loop_file.read_bytes():
+                    raise CorruptedDataError(f"Packed member mismatch: {loop_file.name}")
+            os.replace(tmp_path, pack_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            tmp_path.unlink(missing_ok=True)
+            raise FileIOError(formatter.file.file_io_error("write", pack_path, e)) from e
+        except CorruptedDataError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self._members.update(entries)
+        self._save_index()
+        for loop_file in targets:
+            try:
+                loop_file.unlink()
+            except OSError as e:
+                raise FileIOError(formatter.file.file_io_error("delete", loop_file, e)) from e
+        return [f.name for f in targets]
+
+    def unpack(self, file_names: Iterable[str]) -> List[str]:
+        """
+        パック済みLoopをLoopsディレクトリへ書き戻し、インデックスから外す
+
+        元の mtime を復元する。有効なメンバーがなくなったパックは削除する。
+
+        Returns:
+            書き戻したファイル名（昇順）
+
+        Example:
+            >>> archive.unpack(["L00001_test.txt"])
+            ['L00001_test.txt']
+        """
+        formatter = get_error_formatter()
+        restored = []
+        for name in sorted(set(file_names)):
+            member = self._members.get(name)
+            if member is None:
+                continue
+            target = self.loops_path / name
+            try:
+                target.write_bytes(self.read_bytes(name))
+                os.utime(target, ns=(member["mtime_ns"], member["mtime_ns"]))
+            except OSError as e:
+                raise FileIOError(formatter.file.file_io_error("write", target, e)) from e
+            del self._members[name]
+            restored.append(name)
+        if not restored:
+            return []
+
+        self._save_index()
+        live = {m["pack"] for m in self._members.values()}
+        for pack_path in self.pack_files():
+            if pack_path.name not in live:
+                pack_path.unlink(missing_ok=True)
+        return restored
+
+
+def _index_stat(index_file: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = index_file.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _member_offsets(
+    pack_path: Path, pack_name: str, stats: Dict[str, os.stat_result]
+) -> Dict[str, Dict[str, Any]]:
+    """書き終えたパックの中央ディレクトリから各メンバーのデータ開始オフセットを求める"""
+    entries = {}
+    with zipfile.ZipFile(pack_path) as zf, open(pack_path, "rb") as f:
+        for info in zf.infolist():
+            f.seek(info.header_offset)
+            header = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+            if header[0] != _LOCAL_HEADER_SIGNATURE:
+                raise CorruptedDataError(f"Bad local header in {pack_path.name}: {info.filename}")
+            name_len, extra_len = header[-2:]
+            entries[info.filename] = {
+                "pack": pack_name,
+                "offset": info.header_offset + _LOCAL_HEADER.size + name_len + extra_len,
+                "compress_size": info.compress_size,
+                "method": info.compress_type,
+                "crc": info.CRC,
+                "size": info.file_size,
+                "mtime_ns": stats[info.filename].st_mtime_ns,
+            }
+    return entries
+
+
+def _read_member(pack_path: Path, member: Dict[str, Any]) -> bytes:
+    """データ開始オフセットから1メンバー分だけ読み、伸長する（CRCは呼び出し側で確認）"""
+    with open(pack_path, "rb") as f:
+        f.seek(int(member["offset"]))
+        raw = f.read(int(member["compress_size"]))
+    if member["method"] == zipfile.ZIP_STORED:
+        return raw
+    try:
+        return zlib.decompress(raw, -15)
+    except zlib.error as e:
+        raise CorruptedDataError(f"Corrupted archive member in {pack_path.name}: {e}") from e
+
+
+def loop_stat(loop_file: Path) -> Optional[Tuple[int, int]]:
+    """
+    Loopファイルの (size, mtime_ns)（ディスク → パックの順、どちらにもなければNone）
+    """
+    try:
+        stat = loop_file.stat()
+        return stat.st_size, stat.st_mtime_ns
+    except OSError:
+        return LoopArchive.open(loop_file.parent).stat(loop_file.name)
+
+
+def read_loop_bytes(loop_file: Path) -> bytes:
+    """
+    Loopファイルの内容を読む（ディスクになければパックから）
+
+    Raises:
+        FileIOError: ディスクにもパックにもない場合
+    """
+    try:
+        return loop_file.read_bytes()
+    except FileNotFoundError:
+        return LoopArchive.open(loop_file.parent).read_bytes(loop_file.name)
+
+
+__all__ = [
+    "LoopArchive",
+    "LOOP_ARCHIVE_FORMAT_VERSION",
+    "loop_stat",
+    "read_loop_bytes",
+]
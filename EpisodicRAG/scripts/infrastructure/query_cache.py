@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Query Result Cache
+==================
+
+コーパスの世代をキーに含めた、参照系クエリ（キーワード集計・類似ダイジェスト・
+タイムライン）の結果キャッシュ。
+
+## 設計意図
+
+セッション開始時や digest-analyzer エージェントは、同じクエリ
+（レベル別の上位キーワード、あるダイジェストに似たダイジェスト、期間のタイムライン）を
+何度も投げる。結果はデータが書き換わらない限り同じなので、
+「正規化したクエリ + コーパスの世代」をキーにして結果を保持する。
+
+- 世代（corpus_generation.json）: ダイジェスト確定・Provisional保存・新規Loop検出など、
+  クエリ結果を変えうる書き込みの後に bump_corpus_generation() で1ずつ増える
+- メモリ層: プロセス内のLRU（監視モードなど長く動くプロセス向け）
+- 永続化層（query_cache.json）: 現在の世代の結果だけを保持し、CLIの次の起動でも使う。
+  世代が変わると丸ごと無効になる
+
+ヒット時の照合は corpus_generation.json と query_cache.json の stat
+（JSON読み込みキャッシュ経由）だけで、インデックスやダイジェストファイルには触れない。
+キャッシュの読み書きに失敗しても警告のみで、クエリはそのまま実行する。
+
+結果は永続化層に書くため、JSONの値（dict / list / 文字列 / 数値）で返すクエリに使う。
+
+Usage:
+    from infrastructure.query_cache import bump_corpus_generation, get_query_cache
+
+    cache = get_query_cache(config.essences_path)
+    result = cache.get_or_compute(
+        "trends.top", {"level": "weekly", "limit": 10}, lambda: run_query(...)
+    )
+
+    bump_corpus_generation(config.essences_path)  # 書き込みの後に呼ぶ
+"""
+
+import copy
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar, cast
+
+from domain.exceptions import FileIOError
+from domain.file_constants import CORPUS_GENERATION_FILENAME, QUERY_CACHE_FILENAME
+from infrastructure.file_lock import file_lock
+from infrastructure.json_repository import save_json, try_load_json
+from infrastructure.logging_config import log_warning
+
+T = TypeVar("T")
+
+# メモリ層に保持するクエリ数の上限（超えたら最も古く使われたものから捨てる）
+MAX_MEMORY_ENTRIES = 128
+
+# 永続化層に保持するクエリ数の上限（超えたら最も古く書いたものから捨てる）
+MAX_PERSISTED_ENTRIES = 64
+
+
+def query_key(kind: str, params: Mapping[str, Any]) -> str:
+    """
+    クエリの正規化キー（引数の順序、値がNoneの引数、文字列の前後・連続空白によらない）
+
+    Example:
+        >>> query_key("trends.top", {"limit": 10, "level": " weekly ", "by": None})
+        'trends.top {"level":"weekly","limit":10}'
+    """
+    normalized = {
+        name: " ".join(value.split()) if isinstance(value, str) else value
+        for name, value in params.items()
+        if value is not None
+    }
+    encoded = json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return f"{kind} {encoded}"
+
+
+def corpus_generation(cache_dir: Path) -> int:
+    """
+    コーパスの現在の世代（一度も書き込みがなければ0）
+
+    Example:
+        >>> corpus_generation(config.essences_path)
+        42
+    """
+    data = try_load_json(cache_dir / CORPUS_GENERATION_FILENAME, default={}, log_on_error=False)
+    generation = (data or {}).get("generation", 0)
+    return generation if isinstance(generation, int) else 0
+
+
+def bump_corpus_generation(cache_dir: Path) -> Optional[int]:
+    """
+    コーパスの世代を1増やす（これより前のクエリ結果はすべて無効になる）
+
+    クエリ結果を変えうる書き込みが終わった後に呼ぶ。
+    失敗しても警告のみで例外は投げない。
+
+    Returns:
+        新しい世代（更新に失敗した場合はNone）
+
+    Example:
+        >>> bump_corpus_generation(config.essences_path)
+        43
+    """
+    path = cache_dir / CORPUS_GENERATION_FILENAME
+    try:
+        with file_lock(path):
+            generation = corpus_generation(cache_dir) + 1
+            save_json(path, {"generation": generation})
+    except (OSError, FileIOError) as e:
+        log_warning(f"コーパス世代の更新に失敗: {e}")
+        return None
+    return generation
+
+
+class QueryResultCache:
+    """
+    クエリ結果のキャッシュ（メモリのLRU + cache_dir/query_cache.json）
+
+    Attributes:
+        cache_dir: 世代と永続化層を置くディレクトリ（通常は essences_path）
+        hits: キャッシュから返した回数
+        misses: クエリを実行した回数
+
+    Example:
+        >>> cache = QueryResultCache(config.essences_path)
+        >>> cache.get_or_compute("related", {"digest_id": "W0042", "limit": 5}, compute)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+        max_persisted: int = MAX_PERSISTED_ENTRIES,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.cache_file = cache_dir / QUERY_CACHE_FILENAME
+        self.max_entries = max_entries
+        self.max_persisted = max_persisted
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[Tuple[int, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, kind: str, params: Mapping[str, Any], compute: Callable[[], T]) -> T:
+        """
+        キャッシュにあれば結果を返し、なければ compute() を実行して記録する
+
+        Args:
+            kind: クエリの種類（例: "trends.top"）
+            params: クエリの引数（query_key() で正規化される）
+            compute: 結果を計算する関数（JSONの値を返すこと）
+
+        Returns:
+            クエリ結果（呼び出し側が書き換えてもキャッシュには影響しない）
+
+        Example:
+            >>> cache.get_or_compute("timeline", {"from": "2025-03-01"}, lambda: query())
+        """
+        key = query_key(kind, params)
+        generation = corpus_generation(self.cache_dir)
+        found, value = self._get_memory(generation, key)
+        if not found:
+            found, value = self._get_persisted(generation, key)
+            if found:
+                self._put_memory(generation, key, value)
+        if found:
+            self.hits += 1
+            return cast(T, copy.deepcopy(value))
+
+        self.misses += 1
+        value = compute()
+        self._put_memory(generation, key, copy.deepcopy(value))
+        self._put_persisted(generation, key, value)
+        return value
+
+    def _get_memory(self, generation: int, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry_key = (generation, key)
+            if entry_key not in self._memory:
+                return False, None
+            self._memory.move_to_end(entry_key)
+            return True, self._memory[entry_key]
+
+    def _put_memory(self, generation: int, key: str, value: Any) -> None:
+        with self._lock:
+            self._memory[(generation, key)] = value
+            self._memory.move_to_end((generation, key))
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _get_persisted(self, generation: int, key: str) -> Tuple[bool, Any]:
+        data = try_load_json(self.cache_file, default={}, log_on_error=False) or {}
+        entries = data.get("entries")
+        if data.get("generation") != generation or not isinstance(entries, dict):
+            return False, None
+        if key not in entries:
+            return False, None
+        return True, entries[key]
+
+    def _put_persisted(self, generation: int, key: str, value: Any) -> None:
+        """現在の世代の結果を永続化層に追加（古い世代の結果は捨てる）"""
+        try:
+            with file_lock(self.cache_file):
+                # 計算中に世代が進んでいたら、この結果はもう古い
+                if corpus_generation(self.cache_dir) != generation:
+                    return
+                data = try_load_json(self.cache_file, default={}, log_on_error=False) or {}
+                entries = data.get("entries")
+                if data.get("generation") != generation or not isinstance(entries, dict):
+                    entries = {}
+                entries.pop(key, None)
+                entries[key] = value
+                while len(entries) > self.max_persisted:
+                    entries.pop(next(iter(entries)))
+                save_json(self.cache_file, {"generation": generation, "entries": entries})
+        except (OSError, FileIOError, TypeError) as e:
+            log_warning(f"クエリ結果キャッシュの保存に失敗: {e}")
+
+    def clear(self) -> None:
+        """メモリ層を空にする（永続化層は世代で無効になるため消さない）"""
+        with self._lock:
+            self._memory.clear()
+
+
+_cache_instances: Dict[str, QueryResultCache] = {}
+
+
+def get_query_cache(cache_dir: Path) -> QueryResultCache:
+    """
+    cache_dir ごとにプロセス全体で共有するクエリ結果キャッシュを取得
+
+    Example:
+        >>> get_query_cache(essences_path) is get_query_cache(essences_path)
+        True
+    """
+    key = os.path.abspath(cache_dir)
+    cache = _cache_instances.get(key)
+    if cache is None:
+        cache = _cache_instances[key] = QueryResultCache(cache_dir)
+    return cache
+
+
+def reset_query_cache() -> None:
+    """
+    共有クエリ結果キャッシュをリセット（テスト用）
+
+    Example:
+        >>> reset_query_cache()
+    """
+    _cache_instances.clear()
+
+
+__all__ = [
+    "MAX_MEMORY_ENTRIES",
+    "MAX_PERSISTED_ENTRIES",
+    "QueryResultCache",
+    "bump_corpus_generation",
+    "corpus_generation",
+    "get_query_cache",
+    "query_key",
+    "reset_query_cache",
+]
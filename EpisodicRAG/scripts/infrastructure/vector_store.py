@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Vector Store
+============
+
+固定次元float32ベクトルの追記型ストア（行 → ID マップ付き）。
+
+## ファイル構成
+
+- <name>.f32: 行優先のfloat32行列（リトルエンディアン、ヘッダなし）
+- <name>.json: 次元数、行 → ID マップ、バケットごとの文書頻度
+- <name>.norms.f32: refresh_norms() で計算した、重みを掛けた各行のノルム
+
+行列ファイルはヘッダを持たないため、末尾への追記だけで行を増やせる
+（.npy はヘッダに行数を持つため追記のたびに書き換えが必要になる）。
+置き換えられた行はIDを null にした墓標として残し、compact() で取り除く。
+
+行は重み付け前のまま保存し、search() に weights（例: 最新のIDF）を渡すと
+検索時に各行へ掛けてから正規化する。文書頻度が変わっても既存行を書き直さずに済む。
+行のノルムは refresh_norms() で重みごとに保存しておけば検索時に計算し直さない
+（行の追加・削除で無効になり、保存した重みと異なる weights では検索時に計算する）。
+
+検索はNumPyが利用可能なら np.memmap 上の行列ベクトル積で行い、
+未インストール環境では行列を mmap し、クエリの非ゼロ成分の列だけを読む純Pythonの内積で行う。
+
+Usage:
+    from infrastructure.vector_store import VectorStore
+
+    store = VectorStore(digests_path / "digest_vectors", dim=512)
+    store.append({"W0042": vector})
+    store.search(vector, k=10, exclude={"W0042"})  # [('W0038', 0.71), ...]
+    store.search(vector, k=10, weights=idf)  # 行にIDFを掛けて正規化したコサイン類似度
+"""
+
+import hashlib
+import heapq
+import math
+import mmap
+import os
+import sys
+from array import array
+from contextlib import contextmanager
+from itertools import repeat
+from operator import add, mul
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from domain.error_formatter import get_error_formatter
+from domain.exceptions import FileIOError
+from infrastructure.json_repository import save_json, try_load_json
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+# 永続化形式のバージョン（2: 行は重み付け前のベクトル、重みは検索時に掛ける）
+VECTOR_STORE_FORMAT_VERSION = 2
+
+_ITEM_SIZE = 4  # float32
+
+
+def _to_bytes(values: Sequence[float]) -> bytes:
+    """float32リトルエンディアンのバイト列に変換"""
+    data = array("f", values)
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts only in CI
+        data.byteswap()
+    return data.tobytes()
+
+
+def _weights_key(weights: Sequence[float]) -> str:
+    """保存したノルムがどの重みで計算されたかを判定するキー"""
+    return hashlib.blake2b(_to_bytes(weights), digest_size=16).hexdigest()
+
+
+def _add_scaled(totals: List[float], column: Any, scale: float) -> List[float]:
+    """totals[i] + column[i] * scale（C実装の map で列をまとめて計算）"""
+    return list(map(add, totals, map(mul, column, repeat(scale))))
+
+
+class VectorStore:
+    """
+    追記型ベクトルストア
+
+    Example:
+        >>> store = VectorStore(Path("Digests/digest_vectors"), dim=4)
+        >>> store.append({"W0001": [1.0, 0.0, 0.0, 0.0], "W0002": [0.6, 0.8, 0.0, 0.0]})
+        >>> store.search([1.0, 0.0, 0.0, 0.0], k=1, exclude={"W0001"})
+        [('W0002', 0.6)]
+    """
+
+    def __init__(self, base_path: Path, dim: int):
+        """
+        Args:
+            base_path: 拡張子を除いたファイルパス（.f32 / .json を付与）
+            dim: ベクトル次元
+        """
+        self.dim = dim
+        self.matrix_file = base_path.with_suffix(".f32")
+        self.meta_file = base_path.with_suffix(".json")
+        self.norms_file = base_path.with_suffix(".norms.f32")
+        self._meta = self._load_meta()
+        self._positions = self._build_positions()
+
+    def _load_meta(self) -> Dict[str, Any]:
+        """メタデータを読み込む（存在しない・形式が合わない場合は空）"""
+        data = try_load_json(self.meta_file, default={}) or {}
+        if data.get("format_version") != VECTOR_STORE_FORMAT_VERSION:
+            return self._empty_meta()
+        if data.get("dim") != self.dim:
+            return self._empty_meta()
+        return data
+
+    def _build_positions(self) -> Dict[str, int]:
+        """ID → 行番号（墓標は除く）"""
+        return {row_id: i for i, row_id in enumerate(self._meta["rows"]) if row_id is not None}
+
+    def _empty_meta(self) -> Dict[str, Any]:
+        return {
+            "format_version": VECTOR_STORE_FORMAT_VERSION,
+            "dim": self.dim,
+            "rows": [],
+            "n_docs": 0,
+            "df": [0] * self.dim,
+        }
+
+    # =========================================================================
+    # メタデータ参照
+    # =========================================================================
+
+    @property
+    def row_ids(self) -> List[Optional[str]]:
+        """行 → ID（墓標はNone）"""
+        return list(self._meta["rows"])
+
+    @property
+    def n_docs(self) -> int:
+        """有効な行数（文書数）"""
+        return int(self._meta["n_docs"])
+
+    @property
+    def df(self) -> List[int]:
+        """バケットごとの文書頻度"""
+        return list(self._meta["df"])
+
+    def __len__(self) -> int:
+        return self.n_docs
+
+    def __contains__(self, row_id: str) -> bool:
+        return row_id in self._positions
+
+    # =========================================================================
+    # 行列の読み込み
+    # =========================================================================
+
+    def _matrix(self) -> Any:
+        """有効な行数分の行列（NumPy: memmap、それ以外: array('f')）"""
+        n_rows = len(self._meta["rows"])
+        if n_rows == 0 or not self.matrix_file.exists():
+            return None
+        if np is not None:
+            return np.memmap(self.matrix_file, dtype="<f4", mode="r", shape=(n_rows, self.dim))
+        data = array("f")
+        with open(self.matrix_file, "rb") as f:
+            data.fromfile(f, n_rows * self.dim)
+        if sys.byteorder == "big":  # pragma: no cover
+            data.byteswap()
+        return data
+
+    @contextmanager
+    def _columns(self) -> Iterator[Any]:
+        """
+        行列をfloat32の1次元ビューとして開く（列 j は view[j::dim]）
+
+        mmap のため、ファイル全体を読み込まずに参照した列のページだけを読む。
+        """
+        n_values = len(self._meta["rows"]) * self.dim
+        if sys.byteorder == "big":  # pragma: no cover - little-endian hosts only in CI
+            yield self._matrix()
+            return
+        with (
+            open(self.matrix_file, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            raw = memoryview(mapped)
+            view = raw[: n_values * _ITEM_SIZE].cast("f")
+            try:
+                yield view
+            finally:
+                view.release()
+                raw.release()
+
+    def vector_of(self, row_id: str) -> Optional[List[float]]:
+        """
+        IDのベクトルを取得（存在しない場合はNone）
+
+        Example:
+            >>> store.vector_of("W0002")
+            [0.6, 0.8, 0.0, 0.0]
+        """
+        row = self._positions.get(row_id)
+        if row is None:
+            return None
+        try:
+            with open(self.matrix_file, "rb") as f:
+                f.seek(row * self.dim * _ITEM_SIZE)
+                data = array("f")
+                data.fromfile(f, self.dim)
+        except (OSError, EOFError):
+            return None
+        if sys.byteorder == "big":  # pragma: no cover
+            data.byteswap()
+        return data.tolist()
+
+    # =========================================================================
+    # 更新
+    # =========================================================================
+
+    def _save_meta(self) -> None:
+        save_json(self.meta_file, self._meta, indent=0)
+
+    def _invalidate_norms(self) -> None:
+        """行の変更で保存済みのノルムを無効にする（呼び出し側でメタデータを保存）"""
+        self._meta.pop("norms_key", None)
+
+    def _apply_df(self, vector: Sequence[float], delta: int) -> None:
+        """非ゼロ成分のバケットの文書頻度を増減"""
+        df = self._meta["df"]
+        for bucket, value in enumerate(vector):
+            if value != 0.0:
+                df[bucket] = max(0, df[bucket] + delta)
+        self._meta["n_docs"] = max(0, self._meta["n_docs"] + delta)
+
+    def remove(self, row_ids: Sequence[str]) -> None:
+        """
+        IDの行を墓標にする（文書頻度からも除く）
+
+        Example:
+            >>> store.remove(["W0002"])
+        """
+        rows = self._meta["rows"]
+        changed = False
+        for row_id in set(row_ids):
+            if row_id not in self._positions:
+                continue
+            old = self.vector_of(row_id)
+            if old is not None:
+                self._apply_df(old, -1)
+            rows[self._positions.pop(row_id)] = None
+            changed = True
+        if changed:
+            self._invalidate_norms()
+            self._save_meta()
+
+    def append(self, vectors: Mapping[str, Sequence[float]]) -> None:
+        """
+        行を末尾に追記（同じIDの既存行は墓標にする）
+
+        非ゼロ成分のバケットを文書頻度に加算する。
+
+        Args:
+            vectors: ID → ベクトル
+
+        Raises:
+            FileIOError: 書き込みに失敗した場合
+        """
+        if not vectors:
+            return
+        for vector in vectors.values():
+            if len(vector) != self.dim:
+                raise ValueError(f"vector dim {len(vector)} != {self.dim}")
+        existing = [row_id for row_id in vectors if row_id in self._positions]
+        if existing:
+            self.remove(existing)
+        rows = self._meta["rows"]
+
+        row_bytes = self.dim * _ITEM_SIZE
+        try:
+            self.matrix_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.matrix_file, "ab") as f:
+                # メタデータ更新前に中断した書き込みの残骸を切り詰める
+                f.truncate(len(rows) * row_bytes)
+                for vector in vectors.values():
+                    f.write(_to_bytes(vector))
+        except OSError as e:
+            formatter = get_error_formatter()
+            raise FileIOError(formatter.file.file_io_error("write", self.matrix_file, e)) from e
+
+        for row_id, vector in vectors.items():
+            self._positions[row_id] = len(rows)
+            rows.append(row_id)
+            self._apply_df(vector, 1)
+        self._invalidate_norms()
+        self._save_meta()
+
+    def compact(self) -> int:
+        """
+        墓標の行を取り除いて行列を書き直す
+
+        Returns:
+            取り除いた行数
+
+        Example:
+            >>> store.compact()
+            3
+        """
+        rows = self._meta["rows"]
+        live = [i for i, row_id in enumerate(rows) if row_id is not None]
+        removed = len(rows) - len(live)
+        if removed == 0:
+            return 0
+
+        row_bytes = self.dim * _ITEM_SIZE
+        tmp_file = self.matrix_file.with_suffix(".f32.tmp")
+        try:
+            with open(self.matrix_file, "rb") as src, open(tmp_file, "wb") as dst:
+                for i in live:
+                    src.seek(i * row_bytes)
+                    dst.write(src.read(row_bytes))
+            os.replace(tmp_file, self.matrix_file)
+        except OSError as e:
+            formatter = get_error_formatter()
+            raise FileIOError(formatter.file.file_io_error("write", self.matrix_file, e)) from e
+
+        self._meta["rows"] = [rows[i] for i in live]
+        self._positions = self._build_positions()
+        self._invalidate_norms()
+        self._save_meta()
+        return removed
+
+    def clear(self) -> None:
+        """全行を削除（再構築用）"""
+        self._meta = self._empty_meta()
+        self._positions = {}
+        try:
+            self.matrix_file.unlink(missing_ok=True)
+            self.norms_file.unlink(missing_ok=True)
+        except OSError as e:
+            formatter = get_error_formatter()
+            raise FileIOError(formatter.file.file_io_error("delete", self.matrix_file, e)) from e
+        self._save_meta()
+
+    # =========================================================================
+    # ノルム
+    # =========================================================================
+
+    def _compute_norms(self, weights: Sequence[float]) -> List[float]:
+        """重みを掛けた各行のL2ノルム（墓標も計算する）"""
+        n_rows = len(self._meta["rows"])
+        squared = [0.0] * n_rows
+        with self._columns() as view:
+            for j, weight in enumerate(weights):
+                if weight != 0.0:
+                    column = view[j :: self.dim].tolist()
+                    squared = list(
+                        map(
+                            add,
+                            squared,
+                            map(mul, map(mul, column, column), repeat(weight * weight)),
+                        )
+                    )
+        return list(map(math.sqrt, squared))
+
+    def _cached_norms(self, weights: Sequence[float]) -> Optional[array]:
+        """refresh_norms() で保存したノルム（重みが異なる・行数が合わない場合はNone）"""
+        if self._meta.get("norms_key") != _weights_key(weights):
+            return None
+        norms = array("f")
+        try:
+            with open(self.norms_file, "rb") as f:
+                norms.fromfile(f, len(self._meta["rows"]))
+        except (OSError, EOFError):
+            return None
+        if sys.byteorder == "big":  # pragma: no cover
+            norms.byteswap()
+        return norms
+
+    def refresh_norms(self, weights: Sequence[float]) -> None:
+        """
+        重みを掛けた各行のノルムを計算して保存（同じ weights の検索で使う）
+
+        行を追加・削除したら（または重みが変わったら）呼び直す。
+
+        Raises:
+            FileIOError: 書き込みに失敗した場合
+
+        Example:
+            >>> store.refresh_norms(idf_weights(store.df, store.n_docs))
+        """
+        if len(weights) != self.dim:
+            raise ValueError(f"weights dim {len(weights)} != {self.dim}")
+        norms = self._compute_norms(weights) if self._meta["rows"] else []
+        tmp_file = self.norms_file.with_suffix(".f32.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(_to_bytes(norms))
+            os.replace(tmp_file, self.norms_file)
+        except OSError as e:
+            formatter = get_error_formatter()
+            raise FileIOError(formatter.file.file_io_error("write", self.norms_file, e)) from e
+        self._meta["norms_key"] = _weights_key(weights)
+        self._save_meta()
+
+    # =========================================================================
+    # 検索
+    # =========================================================================
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        exclude: Optional[Set[str]] = None,
+        weights: Optional[Sequence[float]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        コサイン類似度の上位k件
+
+        Args:
+            query: クエリベクトル（L2正規化済み、weights を掛けた後の空間）
+            k: 件数
+            exclude: 結果から除くID
+            weights: 各行に成分ごとに掛ける重み。指定時は重みを掛けた行を
+                L2正規化する（refresh_norms() で保存したノルムがあれば使い、
+                なければ検索時に計算する。省略時は行がL2正規化済みであること）
+
+        Returns:
+            (ID, 類似度) の類似度降順リスト
+        """
+        rows = self._meta["rows"]
+        if not rows or k <= 0 or not self.matrix_file.exists():
+            return []
+        skip = exclude or set()
+        cached = self._cached_norms(weights) if weights is not None else None
+
+        if np is not None:
+            matrix = self._matrix()
+            query_array = np.asarray(query, dtype=np.float32)
+            if weights is None:
+                scores = np.asarray(matrix @ query_array, dtype=np.float64)
+            else:
+                w = np.asarray(weights, dtype=np.float32)
+                dots = np.asarray(matrix @ (query_array * w), dtype=np.float64)
+                if cached is not None:
+                    norms = np.asarray(cached, dtype=np.float64)
+                else:
+                    norms = np.sqrt(np.asarray(np.square(matrix) @ (w * w), dtype=np.float64))
+                scores = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+            for i, row_id in enumerate(rows):
+                if row_id is None or row_id in skip:
+                    scores[i] = -np.inf
+            n_top = min(k, len(rows))
+            top = np.argpartition(-scores, n_top - 1)[:n_top]
+            ranked = [
+                (str(rows[i]), round(float(scores[i]), 6)) for i in top if np.isfinite(scores[i])
+            ]
+            return sorted(ranked, key=lambda t: (-t[1], t[0]))
+
+        # 純Python: クエリの非ゼロ成分の列だけを読み、列ごとに全行の内積へ足し込む
+        dots = [0.0] * len(rows)
+        with self._columns() as view:
+            for j, value in enumerate(query):
+                if value != 0.0:
+                    scale = value * weights[j] if weights is not None else value
+                    dots = _add_scaled(dots, view[j :: self.dim].tolist(), scale)
+        if weights is None:
+            row_norms: Iterable[float] = repeat(1.0)
+        else:
+            row_norms = cached if cached is not None else self._compute_norms(weights)
+        scored = (
+            (str(row_id), round(dot / norm, 6) if norm > 0 else 0.0)
+            for row_id, dot, norm in zip(rows, dots, row_norms)
+            if row_id is not None and row_id not in skip
+        )
+        return heapq.nsmallest(k, scored, key=lambda t: (-t[1], t[0]))
+
+
+__all__ = ["VectorStore", "VECTOR_STORE_FORMAT_VERSION"]
@@ -12,15 +12,20 @@ Classes:
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from application.shadow.loop_signatures import LoopSignatureRecorder
+from application.tracking.loop_manifest import LoopManifestRecorder
 from domain.constants import DIGEST_LEVEL_NAMES, LEVEL_CONFIG
 from domain.exceptions import FileIOError
 from domain.file_constants import (
     CONFIG_FILENAME,
     DIGEST_TIMES_FILENAME,
     GRAND_DIGEST_FILENAME,
+    LOOP_FILE_PATTERN,
     SHADOW_GRAND_DIGEST_FILENAME,
 )
+from domain.indexed_provisional import extract_source_base_key
 from infrastructure.config import get_persistent_config_dir
+from infrastructure.file_scanner import scan_files
 from infrastructure.json_repository import load_json, try_load_json
 
 from .file_scanner import extract_file_number, find_gaps
@@ -72,8 +77,9 @@ class DigestAutoAnalyzer:
             config = self._load_config()
             loops_path, essences_path, digests_path = resolve_paths(config)
 
-            # 2. 未処理Loop検出
-            unprocessed_loops = self._check_unprocessed_loops(loops_path)
+            # 2. 未処理Loop検出（Loopsディレクトリの走査はここで1回だけ行う）
+            loop_files = scan_files(loops_path, LOOP_FILE_PATTERN, include_archived=True)
+            unprocessed_loops = self._check_unprocessed_loops(loop_files)
             if unprocessed_loops:
                 issues.append(
                     Issue(
@@ -84,6 +90,33 @@ class DigestAutoAnalyzer:
                 )
                 recommendations.append("Run /digest to process unprocessed loops first")
 
+            # 2.4 処理後に編集されたLoop検出（stat が変わったLoopのみ再ハッシュ）
+            modified_loops = self._check_modified_loops(loop_files, unprocessed_loops)
+            if modified_loops:
+                issues.append(
+                    Issue(
+                        type="modified_loops",
+                        count=len(modified_loops),
+                        files=modified_loops,
+                    )
+                )
+                recommendations.append(
+                    "Loops were edited after being digested; review or re-digest them"
+                )
+
+            # 2.5 近似重複Loop検出（LSHで候補を絞るため全Loopとの総当たりはしない）
+            near_duplicates = self._check_near_duplicates(loop_files, unprocessed_loops)
+            if near_duplicates:
+                issues.append(
+                    Issue(
+                        type="near_duplicate_loops",
+                        count=len(near_duplicates),
+                        files=sorted(near_duplicates),
+                        details=near_duplicates,
+                    )
+                )
+                recommendations.append("Review near-duplicate loops before running /digest")
+
             # 3. ShadowGrandDigest確認
             shadow_file = essences_path / SHADOW_GRAND_DIGEST_FILENAME
             shadow_data = self._load_json_file(shadow_file)
@@ -128,7 +161,7 @@ class DigestAutoAnalyzer:
 
             generatable, insufficient = self._determine_generatable_levels(
                 config=config,
-                loops_path=loops_path,
+                loop_count=len(loop_files),
                 digests_path=digests_path,
                 grand_data=grand_data,
                 unprocessed_count=len(unprocessed_loops),
@@ -161,13 +194,8 @@ class DigestAutoAnalyzer:
                 error=str(e),
             )
 
-    def _check_unprocessed_loops(self, loops_path: Path) -> List[str]:
+    def _check_unprocessed_loops(self, loop_files: List[Path]) -> List[str]:
         """未処理Loop検出"""
-        if not loops_path.exists():
-            return []
-
-        # Loopファイルを取得
-        loop_files = list(loops_path.glob("L*.txt"))
         if not loop_files:
             return []
 
@@ -190,6 +218,48 @@ class DigestAutoAnalyzer:
 
         return sorted(unprocessed)
 
+    def _check_modified_loops(
+        self, loop_files: List[Path], unprocessed_loops: List[str]
+    ) -> List[str]:
+        """処理後に編集されたLoop検出
+
+        処理済みLoopを loop_manifest.json と照合する。
+        size と mtime が変わっていないLoopはファイルを開かない。
+        """
+        pending = set(unprocessed_loops)
+        processed = [f for f in loop_files if f.stem not in pending]
+        if not processed:
+            return []
+        pending_files = [f for f in loop_files if f.stem in pending]
+        recorder = LoopManifestRecorder(self.last_digest_file.parent)
+        modified = recorder.find_modified(processed, pending_files)
+        return [Path(name).stem for name in modified]
+
+    def _check_near_duplicates(
+        self, loop_files: List[Path], unprocessed_loops: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """近似重複Loop検出
+
+        loop_signatures.json に記録された重複と、まだ索引にない未処理Loopを照合した結果を返す。
+        未処理Loopのスケッチは索引に保存するため、次回の診断では計算し直さない。
+        どちらかのLoopが削除済みの組は除外する。
+        """
+        existing = {extract_source_base_key(f.name): f for f in loop_files}
+        if not existing:
+            return {}
+
+        recorder = LoopSignatureRecorder(self.last_digest_file.parent)
+        pending_keys = (extract_source_base_key(stem) for stem in unprocessed_loops)
+        recorder.check_loops([existing[key] for key in pending_keys if key in existing])
+        found = recorder.load().duplicates()
+
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for loop_id, matches in found.items():
+            alive = [m for m in matches if m.get("duplicate_of") in existing]
+            if loop_id in existing and alive:
+                result[loop_id] = alive
+        return result
+
     def _check_placeholders(self, shadow_data: Dict[str, Any]) -> List[Tuple[str, List[str]]]:
         """プレースホルダー検出"""
         placeholders = []
@@ -239,7 +309,7 @@ class DigestAutoAnalyzer:
     def _determine_generatable_levels(
         self,
         config: Dict[str, Any],
-        loops_path: Path,
+        loop_count: int,
         digests_path: Path,
         grand_data: Dict[str, Any],
         unprocessed_count: int,
@@ -263,10 +333,7 @@ class DigestAutoAnalyzer:
 
             if source == "loops":
                 # Loopファイル数（未処理含む）
-                if loops_path.exists():
-                    current = len(list(loops_path.glob("L*.txt")))
-                else:
-                    current = 0
+                current = loop_count
             else:
                 # 下位階層のRegular Digest数
                 source_level_data = major_digests.get(source, {})
@@ -27,14 +27,16 @@ class Issue:
     """検出された問題
 
     Attributes:
-        type: 問題の種類 ("unprocessed_loops" | "placeholders" | "gaps")
+        type: 問題の種類
+            ("unprocessed_loops" | "placeholders" | "gaps" | "near_duplicate_loops"
+             | "modified_loops")
         level: 関連する階層名（オプション）
         count: 問題の件数
         files: 関連ファイルのリスト
         details: 追加詳細情報（オプション）
     """
 
-    type: str  # "unprocessed_loops" | "placeholders" | "gaps"
+    type: str  # "unprocessed_loops" | "placeholders" | "gaps" | "near_duplicate_loops" | ...
     level: Optional[str] = None
     count: int = 0
     files: List[str] = field(default_factory=list)
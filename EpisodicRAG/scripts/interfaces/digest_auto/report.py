@@ -76,6 +76,27 @@ def format_text_report(result: "AnalysisResult") -> str:
                     output.append(f"  欠番: {len(missing)}個")
                 output.append("")
 
+            elif issue.type == "modified_loops":
+                output.append(f"⚠️ ダイジェスト後に変更されたLoop: {issue.count}個")
+                for f in issue.files[:MAX_DISPLAY_FILES]:
+                    output.append(f"  - {f}")
+                if len(issue.files) > MAX_DISPLAY_FILES:
+                    output.append(f"  ... 他{len(issue.files) - MAX_DISPLAY_FILES}個")
+                output.append("")
+
+            elif issue.type == "near_duplicate_loops":
+                output.append(f"⚠️ 近似重複Loop検出: {issue.count}個")
+                details = issue.details or {}
+                for f in issue.files[:MAX_DISPLAY_FILES]:
+                    matches = details.get(f) or [{}]
+                    output.append(
+                        f"  - {f} ≈ {matches[0].get('duplicate_of', '?')}"
+                        f" (類似度 {matches[0].get('similarity', '?')})"
+                    )
+                if len(issue.files) > MAX_DISPLAY_FILES:
+                    output.append(f"  ... 他{len(issue.files) - MAX_DISPLAY_FILES}個")
+                output.append("")
+
     # 生成可能な階層
     if result.generatable_levels:
         output.append("✅ 生成可能なダイジェスト")
@@ -18,13 +18,16 @@ import json
 import sys
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from domain.constants import DIGEST_LEVEL_NAMES
 from domain.file_constants import CONFIG_FILENAME
 from infrastructure.config import get_persistent_config_dir
 from infrastructure.json_repository import load_json
 
+if TYPE_CHECKING:
+    from application.config import DigestConfig
+
 
 @dataclass
 class DigestEntryResult:
@@ -75,12 +78,28 @@ def get_paths_from_config() -> Dict[str, Any]:
     }
 
 
+def get_prepared_new_loops(config: "DigestConfig") -> Optional[List[str]]:
+    """監視モード（digest_watch）が準備した検出結果が新しければ返す（なければNone）"""
+    from application.tracking import DigestTimesTracker, PendingLoopsRecorder
+
+    times_tracker = DigestTimesTracker(config)
+    last_processed = times_tracker.load_or_create().get("loop", {}).get("last_processed")
+    recorder = PendingLoopsRecorder(times_tracker.last_digest_file.parent)
+    prepared = recorder.fresh(config.loops_path, last_processed)
+    if prepared is None:
+        return None
+    return [Path(name).stem for name in prepared]
+
+
 def get_new_loops() -> List[str]:
     """新規Loopファイルを検出（ShadowUpdaterと同じロジック）"""
     from application.config import DigestConfig
     from application.grand import ShadowGrandDigestManager
 
     config = DigestConfig()
+    prepared = get_prepared_new_loops(config)
+    if prepared is not None:
+        return prepared
     manager = ShadowGrandDigestManager(config)
 
     # FileDetectorを使って新規ファイルを検出
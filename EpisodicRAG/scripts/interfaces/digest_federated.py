@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digest Federated CLI
+====================
+
+自分のストアと config.json の federation.stores に設定した別ストアへ、
+検索・タイムラインクエリを並列に投げて結果をまとめる。
+各ストアは timeout_seconds を過ぎると "timeout" として除外される。
+
+Usage:
+    python -m interfaces.digest_federated search "MCPの設計" --limit 10
+    python -m interfaces.digest_federated timeline --from 2025-03-01 --to 2025-03-31
+    python -m interfaces.digest_federated search "MCP" --timeout 2
+
+Output (search):
+    {
+      "status": "ok",
+      "query": "MCPの設計",
+      "stores": {"local": "ok", "projA": "timeout"},
+      "results": [{"store": "local", "id": "W0042", "score": 1.0, "raw_score": 0.41}]
+    }
+"""
+
+import argparse
+import io
+import sys
+from dataclasses import replace
+from typing import Any, Dict
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.federation import FederatedQuery, load_store_specs
+from domain.exceptions import EpisodicRAGError
+from interfaces.cli_helpers import output_error, output_json
+from interfaces.digest_timeline import _iso_bound
+
+
+def _run(args: argparse.Namespace, query: FederatedQuery) -> Dict[str, Any]:
+    """指定されたクエリを実行して出力用の辞書を返す"""
+    if args.command == "search":
+        result = query.search(args.text, k=args.limit)
+        header: Dict[str, Any] = {"query": args.text}
+    else:
+        if args.range_start > args.range_end:
+            output_error("--from must not be later than --to")
+        result = query.timeline(args.range_start, args.range_end)
+        header = {"from": args.range_start, "to": args.range_end}
+    return {
+        "status": "ok",
+        **header,
+        "stores": result.stores,
+        "elapsed": round(result.elapsed, 3),
+        "results": result.results,
+    }
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="複数ストアへのフェデレーション検索",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None, help="全ストア共通の制限時間（秒、設定を上書き）"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search = subparsers.add_parser("search", help="自由文で検索（ローカルTF-IDF）")
+    search.add_argument("text", help="検索文")
+    search.add_argument("--limit", type=int, default=10, help="返す件数")
+
+    timeline = subparsers.add_parser("timeline", help="期間をカバーするLoop/ダイジェスト")
+    timeline.add_argument(
+        "--from", dest="range_start", type=_iso_bound, required=True, help="期間開始"
+    )
+    timeline.add_argument("--to", dest="range_end", type=_iso_bound, required=True, help="期間終了")
+
+    args = parser.parse_args()
+
+    try:
+        stores = load_store_specs(DigestConfig())
+        if args.timeout is not None:
+            stores = [replace(spec, timeout=args.timeout) for spec in stores]
+        output_json(_run(args, FederatedQuery(stores)))
+    except EpisodicRAGError as e:
+        output_error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 from application.config import DigestConfig
 from domain.constants import DIGEST_LEVEL_NAMES, PLACEHOLDER_MARKER
 from domain.file_constants import SHADOW_GRAND_DIGEST_FILENAME
+from infrastructure.file_lock import file_lock
 from infrastructure.json_repository import load_json
 
 # Windows UTF-8対応（pytest実行時はスキップ）
@@ -81,7 +82,8 @@ class DigestReadinessChecker:
 
             # SDG読み込み
             shadow_path = self.config.essences_path / SHADOW_GRAND_DIGEST_FILENAME
-            shadow_data = load_json(shadow_path)
+            with file_lock(shadow_path, shared=True):
+                shadow_data = load_json(shadow_path)
 
             # 対象レベルのデータ取得
             latest_digests = shadow_data.get("latest_digests", {})
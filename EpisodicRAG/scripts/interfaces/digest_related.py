@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digest Related CLI
+==================
+
+ローカルのTF-IDFベクトルストア（digest_vectors）を参照して、
+指定したダイジェストに似たダイジェストをコサイン類似度の上位順に返す。
+外部の埋め込みサービスは使わない。
+結果はコーパスの世代が変わるまでクエリ結果キャッシュ（query_cache.json）から返す。
+
+Usage:
+    python -m interfaces.digest_related W0042
+    python -m interfaces.digest_related W0042/L00186 --limit 5
+    python -m interfaces.digest_related --rebuild
+    python -m interfaces.digest_related --compact
+"""
+
+import argparse
+import io
+import sys
+from typing import Any, Dict
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.finalize import DigestVectorRecorder
+from domain.exceptions import DigestError, EpisodicRAGError
+from infrastructure import bump_corpus_generation, get_query_cache
+from infrastructure.query_cache import QueryResultCache
+from interfaces.cli_helpers import output_error, output_json
+
+
+def _run(
+    args: argparse.Namespace, recorder: DigestVectorRecorder, cache: QueryResultCache
+) -> Dict[str, Any]:
+    """指定された操作を実行して出力用の辞書を返す"""
+    if args.rebuild:
+        store = recorder.rebuild()
+        bump_corpus_generation(cache.cache_dir)
+        return {"status": "ok", "rows": len(store)}
+    if args.compact:
+        removed = recorder.compact()
+        bump_corpus_generation(cache.cache_dir)
+        return {"status": "ok", "removed": removed}
+
+    if not recorder.contains(args.digest_id):
+        output_error(
+            f"Digest not found in vector store: {args.digest_id}",
+            details={"hint": "Run with --rebuild to index existing digests"},
+        )
+    return cache.get_or_compute(
+        "related",
+        {"digest_id": args.digest_id, "limit": args.limit},
+        lambda: _related(args, recorder),
+    )
+
+
+def _related(args: argparse.Namespace, recorder: DigestVectorRecorder) -> Dict[str, Any]:
+    """
+    似ているダイジェストをベクトルストアから検索
+
+    Raises:
+        DigestError: 行がストアから消えていた場合（結果はキャッシュされない）
+    """
+    related = recorder.related(args.digest_id, k=args.limit)
+    if related is None:
+        raise DigestError(f"Digest not found in vector store: {args.digest_id}")
+    return {
+        "status": "ok",
+        "digest_id": args.digest_id,
+        "related": [{"id": row_id, "score": score} for row_id, score in related],
+    }
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="似ているダイジェストの検索（ローカルTF-IDF）",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "digest_id", nargs="?", help='ダイジェストID（例: "W0042", "W0042/L00186"）'
+    )
+    parser.add_argument("--limit", type=int, default=10, help="返す件数")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="既存RegularDigestからストアを再構築"
+    )
+    parser.add_argument("--compact", action="store_true", help="置き換え済みの行を取り除く")
+
+    args = parser.parse_args()
+    if not (args.digest_id or args.rebuild or args.compact):
+        parser.error("digest_id is required unless --rebuild or --compact is given")
+
+    try:
+        config = DigestConfig()
+        recorder = DigestVectorRecorder(config.digests_path)
+        output_json(_run(args, recorder, get_query_cache(config.essences_path)))
+    except EpisodicRAGError as e:
+        output_error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digest Snippets CLI
+===================
+
+ダイジェスト（abstract / impression）や Loop 本文のうち、クエリに最も合う箇所だけを返す。
+確定時に記録した文境界オフセット（Digests/.sentences/）を使い、
+該当するバイト範囲だけをファイルから読む。
+検索やタイムラインでヒットした文書を丸ごと読まずに、根拠の文だけを確認する用途。
+
+Usage:
+    python -m interfaces.digest_snippets W0042 "MCP 設計"
+    python -m interfaces.digest_snippets L00186 "認証 エラー" --limit 3 --context 1
+    python -m interfaces.digest_snippets --rebuild
+"""
+
+import argparse
+import io
+import sys
+from typing import Any, Dict
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.finalize import SentenceIndexRecorder
+from domain.exceptions import EpisodicRAGError
+from interfaces.cli_helpers import output_error, output_json
+
+
+def _run(args: argparse.Namespace, recorder: SentenceIndexRecorder) -> Dict[str, Any]:
+    """指定された操作を実行して出力用の辞書を返す"""
+    if args.rebuild:
+        return {"status": "ok", "digests": recorder.rebuild()}
+
+    snippets = recorder.snippets(args.row_id, args.query, k=args.limit, context=args.context)
+    if snippets is None:
+        output_error(
+            f"No current sentence index for: {args.row_id}",
+            details={"hint": "Run with --rebuild to index existing digests"},
+        )
+    return {"status": "ok", "id": args.row_id, "query": args.query, "snippets": snippets}
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="クエリに合う箇所の抽出（文境界オフセット）",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("row_id", nargs="?", help='文書ID（例: "W0042", "W0042/L00186", "L00186"）')
+    parser.add_argument("query", nargs="?", help="検索文")
+    parser.add_argument("--limit", type=int, default=3, help="返すスニペットの件数")
+    parser.add_argument("--context", type=int, default=0, help="一致した文の前後に含める文の数")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="既存RegularDigestから文境界を再記録"
+    )
+
+    args = parser.parse_args()
+    if not args.rebuild and not (args.row_id and args.query):
+        parser.error("row_id and query are required unless --rebuild is given")
+
+    try:
+        config = DigestConfig()
+        recorder = SentenceIndexRecorder(config.digests_path, config.loops_path)
+        output_json(_run(args, recorder))
+    except EpisodicRAGError as e:
+        output_error(str(e))
+
+
+if __name__ == "__main__":
+    main()
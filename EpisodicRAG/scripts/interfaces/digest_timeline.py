@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digest Timeline CLI
+===================
+
+期間を指定して、その期間をカバーするLoopと各レベルのダイジェストを
+timeline_index.json から取得する。ダイジェストファイルは開かない。
+結果はコーパスの世代が変わるまでクエリ結果キャッシュ（query_cache.json）から返す。
+
+Usage:
+    python -m interfaces.digest_timeline --from 2025-03-01 --to 2025-03-31
+
+Output:
+    {
+      "status": "ok",
+      "from": "2025-03-01",
+      "to": "2025-03-31",
+      "loops": ["L00186", "L00187"],
+      "digests": {"weekly": ["W0042"], "monthly": ["M012"]}
+    }
+"""
+
+import argparse
+import io
+import sys
+from datetime import datetime
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.tracking import DigestTimesTracker
+from domain.constants import DIGEST_LEVEL_NAMES
+from domain.exceptions import EpisodicRAGError
+from domain.timeline_index import normalize_range_end
+from infrastructure import get_query_cache
+from interfaces.cli_helpers import output_error, output_json
+
+
+def _iso_bound(value: str) -> str:
+    """argparse用: ISO形式の日付/日時かを検証してそのまま返す"""
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO date: '{value}'") from None
+    return value
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="期間をカバーするLoop/ダイジェストを取得",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m interfaces.digest_timeline --from 2025-03-01 --to 2025-03-31
+  python -m interfaces.digest_timeline --from 2025-03-01T09:00:00 --to 2025-03-01T18:00:00
+        """,
+    )
+    parser.add_argument(
+        "--from", dest="range_start", type=_iso_bound, required=True, help="期間開始"
+    )
+    parser.add_argument(
+        "--to",
+        dest="range_end",
+        type=_iso_bound,
+        required=True,
+        help="期間終了（日付のみなら当日を含む）",
+    )
+    args = parser.parse_args()
+
+    # 日付のみの --to はその日の終わりまでを含むため、正規化した終端と比べる
+    if args.range_start > normalize_range_end(args.range_end):
+        output_error("--from must not be later than --to")
+        return
+
+    try:
+        config = DigestConfig()
+        matches = get_query_cache(config.essences_path).get_or_compute(
+            "timeline",
+            {"from": args.range_start, "to": args.range_end},
+            lambda: DigestTimesTracker(config).timeline.query(args.range_start, args.range_end),
+        )
+    except EpisodicRAGError as e:
+        output_error(str(e))
+        return
+
+    output_json(
+        {
+            "status": "ok",
+            "from": args.range_start,
+            "to": args.range_end,
+            "loops": matches.get("loop", []),
+            "digests": {level: matches[level] for level in DIGEST_LEVEL_NAMES if level in matches},
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digest Trends CLI
+=================
+
+keyword_rollup.json（レベル別・期間別キーワード集計）を参照して
+トピックの推移や共起を返す。RegularDigestファイルは開かない。
+結果はコーパスの世代が変わるまでクエリ結果キャッシュ（query_cache.json）から返す。
+
+Usage:
+    python -m interfaces.digest_trends top --level weekly --limit 10
+    python -m interfaces.digest_trends trend MCP --by quarter
+    python -m interfaces.digest_trends related MCP --limit 5
+    python -m interfaces.digest_trends rebuild
+"""
+
+import argparse
+import io
+import sys
+from typing import Any, Dict
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.finalize import KeywordRollupRecorder
+from domain.constants import DIGEST_LEVEL_NAMES
+from domain.exceptions import EpisodicRAGError
+from domain.keyword_rollup import GRANULARITIES
+from infrastructure import bump_corpus_generation, get_query_cache
+from infrastructure.query_cache import QueryResultCache
+from interfaces.cli_helpers import output_error, output_json
+
+
+def _run(
+    args: argparse.Namespace, recorder: KeywordRollupRecorder, cache: QueryResultCache
+) -> Dict[str, Any]:
+    """サブコマンドを実行して出力用の辞書を返す"""
+    if args.command == "rebuild":
+        rollup = recorder.rebuild()
+        bump_corpus_generation(cache.cache_dir)
+        return {"status": "ok", "digests": len(rollup)}
+
+    params = {name: value for name, value in vars(args).items() if name != "command"}
+    return cache.get_or_compute(f"trends.{args.command}", params, lambda: _query(args, recorder))
+
+
+def _query(args: argparse.Namespace, recorder: KeywordRollupRecorder) -> Dict[str, Any]:
+    """参照系サブコマンド（top / trend / related）を keyword_rollup.json から計算"""
+    rollup = recorder.load()
+    if args.command == "top":
+        top = rollup.top_keywords(level=args.level, k=args.limit)
+        return {
+            "status": "ok",
+            "level": args.level,
+            "keywords": [{"keyword": kw, "count": n} for kw, n in top],
+        }
+    if args.command == "trend":
+        return {
+            "status": "ok",
+            "keyword": args.keyword,
+            "level": args.level,
+            "by": args.by,
+            "periods": rollup.trend(args.keyword, level=args.level, granularity=args.by),
+        }
+    related = rollup.cooccurring(args.keyword, k=args.limit)
+    return {
+        "status": "ok",
+        "keyword": args.keyword,
+        "related": [{"keyword": kw, "count": n} for kw, n in related],
+    }
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="キーワード集計の参照（トピック推移・共起）",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    top_parser = subparsers.add_parser("top", help="出現数上位のキーワード")
+    top_parser.add_argument("--level", choices=DIGEST_LEVEL_NAMES, default=None)
+    top_parser.add_argument("--limit", type=int, default=10)
+
+    trend_parser = subparsers.add_parser("trend", help="キーワードの期間別出現数")
+    trend_parser.add_argument("keyword")
+    trend_parser.add_argument("--level", choices=DIGEST_LEVEL_NAMES, default=None)
+    trend_parser.add_argument("--by", choices=GRANULARITIES, default="month")
+
+    related_parser = subparsers.add_parser("related", help="共起キーワード上位")
+    related_parser.add_argument("keyword")
+    related_parser.add_argument("--limit", type=int, default=10)
+
+    subparsers.add_parser("rebuild", help="既存RegularDigestから集計を再構築")
+
+    args = parser.parse_args()
+
+    try:
+        config = DigestConfig()
+        recorder = KeywordRollupRecorder(config.digests_path)
+        output_json(_run(args, recorder, get_query_cache(config.essences_path)))
+    except EpisodicRAGError as e:
+        output_error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digest Watch CLI
+================
+
+Loops と Digests を監視し、新規Loopの検出結果や派生インデックスを
+バックグラウンドで更新し続ける（/digest Pattern 1 を事前準備済みの状態から返すため）。
+
+Linux では inotify、それ以外ではポーリングで監視する。
+変化は --debounce 秒静かになるまでまとめてから処理する。
+新規Loopの検出結果がLoopsディレクトリの変更直後のもので信頼できない間は、
+その時間が過ぎた時点で検出し直す。
+
+Usage:
+    python -m interfaces.digest_watch              # 監視を開始（Ctrl+Cで終了）
+    python -m interfaces.digest_watch --once       # 1回だけ事前更新して終了
+    python -m interfaces.digest_watch --backend poll --interval 5
+"""
+
+import argparse
+import io
+import sys
+from typing import Dict, List, Optional
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.watch import IndexWarmer
+from domain.exceptions import EpisodicRAGError
+from infrastructure import get_structured_logger
+from infrastructure.fs_watcher import (
+    DEFAULT_POLL_INTERVAL,
+    WATCH_BACKENDS,
+    DirectoryWatcher,
+    create_watcher,
+)
+from interfaces.cli_helpers import output_error, output_json
+
+_logger = get_structured_logger(__name__)
+
+# 変化がないときに poll() を待つ最大時間（秒）
+IDLE_TIMEOUT = 60.0
+
+
+def watch(
+    warmer: IndexWarmer,
+    watcher: DirectoryWatcher,
+    debounce: float,
+    max_batches: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    変化を待ってまとめて事前更新する処理を繰り返す（Ctrl+Cで終了）
+
+    Args:
+        warmer: IndexWarmer
+        watcher: 監視バックエンド
+        debounce: 変化が止まってから処理するまでの待ち時間（秒）
+        max_batches: 処理回数の上限（テスト用、Noneなら中断されるまで）
+
+    Returns:
+        {"batches": 処理回数, "new_loops": 検出した新規Loop数（最後の回）, "digests": 反映数}
+    """
+    summary = {"batches": 0, "new_loops": 0, "digests": 0}
+    try:
+        while max_batches is None or summary["batches"] < max_batches:
+            delay = warmer.rewarm_delay()
+            changed = watcher.poll(IDLE_TIMEOUT if delay is None else min(IDLE_TIMEOUT, delay))
+            if not changed:
+                warmer.rewarm_if_due()
+                continue
+            while True:
+                more = watcher.poll(debounce)
+                if not more:
+                    break
+                changed |= more
+            result: Dict[str, List[str]] = warmer.handle(changed)
+            summary["batches"] += 1
+            summary["new_loops"] = len(result["new_loops"])
+            summary["digests"] += len(result["digests"])
+    except KeyboardInterrupt:
+        pass
+    return summary
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="Loops・Digestsの監視と派生インデックスの事前更新",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--backend", choices=WATCH_BACKENDS, default="auto", help="監視方式 (default: auto)"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_POLL_INTERVAL, help="ポーリング間隔（秒）"
+    )
+    parser.add_argument(
+        "--debounce", type=float, default=1.0, help="変化が止まってから処理するまでの秒数"
+    )
+    parser.add_argument("--once", action="store_true", help="1回だけ事前更新して終了")
+
+    args = parser.parse_args()
+
+    try:
+        warmer = IndexWarmer(DigestConfig())
+        initial = warmer.warm_all()
+        if args.once:
+            output_json({"status": "ok", **initial})
+            return
+        with create_watcher(warmer.watch_roots, args.backend, args.interval) as watcher:
+            _logger.state(
+                "digest_watch_started",
+                backend=watcher.backend,
+                new_loops=len(initial["new_loops"]),
+            )
+            summary = watch(warmer, watcher, args.debounce)
+        output_json({"status": "ok", "backend": watcher.backend, **summary})
+    except (EpisodicRAGError, OSError) as e:
+        output_error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -59,11 +59,22 @@ __init__で依存オブジェクト（managers, tracker）をオプション引
     【処理4】last_digest_times.json 更新
         - 最終ダイジェスト生成時刻を記録
         - 処理対象ファイルの連番リストを保存
+
+非同期版（finalize_from_shadow_async、CLIの --async）：
+    処理の順序と失敗時の扱いは同期版と同じ。ディスク待ちをスレッドで重ねる。
+        - RegularDigestの書き込み中に、次レベルの新規ファイル検出を先読み
+        - 派生インデックス（timeline/hierarchy/keyword_rollup/vectors）の記録を、
+          GrandDigest更新・カスケード・last_digest_times更新と並行して実行
+        - RegularDigest → GrandDigest → カスケード → last_digest_times → Provisional削除
+          の順は変えない（前の処理が失敗したら後の処理は行わない）
 """
 
 import argparse
+import asyncio
 import sys
-from typing import Optional
+from array import array
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 # 設定
 from application.config import DigestConfig
@@ -83,9 +94,10 @@ from domain.constants import LEVEL_CONFIG, LOG_SEPARATOR
 from domain.exceptions import EpisodicRAGError
 from domain.file_naming import format_digest_number
 from domain.level_registry import get_level_registry
+from domain.types import RegularDigestData
 
 # Infrastructure層
-from infrastructure import get_structured_logger, log_error
+from infrastructure import get_structured_logger, level_lock, log_error
 
 # Helpers
 from interfaces.interface_helpers import get_next_digest_number, sanitize_filename
@@ -150,10 +162,13 @@ class DigestFinalizerFromShadow:
             self.config, self.grand_digest_manager, self.shadow_manager, self.times_tracker
         )
 
-    def validate_shadow_content(self, level: str, source_files: list) -> None:
+    def validate_shadow_content(self, level: str, source_files: list) -> "array[int]":
         """
         ShadowGrandDigestの内容が妥当かチェック（後方互換性のためのラッパー）
 
+        Returns:
+            抽出したファイル番号の array（source_filesの順）
+
         Raises:
             ValidationError: source_filesの形式が不正な場合
 
@@ -185,6 +200,121 @@ class DigestFinalizerFromShadow:
         _logger.info(f"Shadowからダイジェスト確定: {level.upper()}")
         _logger.info(LOG_SEPARATOR)
 
+        # 同じレベルのProvisional保存・確定処理と直列化（他のレベルは待たせない）
+        with level_lock(self.digests_path, level):
+            self._finalize(level, weave_title)
+
+        _logger.info(LOG_SEPARATOR)
+        _logger.info("ダイジェスト確定処理完了！")
+        _logger.info(LOG_SEPARATOR)
+
+    def _finalize(self, level: str, weave_title: str) -> None:
+        """処理1-5（レベルロックの中で呼ぶ）"""
+        new_digest_name, next_num, regular_digest, provisional_file_to_delete = self._prepare(
+            level, weave_title
+        )
+
+        # ファイル保存（例外を投げる）
+        self._persistence.save_regular_digest(level, regular_digest, new_digest_name)
+
+        # ===== 処理2: GrandDigest更新（例外を投げる） =====
+        self._persistence.update_grand_digest(level, regular_digest, new_digest_name)
+
+        # ===== 処理3-5: カスケードとクリーンアップ =====
+        # regular_digestを渡すことで、次レベルProvisionalにindividual_digestが追加される
+        self._persistence.process_cascade_and_cleanup(
+            level, next_num, provisional_file_to_delete, regular_digest
+        )
+
+    async def finalize_from_shadow_async(self, level: str, weave_title: str) -> None:
+        """
+        ShadowGrandDigestからRegularDigestを作成（ディスク待ちを重ねる非同期版）
+
+        処理の順序・失敗時に行わない処理は finalize_from_shadow() と同じ。
+        同期版との違いは次の2点で、どちらも確定結果を変えない:
+
+        - RegularDigestの書き込みと並行して、次レベルの新規ファイル検出を先読みする
+          （書き込み中のファイルは検出結果に含める）
+        - 派生インデックスの記録（失敗しても警告のみ）を、GrandDigest更新以降の
+          処理と並行して実行する。戻る前に記録の完了を待つ
+
+        Raises:
+            ValidationError: 入力データが不正な場合
+            DigestError: ダイジェスト処理に失敗した場合
+            FileIOError: ファイルI/Oに失敗した場合
+
+        Example:
+            >>> finalizer = DigestFinalizerFromShadow()
+            >>> asyncio.run(finalizer.finalize_from_shadow_async("weekly", "知性射程理論と協働AI実現"))
+        """
+        _logger.info(LOG_SEPARATOR)
+        _logger.info(f"Shadowからダイジェスト確定（非同期）: {level.upper()}")
+        _logger.info(LOG_SEPARATOR)
+
+        # 同じレベルのProvisional保存・確定処理と直列化（他のレベルは待たせない）
+        with level_lock(self.digests_path, level):
+            await self._finalize_async(level, weave_title)
+
+        _logger.info(LOG_SEPARATOR)
+        _logger.info("ダイジェスト確定処理完了！")
+        _logger.info(LOG_SEPARATOR)
+
+    async def _finalize_async(self, level: str, weave_title: str) -> None:
+        """処理1-5の非同期版（レベルロックの中で呼ぶ）"""
+        (
+            new_digest_name,
+            next_num,
+            regular_digest,
+            provisional_file_to_delete,
+        ) = await asyncio.to_thread(self._prepare, level, weave_title)
+        persistence = self._persistence
+        final_path = persistence.regular_digest_path(level, new_digest_name)
+
+        # 次レベルの新規ファイル検出を、RegularDigestの書き込みと並行して先読み
+        prefetch = asyncio.ensure_future(
+            asyncio.to_thread(self._prefetch_next_level_files, level, final_path)
+        )
+        try:
+            await asyncio.to_thread(
+                persistence.write_regular_digest, level, regular_digest, new_digest_name
+            )
+        except BaseException:
+            await asyncio.gather(prefetch, return_exceptions=True)
+            raise
+
+        # 派生インデックスの記録は、以降の処理と並行して実行
+        indexes = asyncio.ensure_future(
+            asyncio.to_thread(persistence.record_indexes, level, new_digest_name, regular_digest)
+        )
+        try:
+            # ===== 処理2: GrandDigest更新（例外を投げる） =====
+            await asyncio.to_thread(
+                persistence.update_grand_digest, level, regular_digest, new_digest_name
+            )
+
+            # ===== 処理3-5: カスケードとクリーンアップ =====
+            next_level_files = await prefetch
+            await asyncio.to_thread(
+                persistence.process_cascade_and_cleanup,
+                level,
+                next_num,
+                provisional_file_to_delete,
+                regular_digest,
+                next_level_files,
+            )
+        finally:
+            await asyncio.gather(prefetch, return_exceptions=True)
+            await indexes
+
+    def _prepare(
+        self, level: str, weave_title: str
+    ) -> Tuple[str, int, RegularDigestData, Optional[Path]]:
+        """
+        処理1の前半: Shadowの検証、ダイジェスト名の決定、RegularDigestの構築
+
+        Returns:
+            (new_digest_name, next_num, regular_digest, provisional_file_to_delete)
+        """
         # ===== 処理1: RegularDigest作成 =====
         _logger.info("[Step 1] ShadowからRegularDigest作成中...")
 
@@ -209,22 +339,20 @@ class DigestFinalizerFromShadow:
         regular_digest = RegularDigestBuilder.build(
             level, new_digest_name, digest_num, shadow_digest, individual_digests
         )
+        return new_digest_name, next_num, regular_digest, provisional_file_to_delete
 
-        # ファイル保存（例外を投げる）
-        self._persistence.save_regular_digest(level, regular_digest, new_digest_name)
-
-        # ===== 処理2: GrandDigest更新（例外を投げる） =====
-        self._persistence.update_grand_digest(level, regular_digest, new_digest_name)
-
-        # ===== 処理3-5: カスケードとクリーンアップ =====
-        # regular_digestを渡すことで、次レベルProvisionalにindividual_digestが追加される
-        self._persistence.process_cascade_and_cleanup(
-            level, next_num, provisional_file_to_delete, regular_digest
-        )
+    def _prefetch_next_level_files(self, level: str, final_path: Path) -> Optional[List[Path]]:
+        """
+        カスケード先レベルの新規ファイルを検出（書き込み中の final_path を含める）
 
-        _logger.info(LOG_SEPARATOR)
-        _logger.info("ダイジェスト確定処理完了！")
-        _logger.info(LOG_SEPARATOR)
+        Returns:
+            検出したファイル。カスケードしないレベルならNone（カスケード側の既定動作に任せる）
+        """
+        registry = get_level_registry()
+        next_level = registry.get_metadata(level).next_level
+        if not registry.should_cascade(level) or not next_level:
+            return None
+        return self.shadow_manager.find_new_files(next_level, pending=[final_path])
 
 
 def main() -> None:
@@ -255,13 +383,22 @@ Example:
         help="Digest level to finalize",
     )
     parser.add_argument("weave_title", help="Title decided by Claude")
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Overlap independent disk writes (same ordering and failure behavior)",
+    )
 
     args = parser.parse_args()
 
     try:
         # ファイナライザー実行
         finalizer = DigestFinalizerFromShadow()
-        finalizer.finalize_from_shadow(args.level, args.weave_title)
+        if args.use_async:
+            asyncio.run(finalizer.finalize_from_shadow_async(args.level, args.weave_title))
+        else:
+            finalizer.finalize_from_shadow(args.level, args.weave_title)
     except EpisodicRAGError as e:
         log_error(str(e))
         sys.exit(1)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Grand History CLI
+=================
+
+GrandDigest.history.jsonl から過去の GrandDigest を復元する。
+指定時刻以前で最寄りのキーフレームから差分を適用するだけで、
+ダイジェストファイルや git の履歴は参照しない。
+
+Usage:
+    python -m interfaces.grand_history --at 2025-06-01
+    python -m interfaces.grand_history --list
+
+Output (--at):
+    {
+      "status": "ok",
+      "at": "2025-06-01",
+      "as_of": "2025-05-30T21:04:11",
+      "grand_digest": {"metadata": {...}, "major_digests": {...}}
+    }
+
+Output (--list):
+    {
+      "status": "ok",
+      "versions": [
+        {"timestamp": "2025-05-30T21:04:11", "kind": "delta", "levels": ["weekly"]}
+      ]
+    }
+"""
+
+import argparse
+import io
+import sys
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.grand import GrandDigestManager
+from domain.exceptions import EpisodicRAGError
+from interfaces.cli_helpers import output_error, output_json
+from interfaces.digest_timeline import _iso_bound
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="過去の GrandDigest を復元",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m interfaces.grand_history --at 2025-06-01
+  python -m interfaces.grand_history --at 2025-06-01T12:00:00
+  python -m interfaces.grand_history --list
+        """,
+    )
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--at", type=_iso_bound, help="この時刻の GrandDigest（日付のみなら当日の終わり時点）"
+    )
+    group.add_argument("--list", action="store_true", help="記録された版の一覧")
+    args = parser.parse_args()
+
+    try:
+        history = GrandDigestManager(DigestConfig()).history
+        if args.list:
+            versions = [
+                {"timestamp": timestamp, "kind": kind, "levels": levels}
+                for timestamp, kind, levels in history.versions()
+            ]
+            output_json({"status": "ok", "versions": versions})
+            return
+        grand_digest = history.at(args.at)
+    except EpisodicRAGError as e:
+        output_error(str(e))
+        return
+
+    if grand_digest is None:
+        output_error(f"No GrandDigest history at or before {args.at}")
+        return
+
+    output_json(
+        {
+            "status": "ok",
+            "at": args.at,
+            "as_of": grand_digest["metadata"]["last_updated"],
+            "grand_digest": grand_digest,
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Loop Archive CLI
+================
+
+処理済みの古いLoopを圧縮パック（Loops/.archive）へ移し、
+パック済みLoopの一覧・読み出し・書き戻しを行う。
+
+パック済みLoopは FileDetector や digest_auto からはディスク上のLoopと同様に見える。
+未処理（loop.last_processed より後）のLoopはパックしない。
+
+Usage:
+    python -m interfaces.loop_archive pack --before L03000
+    python -m interfaces.loop_archive pack --before L03000 --dry-run
+    python -m interfaces.loop_archive list
+    python -m interfaces.loop_archive cat L00186
+    python -m interfaces.loop_archive unpack L00186 L00187
+"""
+
+import argparse
+import io
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+from application.config import DigestConfig
+from application.tracking import DigestTimesTracker
+from domain.exceptions import EpisodicRAGError
+from domain.file_constants import LOOP_FILE_PATTERN
+from domain.file_naming import extract_number_only
+from domain.indexed_provisional import extract_source_base_key
+from infrastructure.file_scanner import scan_files
+from infrastructure.loop_archive import LoopArchive, read_loop_bytes
+from interfaces.cli_helpers import output_error, output_json
+
+
+def _loop_number(value: str) -> int:
+    """--before の Loop ID（例: "L03000"）を番号に変換"""
+    number = extract_number_only(value)
+    if number is None:
+        raise argparse.ArgumentTypeError(f"invalid loop id: {value} (example: L03000)")
+    return number
+
+
+def _resolve(loop_files: List[Path], loop_id: str) -> Optional[Path]:
+    """ファイル名またはLoop ID（例: "L00186"）からLoopファイルを特定"""
+    for loop_file in loop_files:
+        if loop_id in (loop_file.name, extract_source_base_key(loop_file.name)):
+            return loop_file
+    return None
+
+
+def _pack(args: argparse.Namespace, config: DigestConfig, archive: LoopArchive) -> Dict[str, Any]:
+    """--before より前の処理済みLoopをパック（未処理Loopは対象外）"""
+    loop_data = DigestTimesTracker(config).load_or_create().get("loop", {})
+    last_processed = loop_data.get("last_processed")
+    candidates = [
+        f
+        for f in sorted(config.loops_path.glob(LOOP_FILE_PATTERN))
+        if (extract_number_only(f.name) or 0) < args.before
+    ]
+    packable = [
+        f
+        for f in candidates
+        if last_processed is not None and (extract_number_only(f.name) or 0) <= last_processed
+    ]
+    skipped = [f.name for f in candidates if f not in packable]
+    files = [f.name for f in packable] if args.dry_run else archive.pack(packable)
+    return {
+        "status": "ok",
+        "dry_run": args.dry_run,
+        "packed": len(files),
+        "files": files,
+        "skipped_unprocessed": skipped,
+    }
+
+
+def _run(args: argparse.Namespace, config: DigestConfig) -> Dict[str, Any]:
+    """サブコマンドを実行して出力用の辞書を返す"""
+    archive = LoopArchive(config.loops_path)
+    if args.command == "pack":
+        return _pack(args, config, archive)
+    if args.command == "list":
+        return {"status": "ok", **archive.totals(), "names": archive.names()}
+
+    archived = [config.loops_path / name for name in archive.names()]
+    resolved = {loop_id: _resolve(archived, loop_id) for loop_id in args.loop_ids}
+    missing = [loop_id for loop_id, path in resolved.items() if path is None]
+    if missing:
+        output_error("Loop not found in archive", details={"loop_ids": missing})
+    names = [path.name for path in resolved.values() if path is not None]
+    return {"status": "ok", "unpacked": archive.unpack(names)}
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="古いLoopの圧縮パック（コールドストレージ）",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = subparsers.add_parser("pack", help="指定番号より前の処理済みLoopをパック")
+    pack_parser.add_argument(
+        "--before", type=_loop_number, required=True, help='Loop ID（例: "L03000"）'
+    )
+    pack_parser.add_argument("--dry-run", action="store_true", help="対象の表示のみ")
+
+    subparsers.add_parser("list", help="パック済みLoopの一覧とサイズ")
+
+    cat_parser = subparsers.add_parser("cat", help="Loopの本文を出力（パック済みも可）")
+    cat_parser.add_argument("loop_id", help='Loop ID またはファイル名（例: "L00186"）')
+
+    unpack_parser = subparsers.add_parser("unpack", help="パック済みLoopをLoopsへ書き戻す")
+    unpack_parser.add_argument("loop_ids", nargs="+", help='Loop ID（例: "L00186"）')
+
+    args = parser.parse_args()
+
+    try:
+        config = DigestConfig()
+        if args.command == "cat":
+            loop_file = _resolve(
+                scan_files(config.loops_path, LOOP_FILE_PATTERN, include_archived=True),
+                args.loop_id,
+            )
+            if loop_file is None:
+                output_error(f"Loop not found: {args.loop_id}")
+                return
+            sys.stdout.write(read_loop_bytes(loop_file).decode("utf-8", errors="replace"))
+            return
+        output_json(_run(args, config))
+    except EpisodicRAGError as e:
+        output_error(str(e))
+
+
+if __name__ == "__main__":
+    main()
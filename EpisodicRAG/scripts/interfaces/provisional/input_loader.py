@@ -1,17 +1,17 @@
 """
 Input loading utilities for provisional digests.
 
-Handles JSON parsing from files or strings.
+Handles JSON parsing from files or strings, and streaming JSON Lines input.
 """
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, Iterator, List, Union, cast
 
 from domain.error_formatter import get_error_formatter
 from domain.exceptions import ValidationError
 from domain.types import IndividualDigestData
-from interfaces.provisional.validator import validate_input_format
+from interfaces.provisional.validator import validate_individual_digest, validate_input_format
 
 # Type alias for JSON data
 JsonData = Union[Dict[str, Any], List[Any]]
@@ -95,3 +95,46 @@ class InputLoader:
         """
         result: JsonData = json.loads(json_string)
         return result
+
+    @staticmethod
+    def iter_jsonl(lines: Iterable[str]) -> Iterator[IndividualDigestData]:
+        """
+        Parse and validate JSON Lines input one record at a time.
+
+        Each non-blank line must hold a single individual digest object.
+        Records are yielded as soon as they are validated, so callers can
+        merge incrementally and the first invalid line is reported before
+        the rest of the input is read.
+
+        Args:
+            lines: Iterable of text lines (an open file or sys.stdin)
+
+        Yields:
+            Validated individual digests
+
+        Raises:
+            ValidationError: If a line is not valid JSON or fails validation
+
+        Example:
+            >>> with open("digests.jsonl", encoding="utf-8") as f:
+            ...     for digest in InputLoader.iter_jsonl(f):
+            ...         print(digest["source_file"])
+            L00001.txt
+            L00002.txt
+        """
+        formatter = get_error_formatter()
+        index = 0
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValidationError(
+                    formatter.validation.validation_error(
+                        f"input line {line_number}", f"invalid JSON ({e.msg})", None
+                    )
+                ) from e
+            validate_individual_digest(record, index, context=f"line {line_number}")
+            index += 1
+            yield cast(IndividualDigestData, record)
@@ -4,8 +4,9 @@ Digest merging utilities.
 Handles merging of individual digests with deduplication.
 """
 
-from typing import List
+from typing import Any, Dict, Iterable, List, cast
 
+from domain.indexed_provisional import IndexedProvisional
 from domain.types import IndividualDigestData
 from infrastructure import get_structured_logger
 from interfaces.provisional.validator import validate_individual_digests_list
@@ -13,9 +14,74 @@ from interfaces.provisional.validator import validate_individual_digests_list
 _logger = get_structured_logger(__name__)
 
 
+def _source_file_key(digest: Dict[str, Any]) -> str:
+    """Exact source_file key used for merge deduplication."""
+    return str(digest["source_file"])
+
+
 class DigestMerger:
     """Merges individual digests with deduplication by source_file."""
 
+    @staticmethod
+    def create_index(existing_digests: List[IndividualDigestData]) -> IndexedProvisional:
+        """
+        Build a source_file index over existing digests.
+
+        Existing digests were validated when they were saved, so they are
+        only checked in full when one of them cannot be keyed (to report the
+        broken entry by position). Entries merged later through merge_into()
+        are validated by their source (see merge_into()).
+
+        Args:
+            existing_digests: Existing individual digests list
+
+        Returns:
+            IndexedProvisional keyed by exact source_file
+
+        Raises:
+            ValidationError: If an existing digest is not a dict or has no source_file
+
+        Example:
+            >>> index = DigestMerger.create_index(existing)
+            >>> DigestMerger.merge_into(index, new_digests)
+        """
+        index = IndexedProvisional(key_func=_source_file_key)
+        try:
+            index.upsert_all(cast(List[Dict[str, Any]], existing_digests))
+        except (KeyError, TypeError):
+            validate_individual_digests_list(existing_digests, context="existing")
+            raise
+        return index
+
+    @staticmethod
+    def merge_into(
+        index: IndexedProvisional,
+        new_digests: Iterable[IndividualDigestData],
+    ) -> int:
+        """
+        Merge new digests into an existing index incrementally.
+
+        New digests are not validated again here: they must come from a
+        validating source such as InputLoader.iter_jsonl(), which reports
+        errors with their input line numbers.
+
+        Args:
+            index: Index created by create_index()
+            new_digests: Validated individual digests to merge
+
+        Returns:
+            Number of existing digests overwritten
+
+        Example:
+            >>> index = DigestMerger.create_index([])
+            >>> DigestMerger.merge_into(index, InputLoader.iter_jsonl(lines))
+            0
+        """
+        replaced = index.upsert_all(cast(Iterable[Dict[str, Any]], new_digests))
+        for source_file in replaced:
+            _logger.info(f"既存ダイジェストを上書き: {source_file}")
+        return len(replaced)
+
     @staticmethod
     def merge(
         existing_digests: List[IndividualDigestData],
@@ -25,7 +91,8 @@ class DigestMerger:
         Merge existing and new individual digests.
 
         Deduplication is based on source_file key. When duplicates exist,
-        new digests overwrite existing ones.
+        new digests overwrite existing ones. Only the new digests are
+        validated (see create_index() for existing ones).
 
         Args:
             existing_digests: Existing individual digests list
@@ -44,18 +111,7 @@ class DigestMerger:
             >>> len(merged)
             2
         """
-        # Validate inputs
-        validate_individual_digests_list(existing_digests, context="existing")
+        index = DigestMerger.create_index(existing_digests)
         validate_individual_digests_list(new_digests, context="new")
-
-        # Create dict keyed by source_file
-        merged_dict = {d["source_file"]: d for d in existing_digests}
-
-        # Overwrite with new digests
-        for new_digest in new_digests:
-            source_file = new_digest["source_file"]
-            if source_file in merged_dict:
-                _logger.info(f"既存ダイジェストを上書き: {source_file}")
-            merged_dict[source_file] = new_digest
-
-        return list(merged_dict.values())
+        DigestMerger.merge_into(index, new_digests)
+        return cast(List[IndividualDigestData], index.to_list())
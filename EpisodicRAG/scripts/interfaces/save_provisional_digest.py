@@ -7,25 +7,30 @@ DigestAnalyzerが生成したindividual_digestsをProvisionalDigestファイル
 finalize_from_shadow.pyが読み込むための中間ファイルを作成する。
 
 Usage:
-    python save_provisional_digest.py <level> --stdin [--append]
-    python save_provisional_digest.py <level> <json_file> [--append]
+    python save_provisional_digest.py <level> --stdin [--append] [--jsonl]
+    python save_provisional_digest.py <level> <json_file> [--append] [--jsonl]
 
 Examples:
     cat digest.json | python save_provisional_digest.py weekly --stdin --append
     python save_provisional_digest.py weekly individual_digests.json --append
+    cat digests.jsonl | python save_provisional_digest.py weekly --stdin --jsonl --append
 
 Note:
     JSONはファイルまたは--stdinで渡してください。
     コマンドライン引数で直接JSON文字列を渡すと、長いテキストが切り詰められる可能性があります。
+
+    保存はレベルロックの中で行う。同じレベルの保存・確定処理とは直列化され、
+    他のレベルの処理（monthlyの準備状況チェック等）は待たされない。
 """
 
 import argparse
 import io
 import json
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, TextIO, Tuple, cast
 
 # Windows環境でUTF-8入出力を有効化（CLI実行時のみ）
 if sys.platform == 'win32' and __name__ == "__main__":
@@ -39,12 +44,20 @@ from application.config import DigestConfig
 # Domain層
 from domain.exceptions import EpisodicRAGError
 from domain.file_naming import format_digest_number
+from domain.indexed_provisional import IndexedProvisional
 from domain.level_registry import get_level_registry
 from domain.types import IndividualDigestData
 from domain.version import DIGEST_FORMAT_VERSION
 
 # Infrastructure層
-from infrastructure import get_structured_logger, log_error, log_warning, save_json
+from infrastructure import (
+    bump_corpus_generation,
+    get_structured_logger,
+    level_lock,
+    log_error,
+    log_warning,
+    save_json,
+)
 
 # Helpers
 from interfaces.interface_helpers import get_next_digest_number
@@ -87,23 +100,108 @@ class ProvisionalDigestSaver:
 
         Returns:
             保存したファイルのPath
+
+        Note:
+            同じ source_file のダイジェストは後のものが優先され、1件にまとまる
+            （append の有無によらない。save_provisional_stream と同じ結果になる）。
         """
         digits = self.file_manager.get_digits_for_level(level)
 
-        # Determine digest number and handle append mode
-        digest_num, individual_digests = self._resolve_digest_number_and_data(
-            level, individual_digests, append
-        )
+        # 既存Provisionalの読み込みから保存までを、同じレベルの他の更新と直列化
+        with level_lock(self.config.digests_path, level):
+            # Determine digest number and handle append mode
+            digest_num, individual_digests = self._resolve_digest_number_and_data(
+                level, individual_digests, append
+            )
 
-        # Build and save the provisional file
-        file_path = self.file_manager.get_provisional_path(level, digest_num)
-        provisional_data = self._build_provisional_data(
-            level, digest_num, digits, individual_digests
-        )
-        save_json(file_path, provisional_data)
+            # Build and save the provisional file
+            file_path = self.file_manager.get_provisional_path(level, digest_num)
+            provisional_data = self._build_provisional_data(
+                level, digest_num, digits, individual_digests
+            )
+            save_json(file_path, provisional_data)
+            bump_corpus_generation(self.config.essences_path)
 
         return file_path
 
+    def save_provisional_stream(
+        self, level: str, individual_digests: Iterable[IndividualDigestData], append: bool = False
+    ) -> Tuple[Path, int]:
+        """
+        ProvisionalDigestファイルをストリーム入力から保存
+
+        入力をレベルロックの外で最後まで読み、一時ファイルに書き出してから、
+        ロックの中では既存Provisionalの索引へのマージと保存だけを行う。
+        入力の遅い書き手がいても、同じレベルの他の保存・確定処理を待たせない。
+        入力全体をリストとして保持しないため、大量バッチ入力でも
+        メモリ使用量は最終的なProvisionalの大きさに収まる。
+        検証エラー時はロックを取らず、ファイルを書き込まずに例外を送出する。
+
+        Args:
+            level: ダイジェストレベル
+            individual_digests: 個別ダイジェストのイテラブル（InputLoader.iter_jsonl等）
+            append: 既存ファイルに追加するか
+
+        Returns:
+            (保存したファイルのPath, 入力件数) のタプル
+
+        Example:
+            >>> with open("digests.jsonl", encoding="utf-8") as f:
+            ...     path, count = saver.save_provisional_stream(
+            ...         "weekly", InputLoader.iter_jsonl(f), append=True
+            ...     )
+        """
+        digits = self.file_manager.get_digits_for_level(level)
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as spool:
+            count = 0
+            for digest in individual_digests:
+                spool.write(json.dumps(digest, ensure_ascii=False) + "\n")
+                count += 1
+            spool.seek(0)
+
+            with level_lock(self.config.digests_path, level):
+                digest_num, index = self._resolve_digest_number_and_index(level, append)
+                self.merger.merge_into(
+                    index, (cast(IndividualDigestData, json.loads(line)) for line in spool)
+                )
+
+                file_path = self.file_manager.get_provisional_path(level, digest_num)
+                provisional_data = self._build_provisional_data(
+                    level, digest_num, digits, cast(List[IndividualDigestData], index.to_list())
+                )
+                save_json(file_path, provisional_data)
+                bump_corpus_generation(self.config.essences_path)
+
+        return file_path, count
+
+    def _resolve_digest_number_and_index(
+        self, level: str, append: bool
+    ) -> Tuple[int, IndexedProvisional]:
+        """
+        Resolve digest number and build the merge index for stream mode.
+
+        Returns:
+            Tuple of (digest_number, index over existing digests)
+        """
+        current_num = self.file_manager.get_current_digest_number(level) if append else None
+
+        if current_num is None:
+            if append:
+                log_warning(
+                    "--append指定されましたが既存Provisionalがありません。新規ファイルを作成します。"
+                )
+            return get_next_digest_number(self.config.digests_path, level), (
+                self.merger.create_index([])
+            )
+
+        existing_data = self.file_manager.load_existing_provisional(level, current_num)
+        existing_digests = validate_provisional_structure(existing_data) if existing_data else []
+        index = self.merger.create_index(existing_digests)
+        _logger.info(
+            f"既存Provisionalに追加: {format_digest_number(level, current_num)}_Individual.txt"
+        )
+        return current_num, index
+
     def _resolve_digest_number_and_data(
         self,
         level: str,
@@ -111,28 +209,30 @@ class ProvisionalDigestSaver:
         append: bool,
     ) -> tuple[int, List[IndividualDigestData]]:
         """
-        Resolve digest number and merge data if in append mode.
+        Resolve digest number and merge data (with the existing file in append mode).
+
+        Duplicates by source_file are merged even without an existing file,
+        matching _resolve_digest_number_and_index() in stream mode.
 
         Returns:
             Tuple of (digest_number, final_individual_digests)
         """
-        if not append:
-            return get_next_digest_number(self.config.digests_path, level), individual_digests
-
-        # Append mode: try to use existing file
-        current_num = self.file_manager.get_current_digest_number(level)
+        current_num = self.file_manager.get_current_digest_number(level) if append else None
 
         if current_num is None:
-            log_warning(
-                "--append指定されましたが既存Provisionalがありません。新規ファイルを作成します。"
+            if append:
+                log_warning(
+                    "--append指定されましたが既存Provisionalがありません。新規ファイルを作成します。"
+                )
+            index = self.merger.create_index(individual_digests)
+            return get_next_digest_number(self.config.digests_path, level), cast(
+                List[IndividualDigestData], index.to_list()
             )
-            return get_next_digest_number(self.config.digests_path, level), individual_digests
 
         # Load and merge with existing data
         existing_data = self.file_manager.load_existing_provisional(level, current_num)
-        if existing_data:
-            existing_digests = validate_provisional_structure(existing_data)
-            individual_digests = self.merger.merge(existing_digests, individual_digests)
+        existing_digests = validate_provisional_structure(existing_data) if existing_data else []
+        individual_digests = self.merger.merge(existing_digests, individual_digests)
 
         # メッセージはマージ成功後に表示（バリデーションエラー時は表示されない）
         _logger.info(
@@ -160,6 +260,13 @@ class ProvisionalDigestSaver:
         }
 
 
+def _run_stream_mode(
+    saver: ProvisionalDigestSaver, level: str, lines: TextIO, append: bool
+) -> Tuple[Path, int]:
+    """JSON Lines入力を逐次検証・マージして保存"""
+    return saver.save_provisional_stream(level, InputLoader.iter_jsonl(lines), append=append)
+
+
 def main() -> None:
     """メイン処理"""
     parser = argparse.ArgumentParser(
@@ -169,8 +276,10 @@ def main() -> None:
 Examples:
   cat digest.json | python save_provisional_digest.py weekly --stdin --append
   python save_provisional_digest.py weekly individual_digests.json --append
+  cat digests.jsonl | python save_provisional_digest.py weekly --stdin --jsonl --append
 
 Note: JSONはファイルまたは--stdinで渡してください。
+      --jsonl では1行1件の個別ダイジェストを逐次検証・マージします（大量バッチ向け）。
         """,
     )
     # Registry経由でレベル一覧を動的に取得（OCP準拠）
@@ -192,6 +301,11 @@ Note: JSONはファイルまたは--stdinで渡してください。
     parser.add_argument(
         "--append", action="store_true", help="既存のProvisionalファイルに追加（新規作成ではなく）"
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="JSON Lines形式（1行1件）として逐次読み込む（大量バッチ入力に推奨）",
+    )
     args = parser.parse_args()
 
     # Validate: either input_data or --stdin must be provided
@@ -202,29 +316,43 @@ Note: JSONはファイルまたは--stdinで渡してください。
         config = DigestConfig()
         saver = ProvisionalDigestSaver(config=config)
 
-        # Load individual digests using InputLoader
-        if args.stdin:
-            input_data = sys.stdin.read()
+        if args.jsonl:
+            # Stream mode: validate and merge one record at a time
+            if args.stdin:
+                saved_path, digest_count = _run_stream_mode(
+                    saver, args.level, sys.stdin, args.append
+                )
+            else:
+                with open(args.input_data, 'r', encoding='utf-8') as f:
+                    saved_path, digest_count = _run_stream_mode(saver, args.level, f, args.append)
+            if digest_count == 0:
+                log_warning("JSON Lines入力に個別ダイジェストがありませんでした。")
+            _logger.info(f"個別ダイジェスト {digest_count}件をストリーム読込")
         else:
-            input_data = args.input_data
-        individual_digests = InputLoader.load(input_data)
+            # Load individual digests using InputLoader
+            if args.stdin:
+                input_data = sys.stdin.read()
+            else:
+                input_data = args.input_data
+            individual_digests = InputLoader.load(input_data)
+            digest_count = len(individual_digests)
 
-        # Empty list warning
-        if len(individual_digests) == 0:
-            log_warning(
-                "保存する個別ダイジェストがありません。空のProvisionalファイルを作成します。"
-            )
+            # Empty list warning
+            if digest_count == 0:
+                log_warning(
+                    "保存する個別ダイジェストがありません。空のProvisionalファイルを作成します。"
+                )
 
-        _logger.info(f"個別ダイジェスト {len(individual_digests)}件を読込")
+            _logger.info(f"個別ダイジェスト {digest_count}件を読込")
 
-        # Save ProvisionalDigest
-        saved_path = saver.save_provisional(args.level, individual_digests, append=args.append)
+            # Save ProvisionalDigest
+            saved_path = saver.save_provisional(args.level, individual_digests, append=args.append)
 
         _logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         _logger.info("ProvisionalDigest保存完了")
         _logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         _logger.info(f"パス: {saved_path}")
-        _logger.info(f"個別ダイジェスト: {len(individual_digests)}件")
+        _logger.info(f"個別ダイジェスト: {digest_count}件")
         if args.append:
             _logger.info("モード: 追加（既存ファイルとマージ）")
         else:
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+HierarchyRecorder Unit Tests
+============================
+
+Tests for application/finalize/hierarchy_recorder.py
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from application.finalize import HierarchyRecorder
+from application.finalize.digest_corpus import iter_digest_records
+
+
+def _digest(*source_files: str) -> dict:
+    return {"overall_digest": {"source_files": list(source_files)}}
+
+
+class TestHierarchyRecorder:
+    """HierarchyRecorder tests"""
+
+    def test_record_digest_persists_links(self, tmp_path: Path) -> None:
+        """record_digest() links the digest base key to its source base keys"""
+        recorder = HierarchyRecorder(tmp_path)
+        recorder.record_digest("W0001_第1週", _digest("L00001_a.txt", "L00002_b.txt"))
+        recorder.record_digest("M001_1月", _digest("W0001_第1週.txt"))
+
+        index = HierarchyRecorder(tmp_path).load()
+        assert list(index.iter_ancestors("L00002")) == ["W0001", "M001"]
+        assert index.children_of("W0001") == ["L00001", "L00002"]
+
+    def test_corrupted_index_treated_as_empty(self, tmp_path: Path) -> None:
+        """A corrupted index file is replaced on the next record"""
+        recorder = HierarchyRecorder(tmp_path)
+        recorder.index_file.write_text("{broken", encoding="utf-8")
+
+        recorder.record_digest("W0001", _digest("L00001.txt"))
+
+        assert recorder.load().parents_of("L00001") == ["W0001"]
+
+    def test_rebuild_scans_level_directories(self, tmp_path: Path) -> None:
+        """rebuild() reads source_files from every level directory"""
+        weekly = tmp_path / "1_Weekly"
+        monthly = tmp_path / "2_Monthly"
+        weekly.mkdir()
+        monthly.mkdir()
+        (weekly / "W0001_a.txt").write_text(json.dumps(_digest("L00001_x.txt")), encoding="utf-8")
+        (monthly / "M001_b.txt").write_text(json.dumps(_digest("W0001_a.txt")), encoding="utf-8")
+        (weekly / "W0002_broken.txt").write_text("not json", encoding="utf-8")
+
+        index = HierarchyRecorder(tmp_path).rebuild()
+
+        assert list(index.iter_ancestors("L00001")) == ["W0001", "M001"]
+        assert HierarchyRecorder(tmp_path).load().children_of("M001") == ["W0001"]
+
+    def test_iter_digest_records_loads_text_lazily(self, tmp_path: Path) -> None:
+        """iter_digest_records() yields records that re-read their text from disk"""
+        weekly = tmp_path / "1_Weekly"
+        weekly.mkdir()
+        data = _digest("L00001_x.txt")
+        data["overall_digest"]["abstract"] = "要約"
+        (weekly / "W0001_a.txt").write_text(json.dumps(data), encoding="utf-8")
+
+        (record,) = iter_digest_records(tmp_path)
+
+        assert (record.level, record.digest_id) == ("weekly", "W0001")
+        assert record.source_ids() == ["L00001"]
+        assert not record.overall.text_loaded
+        assert record.overall.abstract == "要約"
+
+
+@pytest.mark.integration
+def test_persistence_records_hierarchy(temp_plugin_env) -> None:
+    """DigestPersistence.save_regular_digest() updates hierarchy_index.json"""
+    from application.config import DigestConfig
+    from application.finalize.persistence import DigestPersistence
+    from application.grand import GrandDigestManager, ShadowGrandDigestManager
+    from application.tracking import DigestTimesTracker
+
+    config = DigestConfig()
+    persistence = DigestPersistence(
+        config=config,
+        grand_digest_manager=GrandDigestManager(config),
+        shadow_manager=ShadowGrandDigestManager(config),
+        times_tracker=DigestTimesTracker(config),
+        confirm_callback=lambda _: True,
+    )
+    digest = _digest("L00001_a.txt", "L00002_b.txt")
+    digest["overall_digest"]["timestamp"] = "2025-01-01T00:00:00"
+
+    persistence.save_regular_digest("weekly", digest, "W0001_第1週")
+
+    assert persistence.hierarchy.load().parents_of("L00001") == ["W0001"]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+KeywordRollupRecorder Unit Tests
+================================
+
+Tests for application/finalize/keyword_rollup_recorder.py
+"""
+
+import json
+from pathlib import Path
+
+from application.finalize import KeywordRollupRecorder
+
+
+def _digest(timestamp: str, *keywords: str) -> dict:
+    return {"overall_digest": {"timestamp": timestamp, "keywords": list(keywords)}}
+
+
+class TestKeywordRollupRecorder:
+    """KeywordRollupRecorder tests"""
+
+    def test_record_digest_updates_rollup_file(self, tmp_path: Path) -> None:
+        """record_digest() persists incremental counts"""
+        recorder = KeywordRollupRecorder(tmp_path)
+        recorder.record_digest("weekly", "W0001_a", _digest("2025-03-02T00:00:00", "MCP", "API"))
+        recorder.record_digest("weekly", "W0002_b", _digest("2025-05-02T00:00:00", "MCP"))
+
+        rollup = KeywordRollupRecorder(tmp_path).load()
+        assert rollup.trend("MCP", granularity="quarter") == {"2025-Q1": 1, "2025-Q2": 1}
+        assert rollup.cooccurring("API") == [("MCP", 1)]
+
+    def test_rerecord_after_reload_does_not_double_count(self, tmp_path: Path) -> None:
+        """per-digest contributions live in a separate file and are subtracted on re-record"""
+        KeywordRollupRecorder(tmp_path).record_digest(
+            "weekly", "W0001_a", _digest("2025-03-02T00:00:00", "MCP", "API")
+        )
+        KeywordRollupRecorder(tmp_path).record_digest(
+            "weekly", "W0001_a", _digest("2025-03-02T00:00:00", "MCP")
+        )
+
+        recorder = KeywordRollupRecorder(tmp_path)
+        assert recorder.load().trend("MCP") == {"2025-03": 1}
+        assert recorder.load().cooccurring("MCP") == []
+        view = json.loads(recorder.rollup_file.read_text(encoding="utf-8"))
+        assert "digests" not in view
+        assert recorder.digests_file.exists()
+
+    def test_rebuild_from_regular_digests(self, tmp_path: Path) -> None:
+        """rebuild() aggregates every finalized digest"""
+        weekly = tmp_path / "1_Weekly"
+        weekly.mkdir()
+        for name, ts in (("W0001_a.txt", "2025-01-05T00:00:00"), ("W0002_b.txt", "2025-01-12")):
+            (weekly / name).write_text(json.dumps(_digest(ts, "MCP")), encoding="utf-8")
+
+        rollup = KeywordRollupRecorder(tmp_path).rebuild()
+
+        assert len(rollup) == 2
+        assert KeywordRollupRecorder(tmp_path).load().trend("MCP") == {"2025-01": 2}
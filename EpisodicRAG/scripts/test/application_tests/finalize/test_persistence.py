@@ -206,6 +206,58 @@ class TestSaveRegularDigest:
 
         assert loaded["overall_digest"]["abstract"] == "Modified"
 
+    def test_records_digest_in_timeline(self, persistence, sample_regular_digest) -> None:
+        """Records the saved digest in the timeline index, spanning its sources"""
+        timeline = persistence.times_tracker.timeline
+        timeline.record_sources("loop", ["Loop00001_test.txt"], "2024-12-28T10:00:00")
+
+        persistence.save_regular_digest("weekly", sample_regular_digest, "W0001")
+
+        index = timeline.load()
+        assert index.span_of("weekly", "W0001") == ("2024-12-28T10:00:00", "2025-01-01T00:00:00")
+        assert timeline.query("2024-12-28", "2024-12-28")["weekly"] == ["W0001"]
+
+    def test_write_does_not_record_indexes(self, persistence, sample_regular_digest) -> None:
+        """write_regular_digest は書き込みだけ行い、索引は record_indexes で記録する"""
+        timeline = persistence.times_tracker.timeline
+        timeline.record_sources("loop", ["Loop00001_test.txt"], "2024-12-28T10:00:00")
+
+        path = persistence.write_regular_digest("weekly", sample_regular_digest, "W0001")
+
+        assert path == persistence.regular_digest_path("weekly", "W0001")
+        assert path.exists()
+        assert timeline.load().span_of("weekly", "W0001") is None
+
+        persistence.record_indexes("weekly", "W0001", sample_regular_digest)
+        assert timeline.load().span_of("weekly", "W0001") is not None
+
+    def test_record_indexes_bumps_corpus_generation(
+        self, persistence, sample_regular_digest
+    ) -> None:
+        """Recording the indexes invalidates cached query results"""
+        from infrastructure.query_cache import corpus_generation
+
+        essences_path = persistence.config.essences_path
+        before = corpus_generation(essences_path)
+
+        persistence.save_regular_digest("weekly", sample_regular_digest, "W0001")
+
+        assert corpus_generation(essences_path) == before + 1
+
+    def test_records_sentence_offsets_and_source_loop(
+        self, persistence, sample_regular_digest, temp_plugin_env: "TempPluginEnvironment"
+    ) -> None:
+        """Weekly finalize indexes the digest fields and the source Loop text"""
+        (temp_plugin_env.loops_path / "Loop00001_test.txt").write_text(
+            "Loop text. The test loop.", encoding="utf-8"
+        )
+
+        persistence.save_regular_digest("weekly", sample_regular_digest, "W0001")
+
+        snippets = persistence.sentences.snippets("W0001", "impression")
+        assert [(s["field"], s["text"]) for s in snippets] == [("impression", "Test impression")]
+        assert persistence.sentences.snippets("Loop00001", "loop")[0]["text"] == "Loop text. "
+
 
 # =============================================================================
 # update_grand_digest Tests
@@ -334,6 +386,15 @@ class TestProcessCascadeAndCleanup:
             "weekly", finalized_digest
         )
 
+    def test_passes_prefetched_next_level_files(self, persistence_with_mocks) -> None:
+        """先読みした次レベルのファイルをカスケードに渡す"""
+        persistence, mock_shadow, _ = persistence_with_mocks
+        files = [Path("W0001_test.txt")]
+
+        persistence.process_cascade_and_cleanup("weekly", 1, None, None, files)
+
+        mock_shadow.cascade_update_on_digest_finalize.assert_called_once_with("weekly", None, files)
+
     def test_calls_times_tracker_save_digest_number(self, persistence_with_mocks) -> None:
         """Calls times_tracker.save_digest_number with correct arguments"""
         persistence, _, mock_times = persistence_with_mocks
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+SentenceIndexRecorder Unit Tests
+================================
+
+Tests for application/finalize/sentence_recorder.py
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from application.finalize import SentenceIndexRecorder
+from infrastructure import save_json
+
+ABSTRACT = (
+    "週末は登山に行った。MCPサーバーの設計を見直した。"
+    'エラー時は "retry" を返す\\n方針にした。APIの境界も決めた。'
+)
+LOOP_TEXT = "Hello.\nWe debugged the auth error today. 認証エラーの原因はトークン期限だった。\n"
+
+
+def _digest(abstract: str = ABSTRACT) -> dict:
+    return {
+        "metadata": {"digest_level": "weekly"},
+        "overall_digest": {
+            "source_files": ["L00001_a.txt"],
+            "abstract": {"long": abstract, "short": "短い版"},
+            "impression": "良い設計だった。",
+        },
+        "individual_digests": [
+            {"source_file": "L00001_a.txt", "abstract": {"long": "設計の議論。", "short": ""}}
+        ],
+    }
+
+
+@pytest.fixture
+def env(tmp_path: Path) -> tuple:
+    digests_path = tmp_path / "Digests"
+    loops_path = tmp_path / "Loops"
+    loops_path.mkdir()
+    (loops_path / "L00001_a.txt").write_bytes(LOOP_TEXT.encode("utf-8"))
+    digest_file = digests_path / "1_Weekly" / "W0001_a.txt"
+    save_json(digest_file, _digest())
+    recorder = SentenceIndexRecorder(digests_path, loops_path)
+    recorder.record_digest("weekly", "W0001_a", _digest(), digest_file)
+    return recorder, digest_file
+
+
+class TestRecordDigest:
+    """record_digest() tests"""
+
+    @pytest.mark.unit
+    def test_offsets_point_into_json_literals(self, env) -> None:
+        recorder, digest_file = env
+        data = digest_file.read_bytes()
+
+        snippets = recorder.snippets("W0001", "MCP 設計", k=1)
+
+        assert snippets[0]["field"] == "abstract"
+        assert snippets[0]["text"] == "MCPサーバーの設計を見直した。"
+        chunk = data[snippets[0]["start"] : snippets[0]["end"]]
+        assert chunk.decode("utf-8") == "MCPサーバーの設計を見直した。"
+
+    @pytest.mark.unit
+    def test_escaped_characters_are_decoded(self, env) -> None:
+        recorder, _ = env
+        snippets = recorder.snippets("W0001", "retry", k=1)
+        assert snippets[0]["text"] == 'エラー時は "retry" を返す\\n方針にした。'
+
+    @pytest.mark.unit
+    def test_individual_rows_and_source_loop(self, env) -> None:
+        recorder, _ = env
+
+        assert recorder.snippets("W0001/L00001", "議論")[0]["text"] == "設計の議論。"
+        loop = recorder.snippets("L00001", "auth error")
+        assert loop[0]["text"] == "We debugged the auth error today. "
+        assert loop[0]["highlights"] == [[16, 20], [21, 26]]
+
+    @pytest.mark.unit
+    def test_packed_loop_is_indexed_and_read_from_archive(self, env) -> None:
+        """パック済みLoopもディスク上のLoopと同じように記録・抽出できる"""
+        from infrastructure.loop_archive import LoopArchive
+
+        recorder, _ = env
+        loops_path = recorder.loops_path
+        LoopArchive(loops_path).pack([loops_path / "L00001_a.txt"])
+
+        # パック前に記録したインデックスはそのまま使える
+        assert recorder.snippets("L00001", "auth error")[0]["text"] == (
+            "We debugged the auth error today. "
+        )
+
+        recorder.index_file("L00001").unlink()
+        assert recorder.record_loop("L00001_a.txt")
+        snippets = recorder.snippets("L00001", "トークン")
+        assert snippets[0]["text"] == "認証エラーの原因はトークン期限だった。\n"
+        assert not recorder.record_loop("L09999_missing.txt")
+
+    @pytest.mark.unit
+    def test_non_weekly_level_does_not_index_loops(self, tmp_path: Path) -> None:
+        digest_file = tmp_path / "Digests" / "2_Monthly" / "M001.txt"
+        save_json(digest_file, _digest())
+        (tmp_path / "Loops").mkdir()
+        (tmp_path / "Loops" / "L00001_a.txt").write_text("x.", encoding="utf-8")
+        recorder = SentenceIndexRecorder(tmp_path / "Digests", tmp_path / "Loops")
+
+        recorder.record_digest("monthly", "M001", _digest(), digest_file)
+
+        assert not recorder.index_file("L00001").exists()
+
+    @pytest.mark.unit
+    def test_failure_is_not_raised(self, tmp_path: Path) -> None:
+        recorder = SentenceIndexRecorder(tmp_path)
+        recorder.record_digest("weekly", "W0001", _digest(), tmp_path / "missing.txt")
+        assert not recorder.index_file("W0001").exists()
+
+
+class TestSnippets:
+    """snippets() tests"""
+
+    @pytest.mark.unit
+    def test_context_and_ranking(self, env) -> None:
+        recorder, _ = env
+
+        snippets = recorder.snippets("W0001", "設計 API", k=3, context=1)
+
+        scores = [s["score"] for s in snippets]
+        assert scores == sorted(scores, reverse=True)
+        assert snippets[0]["text"].startswith("週末は登山に行った。MCP")
+        assert {s["field"] for s in snippets} == {"abstract", "impression"}
+
+    @pytest.mark.unit
+    def test_only_indexed_ranges_are_read(self, env) -> None:
+        """一致しない範囲を書き換えても（サイズ・mtimeが同じなら）結果は変わらない"""
+        recorder, digest_file = env
+        stat = digest_file.stat()
+        data = bytearray(digest_file.read_bytes())
+        start = bytes(data).find("週末".encode("utf-8"))
+        data[start : start + 6] = b"XXXXXX"
+        digest_file.write_bytes(bytes(data))
+        os.utime(digest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        snippets = recorder.snippets("W0001", "MCP", k=1)
+
+        assert snippets[0]["text"] == "MCPサーバーの設計を見直した。"
+
+    @pytest.mark.unit
+    def test_changed_file_is_stale(self, env) -> None:
+        recorder, digest_file = env
+        save_json(digest_file, _digest("別の内容。"))
+        assert recorder.snippets("W0001", "MCP") is None
+
+    @pytest.mark.unit
+    def test_unknown_row_and_empty_query(self, env) -> None:
+        recorder, _ = env
+        assert recorder.snippets("W0999", "MCP") is None
+        assert recorder.snippets("W0001/L00999", "MCP") is None
+        assert recorder.snippets("W0001", "、。") == []
+        assert recorder.snippets("W0001", "登山の写真集") != []
+        assert recorder.snippets("W0001", "zzz") == []
+
+    @pytest.mark.unit
+    def test_index_is_compact_and_relative(self, env) -> None:
+        recorder, _ = env
+        index = json.loads(recorder.index_file("W0001").read_text(encoding="utf-8"))
+        assert index["path"] == os.path.join("1_Weekly", "W0001_a.txt")
+        assert "\n" not in recorder.index_file("W0001").read_text(encoding="utf-8")
+
+
+class TestRebuild:
+    """rebuild() tests"""
+
+    @pytest.mark.unit
+    def test_rebuild_indexes_existing_digests(self, env) -> None:
+        recorder, _ = env
+        for path in recorder.index_dir.iterdir():
+            path.unlink()
+
+        assert recorder.rebuild() == 1
+        assert recorder.snippets("W0001", "MCP") is not None
+        assert recorder.snippets("L00001", "auth") is not None
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+DigestVectorRecorder Unit Tests
+===============================
+
+Tests for application/finalize/vector_recorder.py
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from application.finalize import DigestVectorRecorder
+from application.finalize.vector_recorder import digest_documents
+from domain.tfidf import idf_weights
+
+
+def _digest(abstract: str, *individual: tuple) -> dict:
+    return {
+        "overall_digest": {"keywords": ["K"], "abstract": abstract, "impression": ""},
+        "individual_digests": [
+            {"source_file": src, "keywords": [], "abstract": {"long": text, "short": ""}}
+            for src, text in individual
+        ],
+    }
+
+
+MCP = "MCPサーバーの設計とAPI境界について議論した"
+HIKE = "週末の登山で山頂からの景色を楽しんだ"
+
+
+class TestDigestDocuments:
+    """digest_documents tests"""
+
+    @pytest.mark.unit
+    def test_row_ids(self) -> None:
+        docs = digest_documents("W0001_第1週", _digest(MCP, ("L00001_a.txt", HIKE)))
+        assert [row_id for row_id, _ in docs] == ["W0001", "W0001/L00001"]
+        assert docs[1][1] == HIKE
+
+
+class TestDigestVectorRecorder:
+    """DigestVectorRecorder tests"""
+
+    @pytest.mark.unit
+    def test_related_finds_similar_digest(self, tmp_path: Path) -> None:
+        recorder = DigestVectorRecorder(tmp_path)
+        recorder.record_digest("W0001_a", _digest(MCP, ("L00001.txt", HIKE)))
+        recorder.record_digest("W0002_b", _digest(MCP + "。次回はテスト", ("L00002.txt", MCP)))
+
+        related = recorder.related("W0001_a", k=2)
+
+        assert related is not None
+        assert related[0][0] in {"W0002", "W0002/L00002"}
+        assert recorder.related("W0999") is None
+
+    @pytest.mark.unit
+    def test_older_rows_use_current_idf(self, tmp_path: Path) -> None:
+        """逐次追記しても、まとめて追記した場合と同じスコアになる"""
+        digests = [
+            ("W0001_a", _digest(MCP)),
+            ("W0002_b", _digest(MCP + "。次回はテスト")),
+            ("W0003_c", _digest(HIKE + "。MCPの話も少し")),
+        ]
+        incremental = DigestVectorRecorder(tmp_path / "incremental")
+        for name, digest in digests:
+            incremental.record_digest(name, digest)
+        batch = DigestVectorRecorder(tmp_path / "batch")
+        batch.load().append(
+            batch._vectorize([doc for name, d in digests for doc in digest_documents(name, d)])
+        )
+
+        # 逐次追記側は保存したノルム、まとめて追記した側は検索時に計算したノルムを使う
+        store = incremental.load()
+        assert store._cached_norms(idf_weights(store.df, store.n_docs)) is not None
+        assert incremental.related("W0001_a") == batch.related("W0001_a")
+        assert incremental.search("MCP 設計") == batch.search("MCP 設計")
+
+    @pytest.mark.unit
+    def test_rerecord_replaces_and_compact(self, tmp_path: Path) -> None:
+        recorder = DigestVectorRecorder(tmp_path)
+        recorder.record_digest("W0001", _digest(MCP))
+        recorder.record_digest("W0001", _digest(HIKE))
+
+        assert len(recorder.load()) == 1
+        assert recorder.compact() == 1
+        assert recorder.load().row_ids == ["W0001"]
+
+    @pytest.mark.unit
+    def test_rebuild_scans_level_directories(self, tmp_path: Path) -> None:
+        weekly = tmp_path / "1_Weekly"
+        weekly.mkdir()
+        (weekly / "W0001_a.txt").write_text(json.dumps(_digest(MCP)), encoding="utf-8")
+        (weekly / "W0002_b.txt").write_text(json.dumps(_digest(HIKE)), encoding="utf-8")
+
+        store = DigestVectorRecorder(tmp_path).rebuild()
+
+        assert store.row_ids == ["W0001", "W0002"]
+        assert store.n_docs == 2
+
+    @pytest.mark.unit
+    def test_rebuild_reads_each_digest_once(self, tmp_path: Path, monkeypatch) -> None:
+        from application.finalize import digest_corpus
+
+        weekly = tmp_path / "1_Weekly"
+        weekly.mkdir()
+        (weekly / "W0001_a.txt").write_text(
+            json.dumps(_digest(MCP, ("L00001_x.txt", HIKE))), encoding="utf-8"
+        )
+        reads = []
+        original = digest_corpus.try_load_json
+
+        def counting_load(path, *args, **kwargs):
+            reads.append(Path(path).name)
+            return original(path, *args, **kwargs)
+
+        monkeypatch.setattr(digest_corpus, "try_load_json", counting_load)
+        monkeypatch.setattr(digest_corpus, "_load_digest", counting_load)
+
+        store = DigestVectorRecorder(tmp_path).rebuild()
+
+        assert store.row_ids == ["W0001", "W0001/L00001"]
+        assert reads == ["W0001_a.txt"]
@@ -219,6 +219,39 @@ class TestExtractNumbers:
         assert len(errors) == 3  # 123, invalid.txt, None
 
 
+# =============================================================================
+# extract_number_array メソッドのテスト
+# =============================================================================
+
+
+class TestExtractNumberArray:
+    """extract_number_array メソッドのテスト"""
+
+    @pytest.fixture
+    def validator(self):
+        """テスト用FileNumberValidator"""
+        return FileNumberValidator()
+
+    def test_returns_array(self, validator) -> None:
+        """番号を入力順の array で返す"""
+        numbers, errors = validator.extract_number_array(["L00187.txt", "L00186.txt"])
+
+        assert numbers.tolist() == [187, 186]
+        assert errors == []
+
+    def test_errors_keep_input_order(self, validator) -> None:
+        """型エラーと形式エラーを入力順に報告する"""
+        numbers, errors = validator.extract_number_array(
+            ["bad.txt", "L00001.txt", 42, "also_bad.txt"]
+        )
+
+        assert numbers.tolist() == [1]
+        assert len(errors) == 3
+        assert "bad.txt" in errors[0]
+        assert "index 2" in errors[1]
+        assert "also_bad.txt" in errors[2]
+
+
 # =============================================================================
 # check_consecutive メソッドのテスト
 # =============================================================================
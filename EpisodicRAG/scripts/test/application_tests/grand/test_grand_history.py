@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+GrandHistoryRecorder テスト
+===========================
+
+GrandDigest.history.jsonl への追記（キーフレーム/差分）と、
+指定時刻の GrandDigest の復元を検証。
+"""
+
+import copy
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.grand import GrandDigestManager, GrandHistoryRecorder
+from domain.exceptions import CorruptedDataError
+from domain.file_constants import GRAND_HISTORY_FILENAME
+
+if TYPE_CHECKING:
+    from test_helpers import TempPluginEnvironment
+
+LEVELS = ["weekly", "monthly"]
+
+
+def _grand(timestamp: str, major_digests: dict) -> dict:
+    return {
+        "metadata": {"last_updated": timestamp, "version": "1.0"},
+        "major_digests": copy.deepcopy(major_digests),
+    }
+
+
+def _record_versions(recorder: GrandHistoryRecorder, count: int, day: int = 1) -> list:
+    """weekly を count 回更新して記録し、各版の (時刻, major_digests) を返す"""
+    state = {level: {"overall_digest": None} for level in LEVELS}
+    versions = []
+    for i in range(count):
+        previous = copy.deepcopy(state)
+        state["weekly"] = {"overall_digest": {"name": f"W{i:04d}", "keywords": [str(i)]}}
+        timestamp = f"2025-06-{day + i // 24:02d}T{i % 24:02d}:00:00"
+        recorder.record(previous, _grand(timestamp, state))
+        versions.append((timestamp, copy.deepcopy(state)))
+    return versions
+
+
+def _kinds(path: Path) -> list:
+    return [json.loads(line)["k"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def recorder(tmp_path: Path) -> GrandHistoryRecorder:
+    return GrandHistoryRecorder(tmp_path / GRAND_HISTORY_FILENAME, keyframe_interval=4)
+
+
+class TestGrandHistoryRecord:
+    """record() のテスト"""
+
+    @pytest.mark.unit
+    def test_keyframe_every_interval(self, recorder: GrandHistoryRecorder) -> None:
+        _record_versions(recorder, 9)
+
+        assert _kinds(recorder.history_file) == [
+            "key", "delta", "delta", "delta", "key", "delta", "delta", "delta", "key"
+        ]  # fmt: skip
+
+    @pytest.mark.unit
+    def test_delta_holds_only_changed_fields(self, recorder: GrandHistoryRecorder) -> None:
+        _record_versions(recorder, 2)
+
+        delta = json.loads(recorder.history_file.read_text(encoding="utf-8").splitlines()[1])
+        assert delta["levels"] == {"weekly": {"set": {"name": "W0001", "keywords": ["1"]}}}
+
+    @pytest.mark.unit
+    def test_external_edit_forces_keyframe(self, recorder: GrandHistoryRecorder) -> None:
+        """直前の版が最後の記録と一致しなければキーフレームを書く"""
+        _record_versions(recorder, 2)
+        edited = {level: {"overall_digest": {"name": "edited"}} for level in LEVELS}
+        current = copy.deepcopy(edited)
+        current["monthly"] = {"overall_digest": {"name": "M001"}}
+
+        recorder.record(edited, _grand("2025-06-02T00:00:00", current))
+
+        assert _kinds(recorder.history_file) == ["key", "delta", "key"]
+        assert recorder.at("2025-06-02")["major_digests"] == current
+
+    @pytest.mark.unit
+    def test_write_failure_is_not_raised(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        recorder = GrandHistoryRecorder(blocker / GRAND_HISTORY_FILENAME)
+
+        _record_versions(recorder, 1)  # 例外にならない
+
+        assert not recorder.history_file.exists()
+
+
+class TestGrandHistoryAt:
+    """at() / versions() のテスト"""
+
+    @pytest.mark.unit
+    def test_every_version_is_reconstructed(self, recorder: GrandHistoryRecorder) -> None:
+        versions = _record_versions(recorder, 11)
+
+        for timestamp, major_digests in versions:
+            restored = recorder.at(timestamp)
+            assert restored["major_digests"] == major_digests
+            assert restored["metadata"]["last_updated"] == timestamp
+
+    @pytest.mark.unit
+    def test_date_only_is_end_of_day(self, recorder: GrandHistoryRecorder) -> None:
+        versions = _record_versions(recorder, 30)  # 2025-06-01 に24件、06-02 に6件
+
+        assert recorder.at("2025-06-01")["major_digests"] == versions[23][1]
+        assert recorder.at("2025-06-01T05:30:00")["major_digests"] == versions[5][1]
+
+    @pytest.mark.unit
+    def test_before_first_record_is_none(self, recorder: GrandHistoryRecorder) -> None:
+        _record_versions(recorder, 3)
+
+        assert recorder.at("2025-05-31") is None
+        missing = GrandHistoryRecorder(recorder.history_file.with_name("missing.jsonl"))
+        assert missing.at("2025-06-01") is None
+
+    @pytest.mark.unit
+    def test_corrupted_line_raises(self, recorder: GrandHistoryRecorder) -> None:
+        _record_versions(recorder, 2)
+        lines = recorder.history_file.read_text(encoding="utf-8").splitlines()
+        lines[1] = lines[1][:-5]
+        recorder.history_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with pytest.raises(CorruptedDataError):
+            recorder.at("2025-06-01")
+
+    @pytest.mark.unit
+    def test_versions_lists_changed_levels(self, recorder: GrandHistoryRecorder) -> None:
+        _record_versions(recorder, 2)
+
+        assert recorder.versions() == [
+            ("2025-06-01T00:00:00", "key", LEVELS),
+            ("2025-06-01T01:00:00", "delta", ["weekly"]),
+        ]
+
+    @pytest.mark.slow
+    @pytest.mark.unit
+    def test_reconstruction_is_fast_for_long_history(self, tmp_path: Path) -> None:
+        """長い履歴でも最寄りのキーフレーム以降だけを適用する"""
+        recorder = GrandHistoryRecorder(tmp_path / GRAND_HISTORY_FILENAME)
+        versions = _record_versions(recorder, 2000)
+        timestamp, expected = versions[1500]
+
+        start = time.perf_counter()
+        restored = recorder.at(timestamp)
+        elapsed = time.perf_counter() - start
+
+        assert restored["major_digests"] == expected
+        assert elapsed < 0.5
+
+
+class TestGrandDigestManagerHistory:
+    """GrandDigestManager.update_digest() からの記録"""
+
+    @pytest.mark.integration
+    def test_update_digest_records_history(self, temp_plugin_env: "TempPluginEnvironment") -> None:
+        config = MagicMock()
+        config.essences_path = temp_plugin_env.essences_path
+        manager = GrandDigestManager(config)
+
+        manager.update_digest("weekly", "W0001", {"name": "W0001", "keywords": ["a"]})
+        first = manager.load_or_create()
+        manager.update_digest("weekly", "W0002", {"name": "W0002", "keywords": ["a"]})
+        manager.update_digest("weekly", "W0002", {"name": "W0002", "keywords": ["a"]})
+        second = manager.load_or_create()
+
+        assert [kind for _, kind, _ in manager.history.versions()] == ["key", "delta"]
+        assert manager.history.at(first["metadata"]["last_updated"]) == first
+        assert manager.history.at(second["metadata"]["last_updated"]) == second
@@ -215,6 +215,19 @@ class TestFileDetectorFindNewFiles:
         result = detector.find_new_files("weekly")
         assert result == []
 
+    @pytest.mark.integration
+    def test_includes_archived_loops(
+        self, detector, temp_plugin_env: "TempPluginEnvironment"
+    ) -> None:
+        """パック済みLoopもディスク上のLoopと同様に検出される"""
+        from infrastructure.loop_archive import LoopArchive
+
+        files = [create_test_loop_file(temp_plugin_env.loops_path, i) for i in range(1, 4)]
+        LoopArchive(temp_plugin_env.loops_path).pack(files[:2])
+
+        result = detector.find_new_files("weekly")
+        assert [f.name for f in result] == [f.name for f in files]
+
     @pytest.mark.integration
     def test_files_are_sorted(self, detector, temp_plugin_env: "TempPluginEnvironment") -> None:
         """返されるファイルはソートされている"""
@@ -258,6 +271,23 @@ class TestFileDetectorFindNewFiles:
         result = detector.find_new_files("monthly")
         assert len(result) == 3
 
+    @pytest.mark.integration
+    def test_includes_pending_file_not_yet_written(
+        self, detector, temp_plugin_env: "TempPluginEnvironment"
+    ) -> None:
+        """書き込み中（pending）のファイルも検出結果に含める"""
+        weekly_dir = temp_plugin_env.digests_path / "1_Weekly"
+        (weekly_dir / "W0001_test.txt").write_text("{}", encoding="utf-8")
+        pending = [
+            weekly_dir / "W0002_test.txt",
+            weekly_dir / "W0001_test.txt",  # 既に存在するものは重複させない
+            temp_plugin_env.loops_path / "L00009_other.txt",  # 別ディレクトリは無視
+        ]
+
+        result = detector.find_new_files("monthly", pending=pending)
+
+        assert [f.name for f in result] == ["W0001_test.txt", "W0002_test.txt"]
+
 
 # =============================================================================
 # FileDetector 初期化テスト
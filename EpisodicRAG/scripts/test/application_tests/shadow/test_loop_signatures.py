@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+LoopSignatureRecorder Unit Tests
+================================
+
+Tests for application/shadow/loop_signatures.py and its FileDetector hook
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from application.shadow.loop_signatures import LoopSignatureRecorder
+
+if TYPE_CHECKING:
+    from application.shadow import FileDetector
+
+TEXT = "".join(f"{i}回目の打ち合わせではMCPサーバーの設計について議論した。" for i in range(30))
+OTHER = "".join(f"{i}回目の登山は天気が良く、山頂からの景色を楽しんだ。" for i in range(30))
+
+
+def _loop(directory: Path, name: str, text: str) -> Path:
+    path = directory / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestLoopSignatureRecorder:
+    """LoopSignatureRecorder tests"""
+
+    @pytest.mark.unit
+    def test_record_loops_persists_and_reports(self, tmp_path: Path) -> None:
+        recorder = LoopSignatureRecorder(tmp_path)
+        first = _loop(tmp_path, "L00001_a.txt", TEXT)
+        other = _loop(tmp_path, "L00002_b.txt", OTHER)
+        copy = _loop(tmp_path, "L00003_c.txt", TEXT)
+
+        assert recorder.record_loops([first, other]) == {}
+        found = recorder.record_loops([copy])
+
+        assert [m["duplicate_of"] for m in found["L00003"]] == ["L00001"]
+        index = LoopSignatureRecorder(tmp_path).load()
+        assert len(index) == 3
+        assert list(index.duplicates()) == ["L00003"]
+
+    @pytest.mark.unit
+    def test_empty_and_unreadable_loops_skipped(self, tmp_path: Path) -> None:
+        recorder = LoopSignatureRecorder(tmp_path)
+        empty = _loop(tmp_path, "L00001_a.txt", "  \n")
+
+        assert recorder.record_loops([empty, tmp_path / "L00002_missing.txt"]) == {}
+        assert not recorder.index_file.exists()
+
+    @pytest.mark.unit
+    def test_check_loops_caches_sketches(self, tmp_path: Path) -> None:
+        """計算したスケッチは保存され、次回は本文を読まずに記録済みの結果を返す"""
+        recorder = LoopSignatureRecorder(tmp_path)
+        recorder.record_loops([_loop(tmp_path, "L00001_a.txt", TEXT)])
+        pending = [_loop(tmp_path, "L00002_b.txt", TEXT), _loop(tmp_path, "L00003_c.txt", TEXT)]
+
+        found = recorder.check_loops(pending)
+
+        assert [m["duplicate_of"] for m in found["L00002"]] == ["L00001"]
+        assert {m["duplicate_of"] for m in found["L00003"]} == {"L00001", "L00002"}
+        assert len(recorder.load()) == 3
+
+        for path in pending:
+            path.write_text("", encoding="utf-8")
+        assert recorder.check_loops(pending) == found
+
+
+class TestFileDetectorRecordsSignatures:
+    """find_new_files registers Loop sketches only when enabled"""
+
+    @pytest.mark.integration
+    def test_weekly_detection_records_loops(self, file_detector: "FileDetector") -> None:
+        file_detector.record_signatures = True
+        loops_path = file_detector.config.loops_path
+        _loop(loops_path, "L00001_a.txt", TEXT)
+        _loop(loops_path, "L00002_b.txt", TEXT)
+
+        file_detector.find_new_files("weekly")
+
+        index = file_detector.signatures.load()
+        assert "L00001" in index and "L00002" in index
+        assert list(index.duplicates()) == ["L00002"]
+
+    @pytest.mark.integration
+    def test_detection_does_not_read_loops_by_default(self, file_detector: "FileDetector") -> None:
+        _loop(file_detector.config.loops_path, "L00001_a.txt", TEXT)
+
+        assert [f.name for f in file_detector.find_new_files("weekly")] == ["L00001_a.txt"]
+
+        assert not file_detector.signatures.index_file.exists()
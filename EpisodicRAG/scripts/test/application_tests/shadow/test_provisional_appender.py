@@ -256,6 +256,61 @@ class TestDuplicateSourceFileSkipped:
         assert len(data["individual_digests"]) == 1  # 重複なので追加されない
 
 
+class TestConsecutiveAppends:
+    """連続追加時の索引再利用テスト"""
+
+    @staticmethod
+    def _digest(sample: "Dict[str, Any]", name: str) -> "Dict[str, Any]":
+        digest = json.loads(json.dumps(sample))
+        digest["overall_digest"]["name"] = name
+        return digest
+
+    @pytest.mark.integration
+    def test_reuses_index_until_file_changes(
+        self,
+        provisional_appender,
+        temp_plugin_env: "TempPluginEnvironment",
+        sample_finalized_digest: "Dict[str, Any]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """保存後に変更がなければ再読み込みせず、外部で変更されたら読み直す"""
+        loads: "List[Path]" = []
+        original = provisional_appender._load_or_create_provisional
+
+        def counting_load(path: Path, level: str) -> "Dict[str, Any]":
+            loads.append(path)
+            return original(path, level)
+
+        monkeypatch.setattr(provisional_appender, "_load_or_create_provisional", counting_load)
+
+        provisional_appender.append_to_next_provisional(
+            "weekly", self._digest(sample_finalized_digest, "W0053_a")
+        )
+        provisional_appender.append_to_next_provisional(
+            "weekly", self._digest(sample_finalized_digest, "W0054_b")
+        )
+        assert len(loads) == 1
+
+        provisional_file = loads[0]
+        data = json.loads(provisional_file.read_text(encoding="utf-8"))
+        data["individual_digests"].append({"source_file": "W0099_external.txt"})
+        provisional_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        provisional_appender.append_to_next_provisional(
+            "weekly", self._digest(sample_finalized_digest, "W0055_c")
+        )
+
+        # 外部で追加されたエントリを読み直してから追加する（上書きで失わない）
+        assert len(loads) == 2
+        saved = json.loads(provisional_file.read_text(encoding="utf-8"))
+        assert [e["source_file"] for e in saved["individual_digests"]] == [
+            "W0053_a.txt",
+            "W0054_b.txt",
+            "W0099_external.txt",
+            "W0055_c.txt",
+        ]
+
+
 class TestProvisionalDirectoryCreation:
     """Provisionalディレクトリ作成テスト"""
 
@@ -139,7 +139,7 @@ class TestShadowIOTimestampProperties:
 
     @pytest.mark.property
     def test_save_updates_timestamp(self) -> None:
-        """saveでlast_updatedが更新される"""
+        """内容を変えてsaveするとlast_updatedが更新される"""
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
             template = ShadowTemplate(LEVEL_NAMES)
@@ -153,8 +153,9 @@ class TestShadowIOTimestampProperties:
             # 確実に時刻差を出す
             time.sleep(0.02)
 
-            # 再保存
-            io.save(data1)
+            # 内容を変えて再保存
+            data1["latest_digests"]["weekly"]["overall_digest"]["source_files"] = ["L00001.txt"]
+            assert io.save(data1) is True
 
             # 再読み込み
             data2 = io.load_or_create()
@@ -163,25 +164,26 @@ class TestShadowIOTimestampProperties:
             assert new_timestamp != old_timestamp
 
     @pytest.mark.property
-    def test_multiple_saves_increment_timestamp(self) -> None:
-        """複数回のsaveでタイムスタンプが順次更新される"""
+    def test_unchanged_save_does_not_write(self) -> None:
+        """内容が変わらないsaveは書き込まず、タイムスタンプも据え置き"""
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
             template = ShadowTemplate(LEVEL_NAMES)
             shadow_file = tmp_path / "ShadowGrandDigest.txt"
             io = ShadowIO(shadow_file, template.get_template)
 
-            timestamps = []
             data = io.load_or_create()
+            io.save(data)
+            before = shadow_file.read_bytes()
+            mtime_ns = shadow_file.stat().st_mtime_ns
 
             for _ in range(3):
                 time.sleep(0.02)
-                io.save(data)
                 data = io.load_or_create()
-                timestamps.append(data["metadata"]["last_updated"])
+                assert io.save(data) is False
 
-            # タイムスタンプは全て異なる
-            assert len(set(timestamps)) == 3
+            assert shadow_file.read_bytes() == before
+            assert shadow_file.stat().st_mtime_ns == mtime_ns
 
 
 # =============================================================================
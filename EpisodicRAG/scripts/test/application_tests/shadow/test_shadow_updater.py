@@ -268,6 +268,31 @@ class TestUpdateShadowForNewLoops:
         overall = shadow_data["latest_digests"]["weekly"]["overall_digest"]
         assert len(overall["source_files"]) == 2
 
+    @pytest.mark.integration
+    def test_records_loop_manifest(self, updater, temp_plugin_env: "TempPluginEnvironment") -> None:
+        """処理したLoopの内容ハッシュを loop_manifest.json に記録"""
+        loop_file = create_test_loop_file(temp_plugin_env.loops_path, 1)
+
+        updater.update_shadow_for_new_loops()
+
+        entry = updater.file_detector.loop_manifest.load().get(loop_file.name)
+        assert entry is not None
+        assert entry["digested_hash"] == entry["hash"]
+
+    @pytest.mark.integration
+    def test_bumps_corpus_generation_only_when_loops_added(
+        self, updater, temp_plugin_env: "TempPluginEnvironment"
+    ) -> None:
+        """新規Loopを追加したときだけコーパスの世代が進む"""
+        from infrastructure.query_cache import corpus_generation
+
+        updater.update_shadow_for_new_loops()
+        assert corpus_generation(temp_plugin_env.essences_path) == 0
+
+        create_test_loop_file(temp_plugin_env.loops_path, 1)
+        updater.update_shadow_for_new_loops()
+        assert corpus_generation(temp_plugin_env.essences_path) == 1
+
     @pytest.mark.integration
     def test_updates_loop_last_processed(
         self,
@@ -62,6 +62,13 @@ class TestShadowValidatorValidateShadowContent:
         # エラーなく完了すればOK
         validator.validate_shadow_content("weekly", source_files)
 
+    @pytest.mark.unit
+    def test_returns_extracted_numbers(self, validator) -> None:
+        """抽出した番号を source_files の順で返す（再パース不要）"""
+        source_files = ["L00002_test.txt", "L00001_test.txt", "L00003_test.txt"]
+        numbers = validator.validate_shadow_content("weekly", source_files)
+        assert numbers.tolist() == [2, 1, 3]
+
     @pytest.mark.unit
     def test_raises_on_non_list(self, validator) -> None:
         """source_filesがlistでない場合はValidationError"""
@@ -9,7 +9,7 @@ pytestスタイルに移行済み
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -67,6 +67,28 @@ class TestDigestTimesTracker:
         # last_processed is now stored as int (extracted number only)
         assert data["weekly"]["last_processed"] == 2
 
+    @pytest.mark.integration
+    def test_save_reuses_extracted_numbers(self, tracker) -> None:
+        """抽出済みの番号を渡すとファイル名を再パースしない"""
+        from array import array
+
+        input_files = ["L00001_Test.txt", "L00007_Test.txt"]
+        with patch("application.tracking.digest_times.extract_number_array") as extract:
+            tracker.save("loop", input_files, numbers=array("q", [1, 7]))
+
+        extract.assert_not_called()
+        assert tracker.load_or_create()["loop"]["last_processed"] == 7
+
+    @pytest.mark.integration
+    def test_save_records_loops_in_timeline(self, tracker) -> None:
+        """save()はlast_digest_timesと同じ時刻でタイムラインにも記録"""
+        tracker.save("loop", ["L00001_Test.txt", "L00002_Test.txt"])
+
+        timestamp = tracker.load_or_create()["loop"]["timestamp"]
+        result = tracker.timeline.query(timestamp, timestamp)
+        assert result["loop"] == ["L00001", "L00002"]
+        assert tracker.timeline.index_file.parent == tracker.last_digest_file.parent
+
     @pytest.mark.unit
     def test_extract_file_numbers(self, tracker) -> None:
         """ファイル番号抽出"""
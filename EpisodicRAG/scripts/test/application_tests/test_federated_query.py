@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+application/federation のテスト
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+from application.config import DigestConfig
+from application.federation import FederatedQuery, StoreSpec, load_store_specs
+from application.finalize import DigestVectorRecorder
+from application.tracking import TimelineRecorder
+from domain.exceptions import ConfigError
+
+
+def _digest(text: str) -> dict:
+    return {"overall_digest": {"keywords": text.split(), "abstract": text}}
+
+
+def _store(root: Path, name: str, digests: List[Tuple[str, str]], timeout: float = 2.0):
+    digests_path = root / name / "Digests"
+    digests_path.mkdir(parents=True)
+    recorder = DigestVectorRecorder(digests_path)
+    for digest_name, text in digests:
+        recorder.record_digest(digest_name, _digest(text))
+    return StoreSpec(name, digests_path, root / name, timeout)
+
+
+class TestFederatedQuery:
+    """FederatedQuery tests"""
+
+    @pytest.mark.integration
+    def test_search_merges_stores_with_shared_idf(self, tmp_path: Path) -> None:
+        local = _store(tmp_path, "local", [("W0001_a", "MCP サーバー 設計"), ("W0002_b", "料理")])
+        proj = _store(tmp_path, "projA", [("W0007_c", "MCP クライアント 実装")])
+
+        result = FederatedQuery([local, proj]).search("MCP 設計", k=5)
+
+        assert result.stores == {"local": "ok", "projA": "ok"}
+        assert [(hit["store"], hit["id"]) for hit in result.results] == [
+            ("local", "W0001"),
+            ("projA", "W0007"),
+        ]
+        assert result.results[0]["score"] == 1.0
+        assert 0 < result.results[1]["score"] < 1.0
+
+    @pytest.mark.integration
+    def test_slow_store_is_dropped_at_its_timeout(self, tmp_path: Path) -> None:
+        local = _store(tmp_path, "local", [("W0001_a", "MCP 設計")])
+        slow = _store(tmp_path, "slow", [("W0009_z", "MCP 設計")], timeout=0.1)
+        release = threading.Event()
+        original = DigestVectorRecorder.term_stats
+
+        def stalled_term_stats(recorder: DigestVectorRecorder):
+            if recorder.digests_path == slow.digests_path:
+                release.wait(5)
+            return original(recorder)
+
+        with patch.object(DigestVectorRecorder, "term_stats", stalled_term_stats):
+            result = FederatedQuery([local, slow]).search("MCP", k=5)
+        release.set()
+
+        assert result.stores == {"local": "ok", "slow": "timeout"}
+        assert [hit["store"] for hit in result.results] == ["local"]
+        assert result.elapsed < 1.0
+
+    @pytest.mark.integration
+    def test_hanging_store_does_not_use_up_healthy_budget(self, tmp_path: Path) -> None:
+        """1段目で止まるストアがあっても、応答したストアは自分の持ち時間で検索を続ける"""
+        local = _store(tmp_path, "local", [("W0001_a", "MCP 設計")], timeout=0.5)
+        slow = _store(tmp_path, "slow", [("W0009_z", "MCP 設計")], timeout=0.5)
+        release = threading.Event()
+        original = DigestVectorRecorder.term_stats
+
+        def hanging_term_stats(recorder: DigestVectorRecorder):
+            if recorder.digests_path == slow.digests_path:
+                release.wait(5)
+            return original(recorder)
+
+        with patch.object(DigestVectorRecorder, "term_stats", hanging_term_stats):
+            result = FederatedQuery([local, slow]).search("MCP", k=5)
+        release.set()
+
+        assert result.stores == {"local": "ok", "slow": "timeout"}
+        assert [(hit["store"], hit["id"]) for hit in result.results] == [("local", "W0001")]
+        assert result.elapsed < 1.5
+
+    @pytest.mark.integration
+    def test_timeline_per_store(self, tmp_path: Path) -> None:
+        local = _store(tmp_path, "local", [])
+        TimelineRecorder(local.index_dir).record_sources(
+            "loop", ["L00001_a.txt"], "2025-03-02T10:00:00"
+        )
+        no_index = StoreSpec("archive", tmp_path / "archive", None)
+
+        result = FederatedQuery([local, no_index]).timeline("2025-03-01", "2025-03-31")
+
+        assert result.results == {"local": {"loop": ["L00001"]}}
+        assert result.stores == {"local": "ok", "archive": "no index_dir"}
+
+
+class TestLoadStoreSpecs:
+    """load_store_specs tests"""
+
+    @staticmethod
+    def _configure(env: TempPluginEnvironment, federation: dict) -> None:
+        config_file = env.persistent_config_dir / "config.json"
+        config = json.loads(config_file.read_text(encoding="utf-8"))
+        config["federation"] = federation
+        config_file.write_text(json.dumps(config), encoding="utf-8")
+
+    @pytest.mark.integration
+    def test_local_and_configured_stores(self, temp_plugin_env: TempPluginEnvironment) -> None:
+        other = temp_plugin_env.plugin_root / "other" / "Digests"
+        self._configure(
+            temp_plugin_env,
+            {"timeout_seconds": 3, "stores": [{"name": "other", "digests_dir": str(other)}]},
+        )
+
+        specs = load_store_specs(DigestConfig())
+
+        assert [(spec.name, spec.timeout) for spec in specs] == [("local", 3.0), ("other", 3.0)]
+        assert specs[1].digests_path == other.resolve()
+        assert specs[1].index_dir is None
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "store",
+        [
+            {"name": "rel", "digests_dir": "relative/Digests"},
+            {"name": "outside", "digests_dir": "/definitely/not/trusted/Digests"},
+            {"name": "local", "digests_dir": "{root}/Digests"},
+            {"name": "slow", "digests_dir": "{root}/Digests", "timeout_seconds": 0},
+        ],
+    )
+    def test_invalid_store(self, temp_plugin_env: TempPluginEnvironment, store: dict) -> None:
+        root = temp_plugin_env.plugin_root
+        store = {k: v.format(root=root) if isinstance(v, str) else v for k, v in store.items()}
+        self._configure(temp_plugin_env, {"stores": [store]})
+
+        with pytest.raises(ConfigError):
+            load_store_specs(DigestConfig())
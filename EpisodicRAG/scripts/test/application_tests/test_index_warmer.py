@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+application/watch/index_warmer.py と application/tracking/pending_loops.py のテスト
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from test_helpers import TempPluginEnvironment, create_test_loop_file
+
+from application.config import DigestConfig
+from application.tracking import DigestTimesTracker, LoopManifestRecorder, PendingLoopsRecorder
+from application.watch import IndexWarmer
+
+
+def _age(path: Path, seconds: float = 10.0) -> None:
+    """mtime を過去にずらす（RACY_WINDOW_NS より前にする）"""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _regular_digest(*source_files: str) -> dict:
+    return {
+        "overall_digest": {
+            "timestamp": "2025-03-15T10:00:00",
+            "keywords": ["MCP"],
+            "abstract": "設計の記録",
+            "source_files": list(source_files),
+        },
+        "individual_digests": [],
+    }
+
+
+@pytest.fixture
+def warmer(temp_plugin_env: TempPluginEnvironment) -> IndexWarmer:
+    return IndexWarmer(DigestConfig())
+
+
+class TestPendingLoops:
+    """PendingLoopsRecorder tests"""
+
+    @pytest.mark.unit
+    def test_fresh_only_while_directory_and_progress_unchanged(self, tmp_path: Path) -> None:
+        loops_path = tmp_path / "Loops"
+        loops_path.mkdir()
+        _age(loops_path)
+        recorder = PendingLoopsRecorder(tmp_path)
+        recorder.save(loops_path, 3, ["L00004_a.txt"], loops_path.stat().st_mtime_ns)
+
+        assert recorder.fresh(loops_path, 3) == ["L00004_a.txt"]
+        assert recorder.fresh(loops_path, 4) is None
+
+        (loops_path / "L00005_b.txt").write_text("b", encoding="utf-8")
+        assert recorder.fresh(loops_path, 3) is None
+
+    @pytest.mark.unit
+    def test_recent_directory_mtime_is_not_trusted(self, tmp_path: Path) -> None:
+        recorder = PendingLoopsRecorder(tmp_path)
+        recorder.save(tmp_path, None, [], tmp_path.stat().st_mtime_ns)
+
+        assert recorder.fresh(tmp_path, None) is None
+
+
+class TestIndexWarmer:
+    """IndexWarmer tests"""
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_new_loop_is_rewarmed_after_racy_window(self, warmer: IndexWarmer) -> None:
+        """到着直後の検出結果は使われず、待ち時間の後に検出し直すと使われる"""
+        loops_path = warmer.config.loops_path
+        loop_file = create_test_loop_file(loops_path, 1)
+        index_dir = DigestTimesTracker(warmer.config).last_digest_file.parent
+        pending = PendingLoopsRecorder(index_dir)
+
+        warmer.handle({loop_file})
+
+        assert pending.fresh(loops_path, None) is None
+        assert warmer.rewarm_if_due() is None
+        delay = warmer.rewarm_delay()
+        assert delay is not None and 0 < delay <= 2.5
+        time.sleep(delay)
+
+        assert warmer.rewarm_if_due() == [loop_file.name]
+        assert warmer.rewarm_delay() is None
+        assert pending.fresh(loops_path, None) == [loop_file.name]
+
+    @pytest.mark.integration
+    def test_warm_loops_prepares_detection_and_manifest(self, warmer: IndexWarmer) -> None:
+        loops_path = warmer.config.loops_path
+        loop_file = create_test_loop_file(loops_path, 1)
+        _age(loops_path)
+
+        result = warmer.handle({loop_file})
+
+        assert result == {"new_loops": [loop_file.name], "digests": []}
+        index_dir = DigestTimesTracker(warmer.config).last_digest_file.parent
+        assert PendingLoopsRecorder(index_dir).fresh(loops_path, None) == [loop_file.name]
+        assert LoopManifestRecorder(index_dir).load().get(loop_file.name)["hash"]
+
+    @pytest.mark.integration
+    def test_warm_digests_updates_indexes_once(self, warmer: IndexWarmer) -> None:
+        digest = warmer.config.get_level_dir("weekly") / "W0001_第1週.txt"
+        digest.write_text(json.dumps(_regular_digest("L00001_a.txt")), encoding="utf-8")
+        ignored = warmer.config.digests_path / "notes.txt"
+
+        assert warmer.handle({digest, ignored})["digests"] == [digest.name]
+        assert warmer.hierarchy.load().parents_of("L00001") == ["W0001"]
+        assert warmer.keyword_rollup.load().trend("MCP") == {"2025-03": 1}
+        rows = len(warmer.vectors.load())
+
+        # 再度の変化通知でもベクトル行は置き換えない
+        assert warmer.warm_all()["digests"] == [digest.name]
+        assert len(warmer.vectors.load()) == rows
+
+    @pytest.mark.integration
+    def test_warm_digests_invalidates_query_cache(self, warmer: IndexWarmer) -> None:
+        """反映したダイジェストがあるときだけコーパス世代を進める"""
+        from infrastructure.query_cache import corpus_generation
+
+        essences_path = warmer.config.essences_path
+        before = corpus_generation(essences_path)
+        assert warmer.warm_digests([warmer.config.digests_path / "notes.txt"]) == []
+        assert corpus_generation(essences_path) == before
+
+        digest = warmer.config.get_level_dir("weekly") / "W0001_第1週.txt"
+        digest.write_text(json.dumps(_regular_digest("L00001_a.txt")), encoding="utf-8")
+        warmer.warm_digests([digest])
+
+        assert corpus_generation(essences_path) == before + 1
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+LoopManifestRecorder Unit Tests
+===============================
+
+Tests for application/tracking/loop_manifest.py
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from application.tracking import LoopManifestRecorder
+
+
+def _write(path: Path, text: str, mtime_ns: int) -> Path:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+# ハッシュ計算時刻から十分に離れた過去の mtime（racy 判定を避ける）
+OLD_NS = 1_000_000_000_000_000_000
+
+
+class TestLoopManifestRecorder:
+    """LoopManifestRecorder tests"""
+
+    @pytest.mark.unit
+    def test_detects_edit_after_digest(self, tmp_path: Path) -> None:
+        recorder = LoopManifestRecorder(tmp_path)
+        loop1 = _write(tmp_path / "L00001_a.txt", "first", OLD_NS)
+        loop2 = _write(tmp_path / "L00002_b.txt", "second", OLD_NS)
+        recorder.record_digested([loop1, loop2])
+
+        assert recorder.find_modified([loop1, loop2]) == []
+        _write(loop2, "second (edited)", OLD_NS + 1)
+        assert recorder.find_modified([loop1, loop2]) == ["L00002_b.txt"]
+
+    @pytest.mark.unit
+    def test_unchanged_stat_is_not_rehashed(self, tmp_path: Path) -> None:
+        recorder = LoopManifestRecorder(tmp_path)
+        loop1 = _write(tmp_path / "L00001_a.txt", "first", OLD_NS)
+        recorder.record_digested([loop1])
+
+        with patch("application.tracking.loop_manifest.hash_files") as mock_hash:
+            assert recorder.find_modified([loop1]) == []
+        mock_hash.assert_not_called()
+
+    @pytest.mark.unit
+    def test_adopts_baseline_and_prunes(self, tmp_path: Path) -> None:
+        """基準が未記録のLoopは現在の内容を基準にし、消えたLoopは削除する"""
+        recorder = LoopManifestRecorder(tmp_path)
+        loop1 = _write(tmp_path / "L00001_a.txt", "first", OLD_NS)
+        loop2 = _write(tmp_path / "L00002_b.txt", "second", OLD_NS)
+        recorder.record_digested([loop2])
+
+        assert recorder.find_modified([loop1]) == []
+
+        manifest = recorder.load()
+        assert "L00001_a.txt" in manifest
+        assert "L00002_b.txt" not in manifest
+
+    @pytest.mark.unit
+    def test_primed_pending_loops_are_kept(self, tmp_path: Path) -> None:
+        """prime() で記録した未処理Loopのエントリは find_modified() で削除しない"""
+        recorder = LoopManifestRecorder(tmp_path)
+        loop1 = _write(tmp_path / "L00001_a.txt", "first", OLD_NS)
+        loop2 = _write(tmp_path / "L00002_b.txt", "second", OLD_NS)
+        recorder.record_digested([loop1])
+        recorder.prime([loop2])
+
+        assert recorder.find_modified([loop1], [loop2]) == []
+        assert "L00002_b.txt" in recorder.load()
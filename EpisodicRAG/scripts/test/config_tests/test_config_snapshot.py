@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_config_snapshot.py
+=======================
+
+infrastructure/config/config_snapshot.py のテスト
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from domain.exceptions import ConfigError
+from infrastructure.config.config_snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    get_snapshot_path,
+    invalidate_config_snapshot,
+    load_config_snapshot,
+    load_resolved_config,
+    save_config_snapshot,
+    snapshot_from_resolver,
+)
+from infrastructure.config.path_resolver import PathResolver
+
+
+def _write_config(config_file: Path, config: Dict[str, Any]) -> None:
+    config_file.write_text(json.dumps(config), encoding="utf-8")
+
+
+def _age_config(config_file: Path, seconds: int = 60) -> None:
+    """config.json のmtimeを過去にずらしてracy判定を外す"""
+    stat = config_file.stat()
+    past = stat.st_mtime_ns - seconds * 1_000_000_000
+    os.utime(config_file, ns=(past, past))
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    config_file = tmp_path / "config.json"
+    _write_config(
+        config_file,
+        {
+            "base_dir": str(tmp_path),
+            "paths": {
+                "loops_dir": "data/Loops",
+                "digests_dir": "data/Digests",
+                "essences_dir": "data/Essences",
+            },
+            "levels": {"weekly_threshold": 7},
+        },
+    )
+    _age_config(config_file)
+    return config_file
+
+
+class TestConfigSnapshotRoundTrip:
+    """スナップショットの保存・読み込み"""
+
+    @pytest.mark.unit
+    def test_first_load_writes_snapshot(self, config_file: Path) -> None:
+        """初回はconfig.jsonから構築し、スナップショットを書き込む"""
+        loader, resolver = load_resolved_config(config_file)
+
+        assert get_snapshot_path(config_file).exists()
+        assert resolver.loops_path == (config_file.parent / "data/Loops").resolve()
+        assert loader.load()["levels"]["weekly_threshold"] == 7
+
+    @pytest.mark.unit
+    def test_snapshot_hit_skips_validation(self, config_file: Path, monkeypatch) -> None:
+        """有効なスナップショットがあればPathResolverの検証を通らない"""
+        load_resolved_config(config_file)
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("validation should be skipped")
+
+        monkeypatch.setattr(PathResolver, "_resolve_base_dir", fail)
+        loader, resolver = load_resolved_config(config_file)
+
+        assert resolver.digests_path == (config_file.parent / "data/Digests").resolve()
+        assert resolver.base_dir == config_file.parent.resolve()
+        assert loader.is_loaded
+
+    @pytest.mark.unit
+    def test_changed_config_invalidates_snapshot(self, config_file: Path) -> None:
+        """config.json の内容が変わればスナップショットは使われない"""
+        load_resolved_config(config_file)
+        config = json.loads(config_file.read_text(encoding="utf-8"))
+        config["paths"]["loops_dir"] = "other/Loops"
+        _write_config(config_file, config)
+
+        assert load_config_snapshot(config_file) is None
+        _, resolver = load_resolved_config(config_file)
+        assert resolver.loops_path == (config_file.parent / "other/Loops").resolve()
+
+    @pytest.mark.unit
+    def test_touched_but_unchanged_config_still_hits(self, config_file: Path) -> None:
+        """mtimeだけ変わっても内容ハッシュが一致すればヒット"""
+        load_resolved_config(config_file)
+        os.utime(config_file)
+
+        assert load_config_snapshot(config_file) is not None
+
+    @pytest.mark.unit
+    def test_format_version_mismatch_ignored(self, config_file: Path) -> None:
+        """形式バージョンが異なるスナップショットは無視"""
+        load_resolved_config(config_file)
+        snapshot_file = get_snapshot_path(config_file)
+        raw = json.loads(snapshot_file.read_text(encoding="utf-8"))
+        raw["format_version"] = SNAPSHOT_FORMAT_VERSION + 1
+        snapshot_file.write_text(json.dumps(raw), encoding="utf-8")
+
+        assert load_config_snapshot(config_file) is None
+
+    @pytest.mark.unit
+    def test_corrupted_snapshot_ignored(self, config_file: Path) -> None:
+        """壊れたスナップショットは無視して再構築"""
+        get_snapshot_path(config_file).write_text("{not json", encoding="utf-8")
+
+        assert load_config_snapshot(config_file) is None
+        _, resolver = load_resolved_config(config_file)
+        assert resolver.essences_path.name == "Essences"
+
+    @pytest.mark.unit
+    def test_invalid_config_not_cached(self, config_file: Path) -> None:
+        """検証に失敗する設定はスナップショットを書かない"""
+        _write_config(config_file, {"base_dir": "relative", "paths": {}})
+
+        with pytest.raises(ConfigError):
+            load_resolved_config(config_file)
+        assert not get_snapshot_path(config_file).exists()
+
+    @pytest.mark.unit
+    def test_invalidate_removes_snapshot(self, config_file: Path) -> None:
+        """invalidate_config_snapshot() はスナップショットを削除"""
+        resolver = PathResolver(json.loads(config_file.read_text(encoding="utf-8")))
+        save_config_snapshot(config_file, snapshot_from_resolver(resolver))
+        invalidate_config_snapshot(config_file)
+        invalidate_config_snapshot(config_file)  # 存在しなくてもエラーにしない
+
+        assert not get_snapshot_path(config_file).exists()
+
+
+class TestDigestConfigSnapshot:
+    """DigestConfig からのスナップショット利用"""
+
+    @pytest.mark.integration
+    def test_second_instance_uses_snapshot(self, temp_plugin_env) -> None:
+        """2回目のDigestConfig構築はスナップショットから同じパスを復元"""
+        from application.config import DigestConfig
+
+        first = DigestConfig()
+        assert get_snapshot_path(first.config_file).exists()
+
+        second = DigestConfig()
+        assert second.loops_path == first.loops_path
+        assert second.get_level_dir("weekly") == first.get_level_dir("weekly")
+        assert second.threshold.weekly_threshold == first.threshold.weekly_threshold
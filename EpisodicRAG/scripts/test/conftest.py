@@ -66,15 +66,23 @@ def reset_all_singletons() -> Generator[None, None, None]:
         - level_registry: レベル設定のシングルトン
         - file_naming: ファイル命名用レジストリ参照
         - error_formatter: エラーフォーマッタのデフォルトインスタンス
+        - json_cache: JSON読み込みキャッシュ
+        - query_cache: クエリ結果キャッシュ（メモリ層）
     """
     # テスト実行前：クリーンな状態で開始
     from domain.error_formatter import reset_error_formatter
     from domain.file_naming import reset_registry
     from domain.level_registry import reset_level_registry
+    from infrastructure.file_lock import reset_lock_manager
+    from infrastructure.json_repository import reset_json_cache
+    from infrastructure.query_cache import reset_query_cache
 
     reset_level_registry()
     reset_registry()
     reset_error_formatter()
+    reset_json_cache()
+    reset_lock_manager()
+    reset_query_cache()
 
     yield  # テスト実行
 
@@ -82,6 +90,9 @@ def reset_all_singletons() -> Generator[None, None, None]:
     reset_level_registry()
     reset_registry()
     reset_error_formatter()
+    reset_json_cache()
+    reset_lock_manager()
+    reset_query_cache()
 
 
 # =============================================================================
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+domain/digest_records.py のテスト
+=================================
+
+DigestRecord の変換・キーワードのintern・本文の遅延読み込みを検証。
+"""
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from domain.digest_records import DigestRecord, IndividualRecord, intern_keywords
+
+
+def _digest() -> Dict[str, Any]:
+    return {
+        "overall_digest": {
+            "timestamp": "2025-03-15T10:00:00",
+            "digest_type": "統合",
+            "keywords": ["MCP", "API"],
+            "abstract": "全体の要約",
+            "impression": "全体の所感",
+            "source_files": ["L00001_a.txt", "L00002_b.txt"],
+        },
+        "individual_digests": [
+            {
+                "source_file": "L00001_a.txt",
+                "digest_type": "統合",
+                "keywords": ["MCP"],
+                "abstract": {"long": "個別の要約", "short": "短い"},
+                "impression": {"long": "個別の所感", "short": "短い"},
+            },
+        ],
+    }
+
+
+class TestDigestRecord:
+    """DigestRecord tests"""
+
+    @pytest.mark.unit
+    def test_from_dict(self) -> None:
+        record = DigestRecord.from_dict("weekly", "W0042_第4週.txt", _digest())
+
+        assert record.digest_id == "W0042"
+        assert record.source_ids() == ["L00001", "L00002"]
+        assert record.overall.timestamp == "2025-03-15T10:00:00"
+        assert record.overall.keywords == ("MCP", "API")
+        assert record.overall.abstract == "全体の要約"
+        individual = record.individuals[0]
+        assert individual.source_file == "L00001_a.txt"
+        assert (individual.abstract, individual.impression) == ("個別の要約", "個別の所感")
+
+    @pytest.mark.unit
+    def test_missing_fields_default_to_empty(self) -> None:
+        record = DigestRecord.from_dict("weekly", "W0001", {})
+
+        assert record.overall.keywords == ()
+        assert record.overall.abstract == ""
+        assert record.individuals == ()
+
+    @pytest.mark.unit
+    def test_records_have_no_instance_dict(self) -> None:
+        record = DigestRecord.from_dict("weekly", "W0001", _digest())
+
+        for obj in (record, record.overall, record.individuals[0]):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            record.individuals[0].extra = 1  # type: ignore[attr-defined]
+
+    @pytest.mark.unit
+    def test_keywords_and_types_are_interned(self) -> None:
+        # JSONから読むと同じ文字列でも別オブジェクトになる
+        first, second = (json.loads(json.dumps(_digest())) for _ in range(2))
+        a = DigestRecord.from_dict("weekly", "W0001", first)
+        b = DigestRecord.from_dict("weekly", "W0002", second)
+
+        assert a.overall.keywords[0] is b.overall.keywords[0]
+        assert a.overall.digest_type is b.individuals[0].digest_type
+        assert intern_keywords([1, "x"]) == ("1", "x")
+
+
+class TestLazyText:
+    """loader による本文の遅延読み込み"""
+
+    @pytest.mark.unit
+    def test_text_is_loaded_on_first_access_and_released(self) -> None:
+        calls: List[int] = []
+
+        def loader() -> Dict[str, Any]:
+            calls.append(1)
+            return _digest()
+
+        record = DigestRecord.from_dict("weekly", "W0001", _digest(), loader=loader)
+        individual: IndividualRecord = record.individuals[0]
+
+        assert not record.overall.text_loaded
+        assert individual.keywords == ("MCP",)
+        assert calls == []
+
+        assert individual.abstract == "個別の要約"
+        assert record.overall.impression == "全体の所感"
+        assert calls == [1]
+
+        record.release_text()
+        assert not individual.text_loaded
+        assert individual.impression == "個別の所感"
+        assert calls == [1, 1]
+
+    @pytest.mark.unit
+    def test_unmatched_individual_gets_empty_text(self) -> None:
+        record = DigestRecord.from_dict("weekly", "W0001", _digest(), loader=dict)
+
+        assert record.overall.abstract == ""
+        assert record.individuals[0].abstract == ""
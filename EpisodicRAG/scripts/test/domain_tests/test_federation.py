@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+domain/federation.py のテスト
+=============================
+"""
+
+import pytest
+
+from domain.federation import merge_ranked, merge_term_stats
+
+
+class TestMergeTermStats:
+    """merge_term_stats tests"""
+
+    @pytest.mark.unit
+    def test_sums_document_frequencies(self) -> None:
+        assert merge_term_stats([([1, 0, 2], 3), ([0, 1, 1], 2)]) == ([1, 1, 3], 5)
+        assert merge_term_stats([]) == ([], 0)
+
+
+class TestMergeRanked:
+    """merge_ranked tests"""
+
+    @pytest.mark.unit
+    def test_normalizes_against_global_top_score(self) -> None:
+        merged = merge_ranked(
+            {"local": [("W0001", 0.4), ("W0002", 0.2)], "projA": [("W0007", 0.8)]}, k=2
+        )
+
+        assert merged == [
+            {"store": "projA", "id": "W0007", "score": 1.0, "raw_score": 0.8},
+            {"store": "local", "id": "W0001", "score": 0.5, "raw_score": 0.4},
+        ]
+
+    @pytest.mark.unit
+    def test_ties_and_empty(self) -> None:
+        merged = merge_ranked({"b": [("W1", 0.5)], "a": [("W2", 0.5), ("W3", 0.0)]}, k=5)
+
+        assert [(hit["store"], hit["id"]) for hit in merged] == [("a", "W2"), ("b", "W1")]
+        assert merge_ranked({"a": []}, k=5) == []
@@ -7,17 +7,22 @@ domain/file_naming.py のテスト。
 特に新規追加のユーティリティ関数をテスト。
 """
 
+from array import array
 from pathlib import Path
 
 import pytest
 
+import domain.file_naming as file_naming
 from domain.file_naming import (
+    NUMBER_ARRAY_TYPECODE,
     extract_file_number,
+    extract_number_array,
     extract_number_only,
     extract_numbers_formatted,
     filter_files_after,
     find_max_number,
     format_digest_number,
+    is_consecutive_numbers,
 )
 
 # =============================================================================
@@ -250,6 +255,75 @@ class TestExtractNumbersFormatted:
         assert len(result) == 2
 
 
+class TestExtractNumberArray:
+    """extract_number_array のテスト"""
+
+    def test_extracts_numbers_in_input_order(self) -> None:
+        """番号を入力順の array で返す"""
+        numbers, invalid = extract_number_array(["L00003_c.txt", "L00001_a.txt", "MD02_x.txt"])
+
+        assert isinstance(numbers, array)
+        assert numbers.typecode == NUMBER_ARRAY_TYPECODE
+        assert numbers.tolist() == [3, 1, 2]
+        assert invalid == []
+
+    def test_reports_invalid_indices(self) -> None:
+        """抽出できない要素（非strを含む）はインデックスで報告"""
+        numbers, invalid = extract_number_array(["L00001_a.txt", None, "invalid.txt", 123])
+
+        assert numbers.tolist() == [1]
+        assert invalid == [1, 2, 3]
+
+    def test_matches_extract_file_number(self) -> None:
+        """1件ずつの extract_file_number と同じ番号を抽出する"""
+        files = [f"{prefix}{i:04d}_x.txt" for prefix in ("L", "W", "MD", "C") for i in (1, 42)]
+        numbers, invalid = extract_number_array(files)
+
+        assert invalid == []
+        assert numbers.tolist() == [extract_file_number(f)[1] for f in files]
+
+    def test_empty_list(self) -> None:
+        """空のリスト"""
+        numbers, invalid = extract_number_array([])
+        assert (len(numbers), invalid) == (0, [])
+
+
+class TestIsConsecutiveNumbers:
+    """is_consecutive_numbers のテスト（NumPyの有無で同じ結果）"""
+
+    CASES = [
+        ([], True),
+        ([5], True),
+        ([1, 2, 3], True),
+        ([3, 1, 2], True),
+        ([-1, 0, 1], True),
+        ([1, 3], False),
+        ([3, 1], False),
+        ([1, 2, 2, 3], False),
+        ([1, 1, 2], False),
+        ([2, 1, 4], False),
+    ]
+
+    @pytest.mark.parametrize("numbers,expected", CASES)
+    def test_list_and_array(self, numbers, expected) -> None:
+        """リストと array のどちらも判定できる"""
+        assert is_consecutive_numbers(numbers) is expected
+        assert is_consecutive_numbers(array(NUMBER_ARRAY_TYPECODE, numbers)) is expected
+
+    @pytest.mark.parametrize("numbers,expected", CASES)
+    def test_pure_python_fallback(self, numbers, expected, monkeypatch) -> None:
+        """NumPyがなくても同じ結果"""
+        monkeypatch.setattr(file_naming, "np", None)
+        assert is_consecutive_numbers(array(NUMBER_ARRAY_TYPECODE, numbers)) is expected
+
+    def test_large_sequence(self) -> None:
+        """大きな連番と、末尾だけ欠番のある列"""
+        numbers = array(NUMBER_ARRAY_TYPECODE, range(1, 100_001))
+        assert is_consecutive_numbers(numbers) is True
+        numbers[-1] += 1
+        assert is_consecutive_numbers(numbers) is False
+
+
 # =============================================================================
 # エッジケースのテスト
 # =============================================================================
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+domain/grand_history.py のテスト
+================================
+
+major_digests の差分の計算・適用と状態ハッシュを検証。
+"""
+
+import copy
+
+import pytest
+
+from domain.grand_history import apply_level_deltas, diff_major_digests, state_hash
+
+
+def _overall(name: str, **fields) -> dict:
+    return {"overall_digest": {"name": name, "keywords": ["a"], **fields}}
+
+
+class TestDiffMajorDigests:
+    """diff_major_digests() と apply_level_deltas() の往復"""
+
+    @pytest.mark.unit
+    def test_only_changed_fields_are_recorded(self) -> None:
+        previous = {"weekly": _overall("W0001", abstract="x"), "monthly": _overall("M001")}
+        current = {"weekly": _overall("W0002", abstract="x"), "monthly": _overall("M001")}
+
+        delta = diff_major_digests(previous, current)
+
+        assert delta == {"weekly": {"set": {"name": "W0002"}}}
+
+    @pytest.mark.unit
+    def test_removed_field_is_unset(self) -> None:
+        previous = {"weekly": _overall("W0001", abstract="x")}
+        current = {"weekly": _overall("W0001")}
+
+        delta = diff_major_digests(previous, current)
+        apply_level_deltas(previous, delta)
+
+        assert delta == {"weekly": {"unset": ["abstract"]}}
+        assert previous == current
+
+    @pytest.mark.unit
+    def test_first_digest_is_whole_entry(self) -> None:
+        """overall_digest が None からの初回確定はエントリごと記録する"""
+        previous = {"weekly": {"overall_digest": None}}
+        current = {"weekly": _overall("W0001")}
+
+        delta = diff_major_digests(previous, current)
+        apply_level_deltas(previous, delta)
+
+        assert delta == {"weekly": {"entry": current["weekly"]}}
+        assert previous == current
+
+    @pytest.mark.unit
+    def test_added_and_dropped_levels(self) -> None:
+        previous = {"weekly": _overall("W0001"), "decadal": {"overall_digest": None}}
+        current = {"weekly": _overall("W0001"), "monthly": _overall("M001")}
+
+        delta = diff_major_digests(previous, current)
+        apply_level_deltas(previous, delta)
+
+        assert delta == {"monthly": {"entry": current["monthly"]}, "decadal": {"drop": True}}
+        assert previous == current
+
+    @pytest.mark.unit
+    def test_applied_values_are_independent_of_delta(self) -> None:
+        state = {"weekly": _overall("W0001")}
+        delta = {"weekly": {"set": {"keywords": ["b"]}}}
+
+        apply_level_deltas(state, delta)
+        delta["weekly"]["set"]["keywords"].append("c")
+
+        assert state["weekly"]["overall_digest"]["keywords"] == ["b"]
+
+    @pytest.mark.unit
+    def test_apply_does_not_mutate_shared_level_entries(self) -> None:
+        """適用前の状態と共有していたレベルのエントリは書き換えない"""
+        original = {"weekly": _overall("W0001")}
+        state = copy.copy(original)
+
+        apply_level_deltas(state, {"weekly": {"set": {"name": "W0002"}}})
+
+        assert original["weekly"]["overall_digest"]["name"] == "W0001"
+
+
+class TestStateHash:
+    """state_hash() のテスト"""
+
+    @pytest.mark.unit
+    def test_hash_ignores_key_order(self) -> None:
+        a = {"weekly": _overall("W0001"), "monthly": {"overall_digest": None}}
+        b = {"monthly": {"overall_digest": None}, "weekly": _overall("W0001")}
+        assert state_hash(a) == state_hash(b)
+
+    @pytest.mark.unit
+    def test_hash_changes_with_content(self) -> None:
+        assert state_hash({"weekly": _overall("W0001")}) != state_hash(
+            {"weekly": _overall("W0002")}
+        )
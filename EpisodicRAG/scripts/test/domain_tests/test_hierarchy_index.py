@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+domain/hierarchy_index.py のテスト
+==================================
+
+HierarchyIndex のリンク管理・遅延走査・永続化形式を検証。
+"""
+
+import pytest
+
+from domain.hierarchy_index import HIERARCHY_FORMAT_VERSION, HierarchyIndex
+
+
+@pytest.fixture
+def index() -> HierarchyIndex:
+    index = HierarchyIndex()
+    index.link("W0001", ["L00001", "L00002"])
+    index.link("W0002", ["L00003"])
+    index.link("M001", ["W0001", "W0002"])
+    index.link("Q001", ["M001"])
+    return index
+
+
+class TestHierarchyIndexLookup:
+    """直接の親子参照"""
+
+    @pytest.mark.unit
+    def test_children_and_parents(self, index: HierarchyIndex) -> None:
+        assert index.children_of("M001") == ["W0001", "W0002"]
+        assert index.parents_of("L00003") == ["W0002"]
+        assert index.parents_of("Q001") == []
+        assert "L00001" in index
+        assert "L09999" not in index
+
+    @pytest.mark.unit
+    def test_relink_replaces_reverse_links(self, index: HierarchyIndex) -> None:
+        """再リンク時に古い逆リンクを取り除く"""
+        index.link("W0002", ["L00004"])
+        assert index.parents_of("L00003") == []
+        assert "L00003" not in index
+        assert index.parents_of("L00004") == ["W0002"]
+
+
+class TestHierarchyIndexWalk:
+    """祖先・子孫の遅延走査"""
+
+    @pytest.mark.unit
+    def test_iter_ancestors_nearest_first(self, index: HierarchyIndex) -> None:
+        assert list(index.iter_ancestors("L00001")) == ["W0001", "M001", "Q001"]
+
+    @pytest.mark.unit
+    def test_iter_descendants_breadth_first(self, index: HierarchyIndex) -> None:
+        assert list(index.iter_descendants("Q001")) == [
+            "M001",
+            "W0001",
+            "W0002",
+            "L00001",
+            "L00002",
+            "L00003",
+        ]
+
+    @pytest.mark.unit
+    def test_walk_is_lazy(self, index: HierarchyIndex) -> None:
+        """ジェネレータは必要な分だけ走査する"""
+        ancestors = index.iter_ancestors("L00002")
+        assert next(ancestors) == "W0001"
+
+    @pytest.mark.unit
+    def test_walk_terminates_on_cycle(self) -> None:
+        """不正な循環があっても各ノードは1回のみ"""
+        index = HierarchyIndex()
+        index.link("A", ["B"])
+        index.link("B", ["A"])
+        assert list(index.iter_descendants("A")) == ["B"]
+
+
+class TestHierarchyIndexSerialization:
+    """to_dict() / from_dict()"""
+
+    @pytest.mark.unit
+    def test_round_trip_rebuilds_parents(self, index: HierarchyIndex) -> None:
+        restored = HierarchyIndex.from_dict(index.to_dict())
+        assert list(restored.iter_ancestors("L00003")) == ["W0002", "M001", "Q001"]
+
+    @pytest.mark.unit
+    def test_unknown_version_yields_empty_index(self, index: HierarchyIndex) -> None:
+        data = index.to_dict()
+        data["format_version"] = HIERARCHY_FORMAT_VERSION + 1
+        assert "W0001" not in HierarchyIndex.from_dict(data)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+indexed_provisional のテスト
+============================
+
+テスト対象：domain/indexed_provisional.py
+責任範囲：source_fileキー索引による重複判定・追加・置換
+"""
+
+import pytest
+
+from domain.indexed_provisional import (
+    IndexedProvisional,
+    extract_source_base_key,
+    get_entry_source_file,
+    source_base_key,
+)
+
+pytestmark = pytest.mark.unit
+
+
+# =============================================================================
+# キー抽出関数のテスト
+# =============================================================================
+
+
+class TestKeyFunctions:
+    """ベースキー抽出関数のテスト"""
+
+    @pytest.mark.parametrize(
+        "source_file,expected",
+        [
+            ("W0053_タイトル.txt", "W0053"),
+            ("L00186.txt", "L00186"),
+            ("L00186_test.txt", "L00186"),
+            ("", ""),
+        ],
+    )
+    def test_extract_source_base_key(self, source_file: str, expected: str) -> None:
+        """プレフィックス+番号部分を抽出"""
+        assert extract_source_base_key(source_file) == expected
+
+    def test_get_entry_source_file_falls_back_to_filename(self) -> None:
+        """source_fileがなければfilenameを使用"""
+        assert get_entry_source_file({"filename": "W0001_a.txt"}) == "W0001_a.txt"
+        assert get_entry_source_file({}) == ""
+
+    def test_source_base_key_uses_entry(self) -> None:
+        """エントリからベースキーを導出"""
+        assert source_base_key({"source_file": "M0002_月次.txt"}) == "M0002"
+
+
+# =============================================================================
+# IndexedProvisional のテスト
+# =============================================================================
+
+
+class TestIndexedProvisional:
+    """IndexedProvisional のテスト"""
+
+    def test_contains_matches_by_base_key(self) -> None:
+        """タイトル違いでも同一ベースキーなら重複と判定"""
+        index = IndexedProvisional([{"source_file": "W0053_旧タイトル.txt"}])
+        assert index.contains({"source_file": "W0053_新タイトル.txt"})
+        assert not index.contains({"source_file": "W0054_タイトル.txt"})
+
+    def test_contains_legacy_filename_entries(self) -> None:
+        """filenameキーの既存エントリも索引される"""
+        index = IndexedProvisional([{"filename": "W0053_タイトル.txt"}])
+        assert index.contains({"source_file": "W0053_タイトル.txt"})
+
+    def test_append_skips_duplicate(self) -> None:
+        """重複エントリは追加しない"""
+        index = IndexedProvisional([{"source_file": "W0001_a.txt"}])
+        assert index.append({"source_file": "W0001_b.txt"}) is False
+        assert index.append({"source_file": "W0002_c.txt"}) is True
+        assert [e["source_file"] for e in index] == ["W0001_a.txt", "W0002_c.txt"]
+        assert index.position_of("W0002") == 1
+
+    def test_upsert_replaces_in_place(self) -> None:
+        """既存キーは同じ位置で置換、新規キーは末尾に追加"""
+        index = IndexedProvisional(
+            [{"source_file": "L00001.txt", "v": 1}, {"source_file": "L00002.txt", "v": 1}]
+        )
+        assert index.upsert({"source_file": "L00001.txt", "v": 2}) is True
+        assert index.upsert({"source_file": "L00003.txt", "v": 1}) is False
+        assert [e["v"] for e in index.to_list()] == [2, 1, 1]
+        assert len(index) == 3
+
+    def test_upsert_all_validates_only_new_entries(self) -> None:
+        """validatorは新規エントリにのみ適用される"""
+        seen = []
+        index = IndexedProvisional([{"invalid": "existing"}])
+        replaced = index.upsert_all(
+            [{"source_file": "L00001.txt"}, {"source_file": "L00001.txt"}],
+            validator=lambda entry, i: seen.append(i),
+        )
+        assert seen == [0, 1]
+        assert replaced == ["L00001"]
+
+    def test_upsert_all_stops_at_first_invalid(self) -> None:
+        """検証エラー時は以降のエントリを追加しない"""
+
+        def validator(entry, i) -> None:
+            if "source_file" not in entry:
+                raise ValueError(f"invalid at {i}")
+
+        index = IndexedProvisional()
+        with pytest.raises(ValueError, match="invalid at 1"):
+            index.upsert_all(
+                [{"source_file": "L00001.txt"}, {}, {"source_file": "L00002.txt"}],
+                validator=validator,
+            )
+        assert len(index) == 1
+
+    def test_custom_key_func(self) -> None:
+        """キー関数を差し替え可能"""
+        index = IndexedProvisional(key_func=lambda e: e["source_file"])
+        index.append({"source_file": "L00001.txt"})
+        assert index.append({"source_file": "L00001_title.txt"}) is True
+
+    def test_to_list_returns_copy(self) -> None:
+        """to_list()の戻り値を変更しても索引に影響しない"""
+        index = IndexedProvisional([{"source_file": "L00001.txt"}])
+        entries = index.to_list()
+        entries.clear()
+        assert len(index) == 1
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+domain/keyword_rollup.py のテスト
+=================================
+
+KeywordRollup の増分集計・期間集約・共起を検証。
+"""
+
+import pytest
+
+from domain.keyword_rollup import (
+    KEYWORD_ROLLUP_FORMAT_VERSION,
+    MAX_COOCCURRING,
+    KeywordRollup,
+    bucket_period,
+    period_of,
+)
+
+
+@pytest.fixture
+def rollup() -> KeywordRollup:
+    rollup = KeywordRollup()
+    rollup.record("weekly", "W0001", "2025-01", ["MCP", "API"])
+    rollup.record("weekly", "W0002", "2025-02", ["MCP", "設計"])
+    rollup.record("weekly", "W0003", "2025-04", ["MCP", "API"])
+    rollup.record("monthly", "M001", "2025-01", ["MCP"])
+    return rollup
+
+
+class TestKeywordRollupQueries:
+    """trend() / top_keywords() / cooccurring()"""
+
+    @pytest.mark.unit
+    def test_trend_by_month_and_level(self, rollup: KeywordRollup) -> None:
+        assert rollup.trend("MCP", level="weekly") == {"2025-01": 1, "2025-02": 1, "2025-04": 1}
+
+    @pytest.mark.unit
+    def test_trend_by_quarter_all_levels(self, rollup: KeywordRollup) -> None:
+        assert rollup.trend("MCP", granularity="quarter") == {"2025-Q1": 3, "2025-Q2": 1}
+
+    @pytest.mark.unit
+    def test_trend_unknown_keyword_is_empty(self, rollup: KeywordRollup) -> None:
+        assert rollup.trend("unknown") == {}
+
+    @pytest.mark.unit
+    def test_top_keywords(self, rollup: KeywordRollup) -> None:
+        assert rollup.top_keywords(k=2) == [("MCP", 4), ("API", 2)]
+        assert rollup.top_keywords(level="monthly") == [("MCP", 1)]
+
+    @pytest.mark.unit
+    def test_cooccurring_top_k(self, rollup: KeywordRollup) -> None:
+        assert rollup.cooccurring("MCP") == [("API", 2), ("設計", 1)]
+        assert rollup.cooccurring("MCP", k=1) == [("API", 2)]
+
+
+class TestKeywordRollupRecord:
+    """record() の増分更新"""
+
+    @pytest.mark.unit
+    def test_rerecord_replaces_previous_contribution(self, rollup: KeywordRollup) -> None:
+        """同じダイジェストの再記録は二重計上しない"""
+        rollup.record("weekly", "W0001", "2025-01", ["MCP"])
+
+        assert rollup.trend("API") == {"2025-04": 1}
+        assert rollup.cooccurring("API") == [("MCP", 1)]
+        assert len(rollup) == 4
+
+    @pytest.mark.unit
+    def test_cooccurrence_is_bounded_per_keyword(self) -> None:
+        """共起キーワードは上限件数まで保持し、頻出のものは残る"""
+        rollup = KeywordRollup()
+        for i in range(3):
+            rollup.record("weekly", f"W{i:04d}", "2025-01", ["MCP", "API"])
+        for i in range(MAX_COOCCURRING * 2):
+            rollup.record("weekly", f"W1{i:03d}", "2025-01", ["MCP", f"tail{i:03d}"])
+
+        assert len(rollup.to_dict()["pairs"]["MCP"]) == MAX_COOCCURRING
+        assert rollup.cooccurring("MCP", k=1) == [("API", 3)]
+
+    @pytest.mark.unit
+    def test_keywords_normalized(self) -> None:
+        """空白除去・空要素除外・重複排除"""
+        rollup = KeywordRollup()
+        rollup.record("weekly", "W0001", "2025-01", [" MCP ", "", None, "MCP"])
+        assert rollup.top_keywords() == [("MCP", 1)]
+
+
+class TestKeywordRollupSerialization:
+    """to_dict() / from_dict()"""
+
+    @pytest.mark.unit
+    def test_round_trip(self, rollup: KeywordRollup) -> None:
+        restored = KeywordRollup.from_dict(rollup.to_dict(), rollup.digests_to_dict())
+        assert restored.trend("MCP", granularity="year") == {"2025": 4}
+        restored.record("weekly", "W0002", "2025-02", [])
+        assert restored.trend("設計") == {}
+
+    @pytest.mark.unit
+    def test_view_omits_per_digest_contributions(self, rollup: KeywordRollup) -> None:
+        """参照用のビューにはダイジェストごとの寄与を含めない"""
+        assert "digests" not in rollup.to_dict()
+        view_only = KeywordRollup.from_dict(rollup.to_dict())
+        assert view_only.cooccurring("MCP") == [("API", 2), ("設計", 1)]
+
+    @pytest.mark.unit
+    def test_unknown_version_yields_empty(self, rollup: KeywordRollup) -> None:
+        data = rollup.to_dict()
+        data["format_version"] = KEYWORD_ROLLUP_FORMAT_VERSION + 1
+        assert len(KeywordRollup.from_dict(data)) == 0
+
+
+@pytest.mark.unit
+def test_period_helpers() -> None:
+    assert period_of("2025-11-30T23:59:59") == "2025-11"
+    assert bucket_period("2025-11", "quarter") == "2025-Q4"
+    assert bucket_period("2025-11", "year") == "2025"
+    assert bucket_period("2025-11", "month") == "2025-11"
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+domain/loop_manifest.py のテスト
+================================
+
+LoopManifest の再ハッシュ判定・処理時点ハッシュ・変更検出・永続化形式を検証。
+"""
+
+import pytest
+
+from domain.loop_manifest import LOOP_MANIFEST_FORMAT_VERSION, RACY_WINDOW_NS, LoopManifest
+
+HASHED_AT = 10 * RACY_WINDOW_NS
+
+
+@pytest.fixture
+def manifest() -> LoopManifest:
+    manifest = LoopManifest()
+    manifest.update("L00001.txt", 100, 1_000, "aa", hashed_at_ns=HASHED_AT)
+    manifest.update("L00002.txt", 200, 2_000, "bb", hashed_at_ns=HASHED_AT)
+    manifest.mark_digested(["L00001.txt", "L00002.txt"])
+    return manifest
+
+
+class TestNeedsHash:
+    """再ハッシュ判定"""
+
+    @pytest.mark.unit
+    def test_unchanged_stat_skips_hash(self, manifest: LoopManifest) -> None:
+        assert manifest.needs_hash("L00001.txt", 100, 1_000) is False
+
+    @pytest.mark.unit
+    def test_changed_or_unknown_requires_hash(self, manifest: LoopManifest) -> None:
+        assert manifest.needs_hash("L00001.txt", 101, 1_000)
+        assert manifest.needs_hash("L00001.txt", 100, 1_001)
+        assert manifest.needs_hash("L00009.txt", 100, 1_000)
+
+    @pytest.mark.unit
+    def test_racy_mtime_requires_hash(self) -> None:
+        """ハッシュ計算直前に更新されたエントリは stat が一致しても再ハッシュ"""
+        manifest = LoopManifest()
+        manifest.update("L00001.txt", 100, HASHED_AT - 1, "aa", hashed_at_ns=HASHED_AT)
+        assert manifest.needs_hash("L00001.txt", 100, HASHED_AT - 1)
+
+
+class TestModified:
+    """変更検出"""
+
+    @pytest.mark.unit
+    def test_modified_after_digest(self, manifest: LoopManifest) -> None:
+        assert manifest.modified() == []
+        manifest.update("L00002.txt", 210, 3_000, "cc", hashed_at_ns=HASHED_AT)
+        assert manifest.modified() == ["L00002.txt"]
+        assert manifest.get("L00002.txt")["digested_hash"] == "bb"  # type: ignore[index]
+
+        # 元の内容に戻れば変更扱いしない
+        manifest.update("L00002.txt", 200, 4_000, "bb", hashed_at_ns=HASHED_AT)
+        assert manifest.modified() == []
+
+    @pytest.mark.unit
+    def test_only_missing_keeps_existing_baseline(self, manifest: LoopManifest) -> None:
+        manifest.update("L00001.txt", 110, 5_000, "zz", hashed_at_ns=HASHED_AT)
+        manifest.update("L00003.txt", 300, 5_000, "dd", hashed_at_ns=HASHED_AT)
+
+        marked = manifest.mark_digested(["L00001.txt", "L00003.txt"], only_missing=True)
+
+        assert marked == ["L00003.txt"]
+        assert manifest.modified() == ["L00001.txt"]
+
+    @pytest.mark.unit
+    def test_prune(self, manifest: LoopManifest) -> None:
+        assert manifest.prune(["L00001.txt"]) == ["L00002.txt"]
+        assert "L00002.txt" not in manifest and len(manifest) == 1
+
+
+class TestPersistence:
+    """永続化形式"""
+
+    @pytest.mark.unit
+    def test_round_trip(self, manifest: LoopManifest) -> None:
+        restored = LoopManifest.from_dict(manifest.to_dict())
+        assert restored.get("L00001.txt") == manifest.get("L00001.txt")
+
+    @pytest.mark.unit
+    def test_unknown_format_is_empty(self) -> None:
+        data = {"format_version": LOOP_MANIFEST_FORMAT_VERSION + 1, "loops": {"L1": {}}}
+        assert len(LoopManifest.from_dict(data)) == 0
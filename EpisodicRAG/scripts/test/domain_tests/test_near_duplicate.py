@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+domain/near_duplicate.py のテスト
+=================================
+
+SimHash / MinHash スケッチ、LSHによる候補検索、永続化形式を検証。
+"""
+
+import time
+from collections import Counter
+
+import pytest
+
+import domain.near_duplicate as near_duplicate
+from domain.near_duplicate import (
+    NEAR_DUPLICATE_FORMAT_VERSION,
+    NUM_PERM,
+    NearDuplicateIndex,
+    compute_sketch,
+    estimate_jaccard,
+    hamming_distance,
+    minhash_signature,
+    shingle_hashes,
+    simhash64,
+)
+
+BASE_TEXT = "".join(
+    f"{i}回目の打ち合わせではMCPサーバーの設計とAPI境界について議論した。" for i in range(40)
+)
+EDITED_TEXT = BASE_TEXT.replace("39回目の打ち合わせでは", "最後の打ち合わせでは")
+OTHER_TEXT = "".join(f"{i}回目の登山は天気が良く、山頂からの景色を楽しんだ。" for i in range(40))
+
+
+class TestSketch:
+    """スケッチ計算"""
+
+    @pytest.mark.unit
+    def test_shingles_normalize_whitespace(self) -> None:
+        assert shingle_hashes("ab  cd\nef") == shingle_hashes("ab cd ef")
+        assert shingle_hashes("   ") == {}
+        assert len(shingle_hashes("abc")) == 1
+
+    @pytest.mark.unit
+    def test_sketch_is_deterministic(self) -> None:
+        assert compute_sketch(BASE_TEXT) == compute_sketch(BASE_TEXT)
+        simhash, minhash = compute_sketch(BASE_TEXT)
+        assert 0 <= simhash < 1 << 64
+        assert len(minhash) == NUM_PERM
+
+    @pytest.mark.unit
+    def test_similar_texts_have_close_sketches(self) -> None:
+        base = compute_sketch(BASE_TEXT)
+        edited = compute_sketch(EDITED_TEXT)
+        other = compute_sketch(OTHER_TEXT)
+
+        assert estimate_jaccard(base[1], edited[1]) >= 0.8
+        assert estimate_jaccard(base[1], other[1]) < 0.3
+        assert hamming_distance(base[0], edited[0]) < hamming_distance(base[0], other[0])
+
+    @pytest.mark.unit
+    def test_empty_bins_borrow_from_right_neighbour(self) -> None:
+        """シングルが少なく空のビンがあっても、全ビンが埋まる"""
+        hashes = [(5 << 6) | 3, (9 << 6) | 10]
+
+        signature = minhash_signature(hashes)
+
+        assert signature[3] == 5 and signature[10] == 9
+        assert signature[0] == 5 and signature[4] == 9 and signature[11] == 5
+        assert (
+            minhash_signature([]) == minhash_signature([])
+            and len(minhash_signature([])) == NUM_PERM
+        )
+
+    @pytest.mark.unit
+    def test_simhash_weights_by_count(self) -> None:
+        """出現回数の多いハッシュのビットが優先される"""
+        assert simhash64(shingle_hashes("")) == 0
+        assert simhash64(Counter({0b1010: 3, 0b0101: 1})) == 0b1010
+
+    @pytest.mark.slow
+    @pytest.mark.unit
+    def test_long_loop_is_sketched_quickly(self) -> None:
+        """60k字のLoopでも、シングルごとに1回のハッシュで済む"""
+        text = "".join(f"{i}回目: MCPサーバーの設計とAPI境界を議論した。" for i in range(2000))
+
+        start = time.perf_counter()
+        compute_sketch(text[:60000])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+
+    @pytest.mark.unit
+    def test_estimate_jaccard_length_mismatch(self) -> None:
+        assert estimate_jaccard([1, 2], [1]) == 0.0
+        assert estimate_jaccard([], []) == 0.0
+
+
+class TestNearDuplicateIndex:
+    """LSH索引"""
+
+    @pytest.mark.unit
+    def test_add_reports_near_duplicate(self) -> None:
+        index = NearDuplicateIndex()
+        assert index.add("L00001", *compute_sketch(BASE_TEXT)) == []
+        assert index.add("L00002", *compute_sketch(OTHER_TEXT)) == []
+
+        matches = index.add("L00003", *compute_sketch(EDITED_TEXT))
+
+        assert [m["duplicate_of"] for m in matches] == ["L00001"]
+        assert matches[0]["similarity"] >= 0.8
+        assert index.duplicates() == {"L00003": matches}
+
+    @pytest.mark.unit
+    def test_add_existing_id_is_noop(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("L00001", *compute_sketch(BASE_TEXT))
+        index.add("L00002", *compute_sketch(BASE_TEXT))
+
+        again = index.add("L00002", *compute_sketch(OTHER_TEXT))
+
+        assert [m["duplicate_of"] for m in again] == ["L00001"]
+        assert len(index) == 2
+
+    @pytest.mark.unit
+    def test_find_compares_bucket_candidates_only(self) -> None:
+        """バンドが一致しないLoopは類似度を計算しない"""
+        index = NearDuplicateIndex()
+        index.add("L00001", *compute_sketch(OTHER_TEXT))
+        simhash, minhash = compute_sketch(BASE_TEXT)
+
+        calls = []
+        original = near_duplicate.estimate_jaccard
+
+        def counting(a, b):  # type: ignore[no-untyped-def]
+            calls.append(1)
+            return original(a, b)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(near_duplicate, "estimate_jaccard", counting)
+            assert index.find(simhash, minhash) == []
+        assert calls == []
+
+    @pytest.mark.unit
+    def test_round_trip(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("L00001", *compute_sketch(BASE_TEXT))
+        index.add("L00002", *compute_sketch(EDITED_TEXT))
+
+        restored = NearDuplicateIndex.from_dict(index.to_dict())
+
+        assert "L00001" in restored and len(restored) == 2
+        assert restored.duplicates() == index.duplicates()
+        assert restored.find(*compute_sketch(BASE_TEXT), exclude="L00001")
+
+    @pytest.mark.unit
+    def test_unknown_format_is_empty(self) -> None:
+        data = {"format_version": NEAR_DUPLICATE_FORMAT_VERSION + 1, "sketches": {"L1": {}}}
+        assert len(NearDuplicateIndex.from_dict(data)) == 0
+        assert len(NearDuplicateIndex.from_dict({})) == 0
+
+    @pytest.mark.unit
+    def test_malformed_sketch_skipped(self) -> None:
+        data = {
+            "format_version": NEAR_DUPLICATE_FORMAT_VERSION,
+            "sketches": {"L00001": {"simhash": "zz", "minhash": []}},
+            "duplicates": {"L00001": [{"duplicate_of": "L00000"}]},
+        }
+        restored = NearDuplicateIndex.from_dict(data)
+        assert len(restored) == 0
+        assert restored.duplicates() == {}
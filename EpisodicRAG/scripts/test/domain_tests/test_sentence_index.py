@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+domain/sentence_index.py のテスト
+=================================
+
+文境界の分割（日本語・英語の句読点）、文ごとの署名による候補選択、
+ハイライト範囲を検証。
+"""
+
+import pytest
+
+from domain.sentence_index import (
+    MAX_SENTENCE_CHARS,
+    SentenceMap,
+    highlight_spans,
+    match_count,
+    query_terms,
+    split_sentences,
+)
+
+
+def _sentences(text: str) -> list:
+    boundaries = split_sentences(text)
+    return [text[start:end] for start, end in zip(boundaries, boundaries[1:])]
+
+
+def _utf8_length(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+class TestSplitSentences:
+    """split_sentences() のテスト"""
+
+    @pytest.mark.unit
+    def test_japanese_punctuation(self) -> None:
+        assert _sentences("設計を見直した。MCPは良い！本当に？") == [
+            "設計を見直した。", "MCPは良い！", "本当に？"
+        ]  # fmt: skip
+
+    @pytest.mark.unit
+    def test_latin_period_needs_following_space(self) -> None:
+        """小数点やファイル名の「.」では区切らない"""
+        assert _sentences("Version 1.2 is out. See api.md now!") == [
+            "Version 1.2 is out. ", "See api.md now!"
+        ]  # fmt: skip
+
+    @pytest.mark.unit
+    def test_closing_quote_and_newline_stay_with_sentence(self) -> None:
+        assert _sentences("「すごい！」と言った。\n次の行") == [
+            "「すごい！」",
+            "と言った。\n",
+            "次の行",
+        ]
+
+    @pytest.mark.unit
+    def test_long_run_without_punctuation_is_cut(self) -> None:
+        text = "あ" * (MAX_SENTENCE_CHARS * 2 + 10)
+        assert [len(s) for s in _sentences(text)] == [MAX_SENTENCE_CHARS, MAX_SENTENCE_CHARS, 10]
+
+    @pytest.mark.unit
+    def test_boundaries_cover_text(self) -> None:
+        assert split_sentences("") == [0]
+        assert "".join(_sentences("a. b.\n\nc")) == "a. b.\n\nc"
+
+
+class TestSentenceMap:
+    """SentenceMap のテスト"""
+
+    TEXT = "週末は登山に行った。MCPサーバーの設計を見直した。APIの境界も決めた。"
+
+    @pytest.mark.unit
+    def test_byte_boundaries_follow_encoding(self) -> None:
+        sentence_map = SentenceMap.build(self.TEXT, _utf8_length, offset=5)
+        data = b"xxxxx" + self.TEXT.encode("utf-8")
+
+        start, end = sentence_map.byte_range(1, 1)
+
+        assert data[start:end].decode("utf-8") == "MCPサーバーの設計を見直した。"
+
+    @pytest.mark.unit
+    def test_candidates_have_no_false_negatives(self) -> None:
+        sentence_map = SentenceMap.build(self.TEXT, _utf8_length)
+
+        candidates = sentence_map.candidates(query_terms("MCP 設計"), limit=3)
+
+        assert candidates[0] == (1, 2)
+
+    @pytest.mark.unit
+    def test_round_trip(self) -> None:
+        sentence_map = SentenceMap.build(self.TEXT, _utf8_length)
+        assert SentenceMap.from_dict(sentence_map.to_dict()) == sentence_map
+
+
+class TestMatching:
+    """query_terms() / match_count() / highlight_spans() のテスト"""
+
+    @pytest.mark.unit
+    def test_match_count_counts_distinct_terms(self) -> None:
+        terms = query_terms("MCP 設計")
+        assert match_count("MCPとMCPの話", terms) == 1
+        assert match_count("MCPサーバーの設計", terms) == 2
+
+    @pytest.mark.unit
+    def test_latin_terms_match_whole_words(self) -> None:
+        assert highlight_spans("Use api, not rapid", query_terms("API")) == [(4, 7)]
+
+    @pytest.mark.unit
+    def test_overlapping_spans_are_merged(self) -> None:
+        assert highlight_spans("設計書を書く", query_terms("設計書")) == [(0, 3)]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+domain/tfidf.py のテスト
+========================
+
+トークン化、特徴ハッシング、TF-IDFベクトルの正規化を検証。
+"""
+
+import math
+
+import pytest
+
+from domain.tfidf import (
+    VECTOR_DIM,
+    idf,
+    idf_weights,
+    term_buckets,
+    tf_vector,
+    tfidf_vector,
+    tokenize,
+)
+
+
+class TestTokenize:
+    """トークン化"""
+
+    @pytest.mark.unit
+    def test_ascii_words_and_cjk_bigrams(self) -> None:
+        assert list(tokenize("MCPの設計 API")) == ["mcp", "の設", "設計", "api"]
+
+    @pytest.mark.unit
+    def test_punctuation_dropped_and_single_char_kept(self) -> None:
+        assert list(tokenize("雨。")) == ["雨"]
+        assert list(tokenize("  ")) == []
+
+
+class TestTfidfVector:
+    """TF-IDFベクトル"""
+
+    @pytest.mark.unit
+    def test_buckets_within_dimension(self) -> None:
+        counts = term_buckets("設計設計設計 MCP")
+        assert all(0 <= b < VECTOR_DIM for b in counts)
+        assert sum(counts.values()) == 6
+
+    @pytest.mark.unit
+    def test_vector_is_unit_length(self) -> None:
+        vector = tfidf_vector(term_buckets("MCPサーバーの設計"), [0] * VECTOR_DIM, 0)
+        assert len(vector) == VECTOR_DIM
+        assert math.isclose(sum(v * v for v in vector), 1.0, rel_tol=1e-9)
+
+    @pytest.mark.unit
+    def test_empty_text_is_zero_vector(self) -> None:
+        assert not any(tfidf_vector(term_buckets(""), [0] * VECTOR_DIM, 0))
+
+    @pytest.mark.unit
+    def test_common_terms_weigh_less(self) -> None:
+        assert idf(df=9, n_docs=10) < idf(df=1, n_docs=10)
+
+    @pytest.mark.unit
+    def test_tf_vector_weighted_by_idf_matches_tfidf(self) -> None:
+        """保存用のTFベクトルに検索時のIDFを掛けるとTF-IDFと同じ向きになる"""
+        counts = term_buckets("MCPサーバーの設計 MCP")
+        df = [i % 3 for i in range(VECTOR_DIM)]
+        weighted = [t * w for t, w in zip(tf_vector(counts), idf_weights(df, 5))]
+        norm = math.sqrt(sum(v * v for v in weighted))
+        assert [v / norm for v in weighted] == pytest.approx(tfidf_vector(counts, df, 5))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+domain/timeline_index.py のテスト
+=================================
+
+TimelineIndex の記録・期間クエリ・永続化形式を検証。
+"""
+
+import pytest
+
+from domain.timeline_index import TIMELINE_FORMAT_VERSION, TimelineIndex, normalize_range_end
+
+
+@pytest.fixture
+def index() -> TimelineIndex:
+    index = TimelineIndex()
+    index.record("loop", "L00001", "2025-02-27T10:00:00")
+    index.record("loop", "L00002", "2025-03-02T10:00:00")
+    index.record("loop", "L00003", "2025-03-15T10:00:00")
+    index.record("loop", "L00004", "2025-04-02T10:00:00")
+    index.record("weekly", "W0001", "2025-03-03T09:00:00", start="2025-02-27T10:00:00")
+    index.record("weekly", "W0002", "2025-04-03T09:00:00", start="2025-03-15T10:00:00")
+    return index
+
+
+class TestTimelineIndexQuery:
+    """query() のテスト"""
+
+    @pytest.mark.unit
+    def test_query_returns_covering_entries_per_level(self, index: TimelineIndex) -> None:
+        """期間と重なるエントリをレベル別に返す"""
+        result = index.query("2025-03-01", "2025-03-31")
+        assert result["loop"] == ["L00002", "L00003"]
+        assert result["weekly"] == ["W0001", "W0002"]
+
+    @pytest.mark.unit
+    def test_date_only_end_includes_whole_day(self, index: TimelineIndex) -> None:
+        """日付のみの終端はその日全体を含む"""
+        assert index.query("2025-03-15", "2025-03-15")["loop"] == ["L00003"]
+
+    @pytest.mark.unit
+    def test_partial_overlap_selects_minimal_digest_set(self, index: TimelineIndex) -> None:
+        """期間の一部だけと重なるダイジェストのみ返す"""
+        result = index.query("2025-04-01", "2025-04-30")
+        assert result == {"loop": ["L00004"], "weekly": ["W0002"]}
+
+    @pytest.mark.unit
+    def test_empty_range_omits_levels(self, index: TimelineIndex) -> None:
+        """該当なしのレベルは結果に含まない"""
+        assert index.query("2024-01-01", "2024-12-31") == {}
+
+
+class TestTimelineIndexRecord:
+    """record() / span_of() のテスト"""
+
+    @pytest.mark.unit
+    def test_rerecord_replaces_entry(self, index: TimelineIndex) -> None:
+        """同一IDの再記録は置き換え"""
+        index.record("loop", "L00001", "2025-05-01T00:00:00")
+        assert index.span_of("loop", "L00001") == ("2025-05-01T00:00:00", "2025-05-01T00:00:00")
+        assert "loop" not in index.query("2025-02-01", "2025-02-28")
+
+    @pytest.mark.unit
+    def test_out_of_order_record_kept_sorted(self) -> None:
+        """記録順に関係なく時刻順に並ぶ"""
+        index = TimelineIndex()
+        index.record("loop", "L00002", "2025-03-02T00:00:00")
+        index.record("loop", "L00001", "2025-03-01T00:00:00")
+        assert index.query("2025-03-01", "2025-03-02")["loop"] == ["L00001", "L00002"]
+
+    @pytest.mark.unit
+    def test_entry_starting_before_earlier_ends_is_found(self) -> None:
+        """end順で後ろにあっても、早く始まるエントリを取りこぼさない"""
+        index = TimelineIndex()
+        index.record("weekly", "W1", "2025-06-01T00:00:00", start="2025-01-01T00:00:00")
+        index.record("weekly", "W2", "2025-06-02T00:00:00", start="2025-05-01T00:00:00")
+        index.record("weekly", "W3", "2025-06-03T00:00:00", start="2025-01-10T00:00:00")
+
+        assert index.query("2025-01-01", "2025-01-31")["weekly"] == ["W1", "W3"]
+        restored = TimelineIndex.from_dict(index.to_dict())
+        assert restored.query("2025-01-01", "2025-01-31")["weekly"] == ["W1", "W3"]
+
+    @pytest.mark.unit
+    def test_bulk_record_then_query(self) -> None:
+        """置き換えを含む大量の記録後もクエリ結果が時刻順で正しい"""
+        index = TimelineIndex()
+        for i in range(2000):
+            index.record("loop", f"L{i:05d}", f"2025-01-01T{i // 60 % 24:02d}:{i % 60:02d}:00")
+        index.record("loop", "L00000", "2025-02-01T00:00:00")
+
+        assert index.query("2025-02-01", "2025-02-01") == {"loop": ["L00000"]}
+        assert len(index.query("2025-01-01", "2025-01-01")["loop"]) == 1999
+
+    @pytest.mark.unit
+    def test_earliest_start_ignores_unknown_ids(self, index: TimelineIndex) -> None:
+        """未記録のIDは開始時刻の算出から除外"""
+        assert index.earliest_start("loop", ["L00003", "L09999"]) == "2025-03-15T10:00:00"
+        assert index.earliest_start("loop", ["L09999"]) is None
+
+
+class TestTimelineIndexSerialization:
+    """to_dict() / from_dict() のテスト"""
+
+    @pytest.mark.unit
+    def test_round_trip(self, index: TimelineIndex) -> None:
+        restored = TimelineIndex.from_dict(index.to_dict())
+        assert restored.query("2025-03-01", "2025-03-31") == index.query("2025-03-01", "2025-03-31")
+
+    @pytest.mark.unit
+    def test_unknown_version_yields_empty_index(self, index: TimelineIndex) -> None:
+        data = index.to_dict()
+        data["format_version"] = TIMELINE_FORMAT_VERSION + 1
+        assert TimelineIndex.from_dict(data).query("2025-01-01", "2025-12-31") == {}
+
+
+@pytest.mark.unit
+def test_normalize_range_end() -> None:
+    assert normalize_range_end("2025-03-31") == "2025-03-31T23:59:59.999999"
+    assert normalize_range_end("2025-03-31T12:00:00") == "2025-03-31T12:00:00"
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+スキーマコンパイラのテスト
+==========================
+
+テスト対象：domain/types/schema.py の compile_schema
+責任範囲：TypedDict から作った検証関数の判定とエラーメッセージ
+"""
+
+from typing import Dict, List, Optional, TypedDict
+
+import pytest
+
+from domain.types import (
+    IndividualDigestData,
+    ProvisionalDigestFile,
+    RegularDigestData,
+    ShadowLevelData,
+    compile_schema,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _individual(**overrides: object) -> Dict[str, object]:
+    entry: Dict[str, object] = {
+        "source_file": "L00001_test.txt",
+        "digest_type": "開発",
+        "keywords": ["MCP", "API"],
+        "abstract": {"long": "長い要約", "short": "短い要約"},
+        "impression": {"long": "長い所感", "short": "短い所感"},
+    }
+    entry.update(overrides)
+    return entry
+
+
+class TestCompileSchema:
+    """compile_schema() のテスト"""
+
+    def test_regular_digest_is_valid(self) -> None:
+        """個別の abstract / impression が文字列に正規化されたRegularDigestは適合する"""
+        digest = {
+            "metadata": {"digest_level": "weekly", "digest_number": "0001", "version": "1.0"},
+            "overall_digest": {
+                "name": "W0001_テスト",
+                "source_files": ["L00001_test.txt"],
+                "keywords": ["MCP"],
+                "abstract": "要約",
+            },
+            "individual_digests": [_individual(abstract="短い要約", impression="短い所感")],
+        }
+        assert compile_schema(RegularDigestData)(digest) == []
+
+    def test_provisional_file_is_valid(self) -> None:
+        """{long, short} 形式のProvisionalファイルは適合する"""
+        data = {"metadata": {"digest_level": "weekly"}, "individual_digests": [_individual()]}
+        assert compile_schema(ProvisionalDigestFile)(data) == []
+
+    def test_reports_paths_of_errors(self) -> None:
+        """エラーは入れ子のパス付きで報告される"""
+        data = {
+            "metadata": {"source_count": "3"},
+            "overall_digest": {"keywords": ["MCP", 1]},
+            "individual_digests": [_individual(), _individual(abstract={"long": "x"})],
+        }
+
+        errors = compile_schema(RegularDigestData)(data)
+
+        assert errors == [
+            "metadata.source_count: expected int, got str",
+            "overall_digest.keywords[1]: expected str, got int",
+            "individual_digests[1].abstract.short: missing",
+        ]
+
+    def test_missing_required_keys(self) -> None:
+        """必須キーの欠落を報告し、total=False のキーは任意扱い"""
+        errors = compile_schema(RegularDigestData)({"overall_digest": {}})
+        assert errors == ["metadata: missing", "individual_digests: missing"]
+
+    def test_not_an_object(self) -> None:
+        """ルートや要素がオブジェクトでない場合"""
+        check = compile_schema(RegularDigestData)
+        assert check([]) == ["$: expected object, got list"]
+        errors = check({"metadata": {}, "overall_digest": {}, "individual_digests": ["x"]})
+        assert errors == ["individual_digests[0]: expected object, got str"]
+
+    def test_bool_is_not_int(self) -> None:
+        """bool は int として扱わない"""
+        errors = compile_schema(ProvisionalDigestFile)(
+            {"metadata": {"source_count": True}, "individual_digests": []}
+        )
+        assert errors == ["metadata.source_count: expected int, got bool"]
+
+    def test_optional_accepts_none(self) -> None:
+        """Optional のフィールドは None を受け付ける"""
+        check = compile_schema(ShadowLevelData)
+        assert check({"overall_digest": None, "individual_digests": []}) == []
+        assert check({"overall_digest": "x"}) == ["overall_digest: expected object, got str"]
+
+    def test_long_short_text_accepts_string(self) -> None:
+        """LongShortText のフィールドは文字列も受け付ける"""
+        check = compile_schema(IndividualDigestData)
+        assert check(_individual(abstract="要約", impression="所感")) == []
+        assert check(_individual(abstract=3)) == ["abstract: expected object, got int"]
+
+    def test_dict_values_are_checked(self) -> None:
+        """Dict[str, X] の値を検証する"""
+
+        class Scores(TypedDict):
+            scores: Dict[str, List[float]]
+            note: Optional[str]
+
+        check = compile_schema(Scores)
+        assert check({"scores": {"a": [1, 2.5]}, "note": None}) == []
+        assert check({"scores": {"a": [True]}, "note": 1}) == [
+            "scores.a[0]: expected float, got bool",
+            "note: expected str, got int",
+        ]
+
+    def test_compiled_once(self) -> None:
+        """同じ型は同じ検証関数を返す"""
+        assert compile_schema(RegularDigestData) is compile_schema(RegularDigestData)
+
+    def test_rejects_non_typeddict(self) -> None:
+        """TypedDict 以外は TypeError"""
+        with pytest.raises(TypeError):
+            compile_schema(dict)
+
+    def test_rejects_unsupported_type(self) -> None:
+        """未対応の型ヒントは TypeError"""
+
+        class Unsupported(TypedDict):
+            value: set
+
+        with pytest.raises(TypeError, match="unsupported schema type"):
+            compile_schema(Unsupported)
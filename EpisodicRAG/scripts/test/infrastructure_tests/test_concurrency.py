@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+infrastructure/concurrency.py のテスト
+======================================
+"""
+
+import threading
+import time
+
+import pytest
+
+from infrastructure.concurrency import TIMEOUT_ERROR, run_with_timeouts
+
+
+class TestRunWithTimeouts:
+    """run_with_timeouts tests"""
+
+    @pytest.mark.unit
+    def test_results_and_errors(self) -> None:
+        def fail() -> None:
+            raise ValueError("broken store")
+
+        results, errors = run_with_timeouts({"a": (lambda: 1, 1.0), "b": (fail, 1.0)})
+
+        assert results == {"a": 1}
+        assert errors == {"b": "broken store"}
+        assert run_with_timeouts({}) == ({}, {})
+
+    @pytest.mark.unit
+    def test_slow_task_does_not_stall_others(self) -> None:
+        release = threading.Event()
+
+        started = time.monotonic()
+        results, errors = run_with_timeouts(
+            {"slow": (lambda: release.wait(5), 0.1), "fast": (lambda: "ok", 1.0)}
+        )
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert results == {"fast": "ok"}
+        assert errors == {"slow": TIMEOUT_ERROR}
+        assert elapsed < 1.0
+
+    @pytest.mark.unit
+    def test_queued_task_clock_starts_when_picked_up(self) -> None:
+        """詰まったタスクの後ろに並んだタスクは、開始してから制限時間を数える"""
+        release = threading.Event()
+
+        results, errors = run_with_timeouts(
+            {"stuck": (lambda: release.wait(5), 0.2), "queued": (lambda: 1, 0.1)},
+            max_workers=1,
+        )
+        release.set()
+
+        assert results == {"queued": 1}
+        assert errors == {"stuck": TIMEOUT_ERROR}
+
+    @pytest.mark.unit
+    def test_queued_task_times_out_after_start(self) -> None:
+        """開始後に制限時間を過ぎたタスクは打ち切る"""
+        release = threading.Event()
+
+        results, errors = run_with_timeouts(
+            {"stuck": (lambda: release.wait(5), 0.1), "queued": (lambda: release.wait(5), 0.1)},
+            max_workers=1,
+        )
+        release.set()
+
+        assert results == {}
+        assert errors == {"stuck": TIMEOUT_ERROR, "queued": TIMEOUT_ERROR}
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+infrastructure/derived_data.py のテスト
+=======================================
+
+派生データの更新ヘルパー（失敗を警告にして本処理を止めない）を検証。
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from domain.exceptions import FileIOError
+from infrastructure.derived_data import DerivedUpdate, update_json_index
+
+
+class _Counter:
+    def __init__(self, count: int = 0) -> None:
+        self.count = count
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_Counter":
+        return cls(int(data.get("count", 0)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count}
+
+    def bump(self) -> None:
+        self.count += 1
+
+
+class TestDerivedUpdate:
+    """DerivedUpdate のテスト"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("error", [FileIOError("disk full"), OSError("disk full")])
+    def test_io_error_is_warned_and_suppressed(self, error: Exception, caplog: Any) -> None:
+        with DerivedUpdate("index.json") as update:
+            raise error
+        assert update.failed
+        assert "index.jsonの更新に失敗" in caplog.text
+
+    @pytest.mark.unit
+    def test_extra_errors_are_suppressed(self) -> None:
+        with DerivedUpdate("index.json", UnicodeDecodeError) as update:
+            b"\xff".decode("utf-8")
+        assert update.failed
+
+    @pytest.mark.unit
+    def test_other_errors_propagate(self) -> None:
+        with pytest.raises(KeyError), DerivedUpdate("index.json"):
+            raise KeyError("bug")
+
+    @pytest.mark.unit
+    def test_success_is_not_failed(self) -> None:
+        with DerivedUpdate("index.json") as update:
+            pass
+        assert not update.failed
+
+
+class TestUpdateJsonIndex:
+    """update_json_index() のテスト"""
+
+    @pytest.mark.unit
+    def test_loads_mutates_and_saves(self, tmp_path: Path) -> None:
+        path = tmp_path / "counter.json"
+        assert update_json_index(path, _Counter.from_dict, _Counter.bump) is not None
+        index = update_json_index(path, _Counter.from_dict, _Counter.bump)
+        assert index is not None and index.count == 2
+        assert json.loads(path.read_text(encoding="utf-8")) == {"count": 2}
+
+    @pytest.mark.unit
+    def test_unchanged_index_is_not_rewritten(self, tmp_path: Path) -> None:
+        path = tmp_path / "counter.json"
+        update_json_index(path, _Counter.from_dict, _Counter.bump)
+        mtime_ns = path.stat().st_mtime_ns
+        calls: List[int] = []
+        update_json_index(path, _Counter.from_dict, lambda c: calls.append(c.count))
+        assert calls == [1]
+        assert path.stat().st_mtime_ns == mtime_ns
+
+    @pytest.mark.unit
+    def test_save_failure_returns_none(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        assert (
+            update_json_index(blocker / "counter.json", _Counter.from_dict, _Counter.bump) is None
+        )
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+infrastructure/file_hashing.py のテスト
+=======================================
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from infrastructure.file_hashing import hash_file, hash_files
+
+
+class TestFileHashing:
+    """hash_file / hash_files tests"""
+
+    @pytest.mark.unit
+    def test_streamed_hash_matches_whole_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "L00001.txt"
+        data = "会話ログ".encode("utf-8") * 5000
+        path.write_bytes(data)
+
+        expected = hashlib.blake2b(data, digest_size=16).hexdigest()
+        assert hash_file(path, chunk_size=1000) == expected
+        assert hash_file(path) == expected
+
+    @pytest.mark.unit
+    def test_hash_files_parallel_and_missing(self, tmp_path: Path) -> None:
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"L{i:05d}.txt"
+            path.write_text(f"loop {i}", encoding="utf-8")
+            paths.append(path)
+        missing = tmp_path / "missing.txt"
+
+        result = hash_files([*paths, missing], max_workers=3)
+
+        assert result[missing] is None
+        assert [result[p] for p in paths] == [hash_file(p) for p in paths]
+        assert len(set(result[p] for p in paths)) == 5
+
+    @pytest.mark.unit
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            hash_file(tmp_path / "missing.txt")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+infrastructure/file_lock.py のテスト
+====================================
+
+fcntl.flock による共有・排他ロックと、複数プロセスから同時に
+ShadowGrandDigest.txt / last_digest_times.json を更新したときに更新が失われないことを検証。
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from domain.exceptions import FileIOError
+from infrastructure.file_lock import (
+    LOCK_DIRNAME,
+    fcntl,
+    file_lock,
+    level_lock,
+    level_lock_path,
+    lock_path_for,
+)
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="fcntl is POSIX only")
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2]
+
+
+def _hold_in_thread(lock, ready: threading.Event, release: threading.Event) -> threading.Thread:
+    """別スレッドでロックを取り、release されるまで保持する"""
+
+    def hold() -> None:
+        with lock():
+            ready.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold, daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    return thread
+
+
+class TestLockPaths:
+    """ロックファイルの配置"""
+
+    @pytest.mark.unit
+    def test_file_lock_is_next_to_target(self, tmp_path: Path) -> None:
+        target = tmp_path / "Essences" / "ShadowGrandDigest.txt"
+        assert lock_path_for(target) == target.parent / LOCK_DIRNAME / "ShadowGrandDigest.txt.lock"
+
+    @pytest.mark.unit
+    def test_level_lock_is_per_level(self, tmp_path: Path) -> None:
+        assert level_lock_path(tmp_path, "weekly") != level_lock_path(tmp_path, "monthly")
+
+    @pytest.mark.unit
+    def test_lock_directory_is_created(self, tmp_path: Path) -> None:
+        target = tmp_path / "missing" / "data.json"
+        with file_lock(target):
+            assert lock_path_for(target).exists()
+        assert not target.exists()
+
+
+class TestFileLock:
+    """共有・排他の判定と再入"""
+
+    @pytest.mark.unit
+    def test_exclusive_blocks_other_thread(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.json"
+        ready, release = threading.Event(), threading.Event()
+        thread = _hold_in_thread(lambda: file_lock(target), ready, release)
+        try:
+            with pytest.raises(FileIOError, match="exclusive lock"):
+                with file_lock(target, timeout=0.05):
+                    pass
+            with pytest.raises(FileIOError, match="shared lock"):
+                with file_lock(target, shared=True, timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            thread.join(5)
+        with file_lock(target, timeout=1):
+            pass
+
+    @pytest.mark.unit
+    def test_shared_locks_do_not_block_each_other(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.json"
+        ready, release = threading.Event(), threading.Event()
+        thread = _hold_in_thread(lambda: file_lock(target, shared=True), ready, release)
+        try:
+            with file_lock(target, shared=True, timeout=0.5):
+                pass
+            with pytest.raises(FileIOError):
+                with file_lock(target, timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            thread.join(5)
+
+    @pytest.mark.unit
+    def test_reentrant_in_same_thread(self, tmp_path: Path) -> None:
+        """排他ロック中は同じスレッドから排他・共有のどちらも取り直せる"""
+        target = tmp_path / "data.json"
+        with file_lock(target, timeout=0.05):
+            with file_lock(target, timeout=0.05):
+                with file_lock(target, shared=True, timeout=0.05):
+                    pass
+            # 内側を抜けても外側のロックは保持されたまま
+            ready = threading.Event()
+            result = []
+
+            def try_lock() -> None:
+                try:
+                    with file_lock(target, timeout=0.05):
+                        result.append("acquired")
+                except FileIOError:
+                    result.append("blocked")
+                ready.set()
+
+            threading.Thread(target=try_lock, daemon=True).start()
+            assert ready.wait(5)
+            assert result == ["blocked"]
+
+    @pytest.mark.unit
+    def test_upgrade_is_rejected(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.json"
+        with file_lock(target, shared=True):
+            with pytest.raises(RuntimeError, match="upgrade"):
+                with file_lock(target):
+                    pass
+
+    @pytest.mark.unit
+    def test_released_on_exception(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.json"
+        with pytest.raises(ValueError):
+            with file_lock(target):
+                raise ValueError("boom")
+
+        ready, release = threading.Event(), threading.Event()
+        thread = _hold_in_thread(lambda: file_lock(target, timeout=0.5), ready, release)
+        release.set()
+        thread.join(5)
+
+
+class TestLevelLock:
+    """レベル単位のロック"""
+
+    @pytest.mark.unit
+    def test_other_levels_and_shadow_reads_are_not_blocked(self, tmp_path: Path) -> None:
+        """weekly のProvisional保存中でも、monthly の処理とShadowの読み込みは待たない"""
+        digests = tmp_path / "Digests"
+        shadow = tmp_path / "Essences" / "ShadowGrandDigest.txt"
+        ready, release = threading.Event(), threading.Event()
+        thread = _hold_in_thread(lambda: level_lock(digests, "weekly"), ready, release)
+        try:
+            with level_lock(digests, "monthly", timeout=0.05):
+                pass
+            with file_lock(shadow, shared=True, timeout=0.05):
+                pass
+            with pytest.raises(FileIOError):
+                with level_lock(digests, "weekly", timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            thread.join(5)
+
+
+# =============================================================================
+# 複数プロセスからの同時更新
+# =============================================================================
+
+_SHADOW_WRITER = """
+import sys
+from pathlib import Path
+
+from application.shadow.shadow_io import ShadowIO
+
+path, name, count = Path(sys.argv[1]), sys.argv[2], int(sys.argv[3])
+shadow_io = ShadowIO(path, lambda: {"metadata": {}, "latest_digests": {"weekly": []}})
+for i in range(count):
+    with shadow_io.locked():
+        data = shadow_io.load_or_create()
+        data["latest_digests"]["weekly"].append(f"{name}-{i}")
+        shadow_io.save(data)
+"""
+
+_TIMES_WRITER = """
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+path, level, count = Path(sys.argv[1]), sys.argv[2], int(sys.argv[3])
+with patch(
+    "application.tracking.digest_times.get_persistent_config_dir", return_value=path.parent
+), patch("application.tracking.digest_times.get_template_dir", return_value=None):
+    from application.tracking.digest_times import DigestTimesTracker
+
+    tracker = DigestTimesTracker(MagicMock())
+    for i in range(1, count + 1):
+        tracker.update_direct(level, i)
+"""
+
+
+def _run_writers(script: str, args_list: list) -> None:
+    env = {**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)}
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, *args],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        for args in args_list
+    ]
+    for proc in procs:
+        _, stderr = proc.communicate(timeout=120)
+        assert proc.returncode == 0, stderr.decode("utf-8", "replace")
+
+
+class TestConcurrentWriters:
+    """並列プロセスの読み込み → 変更 → 保存で更新が失われない"""
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_shadow_updates_are_not_lost(self, tmp_path: Path) -> None:
+        shadow = tmp_path / "ShadowGrandDigest.txt"
+        writers, count = 4, 100
+
+        _run_writers(_SHADOW_WRITER, [[str(shadow), f"w{n}", str(count)] for n in range(writers)])
+
+        entries = json.loads(shadow.read_text(encoding="utf-8"))["latest_digests"]["weekly"]
+        expected = {f"w{n}-{i}" for n in range(writers) for i in range(count)}
+        assert len(entries) == writers * count
+        assert set(entries) == expected
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_times_updates_for_other_levels_are_not_lost(self, tmp_path: Path) -> None:
+        """レベルごとに別プロセスが更新しても、どのレベルの最終値も残る"""
+        times = tmp_path / "last_digest_times.json"
+        levels, count = ["weekly", "monthly", "quarterly", "annual"], 60
+
+        _run_writers(_TIMES_WRITER, [[str(times), level, str(count)] for level in levels])
+
+        data = json.loads(times.read_text(encoding="utf-8"))
+        assert {level: data[level]["last_processed"] for level in levels} == {
+            level: count for level in levels
+        }
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+infrastructure/fs_watcher.py のテスト
+=====================================
+"""
+
+from pathlib import Path
+
+import pytest
+
+from infrastructure.fs_watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_watcher,
+    inotify_available,
+)
+
+
+class TestPollingWatcher:
+    """PollingWatcher tests"""
+
+    @pytest.mark.unit
+    def test_detects_create_modify_delete(self, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        existing = tmp_path / "sub" / "a.txt"
+        existing.write_text("a", encoding="utf-8")
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+
+        assert watcher.poll(timeout=0) == set()
+
+        created = tmp_path / "b.txt"
+        created.write_text("b", encoding="utf-8")
+        existing.write_text("changed", encoding="utf-8")
+        assert watcher.poll(timeout=1.0) == {created, existing}
+
+        created.unlink()
+        assert watcher.poll(timeout=1.0) == {created}
+
+    @pytest.mark.unit
+    def test_missing_root_is_empty(self, tmp_path: Path) -> None:
+        watcher = PollingWatcher([tmp_path / "missing"], interval=0.01)
+        assert watcher.poll(timeout=0) == set()
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify is not available")
+class TestInotifyWatcher:
+    """InotifyWatcher tests (Linux only)"""
+
+    @pytest.mark.unit
+    def test_detects_files_in_new_subdirectories(self, tmp_path: Path) -> None:
+        with InotifyWatcher([tmp_path]) as watcher:
+            loop_file = tmp_path / "L00001_a.txt"
+            loop_file.write_text("a", encoding="utf-8")
+            assert loop_file in watcher.poll(timeout=1.0)
+
+            sub_dir = tmp_path / "1_Weekly"
+            sub_dir.mkdir()
+            assert sub_dir in watcher.poll(timeout=1.0)
+            digest = sub_dir / "W0001_a.txt"
+            digest.write_text("{}", encoding="utf-8")
+            assert digest in watcher.poll(timeout=1.0)
+
+            assert watcher.poll(timeout=0.01) == set()
+
+
+class TestCreateWatcher:
+    """create_watcher tests"""
+
+    @pytest.mark.unit
+    def test_backends(self, tmp_path: Path) -> None:
+        expected = "inotify" if inotify_available() else "poll"
+        with create_watcher([tmp_path]) as watcher:
+            assert watcher.backend == expected
+        assert create_watcher([tmp_path], backend="poll").backend == "poll"
+        with pytest.raises(ValueError):
+            create_watcher([tmp_path], backend="fsevents")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+infrastructure/json_repository/cache.py のテスト
+================================================
+
+(パス, st_mtime_ns, st_size) をキーにした読み込みキャッシュと、
+save_json / load_json 系からの利用を検証。
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.exceptions import FileIOError
+from domain.loop_manifest import RACY_WINDOW_NS
+from infrastructure.json_repository import (
+    JsonFileCache,
+    get_json_cache,
+    load_json,
+    load_json_with_template,
+    save_json,
+    try_load_json,
+)
+from infrastructure.json_repository.codec import loads
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """mtime を過去にずらして racy でないファイルにする"""
+    past = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+class TestJsonFileCache:
+    """JsonFileCache のテスト"""
+
+    @pytest.mark.unit
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.json"
+        path.write_text('{"a": [1, 2]}', encoding="utf-8")
+        _age(path)
+        cache = JsonFileCache()
+        parse = MagicMock(side_effect=loads)
+
+        assert cache.load(path, parse) == {"a": [1, 2]}
+        assert cache.load(path, parse) == {"a": [1, 2]}
+
+        assert parse.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_handout_is_a_copy(self, tmp_path: Path) -> None:
+        """呼び出し側が書き換えてもキャッシュは変わらない"""
+        path = tmp_path / "data.json"
+        path.write_text('{"a": {"b": [1]}}', encoding="utf-8")
+        cache = JsonFileCache()
+
+        first = cache.load(path, loads)
+        first["a"]["b"].append(2)
+        first["c"] = 3
+
+        assert cache.load(path, loads) == {"a": {"b": [1]}}
+
+    @pytest.mark.unit
+    def test_changed_size_is_reloaded(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}', encoding="utf-8")
+        cache = JsonFileCache()
+        cache.load(path, loads)
+
+        path.write_text('{"a": 10}', encoding="utf-8")
+
+        assert cache.load(path, loads) == {"a": 10}
+        assert cache.hits == 0
+
+    @pytest.mark.unit
+    def test_racy_entry_compares_content(self, tmp_path: Path) -> None:
+        """同じ mtime・同じサイズの書き換えも、racy なエントリなら検出する"""
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}', encoding="utf-8")
+        cache = JsonFileCache()
+        cache.load(path, loads)
+        stat = path.stat()
+
+        path.write_text('{"a": 2}', encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.load(path, loads) == {"a": 2}
+
+    @pytest.mark.unit
+    def test_old_entry_is_trusted_by_stat(self, tmp_path: Path) -> None:
+        """mtime が窓より古いエントリは本文を保持しない"""
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}', encoding="utf-8")
+        _age(path, seconds=RACY_WINDOW_NS // 1_000_000_000 + 10)
+        cache = JsonFileCache()
+        cache.load(path, loads)
+
+        entry = next(iter(cache._entries.values()))
+        assert entry.text is None
+
+    @pytest.mark.unit
+    def test_errors_are_not_cached(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.json"
+        path.write_text("{broken", encoding="utf-8")
+        cache = JsonFileCache()
+
+        with pytest.raises(json.JSONDecodeError):
+            cache.load(path, loads)
+        path.unlink()
+        with pytest.raises(FileNotFoundError):
+            cache.load(path, loads)
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_least_recently_used_entry_is_evicted(self, tmp_path: Path) -> None:
+        cache = JsonFileCache(max_entries=2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps({name: 1}), encoding="utf-8")
+            paths.append(path)
+
+        cache.load(paths[0], loads)
+        cache.load(paths[1], loads)
+        cache.load(paths[0], loads)
+        cache.load(paths[2], loads)
+
+        assert sorted(Path(key).name for key in cache._entries) == ["a.json", "c.json"]
+
+    @pytest.mark.unit
+    def test_non_object_is_not_cached(self, tmp_path: Path) -> None:
+        path = tmp_path / "list.json"
+        path.write_text("[1, 2]", encoding="utf-8")
+        cache = JsonFileCache()
+
+        assert cache.load(path, loads) == [1, 2]
+        assert len(cache) == 0
+
+
+class TestJsonRepositoryCache:
+    """save_json / load_json 系とキャッシュの連携"""
+
+    @pytest.mark.integration
+    def test_save_json_updates_cache_in_place(self, tmp_path: Path) -> None:
+        """save_json の直後の読み込みはパースしない"""
+        path = tmp_path / "data.json"
+        data = {"weekly": {"last_processed": 3}}
+
+        save_json(path, data)
+        data["weekly"]["last_processed"] = 4  # 保存後の書き換えはキャッシュに影響しない
+
+        assert load_json(path) == {"weekly": {"last_processed": 3}}
+        assert (get_json_cache().hits, get_json_cache().misses) == (1, 0)
+
+    @pytest.mark.integration
+    def test_values_that_do_not_round_trip_are_not_cached(self, tmp_path: Path) -> None:
+        """タプルや非文字列キーは読み直した値を返す"""
+        path = tmp_path / "data.json"
+
+        save_json(path, {"pair": (1, 2), "keys": {1: "a"}})
+
+        assert load_json(path) == {"pair": [1, 2], "keys": {"1": "a"}}
+        assert get_json_cache().hits == 0
+
+    @pytest.mark.integration
+    def test_deleted_file_is_not_served_from_cache(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.json"
+        save_json(path, {"a": 1})
+        path.unlink()
+
+        assert try_load_json(path, default={}) == {}
+        with pytest.raises(FileIOError):
+            load_json(path)
+
+    @pytest.mark.integration
+    def test_template_loader_reuses_cache(self, tmp_path: Path) -> None:
+        """load_json_with_template の2回目以降は stat だけで返す"""
+        path = tmp_path / "times.json"
+
+        created = load_json_with_template(path, default_factory=lambda: {"loop": {"n": 1}})
+        created["loop"]["n"] = 2
+        reloaded = load_json_with_template(path, default_factory=lambda: {})
+
+        assert reloaded == {"loop": {"n": 1}}
+        assert get_json_cache().hits == 1
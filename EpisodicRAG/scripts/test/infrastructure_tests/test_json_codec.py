@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+infrastructure/json_repository/codec.py のテスト
+================================================
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from domain.file_constants import DIGEST_TIMES_FILENAME, GRAND_DIGEST_FILENAME
+from infrastructure.json_repository import (
+    COMPACT,
+    PRETTY,
+    codec_for,
+    load_json,
+    save_json,
+    save_json_if_changed,
+)
+from infrastructure.json_repository.codec import loads
+
+
+class TestJsonCodec:
+    """JsonCodec / codec_for tests"""
+
+    @pytest.mark.unit
+    def test_formats(self) -> None:
+        data = {"名前": "テスト", "values": [1, 2]}
+
+        assert COMPACT.dumps(data) == '{"名前":"テスト","values":[1,2]}'
+        assert PRETTY.dumps(data) == json.dumps(data, ensure_ascii=False, indent=2)
+        assert COMPACT.loads(PRETTY.dumps(data)) == data
+
+    @pytest.mark.unit
+    def test_loads_matches_stdlib(self) -> None:
+        assert loads('{"a": NaN, "b": 1.5}')["b"] == 1.5
+        with pytest.raises(json.JSONDecodeError):
+            loads("{broken")
+
+    @pytest.mark.unit
+    def test_codec_for_file_names(self) -> None:
+        assert codec_for(Path(DIGEST_TIMES_FILENAME)) is COMPACT
+        assert codec_for(Path(GRAND_DIGEST_FILENAME)) == PRETTY
+        assert codec_for(Path("other.json"), indent=4).indent == 4
+
+    @pytest.mark.integration
+    def test_save_json_uses_registered_codec(self, tmp_path: Path) -> None:
+        times_file = tmp_path / DIGEST_TIMES_FILENAME
+        data = {"weekly": {"timestamp": "", "last_processed": 3}}
+
+        save_json(times_file, data)
+
+        assert "\n" not in times_file.read_text(encoding="utf-8")
+        assert load_json(times_file) == data
+        assert save_json_if_changed(times_file, data) is False
+        save_json(times_file, data, codec=PRETTY)
+        assert times_file.read_text(encoding="utf-8") == PRETTY.dumps(data)
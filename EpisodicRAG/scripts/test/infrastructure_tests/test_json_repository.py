@@ -20,6 +20,8 @@ from infrastructure.json_repository import (
     load_json,
     load_json_with_template,
     save_json,
+    save_json_if_changed,
+    save_json_stamped,
     try_load_json,
     try_read_json_from_file,
 )
@@ -151,6 +153,43 @@ class TestSaveJson:
         assert "old" not in result
 
 
+class TestSaveJsonIfChanged:
+    """save_json_if_changed() / save_json_stamped() 関数のテスト"""
+
+    @pytest.mark.integration
+    def test_skips_identical_content(self, tmp_path: Path) -> None:
+        """内容が同じなら書き込まない"""
+        json_file = tmp_path / "state.json"
+        data = {"name": "テスト", "values": [1, 2]}
+
+        assert save_json_if_changed(json_file, data) is True
+        mtime_ns = json_file.stat().st_mtime_ns
+        assert save_json_if_changed(json_file, dict(data)) is False
+        assert json_file.stat().st_mtime_ns == mtime_ns
+        # save_json と同じ形式で書かれる
+        save_json(json_file, data)
+        assert save_json_if_changed(json_file, data) is False
+
+        assert save_json_if_changed(json_file, {**data, "values": [1, 2, 3]}) is True
+        assert json.loads(json_file.read_text(encoding='utf-8'))["values"] == [1, 2, 3]
+
+    @pytest.mark.integration
+    def test_stamp_only_changes_with_content(self, tmp_path: Path) -> None:
+        """stampは内容が変わった場合のみ更新される"""
+        json_file = tmp_path / "digest.json"
+        save_json(json_file, {"metadata": {"last_updated": "2020-01-01T00:00:00"}, "items": []})
+
+        unchanged = {"metadata": {"last_updated": "2099-01-01T00:00:00"}, "items": []}
+        assert save_json_stamped(json_file, unchanged) is False
+        assert unchanged["metadata"]["last_updated"] == "2020-01-01T00:00:00"
+
+        changed = {"metadata": {"last_updated": "2020-01-01T00:00:00"}, "items": ["a"]}
+        assert save_json_stamped(json_file, changed) is True
+        saved = json.loads(json_file.read_text(encoding='utf-8'))
+        assert saved["items"] == ["a"]
+        assert saved["metadata"]["last_updated"] > "2020-01-01T00:00:00"
+
+
 # =============================================================================
 # load_json_with_template テスト
 # =============================================================================
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+infrastructure/loop_archive.py のテスト
+=======================================
+"""
+
+import json
+import zipfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from domain.exceptions import CorruptedDataError, FileIOError
+from infrastructure.file_scanner import count_files, scan_files
+from infrastructure.loop_archive import LoopArchive, loop_stat, read_loop_bytes
+
+
+def _write_loops(loops_path: Path, count: int) -> List[Path]:
+    loops_path.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(1, count + 1):
+        path = loops_path / f"L{i:05d}_会話{i}.txt"
+        path.write_text(f"# Loop {i}\n" + "対話の内容。" * 200 * i, encoding="utf-8")
+        files.append(path)
+    return files
+
+
+class TestLoopArchive:
+    """LoopArchive tests"""
+
+    @pytest.mark.unit
+    def test_pack_moves_files_and_reads_members_by_offset(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 3)
+        contents = {f.name: f.read_bytes() for f in files}
+        stats = {f.name: f.stat() for f in files}
+
+        archive = LoopArchive(tmp_path)
+        packed = archive.pack(files[:2])
+
+        assert packed == [files[0].name, files[1].name]
+        assert not files[0].exists() and not files[1].exists()
+        assert files[2].exists()
+        for name in packed:
+            assert archive.read_bytes(name) == contents[name]
+            assert archive.stat(name) == (stats[name].st_size, stats[name].st_mtime_ns)
+        # パックは標準のzipとして展開できる
+        with zipfile.ZipFile(archive.pack_files()[0]) as zf:
+            assert zf.read(files[0].name) == contents[files[0].name]
+
+    @pytest.mark.unit
+    def test_index_survives_reload_and_new_packs_are_appended(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 3)
+        LoopArchive(tmp_path).pack(files[:1])
+        LoopArchive(tmp_path).pack(files[1:])
+
+        archive = LoopArchive(tmp_path)
+        assert archive.names() == [f.name for f in files]
+        assert [p.name for p in archive.pack_files()] == ["pack-0001.zip", "pack-0002.zip"]
+        assert archive.totals()["files"] == 3
+        assert archive.totals()["compress_size"] < archive.totals()["size"]
+
+    @pytest.mark.unit
+    def test_unpack_restores_file_and_drops_empty_pack(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 1)
+        original = files[0].read_bytes()
+        mtime_ns = files[0].stat().st_mtime_ns
+        archive = LoopArchive(tmp_path)
+        archive.pack(files)
+
+        assert archive.unpack([files[0].name, "L09999_none.txt"]) == [files[0].name]
+        assert files[0].read_bytes() == original
+        assert files[0].stat().st_mtime_ns == mtime_ns
+        assert archive.pack_files() == []
+        assert len(LoopArchive(tmp_path)) == 0
+
+    @pytest.mark.unit
+    def test_read_errors(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 1)
+        archive = LoopArchive(tmp_path)
+        archive.pack(files)
+
+        with pytest.raises(FileIOError):
+            archive.read_bytes("L09999_none.txt")
+
+        index = json.loads(archive.index_file.read_text(encoding="utf-8"))
+        index["members"][files[0].name]["crc"] ^= 1
+        archive.index_file.write_text(json.dumps(index), encoding="utf-8")
+        with pytest.raises(CorruptedDataError):
+            LoopArchive(tmp_path).read_bytes(files[0].name)
+
+
+class TestArchivedLoopsOnDisk:
+    """パック済みLoopがディスク上のLoopと同様に見えることの確認"""
+
+    @pytest.mark.unit
+    def test_scanner_counts_archived_loops(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 3)
+        LoopArchive(tmp_path).pack(files[1:])
+
+        scanned = scan_files(tmp_path, "L*.txt", include_archived=True)
+        assert [f.name for f in scanned] == [f.name for f in files]
+        assert count_files(tmp_path, "L*.txt", include_archived=True) == 3
+
+    @pytest.mark.unit
+    def test_scanner_ignores_archive_unless_requested(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 3)
+        LoopArchive(tmp_path).pack(files[1:])
+
+        assert [f.name for f in scan_files(tmp_path, "L*.txt")] == [files[0].name]
+        assert count_files(tmp_path, "L*.txt") == 1
+
+    @pytest.mark.unit
+    def test_read_and_stat_fall_back_to_archive(self, tmp_path: Path) -> None:
+        files = _write_loops(tmp_path, 2)
+        content = files[1].read_bytes()
+        size = files[1].stat().st_size
+        LoopArchive(tmp_path).pack(files[1:])
+
+        assert read_loop_bytes(files[1]) == content
+        assert read_loop_bytes(files[0]) == files[0].read_bytes()
+        assert loop_stat(files[1])[0] == size
+        assert loop_stat(tmp_path / "L09999_none.txt") is None
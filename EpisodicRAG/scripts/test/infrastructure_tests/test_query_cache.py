@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+infrastructure/query_cache.py のテスト
+======================================
+
+正規化したクエリ + コーパスの世代をキーにした結果キャッシュ
+（メモリ層・永続化層）と、世代の更新による無効化を検証。
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.file_constants import QUERY_CACHE_FILENAME
+from infrastructure.query_cache import (
+    QueryResultCache,
+    bump_corpus_generation,
+    corpus_generation,
+    get_query_cache,
+    query_key,
+)
+
+
+class TestQueryKey:
+    """query_key() のテスト"""
+
+    @pytest.mark.unit
+    def test_argument_order_and_whitespace_are_normalized(self) -> None:
+        assert query_key("search", {"q": "  MCP   設計 ", "k": 5}) == query_key(
+            "search", {"k": 5, "q": "MCP 設計"}
+        )
+
+    @pytest.mark.unit
+    def test_none_arguments_are_dropped(self) -> None:
+        assert query_key("trends.top", {"level": None, "limit": 10}) == query_key(
+            "trends.top", {"limit": 10}
+        )
+
+    @pytest.mark.unit
+    def test_kind_and_values_distinguish_queries(self) -> None:
+        assert query_key("trends.top", {"limit": 10}) != query_key("trends.top", {"limit": 5})
+        assert query_key("trends.top", {"limit": 10}) != query_key("related", {"limit": 10})
+
+
+class TestCorpusGeneration:
+    """corpus_generation() / bump_corpus_generation() のテスト"""
+
+    @pytest.mark.unit
+    def test_starts_at_zero_and_increases(self, tmp_path: Path) -> None:
+        assert corpus_generation(tmp_path) == 0
+        assert bump_corpus_generation(tmp_path) == 1
+        assert bump_corpus_generation(tmp_path) == 2
+        assert corpus_generation(tmp_path) == 2
+
+    @pytest.mark.unit
+    def test_failure_is_not_raised(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+
+        assert bump_corpus_generation(blocker / "Essences") is None
+
+
+class TestQueryResultCache:
+    """QueryResultCache のテスト"""
+
+    @pytest.mark.unit
+    def test_repeated_query_is_not_computed_again(self, tmp_path: Path) -> None:
+        cache = QueryResultCache(tmp_path)
+        compute = MagicMock(return_value={"keywords": ["MCP"]})
+
+        assert cache.get_or_compute("trends.top", {"limit": 10}, compute) == {"keywords": ["MCP"]}
+        assert cache.get_or_compute("trends.top", {"limit": 10}, compute) == {"keywords": ["MCP"]}
+
+        assert compute.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_bump_invalidates_results(self, tmp_path: Path) -> None:
+        cache = QueryResultCache(tmp_path)
+        cache.get_or_compute("trends.top", {}, lambda: {"n": 1})
+
+        bump_corpus_generation(tmp_path)
+
+        assert cache.get_or_compute("trends.top", {}, lambda: {"n": 2}) == {"n": 2}
+
+    @pytest.mark.unit
+    def test_handout_is_a_copy(self, tmp_path: Path) -> None:
+        cache = QueryResultCache(tmp_path)
+        first = cache.get_or_compute("timeline", {}, lambda: {"loop": ["L00001"]})
+        first["loop"].append("L00002")
+
+        assert cache.get_or_compute("timeline", {}, lambda: {}) == {"loop": ["L00001"]}
+
+    @pytest.mark.unit
+    def test_persisted_tier_survives_new_process(self, tmp_path: Path) -> None:
+        """別のインスタンス（次のCLI起動）でも計算せずに返す"""
+        QueryResultCache(tmp_path).get_or_compute("related", {"id": "W0001"}, lambda: [1, 2])
+        compute = MagicMock(return_value=[])
+
+        result = QueryResultCache(tmp_path).get_or_compute("related", {"id": "W0001"}, compute)
+
+        assert result == [1, 2]
+        compute.assert_not_called()
+
+    @pytest.mark.unit
+    def test_persisted_tier_keeps_only_current_generation(self, tmp_path: Path) -> None:
+        cache = QueryResultCache(tmp_path)
+        cache.get_or_compute("a", {}, lambda: 1)
+        bump_corpus_generation(tmp_path)
+        cache.get_or_compute("b", {}, lambda: 2)
+
+        data = json.loads((tmp_path / QUERY_CACHE_FILENAME).read_text(encoding="utf-8"))
+        assert data == {"generation": 1, "entries": {"b {}": 2}}
+
+    @pytest.mark.unit
+    def test_result_computed_during_write_is_not_persisted(self, tmp_path: Path) -> None:
+        """計算中に世代が進んだ結果は永続化層に書かない"""
+        cache = QueryResultCache(tmp_path)
+
+        def compute() -> int:
+            bump_corpus_generation(tmp_path)
+            return 1
+
+        cache.get_or_compute("a", {}, compute)
+
+        assert not (tmp_path / QUERY_CACHE_FILENAME).exists()
+
+    @pytest.mark.unit
+    def test_entry_limits(self, tmp_path: Path) -> None:
+        cache = QueryResultCache(tmp_path, max_entries=2, max_persisted=2)
+        for name in ("a", "b", "c"):
+            cache.get_or_compute(name, {}, lambda: name)
+
+        data = json.loads((tmp_path / QUERY_CACHE_FILENAME).read_text(encoding="utf-8"))
+        assert list(data["entries"]) == ["b {}", "c {}"]
+        assert len(cache._memory) == 2
+
+    @pytest.mark.unit
+    def test_unserializable_result_is_returned_but_not_persisted(self, tmp_path: Path) -> None:
+        cache = QueryResultCache(tmp_path)
+        value = {"ids": {"W0001"}}
+
+        assert cache.get_or_compute("a", {}, lambda: value) == value
+        assert not (tmp_path / QUERY_CACHE_FILENAME).exists()
+
+    @pytest.mark.unit
+    def test_shared_instance_per_directory(self, tmp_path: Path) -> None:
+        assert get_query_cache(tmp_path) is get_query_cache(tmp_path / ".")
+        assert get_query_cache(tmp_path) is not get_query_cache(tmp_path / "other")
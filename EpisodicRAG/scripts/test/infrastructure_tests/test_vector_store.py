@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+infrastructure/vector_store.py のテスト
+=======================================
+
+VectorStore の追記・置き換え・コンパクション・検索を検証。
+"""
+
+from pathlib import Path
+
+import pytest
+
+import infrastructure.vector_store as vector_store
+from infrastructure.vector_store import VectorStore
+
+E1 = [1.0, 0.0, 0.0, 0.0]
+E2 = [0.0, 1.0, 0.0, 0.0]
+MIX = [0.6, 0.8, 0.0, 0.0]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> VectorStore:
+    store = VectorStore(tmp_path / "vectors", dim=4)
+    store.append({"A": E1, "B": E2, "C": MIX})
+    return store
+
+
+class TestVectorStore:
+    """VectorStore tests"""
+
+    @pytest.mark.unit
+    def test_append_persists_rows_and_df(self, store: VectorStore, tmp_path: Path) -> None:
+        reopened = VectorStore(tmp_path / "vectors", dim=4)
+        assert reopened.row_ids == ["A", "B", "C"]
+        assert reopened.n_docs == 3
+        assert reopened.df == [2, 2, 0, 0]
+        assert reopened.vector_of("C") == pytest.approx(MIX)
+        assert store.matrix_file.stat().st_size == 3 * 4 * 4
+
+    @pytest.mark.unit
+    def test_search_ranks_by_cosine(self, store: VectorStore) -> None:
+        results = store.search(E1, k=2, exclude={"A"})
+        assert [row_id for row_id, _ in results] == ["C", "B"]
+        assert results[0][1] == pytest.approx(0.6)
+
+    @pytest.mark.unit
+    def test_pure_python_search_matches(
+        self, store: VectorStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        expected = store.search(MIX, k=3)
+        monkeypatch.setattr(vector_store, "np", None)
+        assert store.search(MIX, k=3) == expected
+
+    @pytest.mark.unit
+    def test_weighted_search_normalizes_rows_at_query_time(self, store: VectorStore) -> None:
+        """weights を掛けた行を検索時に正規化する"""
+        results = store.search(E1, k=2, exclude={"A"}, weights=[1.0, 3.0, 1.0, 1.0])
+        assert [row_id for row_id, _ in results] == ["C", "B"]
+        assert results[0][1] == pytest.approx(0.6 / (0.6**2 + 2.4**2) ** 0.5, abs=1e-6)
+
+    @pytest.mark.unit
+    def test_saved_norms_are_used_until_rows_change(
+        self, store: VectorStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """refresh_norms() で保存したノルムは同じ重みの検索で使い、行の変更で無効になる"""
+        weights = [1.0, 3.0, 1.0, 1.0]
+        expected = store.search(E1, k=2, exclude={"A"}, weights=weights)
+        store.refresh_norms(weights)
+
+        def fail(_weights: list) -> list:
+            raise AssertionError("norms were recomputed")
+
+        monkeypatch.setattr(store, "_compute_norms", fail)
+        assert store.search(E1, k=2, exclude={"A"}, weights=weights) == expected
+        reopened = VectorStore(store.meta_file.with_suffix(""), dim=4)
+        monkeypatch.setattr(reopened, "_compute_norms", fail)
+        assert reopened.search(E1, k=2, exclude={"A"}, weights=weights) == expected
+
+        monkeypatch.undo()
+        store.append({"D": E2})
+        assert store._cached_norms(weights) is None
+        assert store._cached_norms([1.0, 1.0, 1.0, 1.0]) is None
+
+    @pytest.mark.unit
+    def test_replace_leaves_tombstone_until_compact(
+        self, store: VectorStore, tmp_path: Path
+    ) -> None:
+        store.append({"A": E2})
+        assert store.row_ids == [None, "B", "C", "A"]
+        assert store.df == [1, 3, 0, 0]
+        assert store.search(E2, k=1, exclude={"B"})[0][0] == "A"
+
+        assert store.compact() == 1
+        reopened = VectorStore(tmp_path / "vectors", dim=4)
+        assert reopened.row_ids == ["B", "C", "A"]
+        assert reopened.vector_of("A") == pytest.approx(E2)
+        assert store.compact() == 0
+
+    @pytest.mark.unit
+    def test_interrupted_append_is_truncated(self, store: VectorStore, tmp_path: Path) -> None:
+        """メタデータに記録されていない末尾の残骸は次の追記で切り詰める"""
+        with open(store.matrix_file, "ab") as f:
+            f.write(b"\x00" * 7)
+        store.append({"D": E1})
+        assert store.matrix_file.stat().st_size == 4 * 4 * 4
+        assert VectorStore(tmp_path / "vectors", dim=4).vector_of("D") == pytest.approx(E1)
+
+    @pytest.mark.unit
+    def test_dimension_mismatch(self, store: VectorStore, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            store.append({"D": [1.0]})
+        # 次元が異なるストアは空として扱う
+        assert len(VectorStore(tmp_path / "vectors", dim=8)) == 0
+
+    @pytest.mark.unit
+    def test_clear(self, store: VectorStore) -> None:
+        store.clear()
+        assert store.row_ids == []
+        assert store.search(E1) == []
+        assert not store.matrix_file.exists()
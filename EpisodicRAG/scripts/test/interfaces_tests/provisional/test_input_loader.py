@@ -245,5 +245,37 @@ class TestInputLoaderEdgeCases(unittest.TestCase):
         self.assertIsNone(result[0]["metadata"])
 
 
+class TestInputLoaderIterJsonl(unittest.TestCase):
+    """InputLoader.iter_jsonl() tests"""
+
+    def test_yields_records_and_skips_blank_lines(self) -> None:
+        """Each non-blank line becomes one validated digest"""
+        lines = ['{"source_file": "a.txt"}\n', "\n", '{"source_file": "b.txt"}\n']
+        result = list(InputLoader.iter_jsonl(lines))
+        self.assertEqual([d["source_file"] for d in result], ["a.txt", "b.txt"])
+
+    def test_invalid_json_reports_line_number(self) -> None:
+        """Malformed JSON raises ValidationError with the line number"""
+        lines = ['{"source_file": "a.txt"}', "{broken"]
+        with self.assertRaises(ValidationError) as cm:
+            list(InputLoader.iter_jsonl(lines))
+        self.assertIn("line 2", str(cm.exception))
+
+    def test_stops_at_first_invalid_record(self) -> None:
+        """Records before the first invalid one are yielded, later lines are not read"""
+        consumed = []
+
+        def lines():
+            for line in ['{"source_file": "a.txt"}', '{"other": 1}', '{"source_file": "c.txt"}']:
+                consumed.append(line)
+                yield line
+
+        iterator = InputLoader.iter_jsonl(lines())
+        self.assertEqual(next(iterator)["source_file"], "a.txt")
+        with self.assertRaises(ValidationError):
+            next(iterator)
+        self.assertEqual(len(consumed), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
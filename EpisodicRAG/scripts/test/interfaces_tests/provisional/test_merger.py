@@ -9,6 +9,7 @@ Tests for DigestMerger.merge() deduplication and merging logic.
 import unittest
 
 from domain.exceptions import ValidationError
+from interfaces.provisional.input_loader import InputLoader
 from interfaces.provisional.merger import DigestMerger
 
 
@@ -193,5 +194,52 @@ class TestDigestMergerEdgeCases(unittest.TestCase):
         self.assertTrue(result[0]["updated"])
 
 
+class TestDigestMergerIncremental(unittest.TestCase):
+    """DigestMerger.create_index() / merge_into() tests"""
+
+    def test_merge_into_appends_and_overwrites(self) -> None:
+        """merge_into() overwrites by source_file and appends new items"""
+        index = DigestMerger.create_index([{"source_file": "a.txt", "content": "old"}])
+        replaced = DigestMerger.merge_into(
+            index,
+            [{"source_file": "a.txt", "content": "new"}, {"source_file": "b.txt"}],
+        )
+        self.assertEqual(replaced, 1)
+        result = index.to_list()
+        self.assertEqual([d["source_file"] for d in result], ["a.txt", "b.txt"])
+        self.assertEqual(result[0]["content"], "new")
+
+    def test_create_index_reports_broken_existing(self) -> None:
+        """create_index() reports existing digests that cannot be keyed"""
+        with self.assertRaises(ValidationError) as cm:
+            DigestMerger.create_index([{"missing_key": "value"}])
+        self.assertIn("existing", str(cm.exception))
+
+    def test_merge_validates_only_new_entries(self) -> None:
+        """Existing digests were validated when saved and are not checked again"""
+        existing = [{"source_file": "a.txt", "abstract": "legacy string"}]
+        result = DigestMerger.merge(existing, [{"source_file": "b.txt"}])
+        self.assertEqual([d["source_file"] for d in result], ["a.txt", "b.txt"])
+
+    def test_merge_into_accepts_validated_stream(self) -> None:
+        """merge_into() merges records validated by InputLoader.iter_jsonl()"""
+        index = DigestMerger.create_index([])
+        lines = ['{"source_file": "a.txt"}\n', '{"content": "x"}\n']
+        with self.assertRaises(ValidationError) as cm:
+            DigestMerger.merge_into(index, InputLoader.iter_jsonl(lines))
+        self.assertIn("line 2", str(cm.exception))
+        self.assertEqual([d["source_file"] for d in index.to_list()], ["a.txt"])
+
+    def test_merge_collapses_duplicate_existing_entries(self) -> None:
+        """Duplicate existing source_files collapse to the last value"""
+        existing = [
+            {"source_file": "a.txt", "content": "first"},
+            {"source_file": "a.txt", "content": "second"},
+        ]
+        result = DigestMerger.merge(existing, [])
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["content"], "second")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -236,6 +236,60 @@ class TestDigestAutoAnalyzer(unittest.TestCase):
 
         assert len(result.recommendations) > 0
 
+    @pytest.mark.unit
+    def test_analyze_detects_near_duplicate_loops(self) -> None:
+        """ほぼ同じ内容のLoopを近似重複として検出する"""
+        from application.shadow.loop_signatures import LoopSignatureRecorder
+        from interfaces.digest_auto import DigestAutoAnalyzer
+
+        loops = self.plugin_root / "data" / "Loops"
+        text = "".join(f"{i}回目の打ち合わせではMCPの設計を議論した。" for i in range(30))
+        other = "".join(f"{i}回目の登山は天気が良く景色を楽しんだ。" for i in range(30))
+        (loops / "L00001_Test.txt").write_text(text, encoding="utf-8")
+        (loops / "L00002_Test.txt").write_text(other, encoding="utf-8")
+        LoopSignatureRecorder(self.persistent_config).record_loops(sorted(loops.glob("L*.txt")))
+        (loops / "L00003_Test.txt").write_text(text, encoding="utf-8")
+
+        result = DigestAutoAnalyzer().analyze()
+
+        dup_issues = [i for i in result.issues if i.type == "near_duplicate_loops"]
+        assert len(dup_issues) == 1
+        assert dup_issues[0].files == ["L00003"]
+        assert dup_issues[0].details is not None
+        assert dup_issues[0].details["L00003"][0]["duplicate_of"] == "L00001"
+
+        # 重複元が削除されたら報告しない
+        (loops / "L00001_Test.txt").unlink()
+        result = DigestAutoAnalyzer().analyze()
+        assert not [i for i in result.issues if i.type == "near_duplicate_loops"]
+
+    @pytest.mark.unit
+    def test_analyze_detects_modified_loops(self) -> None:
+        """処理後に編集されたLoopを検出する"""
+        from application.tracking import LoopManifestRecorder
+        from interfaces.digest_auto import DigestAutoAnalyzer
+
+        loops = self.plugin_root / "data" / "Loops"
+        old_ns = 1_000_000_000_000_000_000
+        for i in (1, 2):
+            path = loops / f"L{i:05d}_Test.txt"
+            path.write_text(f"loop {i}", encoding="utf-8")
+            os.utime(path, ns=(old_ns, old_ns))
+        times_data = {"loop": {"timestamp": "2025-01-01T00:00:00", "last_processed": 2}}
+        with open(self.persistent_config / "last_digest_times.json", "w", encoding="utf-8") as f:
+            json.dump(times_data, f)
+        LoopManifestRecorder(self.persistent_config).record_digested(sorted(loops.glob("L*")))
+
+        assert not [i for i in DigestAutoAnalyzer().analyze().issues if i.type == "modified_loops"]
+
+        edited = loops / "L00002_Test.txt"
+        edited.write_text("loop 2 (edited)", encoding="utf-8")
+        result = DigestAutoAnalyzer().analyze()
+
+        modified = [i for i in result.issues if i.type == "modified_loops"]
+        assert len(modified) == 1
+        assert modified[0].files == ["L00002_Test"]
+
     @pytest.mark.unit
     def test_analyze_returns_error_when_config_missing(self) -> None:
         """設定ファイルがない場合にエラーを返す"""
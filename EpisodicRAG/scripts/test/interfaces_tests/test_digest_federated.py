@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digest_federated.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.digest_federated import main
+
+    with patch("sys.argv", ["digest_federated.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+class TestDigestFederatedCLI:
+    """digest_federated CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_search_local_store(self, temp_plugin_env: TempPluginEnvironment, capsys) -> None:
+        from application.finalize import DigestVectorRecorder
+
+        DigestVectorRecorder(temp_plugin_env.digests_path).record_digest(
+            "W0001_a", {"overall_digest": {"keywords": ["MCP"], "abstract": "MCPの設計"}}
+        )
+
+        result = _run_cli(capsys, "search", "MCP", "--limit", "3")
+
+        assert result["stores"] == {"local": "ok"}
+        assert [hit["id"] for hit in result["results"]] == ["W0001"]
+
+    @pytest.mark.integration
+    def test_timeline_rejects_reversed_range(
+        self, temp_plugin_env: TempPluginEnvironment, capsys
+    ) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            _run_cli(capsys, "timeline", "--from", "2025-03-31", "--to", "2025-03-01")
+        assert exc_info.value.code == 1
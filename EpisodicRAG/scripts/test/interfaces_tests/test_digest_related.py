@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digest_related.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.digest_related import main
+
+    with patch("sys.argv", ["digest_related.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def populated_env(temp_plugin_env: TempPluginEnvironment) -> TempPluginEnvironment:
+    from application.finalize import DigestVectorRecorder
+
+    recorder = DigestVectorRecorder(temp_plugin_env.digests_path)
+    for name, abstract in (
+        ("W0001_a", "MCPサーバーの設計とAPI境界"),
+        ("W0002_b", "MCPサーバーの設計レビュー"),
+        ("W0003_c", "週末の登山と山頂の景色"),
+    ):
+        recorder.record_digest(name, {"overall_digest": {"abstract": abstract}})
+    return temp_plugin_env
+
+
+class TestDigestRelatedCLI:
+    """digest_related CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_related(self, populated_env, capsys) -> None:
+        result = _run_cli(capsys, "W0001", "--limit", "1")
+        assert result["status"] == "ok"
+        assert [r["id"] for r in result["related"]] == ["W0002"]
+
+    @pytest.mark.integration
+    def test_unknown_digest(self, populated_env, capsys) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            _run_cli(capsys, "W0999")
+        assert exc_info.value.code == 1
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
+
+    @pytest.mark.integration
+    def test_rebuild_and_compact(self, temp_plugin_env, capsys) -> None:
+        assert _run_cli(capsys, "--rebuild") == {"status": "ok", "rows": 0}
+        assert _run_cli(capsys, "--compact") == {"status": "ok", "removed": 0}
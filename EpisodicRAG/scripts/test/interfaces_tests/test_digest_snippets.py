@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digest_snippets.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.digest_snippets import main
+
+    with patch("sys.argv", ["digest_snippets.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def populated_env(temp_plugin_env: TempPluginEnvironment) -> TempPluginEnvironment:
+    from infrastructure import save_json
+
+    save_json(
+        temp_plugin_env.digests_path / "1_Weekly" / "W0001_a.txt",
+        {"overall_digest": {"abstract": "週末は登山に行った。MCPサーバーの設計を見直した。"}},
+    )
+    return temp_plugin_env
+
+
+class TestDigestSnippetsCLI:
+    """digest_snippets CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_rebuild_then_snippets(self, populated_env, capsys) -> None:
+        assert _run_cli(capsys, "--rebuild") == {"status": "ok", "digests": 1}
+
+        result = _run_cli(capsys, "W0001", "MCP 設計", "--limit", "1")
+
+        assert result["status"] == "ok"
+        assert [s["text"] for s in result["snippets"]] == ["MCPサーバーの設計を見直した。"]
+
+    @pytest.mark.integration
+    def test_unindexed_digest(self, populated_env, capsys) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            _run_cli(capsys, "W0001", "MCP")
+        assert exc_info.value.code == 1
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digest_timeline.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.digest_timeline import main
+
+    with patch("sys.argv", ["digest_timeline.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+class TestDigestTimelineCLI:
+    """digest_timeline CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_returns_loops_and_digests_in_range(
+        self, temp_plugin_env: TempPluginEnvironment, capsys
+    ) -> None:
+        """期間内のLoopと各レベルのダイジェストを返す"""
+        from application.config import DigestConfig
+        from application.tracking import DigestTimesTracker
+
+        timeline = DigestTimesTracker(DigestConfig()).timeline
+        timeline.record_sources("loop", ["L00001_a.txt"], "2025-02-20T10:00:00")
+        timeline.record_sources("loop", ["L00002_b.txt"], "2025-03-05T10:00:00")
+        timeline.record_digest(
+            "weekly",
+            "W0001_第1週",
+            {
+                "overall_digest": {
+                    "timestamp": "2025-03-06T10:00:00",
+                    "source_files": ["L00001_a.txt", "L00002_b.txt"],
+                }
+            },
+        )
+
+        result = _run_cli(capsys, "--from", "2025-03-01", "--to", "2025-03-31")
+
+        assert result["status"] == "ok"
+        assert result["loops"] == ["L00002"]
+        assert result["digests"] == {"weekly": ["W0001"]}
+
+    @pytest.mark.integration
+    def test_empty_index(self, temp_plugin_env: TempPluginEnvironment, capsys) -> None:
+        """インデックスがなければ空の結果"""
+        result = _run_cli(capsys, "--from", "2025-03-01", "--to", "2025-03-31")
+        assert result["loops"] == []
+        assert result["digests"] == {}
+
+    @pytest.mark.unit
+    def test_invalid_date_rejected(self, temp_plugin_env: TempPluginEnvironment) -> None:
+        """ISO形式でない日付はargparseエラー"""
+        from interfaces.digest_timeline import main
+
+        with patch("sys.argv", ["digest_timeline.py", "--from", "March", "--to", "2025-03-31"]):
+            with pytest.raises(SystemExit):
+                main()
+
+    @pytest.mark.unit
+    def test_reversed_range_is_error(self, temp_plugin_env: TempPluginEnvironment, capsys) -> None:
+        """--from が --to より後ならエラー"""
+        from interfaces.digest_timeline import main
+
+        with patch(
+            "sys.argv", ["digest_timeline.py", "--from", "2025-04-01", "--to", "2025-03-01"]
+        ):
+            with pytest.raises(SystemExit):
+                main()
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
+
+    @pytest.mark.integration
+    def test_time_on_date_only_end_day_is_accepted(
+        self, temp_plugin_env: TempPluginEnvironment, capsys
+    ) -> None:
+        """日付のみの --to はその日の終わりまでを含むため、同じ日の時刻指定の --from は有効"""
+        result = _run_cli(capsys, "--from", "2025-03-31T12:00:00", "--to", "2025-03-31")
+        assert result["status"] == "ok"
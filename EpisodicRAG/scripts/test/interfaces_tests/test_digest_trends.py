@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digest_trends.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.digest_trends import main
+
+    with patch("sys.argv", ["digest_trends.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def populated_env(temp_plugin_env: TempPluginEnvironment) -> TempPluginEnvironment:
+    from application.finalize import KeywordRollupRecorder
+
+    recorder = KeywordRollupRecorder(temp_plugin_env.digests_path)
+    for name, ts, keywords in (
+        ("W0001_a", "2025-01-05T00:00:00", ["MCP", "API"]),
+        ("W0002_b", "2025-04-05T00:00:00", ["MCP"]),
+    ):
+        recorder.record_digest(
+            "weekly", name, {"overall_digest": {"timestamp": ts, "keywords": keywords}}
+        )
+    return temp_plugin_env
+
+
+class TestDigestTrendsCLI:
+    """digest_trends CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_trend_by_quarter(self, populated_env, capsys) -> None:
+        result = _run_cli(capsys, "trend", "MCP", "--by", "quarter")
+        assert result["periods"] == {"2025-Q1": 1, "2025-Q2": 1}
+
+    @pytest.mark.integration
+    def test_top(self, populated_env, capsys) -> None:
+        result = _run_cli(capsys, "top", "--level", "weekly", "--limit", "1")
+        assert result["keywords"] == [{"keyword": "MCP", "count": 2}]
+
+    @pytest.mark.integration
+    def test_related(self, populated_env, capsys) -> None:
+        result = _run_cli(capsys, "related", "API")
+        assert result["related"] == [{"keyword": "MCP", "count": 1}]
+
+    @pytest.mark.integration
+    def test_rebuild_without_digests(self, temp_plugin_env, capsys) -> None:
+        result = _run_cli(capsys, "rebuild")
+        assert result == {"status": "ok", "digests": 0}
+
+    @pytest.mark.integration
+    def test_repeated_query_is_served_until_corpus_changes(
+        self, populated_env: TempPluginEnvironment, capsys
+    ) -> None:
+        """同じクエリは keyword_rollup.json を読まずに返し、世代が進むと再計算する"""
+        from application.finalize import KeywordRollupRecorder
+        from infrastructure import bump_corpus_generation
+
+        first = _run_cli(capsys, "top", "--level", "weekly")
+        with patch.object(KeywordRollupRecorder, "load", side_effect=AssertionError):
+            assert _run_cli(capsys, "top", "--level", "weekly") == first
+
+        overall = {"timestamp": "2025-05-01T00:00:00", "keywords": ["API"]}
+        KeywordRollupRecorder(populated_env.digests_path).record_digest(
+            "weekly", "W0003_c", {"overall_digest": overall}
+        )
+        bump_corpus_generation(populated_env.essences_path)
+
+        result = _run_cli(capsys, "top", "--level", "weekly")
+        assert {"keyword": "API", "count": 2} in result["keywords"]
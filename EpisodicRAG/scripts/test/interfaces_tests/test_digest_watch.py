@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digest_watch.py CLI統合テスト
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Set
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment, create_test_loop_file
+
+from infrastructure.fs_watcher import DirectoryWatcher
+
+
+class _ScriptedWatcher(DirectoryWatcher):
+    """決まった順に変化を返す監視バックエンド"""
+
+    backend = "scripted"
+
+    def __init__(self, batches: List[Set[Path]]):
+        super().__init__([])
+        self.batches = batches
+
+    def poll(self, timeout: float) -> Set[Path]:
+        return self.batches.pop(0) if self.batches else set()
+
+
+def _age(path: Path) -> None:
+    past = time.time() - 10
+    os.utime(path, (past, past))
+
+
+class TestDigestWatch:
+    """digest_watch tests"""
+
+    @pytest.mark.integration
+    def test_once_prepares_pattern1(self, temp_plugin_env: TempPluginEnvironment, capsys) -> None:
+        from interfaces.digest_entry import get_new_loops
+        from interfaces.digest_watch import main
+
+        create_test_loop_file(temp_plugin_env.loops_path, 1)
+        _age(temp_plugin_env.loops_path)
+        with patch("sys.argv", ["digest_watch.py", "--once"]):
+            main()
+        result = json.loads(capsys.readouterr().out)
+        assert result["new_loops"] == ["L00001_test.txt"]
+
+        # Pattern 1 は準備済みの結果を返し、検出処理を実行しない
+        with patch("application.grand.ShadowGrandDigestManager") as manager:
+            assert get_new_loops() == ["L00001_test"]
+        manager.assert_not_called()
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_watch_rewarms_new_loop_for_pattern1(
+        self, temp_plugin_env: TempPluginEnvironment
+    ) -> None:
+        """新規Loopの到着直後に監視が検出し、待ち時間の後に Pattern 1 で使える状態にする"""
+        from application.config import DigestConfig
+        from application.watch import IndexWarmer
+        from interfaces.digest_entry import get_new_loops
+        from interfaces.digest_watch import watch
+
+        loop_file = create_test_loop_file(temp_plugin_env.loops_path, 1)
+        timeouts: List[float] = []
+
+        class _SleepingWatcher(_ScriptedWatcher):
+            def poll(self, timeout: float) -> Set[Path]:
+                if self.batches:
+                    return self.batches.pop(0)
+                if timeouts:
+                    raise KeyboardInterrupt
+                timeouts.append(timeout)
+                time.sleep(timeout)
+                return set()
+
+        watch(IndexWarmer(DigestConfig()), _SleepingWatcher([{loop_file}, set()]), debounce=0)
+
+        assert 0 < timeouts[0] <= 2.5
+        with patch("application.grand.ShadowGrandDigestManager") as manager:
+            assert get_new_loops() == ["L00001_test"]
+        manager.assert_not_called()
+
+    @pytest.mark.integration
+    def test_watch_debounces_changes(self, temp_plugin_env: TempPluginEnvironment) -> None:
+        from application.config import DigestConfig
+        from application.watch import IndexWarmer
+        from interfaces.digest_watch import watch
+
+        first = create_test_loop_file(temp_plugin_env.loops_path, 1)
+        second = create_test_loop_file(temp_plugin_env.loops_path, 2)
+        watcher = _ScriptedWatcher([{first}, {second}, set()])
+
+        summary = watch(IndexWarmer(DigestConfig()), watcher, debounce=0, max_batches=1)
+
+        assert summary == {"batches": 1, "new_loops": 2, "digests": 0}
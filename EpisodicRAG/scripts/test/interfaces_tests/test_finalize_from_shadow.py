@@ -10,6 +10,7 @@ Note:
     test_helpers.pyの共通ヘルパーを活用。
 """
 
+import asyncio
 import json
 import shutil
 import tempfile
@@ -256,5 +257,74 @@ class TestDigestFinalizerIntegration(unittest.TestCase):
         self.assertEqual(len(individual_digests), 2)  # L00001, L00002
 
 
+class TestDigestFinalizerAsync(unittest.TestCase):
+    """finalize_from_shadow_async の統合テスト（同期版と同じ結果になること）"""
+
+    # 環境構築は同期版の統合テストと共通
+    setUp = TestDigestFinalizerIntegration.setUp
+    tearDown = TestDigestFinalizerIntegration.tearDown
+    _create_finalizer = TestDigestFinalizerIntegration._create_finalizer
+
+    def _snapshot(self) -> dict:
+        """確定処理が書き込む状態（GrandDigest・次レベルShadow・times）を取得"""
+        with open(self.essences_path / "GrandDigest.txt", 'r', encoding='utf-8') as f:
+            grand = json.load(f)["major_digests"]["weekly"]["overall_digest"]
+        with open(self.essences_path / "ShadowGrandDigest.txt", 'r', encoding='utf-8') as f:
+            shadow = json.load(f)["latest_digests"]["monthly"]["overall_digest"]
+        with open(
+            self.env.persistent_config_dir / "last_digest_times.json", 'r', encoding='utf-8'
+        ) as f:
+            times = json.load(f)
+        return {
+            "grand_name": grand["name"],
+            "grand_sources": grand["source_files"],
+            "monthly_sources": shadow["source_files"],
+            "last_processed": {level: data["last_processed"] for level, data in times.items()},
+        }
+
+    def test_async_matches_sync(self) -> None:
+        """非同期版は同期版と同じファイル・GrandDigest・カスケード・timesを残す"""
+        self._create_finalizer().finalize_from_shadow("weekly", "TestDigest")
+        expected = self._snapshot()
+        expected_files = sorted(p.name for p in (self.digests_path / "1_Weekly").iterdir())
+
+        # 同じ初期状態から非同期版を実行
+        for name in expected_files:
+            if name.startswith("W"):
+                (self.digests_path / "1_Weekly" / name).unlink()
+        self.env.create_grand_digest()
+        self.env.create_shadow_digest(
+            level="weekly", source_files=["L00001_test.txt", "L00002_test.txt"]
+        )
+        (self.env.persistent_config_dir / "last_digest_times.json").unlink()
+        asyncio.run(self._create_finalizer().finalize_from_shadow_async("weekly", "TestDigest"))
+
+        self.assertEqual(self._snapshot(), expected)
+        self.assertEqual(expected["monthly_sources"], ["W0001_TestDigest.txt"])
+        actual_files = sorted(p.name for p in (self.digests_path / "1_Weekly").iterdir())
+        self.assertEqual(actual_files, expected_files)
+
+    def test_async_save_failure_skips_later_steps(self) -> None:
+        """RegularDigestの保存に失敗したらGrandDigest・timesは更新しない"""
+        finalizer = self._create_finalizer()
+        grand_before = (self.essences_path / "GrandDigest.txt").read_text(encoding='utf-8')
+        times_path = self.env.persistent_config_dir / "last_digest_times.json"
+
+        with patch(
+            "application.finalize.persistence.save_json",
+            side_effect=OSError("disk full"),
+        ):
+            with self.assertRaises(Exception):
+                asyncio.run(finalizer.finalize_from_shadow_async("weekly", "TestDigest"))
+
+        self.assertEqual(
+            (self.essences_path / "GrandDigest.txt").read_text(encoding='utf-8'), grand_before
+        )
+        # 次レベル検出の先読みがテンプレートから初期化することはあるが、確定値は記録しない
+        if times_path.exists():
+            with open(times_path, 'r', encoding='utf-8') as f:
+                self.assertIsNone(json.load(f)["weekly"]["last_processed"])
+
+
 if __name__ == "__main__":
     unittest.main()
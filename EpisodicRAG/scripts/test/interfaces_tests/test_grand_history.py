@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+grand_history.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.grand_history import main
+
+    with patch("sys.argv", ["grand_history.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+def _update_weekly(name: str, timestamp: str) -> None:
+    from application.config import DigestConfig
+    from application.grand import GrandDigestManager
+
+    with patch("infrastructure.json_repository.operations.datetime") as mock_datetime:
+        mock_datetime.now.return_value.isoformat.return_value = timestamp
+        GrandDigestManager(DigestConfig()).update_digest("weekly", name, {"name": name})
+
+
+class TestGrandHistoryCLI:
+    """grand_history CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_at_returns_past_grand_digest(
+        self, temp_plugin_env: TempPluginEnvironment, capsys
+    ) -> None:
+        """--at はその時刻以前で最後の版を返す"""
+        _update_weekly("W0001", "2025-05-30T21:00:00")
+        _update_weekly("W0002", "2025-06-02T09:00:00")
+
+        result = _run_cli(capsys, "--at", "2025-06-01")
+
+        assert result["status"] == "ok"
+        assert result["as_of"] == "2025-05-30T21:00:00"
+        weekly = result["grand_digest"]["major_digests"]["weekly"]
+        assert weekly["overall_digest"] == {"name": "W0001"}
+
+    @pytest.mark.integration
+    def test_list_returns_versions(self, temp_plugin_env: TempPluginEnvironment, capsys) -> None:
+        _update_weekly("W0001", "2025-05-30T21:00:00")
+        _update_weekly("W0002", "2025-06-02T09:00:00")
+
+        result = _run_cli(capsys, "--list")
+
+        assert [v["kind"] for v in result["versions"]] == ["key", "delta"]
+        assert result["versions"][1] == {
+            "timestamp": "2025-06-02T09:00:00",
+            "kind": "delta",
+            "levels": ["weekly"],
+        }
+
+    @pytest.mark.integration
+    def test_no_history_is_error(self, temp_plugin_env: TempPluginEnvironment, capsys) -> None:
+        from interfaces.grand_history import main
+
+        with patch("sys.argv", ["grand_history.py", "--at", "2025-06-01"]):
+            with pytest.raises(SystemExit):
+                main()
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
+
+    @pytest.mark.unit
+    def test_at_and_list_are_exclusive(self, temp_plugin_env: TempPluginEnvironment) -> None:
+        from interfaces.grand_history import main
+
+        with patch("sys.argv", ["grand_history.py", "--at", "2025-06-01", "--list"]):
+            with pytest.raises(SystemExit):
+                main()
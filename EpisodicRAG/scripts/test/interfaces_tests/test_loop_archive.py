@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+loop_archive.py CLI統合テスト
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from test_helpers import TempPluginEnvironment
+
+
+def _run_cli(capsys, *argv: str) -> dict:
+    from interfaces.loop_archive import main
+
+    with patch("sys.argv", ["loop_archive.py", *argv]):
+        main()
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def loops_env(temp_plugin_env: TempPluginEnvironment) -> TempPluginEnvironment:
+    from application.config import DigestConfig
+    from application.tracking import DigestTimesTracker
+
+    names = [f"L{i:05d}_loop.txt" for i in range(1, 5)]
+    for name in names:
+        (temp_plugin_env.loops_path / name).write_text(f"{name} の本文", encoding="utf-8")
+    # L00001-L00003 は処理済み、L00004 は未処理
+    DigestTimesTracker(DigestConfig()).save("loop", names[:3])
+    return temp_plugin_env
+
+
+class TestLoopArchiveCLI:
+    """loop_archive CLIのテスト"""
+
+    @pytest.mark.integration
+    def test_pack_skips_unprocessed_loops(self, loops_env, capsys) -> None:
+        result = _run_cli(capsys, "pack", "--before", "L00005")
+
+        assert result["files"] == ["L00001_loop.txt", "L00002_loop.txt", "L00003_loop.txt"]
+        assert result["skipped_unprocessed"] == ["L00004_loop.txt"]
+        assert not (loops_env.loops_path / "L00001_loop.txt").exists()
+        assert _run_cli(capsys, "list")["files"] == 3
+
+    @pytest.mark.integration
+    def test_dry_run_keeps_files(self, loops_env, capsys) -> None:
+        result = _run_cli(capsys, "pack", "--before", "L00002", "--dry-run")
+
+        assert result["files"] == ["L00001_loop.txt"]
+        assert (loops_env.loops_path / "L00001_loop.txt").exists()
+
+    @pytest.mark.integration
+    def test_cat_and_unpack(self, loops_env, capsys) -> None:
+        from interfaces.loop_archive import main
+
+        _run_cli(capsys, "pack", "--before", "L00003")
+        with patch("sys.argv", ["loop_archive.py", "cat", "L00002"]):
+            main()
+        assert capsys.readouterr().out == "L00002_loop.txt の本文"
+
+        assert _run_cli(capsys, "unpack", "L00002")["unpacked"] == ["L00002_loop.txt"]
+        assert (loops_env.loops_path / "L00002_loop.txt").exists()
+
+    @pytest.mark.integration
+    def test_unknown_loop(self, loops_env, capsys) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            _run_cli(capsys, "unpack", "L00009")
+        assert exc_info.value.code == 1
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
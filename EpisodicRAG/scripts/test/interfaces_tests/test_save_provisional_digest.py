@@ -45,6 +45,7 @@ def provisional_saver(temp_plugin_env: "TempPluginEnvironment") -> None:
     with patch('interfaces.save_provisional_digest.DigestConfig') as mock_config_class:
         mock_config = MagicMock()
         mock_config.digests_path = temp_plugin_env.digests_path
+        mock_config.essences_path = temp_plugin_env.essences_path
         mock_config.get_provisional_dir.return_value = weekly_provisional
         mock_config_class.return_value = mock_config
         saver = ProvisionalDigestSaver()
@@ -142,6 +143,19 @@ class TestProvisionalDigestSaver:
         assert "individual_digests" in data
         assert len(data["individual_digests"]) == 1
 
+    @pytest.mark.integration
+    def test_save_provisional_bumps_corpus_generation(
+        self, provisional_saver, temp_plugin_env: "TempPluginEnvironment"
+    ) -> None:
+        """保存のたびにコーパスの世代が進む（クエリ結果キャッシュの無効化）"""
+        from infrastructure.query_cache import corpus_generation
+
+        individual_digests = [{"source_file": "Loop0001.txt", "keywords": ["test"]}]
+        provisional_saver.save_provisional("weekly", individual_digests)
+        provisional_saver.save_provisional("weekly", individual_digests, append=True)
+
+        assert corpus_generation(temp_plugin_env.essences_path) == 2
+
     @pytest.mark.integration
     def test_save_provisional_append_mode(self, provisional_saver) -> None:
         """追加モードでの保存"""
@@ -162,6 +176,93 @@ class TestProvisionalDigestSaver:
         assert len(data["individual_digests"]) == 2
 
 
+class TestProvisionalDigestSaverStream:
+    """save_provisional_stream（JSON Lines逐次マージ）のテスト"""
+
+    @pytest.mark.integration
+    def test_stream_append_merges_incrementally(self, provisional_saver) -> None:
+        """既存Provisionalにストリーム入力を逐次マージ"""
+        provisional_saver.save_provisional(
+            "weekly", [{"source_file": "Loop0001.txt", "keywords": ["old"]}]
+        )
+        lines = io.StringIO(
+            '{"source_file": "Loop0001.txt", "keywords": ["new"]}\n'
+            "\n"
+            '{"source_file": "Loop0002.txt", "keywords": ["second"]}\n'
+        )
+
+        saved_path, count = provisional_saver.save_provisional_stream(
+            "weekly", InputLoader.iter_jsonl(lines), append=True
+        )
+
+        assert count == 2
+        data = json.loads(saved_path.read_text(encoding="utf-8"))
+        assert [d["keywords"] for d in data["individual_digests"]] == [["new"], ["second"]]
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("append", [False, True])
+    def test_stream_and_list_produce_same_provisional(self, provisional_saver, append) -> None:
+        """同じ入力ならリスト入力とストリーム入力で同じProvisionalになる（重複はsource_fileで統合）"""
+        records = [
+            {"source_file": "Loop0001.txt", "keywords": ["first"]},
+            {"source_file": "Loop0002.txt", "keywords": ["second"]},
+            {"source_file": "Loop0001.txt", "keywords": ["again"]},
+        ]
+        seed = [{"source_file": "Loop0002.txt", "keywords": ["old"]}]
+
+        provisional_saver.save_provisional("weekly", seed)
+        list_path = provisional_saver.save_provisional("weekly", records, append=append)
+        list_digests = json.loads(list_path.read_text(encoding="utf-8"))["individual_digests"]
+        for path in provisional_saver._weekly_provisional.glob("*.txt"):
+            path.unlink()
+
+        provisional_saver.save_provisional("weekly", seed)
+        lines = io.StringIO("".join(json.dumps(r) + "\n" for r in records))
+        stream_path, _ = provisional_saver.save_provisional_stream(
+            "weekly", InputLoader.iter_jsonl(lines), append=append
+        )
+        stream_digests = json.loads(stream_path.read_text(encoding="utf-8"))["individual_digests"]
+
+        assert stream_path.name == list_path.name
+        assert stream_digests == list_digests
+        assert [d["keywords"] for d in list_digests] == (
+            [["second"], ["again"]] if append else [["again"], ["second"]]
+        )
+
+    @pytest.mark.integration
+    def test_stream_error_writes_nothing(self, provisional_saver) -> None:
+        """検証エラー時はファイルを作成しない"""
+        lines = io.StringIO('{"source_file": "Loop0001.txt"}\n{"no_source": true}\n')
+
+        with pytest.raises(ValidationError, match="line 2"):
+            provisional_saver.save_provisional_stream("weekly", InputLoader.iter_jsonl(lines))
+
+        assert list(provisional_saver._weekly_provisional.glob("*.txt")) == []
+
+    @pytest.mark.integration
+    def test_stream_input_is_read_outside_level_lock(self, provisional_saver) -> None:
+        """入力を読んでいる間は同じレベルのロックを保持しない"""
+        import threading
+
+        from infrastructure import level_lock
+
+        acquired = []
+
+        def digests():
+            def try_lock() -> None:
+                with level_lock(provisional_saver.config.digests_path, "weekly", timeout=0.05):
+                    acquired.append(True)
+
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join(5)
+            yield {"source_file": "Loop0001.txt"}
+
+        provisional_saver.save_provisional_stream("weekly", digests())
+
+        assert acquired == [True]
+
+
 class TestCLIStdinOption:
     """--stdin オプションのテスト"""
 
@@ -198,6 +299,7 @@ class TestCLIStdinOption:
         with patch('interfaces.save_provisional_digest.DigestConfig') as mock_config_class:
             mock_config = MagicMock()
             mock_config.digests_path = temp_plugin_env.digests_path
+            mock_config.essences_path = temp_plugin_env.essences_path
             provisional_dir = temp_plugin_env.digests_path / "1_Weekly" / "Provisional"
             provisional_dir.mkdir(parents=True, exist_ok=True)
             mock_config.get_provisional_dir.return_value = provisional_dir
@@ -210,6 +312,35 @@ class TestCLIStdinOption:
         provisional_files = list(provisional_dir.glob("*.txt"))
         assert len(provisional_files) == 1
 
+    @pytest.mark.integration
+    def test_stdin_jsonl_option(
+        self, temp_plugin_env: "TempPluginEnvironment", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--stdin --jsonl で1行1件の入力を保存"""
+        from interfaces.save_provisional_digest import main
+
+        records = [{"source_file": f"Loop{i:04d}.txt", "keywords": []} for i in range(1, 4)]
+        monkeypatch.setattr('sys.stdin', io.StringIO("\n".join(json.dumps(r) for r in records)))
+        monkeypatch.setattr(
+            'sys.argv', ['save_provisional_digest.py', 'weekly', '--stdin', '--jsonl']
+        )
+
+        with patch('interfaces.save_provisional_digest.DigestConfig') as mock_config_class:
+            mock_config = MagicMock()
+            mock_config.digests_path = temp_plugin_env.digests_path
+            mock_config.essences_path = temp_plugin_env.essences_path
+            provisional_dir = temp_plugin_env.digests_path / "1_Weekly" / "Provisional"
+            provisional_dir.mkdir(parents=True, exist_ok=True)
+            mock_config.get_provisional_dir.return_value = provisional_dir
+            mock_config_class.return_value = mock_config
+
+            main()
+
+        provisional_files = list(provisional_dir.glob("*.txt"))
+        assert len(provisional_files) == 1
+        data = json.loads(provisional_files[0].read_text(encoding="utf-8"))
+        assert len(data["individual_digests"]) == 3
+
     @pytest.mark.integration
     def test_error_when_no_input_and_no_stdin(
         self, temp_plugin_env: "TempPluginEnvironment", monkeypatch: pytest.MonkeyPatch
@@ -16,9 +16,11 @@ from tools.check_footer import (
     CheckResult,
     FooterDefinition,
     FooterStatus,
+    check_file,
     check_footer_in_file,
     fix_footer,
     parse_footer_md,
+    parse_stamp,
     print_report,
     run_check,
 )
@@ -488,8 +490,8 @@ class TestMain:
                     mock_footer = tmp_path / "_footer.md"
                     mock_footer.parent.mkdir(parents=True, exist_ok=True)
                     mock_footer.write_text("```text\n---\nFooter\n```\n", encoding="utf-8")
-                    mock_path.__truediv__ = (
-                        lambda s, x: tmp_path / x if x == "_footer.md" else tmp_path
+                    mock_path.__truediv__ = lambda s, x: (
+                        tmp_path / x if x == "_footer.md" else tmp_path
                     )
                     mock_path_cls.return_value = mock_path
                     mock_path_cls.__file__ = str(tmp_path / "check_footer.py")
@@ -504,3 +506,170 @@ class TestMain:
                     else:
                         # モックのセットアップが不完全でも最低限の検証
                         assert exc_info.value.code in (0, 1, 2)
+
+
+# =============================================================================
+# 末尾読み込み・並列処理・差分チェックのテスト
+# =============================================================================
+
+
+class TestTailRead:
+    """末尾だけを読むチェック・修正のテスト"""
+
+    FOOTER = "---\n**Footer** | [Link](https://example.com)"
+
+    def test_large_file_reads_only_tail(self, tmp_path: Path) -> None:
+        """大きなファイルでも末尾の窓だけを読む"""
+        from tools.check_footer import TAIL_READ_BYTES, _FileTail
+
+        test_file = tmp_path / "large.md"
+        test_file.write_text("本文\n" * 500_000 + "\n" + self.FOOTER + "\n", encoding="utf-8")
+
+        assert check_footer_in_file(test_file, self.FOOTER) == (FooterStatus.OK, None)
+        with open(test_file, "rb") as f:
+            tail = _FileTail(f)
+            tail.lines(5)
+            assert tail.size - tail.offset <= TAIL_READ_BYTES
+
+    def test_long_lines_expand_window(self, tmp_path: Path, monkeypatch) -> None:
+        """末尾の行が窓より長い場合は窓を広げて判定する"""
+        import tools.check_footer as check_footer
+
+        monkeypatch.setattr(check_footer, "TAIL_READ_BYTES", 8)
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# T\n\n" + "x" * 100 + "\n\n---\n**Wrong**\n", encoding="utf-8")
+
+        assert check_footer_in_file(test_file, self.FOOTER)[0] == FooterStatus.MISMATCH
+        assert fix_footer(test_file, self.FOOTER) is True
+        expected = "# T\n\n" + "x" * 100 + "\n\n" + self.FOOTER + "\n"
+        assert test_file.read_text(encoding="utf-8") == expected
+
+    def test_fix_keeps_body_and_crlf(self, tmp_path: Path, monkeypatch) -> None:
+        """修正は末尾だけを書き換え、CRLF の改行形式を保つ"""
+        import tools.check_footer as check_footer
+
+        monkeypatch.setattr(check_footer, "TAIL_READ_BYTES", 16)
+        body = "".join(f"line {i}\r\n" for i in range(200))
+        test_file = tmp_path / "crlf.md"
+        test_file.write_bytes((body + "\r\n---\r\nold\r\n\r\n").encode("utf-8"))
+
+        assert fix_footer(test_file, self.FOOTER) is True
+
+        expected = body.rstrip() + "\r\n\r\n" + self.FOOTER.replace("\n", "\r\n") + "\r\n"
+        assert test_file.read_bytes().decode("utf-8") == expected
+        assert check_footer_in_file(test_file, self.FOOTER) == (FooterStatus.OK, None)
+
+    def test_fix_when_only_blank_lines_precede_footer(self, tmp_path: Path, monkeypatch) -> None:
+        """既存フッターの前が空行だけの窓なら、本文まで窓を広げて空行を除く"""
+        import tools.check_footer as check_footer
+
+        monkeypatch.setattr(check_footer, "TAIL_READ_BYTES", 4)
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Title\n" + "\n" * 20 + "---\nold\n", encoding="utf-8")
+
+        fix_footer(test_file, self.FOOTER)
+
+        assert test_file.read_text(encoding="utf-8") == "# Title\n\n" + self.FOOTER + "\n"
+
+    def test_check_file_fixes_with_single_open(self, tmp_path: Path) -> None:
+        """check_file(fix=True) はチェックと修正を1回のオープンで行う"""
+        from unittest.mock import patch
+
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Title\n", encoding="utf-8")
+
+        with patch("builtins.open", wraps=open) as spy:
+            result = check_file(test_file, self.FOOTER, fix=True)
+
+        assert (result.status, result.message) == (FooterStatus.OK, "Fixed")
+        assert spy.call_count == 1
+        assert test_file.read_text(encoding="utf-8").endswith(self.FOOTER + "\n")
+
+    def test_check_file_not_found(self, tmp_path: Path) -> None:
+        """存在しないファイルは FILE_NOT_FOUND"""
+        result = check_file(tmp_path / "missing.md", self.FOOTER, fix=True)
+        assert result.status == FooterStatus.FILE_NOT_FOUND
+
+
+class TestRunCheckConcurrency:
+    """run_check() の並列処理と --changed-since のテスト"""
+
+    FOOTER = "---\n**Footer** | [Link](https://example.com)"
+
+    def _create(self, tmp_path: Path, count: int) -> Path:
+        base = tmp_path / "plugins-weave"
+        (base / "EpisodicRAG").mkdir(parents=True)
+        entries = "\n".join(f"- `DOC{i}.md`" for i in range(count))
+        (base / "EpisodicRAG" / "_footer.md").write_text(
+            f"```text\n{self.FOOTER}\n```\n\n### EpisodicRAG/\n{entries}\n- `DOC0.md`\n",
+            encoding="utf-8",
+        )
+        for i in range(count):
+            (base / "EpisodicRAG" / f"DOC{i}.md").write_text(f"# Doc {i}\n", encoding="utf-8")
+        return base
+
+    def _set_mtime(self, path: Path, mtime: float) -> None:
+        import os
+
+        os.utime(path, (mtime, mtime))
+
+    def test_parallel_keeps_order_and_dedupes(self, tmp_path: Path) -> None:
+        """並列でも定義順に結果を返し、重複したファイルは1回だけ修正する"""
+        base = self._create(tmp_path, 8)
+
+        results = run_check(base / "EpisodicRAG" / "_footer.md", base, fix=True, jobs=4)
+
+        names = [r.file_path.name for r in results]
+        assert names == [f"DOC{i}.md" for i in range(8)] + ["DOC0.md"]
+        assert all(r.status == FooterStatus.OK for r in results)
+        content = (base / "EpisodicRAG" / "DOC0.md").read_text(encoding="utf-8")
+        assert content == "# Doc 0\n\n" + self.FOOTER + "\n"
+
+    def test_changed_since_checks_only_newer_files(self, tmp_path: Path) -> None:
+        """stamp より後に変更されたファイルだけをチェックする"""
+        base = self._create(tmp_path, 3)
+        episodic = base / "EpisodicRAG"
+        for path in [episodic / "_footer.md", *episodic.glob("DOC*.md")]:
+            self._set_mtime(path, 1_000)
+        self._set_mtime(episodic / "DOC1.md", 3_000)
+
+        results = run_check(episodic / "_footer.md", base, changed_since=2_000)
+
+        assert [r.file_path.name for r in results] == ["DOC1.md"]
+
+    def test_changed_footer_definition_checks_all(self, tmp_path: Path) -> None:
+        """_footer.md 自体が変更されていれば全ファイルをチェックする"""
+        base = self._create(tmp_path, 3)
+        episodic = base / "EpisodicRAG"
+        for path in episodic.glob("DOC*.md"):
+            self._set_mtime(path, 1_000)
+        self._set_mtime(episodic / "_footer.md", 3_000)
+
+        results = run_check(episodic / "_footer.md", base, changed_since=2_000)
+
+        assert len(results) == 4
+
+    def test_parse_stamp_formats(self, tmp_path: Path) -> None:
+        """UNIX時刻・ISO 8601・ファイルの mtime を受け付ける"""
+        from datetime import datetime
+
+        stamp_file = tmp_path / ".footer-stamp"
+        stamp_file.write_text("", encoding="utf-8")
+        self._set_mtime(stamp_file, 1_234)
+
+        assert parse_stamp("1700000000.5") == 1700000000.5
+        assert parse_stamp("2025-01-01T00:00:00") == datetime(2025, 1, 1).timestamp()
+        assert parse_stamp(str(stamp_file)) == 1_234
+        with pytest.raises(ValueError):
+            parse_stamp(str(tmp_path / "missing-stamp"))
+
+    def test_main_rejects_invalid_stamp(self, monkeypatch) -> None:
+        """解釈できない --changed-since は終了コード2"""
+        from tools.check_footer import main
+
+        monkeypatch.setattr("sys.argv", ["check_footer.py", "--changed-since", "not-a-stamp"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
@@ -15,15 +15,20 @@ tools/link_checker.py のテスト
 7. サマリー生成
 """
 
+import json
+import os
 from pathlib import Path
 
 import pytest
 
+import tools.link_checker as link_checker
 from tools.link_checker import (
     CheckSummary,
+    LinkCheckCache,
     LinkCheckResult,
     LinkStatus,
     MarkdownLinkChecker,
+    parse_markdown,
 )
 
 
@@ -966,3 +971,166 @@ class TestLinkCheckerEdgeCases:
         )
         summary = checker.get_summary()
         assert summary.skipped == 1
+
+
+def _counting_parser(monkeypatch) -> list:
+    """parse_markdown の呼び出しを記録する（逐次解析時のみ有効）"""
+    parsed: list = []
+    original = link_checker.parse_markdown
+
+    def counting(file_path):
+        parsed.append(file_path.name)
+        return original(file_path)
+
+    monkeypatch.setattr(link_checker, "parse_markdown", counting)
+    return parsed
+
+
+class TestParseMarkdown:
+    """parse_markdown（解析フェーズ）のテスト"""
+
+    def test_extracts_links_and_headings(self, temp_docs_dir) -> None:
+        """リンクと見出しスラッグを1回の読み込みで抽出"""
+        file1 = temp_docs_dir / "index.md"
+        file1.write_text(
+            "# Index Page\n\n[Guide](guide.md) `[Code](x.md)`\n"
+            "```\n[Skip](skip.md)\n```\n<details id=\"More\">\n",
+            encoding="utf-8",
+        )
+
+        parsed = parse_markdown(file1)
+
+        assert parsed is not None
+        assert parsed.links == [(3, "Guide", "guide.md")]
+        assert parsed.headings == {"index-page", "more"}
+
+    def test_crlf_line_endings(self, temp_docs_dir) -> None:
+        """CRLFの行末でも見出しと行番号が変わらない"""
+        file1 = temp_docs_dir / "index.md"
+        file1.write_bytes(b"# Title\r\n\r\n[Link](#title)\r\n")
+
+        parsed = parse_markdown(file1)
+
+        assert parsed is not None
+        assert parsed.links == [(3, "Link", "#title")]
+        assert parsed.headings == {"title"}
+
+    def test_missing_file_returns_none(self, temp_docs_dir) -> None:
+        """存在しないファイルは None"""
+        assert parse_markdown(temp_docs_dir / "missing.md") is None
+
+
+class TestLinkCheckerEngine:
+    """2段階エンジン（並列解析・永続キャッシュ）のテスト"""
+
+    def _write_docs(self, docs: Path, count: int) -> None:
+        for i in range(count):
+            (docs / f"page{i}.md").write_text(
+                f"# Page {i}\n\n[Next](page{(i + 1) % count}.md#page-{(i + 1) % count})\n"
+                "[Broken](missing.md)\n",
+                encoding="utf-8",
+            )
+
+    def test_parallel_matches_sequential(self, temp_docs_dir, monkeypatch) -> None:
+        """プロセスプールでの解析結果が逐次解析と一致"""
+        self._write_docs(temp_docs_dir, 6)
+        monkeypatch.setattr(link_checker, "PARALLEL_MIN_FILES", 1)
+
+        parallel = MarkdownLinkChecker(temp_docs_dir, jobs=2).check_all()
+        sequential = MarkdownLinkChecker(temp_docs_dir, jobs=1).check_all()
+
+        assert sorted(r.to_dict().items() for r in parallel) == sorted(
+            r.to_dict().items() for r in sequential
+        )
+        assert len(parallel) == 12
+        assert sum(r.status == LinkStatus.VALID.value for r in parallel) == 6
+
+    def test_cache_skips_unchanged_files(self, temp_docs_dir, tmp_path, monkeypatch) -> None:
+        """2回目の実行では未変更のファイルを再解析しない"""
+        self._write_docs(temp_docs_dir, 3)
+        cache_file = tmp_path / "cache" / "links.json"
+        parsed = _counting_parser(monkeypatch)
+
+        first = MarkdownLinkChecker(temp_docs_dir, cache=LinkCheckCache(cache_file)).check_all()
+        assert sorted(parsed) == ["page0.md", "page1.md", "page2.md"]
+        assert cache_file.exists()
+
+        parsed.clear()
+        cache = LinkCheckCache(cache_file)
+        second = MarkdownLinkChecker(temp_docs_dir, cache=cache).check_all()
+
+        assert parsed == []
+        assert cache.hits == 3
+        assert [r.to_dict() for r in second] == [r.to_dict() for r in first]
+
+    def test_cache_reparses_changed_file(self, temp_docs_dir, tmp_path, monkeypatch) -> None:
+        """内容が変わったファイルだけを再解析し、新しい見出しで検証する"""
+        self._write_docs(temp_docs_dir, 3)
+        cache_file = tmp_path / "links.json"
+        MarkdownLinkChecker(temp_docs_dir, cache=LinkCheckCache(cache_file)).check_all()
+        (temp_docs_dir / "page1.md").write_text("# Renamed\n", encoding="utf-8")
+        parsed = _counting_parser(monkeypatch)
+
+        results = MarkdownLinkChecker(temp_docs_dir, cache=LinkCheckCache(cache_file)).check_all()
+
+        assert parsed == ["page1.md"]
+        to_page1 = [r for r in results if r.link_target == "page1.md#page-1"]
+        assert to_page1[0].status == LinkStatus.ANCHOR_MISSING.value
+
+    def test_cache_hash_match_after_touch(self, temp_docs_dir, tmp_path, monkeypatch) -> None:
+        """mtime だけが変わったファイルはハッシュ一致で再解析しない"""
+        self._write_docs(temp_docs_dir, 2)
+        cache_file = tmp_path / "links.json"
+        MarkdownLinkChecker(temp_docs_dir, cache=LinkCheckCache(cache_file)).check_all()
+        page0 = temp_docs_dir / "page0.md"
+        stat = page0.stat()
+        os.utime(page0, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        parsed = _counting_parser(monkeypatch)
+
+        cache = LinkCheckCache(cache_file)
+        MarkdownLinkChecker(temp_docs_dir, cache=cache).check_all()
+
+        assert parsed == []
+        assert cache.hits == 2
+
+    def test_corrupted_cache_is_ignored(self, temp_docs_dir, tmp_path) -> None:
+        """壊れたキャッシュファイルは空として扱う"""
+        self._write_docs(temp_docs_dir, 2)
+        cache_file = tmp_path / "links.json"
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        cache = LinkCheckCache(cache_file)
+        results = MarkdownLinkChecker(temp_docs_dir, cache=cache).check_all()
+
+        assert len(results) == 4
+        assert cache.misses == 2
+        assert json.loads(cache_file.read_text(encoding="utf-8"))["format_version"] == 1
+
+    def test_cache_drops_deleted_files(self, temp_docs_dir, tmp_path) -> None:
+        """削除されたファイルのエントリは次の保存で消える"""
+        self._write_docs(temp_docs_dir, 2)
+        cache_file = tmp_path / "links.json"
+        MarkdownLinkChecker(temp_docs_dir, cache=LinkCheckCache(cache_file)).check_all()
+        (temp_docs_dir / "page1.md").unlink()
+
+        MarkdownLinkChecker(temp_docs_dir, cache=LinkCheckCache(cache_file)).check_all()
+
+        files = json.loads(cache_file.read_text(encoding="utf-8"))["files"]
+        assert [Path(name).name for name in files] == ["page0.md"]
+
+    def test_main_with_cache_option(self, temp_docs_dir, tmp_path) -> None:
+        """--cache でキャッシュファイルを書き出す"""
+        from unittest.mock import patch
+
+        from tools.link_checker import main
+
+        (temp_docs_dir / "index.md").write_text("# Top\n[Top](#top)", encoding="utf-8")
+        cache_file = tmp_path / "links.json"
+        argv = ["link_checker.py", str(temp_docs_dir), "--cache", str(cache_file), "-j", "1"]
+
+        with patch("sys.argv", argv), patch("builtins.print"):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        assert cache_file.exists()
@@ -545,3 +545,127 @@ class TestCLIIntegration:
         assert "OK" in captured.out
         assert "Template structure valid" in captured.out
         assert "Path validation passed" in captured.out
+
+
+# =============================================================================
+# Cycle 5: コーパス検証（--corpus）
+# =============================================================================
+
+
+def _write_corpus(digests: Path, count: int = 3) -> None:
+    """RegularDigestBuilder の出力とProvisionalファイルでコーパスを作成"""
+    import json
+
+    from application.finalize.digest_builder import RegularDigestBuilder
+
+    weekly = digests / "1_Weekly"
+    provisional = weekly / "Provisional"
+    provisional.mkdir(parents=True)
+    entry = {
+        "source_file": "L00001_test.txt",
+        "digest_type": "開発",
+        "keywords": ["MCP"],
+        "abstract": {"long": "長い要約", "short": "短い要約"},
+        "impression": {"long": "長い所感", "short": "短い所感"},
+    }
+    shadow = {"digest_type": "統合", "keywords": ["MCP"], "abstract": "要約", "impression": "所感"}
+    for n in range(1, count + 1):
+        digest = RegularDigestBuilder.build(
+            "weekly",
+            f"W{n:04d}_テスト",
+            f"{n:04d}",
+            shadow,
+            [entry],  # type: ignore[arg-type]
+        )
+        (weekly / f"W{n:04d}_テスト.txt").write_text(
+            json.dumps(digest, ensure_ascii=False), encoding="utf-8"
+        )
+    (provisional / f"W{count + 1:04d}_Individual.txt").write_text(
+        json.dumps({"metadata": {"digest_level": "weekly"}, "individual_digests": [entry]}),
+        encoding="utf-8",
+    )
+
+
+class TestCorpusValidator:
+    """CorpusValidator（--corpus）のテスト"""
+
+    def test_valid_corpus(self, tmp_path: Path) -> None:
+        """確定ダイジェストとProvisionalファイルがすべて適合する"""
+        from tools.validate_json import CorpusValidator
+
+        _write_corpus(tmp_path)
+
+        reports = list(CorpusValidator(jobs=1).validate(tmp_path))
+
+        assert len(reports) == 4
+        assert all(r.valid for r in reports)
+        assert reports[-1].file_path.name == "W0004_Individual.txt"
+
+    def test_reports_broken_files(self, tmp_path: Path) -> None:
+        """構文エラーと構造エラーをファイルごとに報告する"""
+        from tools.validate_json import CorpusValidator
+
+        _write_corpus(tmp_path, count=1)
+        weekly = tmp_path / "1_Weekly"
+        (weekly / "W0002_broken.txt").write_text("{", encoding="utf-8")
+        (weekly / "W0003_shape.txt").write_text('{"metadata": {}}', encoding="utf-8")
+
+        invalid = {
+            r.file_path.name: r.errors
+            for r in CorpusValidator(jobs=1).validate(tmp_path)
+            if not r.valid
+        }
+
+        assert list(invalid) == ["W0002_broken.txt", "W0003_shape.txt"]
+        assert invalid["W0002_broken.txt"][0].startswith("JSON syntax error")
+        assert invalid["W0003_shape.txt"] == [
+            "overall_digest: missing",
+            "individual_digests: missing",
+        ]
+
+    def test_parallel_matches_sequential(self, tmp_path: Path, monkeypatch) -> None:
+        """プロセスプールでの検証結果が逐次と一致し、順序も保たれる"""
+        import tools.validate_json as validate_json
+        from tools.validate_json import CorpusValidator
+
+        _write_corpus(tmp_path, count=5)
+        (tmp_path / "1_Weekly" / "W0009_bad.txt").write_text("[]", encoding="utf-8")
+        monkeypatch.setattr(validate_json, "CORPUS_PARALLEL_MIN_FILES", 1)
+
+        parallel = list(CorpusValidator(jobs=2).validate(tmp_path))
+        sequential = list(CorpusValidator(jobs=1).validate(tmp_path))
+
+        assert [(r.file_path, r.errors) for r in parallel] == [
+            (r.file_path, r.errors) for r in sequential
+        ]
+        assert [r.valid for r in parallel].count(False) == 1
+
+    def test_report_format_truncates_errors(self, tmp_path: Path) -> None:
+        """1行の報告は先頭のエラーだけを表示し、残りの件数を添える"""
+        from tools.validate_json import CorpusFileReport
+
+        report = CorpusFileReport(tmp_path / "1_Weekly" / "W0001.txt", ["a", "b", "c", "d", "e"])
+
+        assert report.format(tmp_path) == str(Path("1_Weekly") / "W0001.txt") + (
+            ": 5 error(s): a; b; c (+2 more)"
+        )
+
+    def test_main_corpus_exit_codes(self, tmp_path: Path, capsys) -> None:
+        """--corpus は全ファイル適合で0、不適合があれば1"""
+        from tools.validate_json import main
+
+        _write_corpus(tmp_path)
+        assert main(["--corpus", str(tmp_path), "-j", "1"]) == 0
+        assert "4 digest file(s) valid" in capsys.readouterr().out
+
+        (tmp_path / "1_Weekly" / "W0009_bad.txt").write_text("{}", encoding="utf-8")
+        assert main(["--corpus", str(tmp_path), "-j", "1"]) == 1
+        err = capsys.readouterr().err
+        assert "W0009_bad.txt: 3 error(s): metadata: missing" in err
+        assert "1 of 5 file(s) invalid" in err
+
+    def test_main_corpus_missing_directory(self, tmp_path: Path) -> None:
+        """存在しないディレクトリは終了コード1"""
+        from tools.validate_json import main
+
+        assert main(["--corpus", str(tmp_path / "missing")]) == 1
@@ -9,21 +9,37 @@ Usage:
     python -m tools.check_footer          # チェック実行
     python -m tools.check_footer --fix    # 不足しているフッターを自動追加
     python -m tools.check_footer --quiet  # サマリーのみ出力
+    python -m tools.check_footer --changed-since .footer-stamp  # 変更されたファイルのみ
 
 Features:
     - _footer.md からフッター定義を読み込み
     - 適用対象ファイル一覧を自動抽出
     - OK / MISSING / MISMATCH を分類
     - --fix オプションで自動修正
+    - 各ファイルは末尾だけを1回読み（seek）、修正も同じファイルハンドルで行う
+    - 対象ファイルはスレッドプールで並列に処理（--jobs）
+    - --changed-since で指定時刻より後に変更されたファイルだけをチェック
 """
 
 import argparse
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple
+
+# 末尾から最初に読むバイト数（必要な行数が揃わなければ4倍ずつ広げる）
+TAIL_READ_BYTES = 4096
+
+# MISMATCH 判定で "---" を探す末尾の行数
+_MISMATCH_SCAN_LINES = 5
+
+# 修正時に既存フッターの "---" を探す末尾の行数
+_FIX_SCAN_LINES = 9
 
 
 class FooterStatus(Enum):
@@ -110,30 +126,59 @@ def parse_footer_md(footer_md_path: Path) -> FooterDefinition:
     return FooterDefinition(content=footer_content, target_files=target_files)
 
 
-def check_footer_in_file(
-    file_path: Path, expected_footer: str
-) -> Tuple[FooterStatus, Optional[str]]:
+class _FileTail:
     """
-    ファイル内のフッターをチェック
-
-    Args:
-        file_path: チェック対象ファイルのパス
-        expected_footer: 期待されるフッター内容
+    ファイル末尾の読み込み
 
-    Returns:
-        (ステータス, メッセージ) のタプル
+    末尾 TAIL_READ_BYTES から読み始め、必要な行数が揃うまで窓を4倍ずつ広げる
+    （広げた分だけを追加で読む）。窓の先頭は途中から始まる行を捨てて行頭にそろえる。
     """
-    if not file_path.exists():
-        return FooterStatus.FILE_NOT_FOUND, f"File not found: {file_path}"
-
-    content = file_path.read_text(encoding="utf-8")
-
-    # 末尾の空白行を除去してチェック
-    lines = content.rstrip().split("\n")
-
-    # 期待されるフッターの行
-    expected_lines = expected_footer.strip().split("\n")
 
+    def __init__(self, handle: BinaryIO):
+        self.handle = handle
+        self.size = handle.seek(0, os.SEEK_END)
+        self.offset = self.size  # text が始まるバイト位置
+        self.crlf = False
+        self._raw = b""
+        self._raw_start = self.size
+
+    def lines(self, min_lines: int) -> List[str]:
+        """
+        末尾の空白を除いた行を、min_lines より多く（またはファイル全体を）返す
+
+        改行は read_text() と同じく \n にそろえる。
+        """
+        window = TAIL_READ_BYTES
+        while True:
+            start = max(0, self.size - window)
+            if start < self._raw_start:
+                self.handle.seek(start)
+                self._raw = self.handle.read(self._raw_start - start) + self._raw
+                self._raw_start = start
+            data, offset = self._raw, start
+            if start > 0:
+                cut = data.find(b"\n")
+                if cut < 0:
+                    window *= 4
+                    continue
+                data, offset = data[cut + 1 :], start + cut + 1
+            text = data.decode("utf-8")
+            lines = _normalize_newlines(text).rstrip().split("\n")
+            if start == 0 or len(lines) > min_lines:
+                self.offset = offset
+                self.crlf = "\r\n" in text
+                return lines
+            window *= 4
+
+
+def _normalize_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _footer_status(
+    lines: List[str], expected_lines: List[str]
+) -> Tuple[FooterStatus, Optional[str]]:
+    """末尾の行と期待されるフッターを比較"""
     # 末尾N行を取得
     n = len(expected_lines)
     if len(lines) < n:
@@ -148,7 +193,7 @@ def check_footer_in_file(
     # フッターが存在するが内容が異なる場合
     # "---" で始まる行があればフッターらしきものが存在
     for i, line in enumerate(reversed(lines)):
-        if i >= 5:  # 末尾5行以内を探索
+        if i >= _MISMATCH_SCAN_LINES:  # 末尾5行以内を探索
             break
         if line.strip() == "---":
             return FooterStatus.MISMATCH, "Footer exists but content differs"
@@ -156,6 +201,58 @@ def check_footer_in_file(
     return FooterStatus.MISSING, "Footer not found"
 
 
+def _check_tail(tail: _FileTail, expected_footer: str) -> Tuple[FooterStatus, Optional[str]]:
+    expected_lines = expected_footer.strip().split("\n")
+    lines = tail.lines(max(len(expected_lines), _MISMATCH_SCAN_LINES))
+    return _footer_status(lines, expected_lines)
+
+
+def _fix_tail(tail: _FileTail, expected_footer: str) -> None:
+    """既存のフッター（末尾の "---" 以降）を除き、期待されるフッターを書き込む"""
+    min_lines = _FIX_SCAN_LINES
+    while True:
+        lines = tail.lines(min_lines)
+        footer_start = None
+        for i in range(len(lines) - 1, max(len(lines) - _FIX_SCAN_LINES - 1, -1), -1):
+            if lines[i].strip() == "---":
+                footer_start = i
+                break
+        # 既存フッターを除去
+        body = "\n".join(lines[:footer_start]).rstrip()
+        # 残りが空白だけなら、本文の末尾が読んだ範囲より前にあるので窓を広げる
+        if body or tail.offset == 0:
+            break
+        min_lines = len(lines)
+
+    # 新しいフッターを追加（読んだ範囲だけを書き換え、ファイルの改行形式を保つ）
+    new_tail = body + "\n\n" + expected_footer + "\n"
+    if tail.crlf:
+        new_tail = new_tail.replace("\n", "\r\n")
+    tail.handle.seek(tail.offset)
+    tail.handle.write(new_tail.encode("utf-8"))
+    tail.handle.truncate()
+
+
+def check_footer_in_file(
+    file_path: Path, expected_footer: str
+) -> Tuple[FooterStatus, Optional[str]]:
+    """
+    ファイル内のフッターをチェック（末尾だけを読む）
+
+    Args:
+        file_path: チェック対象ファイルのパス
+        expected_footer: 期待されるフッター内容
+
+    Returns:
+        (ステータス, メッセージ) のタプル
+    """
+    if not file_path.exists():
+        return FooterStatus.FILE_NOT_FOUND, f"File not found: {file_path}"
+
+    with open(file_path, "rb") as f:
+        return _check_tail(_FileTail(f), expected_footer)
+
+
 def fix_footer(file_path: Path, expected_footer: str) -> bool:
     """
     フッターを修正（追加または置換）
@@ -170,34 +267,84 @@ def fix_footer(file_path: Path, expected_footer: str) -> bool:
     if not file_path.exists():
         return False
 
-    content = file_path.read_text(encoding="utf-8")
+    with open(file_path, "r+b") as f:
+        _fix_tail(_FileTail(f), expected_footer)
+    return True
 
-    # 末尾の空白行を除去
-    content = content.rstrip()
 
-    # 既存のフッター（---で始まる最後のブロック）を除去
-    lines = content.split("\n")
-    footer_start = None
+def check_file(file_path: Path, expected_footer: str, fix: bool = False) -> CheckResult:
+    """
+    1ファイルをチェックし、必要なら同じ読み込みのまま修正
 
-    for i in range(len(lines) - 1, max(len(lines) - 10, -1), -1):
-        if lines[i].strip() == "---":
-            footer_start = i
-            break
+    Args:
+        file_path: 対象ファイルのパス
+        expected_footer: 期待されるフッター内容
+        fix: True の場合、MISSING / MISMATCH を修正
 
-    if footer_start is not None:
-        # 既存フッターを除去
-        lines = lines[:footer_start]
-        content = "\n".join(lines).rstrip()
+    Returns:
+        チェック結果（修正した場合は OK / "Fixed"）
+    """
+    if not file_path.exists():
+        return CheckResult(file_path, FooterStatus.FILE_NOT_FOUND, f"File not found: {file_path}")
 
-    # 新しいフッターを追加
-    new_content = content + "\n\n" + expected_footer + "\n"
-    file_path.write_text(new_content, encoding="utf-8")
+    with open(file_path, "r+b" if fix else "rb") as f:
+        tail = _FileTail(f)
+        status, message = _check_tail(tail, expected_footer)
+        if fix and status in (FooterStatus.MISSING, FooterStatus.MISMATCH):
+            _fix_tail(tail, expected_footer)
+            status, message = FooterStatus.OK, "Fixed"
 
-    return True
+    return CheckResult(file_path=file_path, status=status, message=message)
+
+
+def parse_stamp(value: str) -> float:
+    """
+    --changed-since の値を UNIX 時刻（秒）に変換
+
+    Args:
+        value: UNIX 時刻、ISO 8601 形式の日時、または mtime を基準にするファイルのパス
+
+    Returns:
+        UNIX 時刻（秒）
+
+    Raises:
+        ValueError: どの形式としても解釈できない場合
+
+    Example:
+        >>> parse_stamp("1735689600")
+        1735689600.0
+        >>> parse_stamp(".footer-stamp")  # 前回成功時に touch したファイル
+        1735689600.123
+    """
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        pass
+    try:
+        return Path(value).stat().st_mtime
+    except OSError:
+        raise ValueError(f"Invalid --changed-since value: {value}") from None
+
+
+def _changed_since(file_path: Path, stamp: float) -> bool:
+    """stamp より後に変更されたか（存在しないファイルは常にチェック対象）"""
+    try:
+        return file_path.stat().st_mtime > stamp
+    except OSError:
+        return True
 
 
 def run_check(
-    footer_md_path: Path, base_path: Path, fix: bool = False, quiet: bool = False
+    footer_md_path: Path,
+    base_path: Path,
+    fix: bool = False,
+    quiet: bool = False,
+    jobs: Optional[int] = None,
+    changed_since: Optional[float] = None,
 ) -> List[CheckResult]:
     """
     フッターチェックを実行
@@ -207,25 +354,33 @@ def run_check(
         base_path: 対象ファイルのベースパス
         fix: True の場合、問題を自動修正
         quiet: True の場合、サマリーのみ出力
+        jobs: 並列スレッド数（省略時は ThreadPoolExecutor の既定値、1 なら逐次）
+        changed_since: 指定した UNIX 時刻より後に変更されたファイルだけをチェック
+            （_footer.md 自体が変更されていれば全ファイル）
 
     Returns:
-        チェック結果のリスト
+        チェック結果のリスト（対象ファイルの定義順）
     """
     definition = parse_footer_md(footer_md_path)
-    results: List[CheckResult] = []
+    file_paths = [base_path / relative_path for relative_path in definition.target_files]
 
-    for relative_path in definition.target_files:
-        file_path = base_path / relative_path
-        status, message = check_footer_in_file(file_path, definition.content)
+    if changed_since is not None and not _changed_since(footer_md_path, changed_since):
+        file_paths = [f for f in file_paths if _changed_since(f, changed_since)]
 
-        if fix and status in (FooterStatus.MISSING, FooterStatus.MISMATCH):
-            if fix_footer(file_path, definition.content):
-                message = "Fixed"
-                status = FooterStatus.OK
+    # 同じファイルを複数のスレッドで書き換えないよう、重複を除いて処理する
+    unique_paths = list(dict.fromkeys(file_paths))
 
-        results.append(CheckResult(file_path=file_path, status=status, message=message))
+    def process(file_path: Path) -> CheckResult:
+        return check_file(file_path, definition.content, fix=fix)
 
-    return results
+    if jobs == 1 or len(unique_paths) <= 1:
+        checked = [process(f) for f in unique_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            checked = list(pool.map(process, unique_paths))
+
+    by_path = dict(zip(unique_paths, checked))
+    return [by_path[f] for f in file_paths]
 
 
 def print_report(results: List[CheckResult], quiet: bool = False) -> None:
@@ -275,8 +430,24 @@ def main() -> None:
     )
     parser.add_argument("--fix", action="store_true", help="Auto-fix missing or mismatched footers")
     parser.add_argument("--quiet", action="store_true", help="Only print summary")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None, help="Number of worker threads (1 = sequential)"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="STAMP",
+        help="Only check files modified after STAMP "
+        "(UNIX time, ISO 8601 datetime, or a file whose mtime is used)",
+    )
     args = parser.parse_args()
 
+    changed_since = None
+    if args.changed_since:
+        try:
+            changed_since = parse_stamp(args.changed_since)
+        except ValueError as e:
+            parser.error(str(e))
+
     # パス設定
     scripts_path = Path(__file__).parent.parent
     episodic_rag_path = scripts_path.parent
@@ -284,7 +455,14 @@ def main() -> None:
     base_path = episodic_rag_path.parent  # plugins-weave/
 
     try:
-        results = run_check(footer_md_path, base_path, fix=args.fix, quiet=args.quiet)
+        results = run_check(
+            footer_md_path,
+            base_path,
+            fix=args.fix,
+            quiet=args.quiet,
+            jobs=args.jobs,
+            changed_since=changed_since,
+        )
         print_report(results, quiet=args.quiet)
 
         # 問題があれば終了コード1
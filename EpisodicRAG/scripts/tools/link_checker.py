@@ -10,6 +10,8 @@ Usage:
     python -m tools.link_checker [docs_path]           # 検証実行
     python -m tools.link_checker [docs_path] --verbose # 詳細出力
     python -m tools.link_checker [docs_path] --json    # JSON出力
+    python -m tools.link_checker [docs_path] --cache .cache/links.json  # 差分実行
+    python -m tools.link_checker [docs_path] --jobs 4  # 解析の並列数
 
 Features:
     1. 相対リンクの有効性検証 [text](path/to/file.md)
@@ -18,6 +20,15 @@ Features:
     4. 外部リンクの検出（検証はスキップ）
     5. 検証結果のサマリー出力
 
+Engine:
+    check_all() は2段階で検証する。
+    1. 解析: 各.mdファイルを1回だけ読み、リンクと見出しスラッグを抽出する
+       （ファイル数が PARALLEL_MIN_FILES 以上ならプロセスプールで並列実行）
+    2. 解決: 全リンクを、メモリ上のスラッグ表とディレクトリ一覧で検証する
+       （リンク先ごとのファイル再読み込み・stat・globを行わない）
+    --cache を指定すると解析結果を mtime / サイズ / SHA-256 で保存し、
+    次回は変更されたファイルだけを再解析する。
+
 lychee compatibility:
     - 絵文字は削除される
     - スペースはハイフンに変換
@@ -27,13 +38,38 @@ lychee compatibility:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.loop_manifest import RACY_WINDOW_NS
+
+# Markdownリンクパターン: [text](url)
+LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+
+# Markdown見出しパターン: # Heading
+HEADING_PATTERN = re.compile(r"^#+\s+(.+)$", re.MULTILINE)
+
+# HTML id属性（<details id="..."> 等、lychee互換）
+ID_PATTERN = re.compile(r'id=["\']([^"\']+)["\']')
+
+# この数未満のファイルはプロセスプールを使わずに解析する（起動コストの方が大きい）
+PARALLEL_MIN_FILES = 32
+
+# 解析キャッシュの形式バージョン
+CACHE_FORMAT_VERSION = 1
+
+# (行番号, リンクテキスト, リンク先)
+LinkRef = Tuple[int, str, str]
 
 
 class LinkStatus(Enum):
@@ -79,11 +115,258 @@ class CheckSummary:
         return asdict(self)
 
 
+@dataclass
+class ParsedMarkdown:
+    """1ファイルの解析結果（リンクと見出しスラッグ）"""
+
+    links: List[LinkRef]
+    headings: Set[str]
+    sha256: str
+
+    def to_dict(self) -> Dict:
+        """辞書形式に変換（キャッシュ保存用）"""
+        return {
+            "links": [list(link) for link in self.links],
+            "headings": sorted(self.headings),
+            "sha256": self.sha256,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParsedMarkdown":
+        """辞書から復元"""
+        return cls(
+            links=[(int(line), str(text), str(target)) for line, text, target in data["links"]],
+            headings=set(data["headings"]),
+            sha256=str(data["sha256"]),
+        )
+
+
+def slugify(text: str) -> str:
+    """
+    見出しテキストをスラッグ化（lychee/GitHub互換）
+
+    lychee/GitHub's algorithm (per github-slugger):
+    1. Lowercase
+    2. Remove punctuation, emojis, special chars (keep letters, numbers, spaces, hyphens)
+    3. Replace spaces with hyphens
+    4. Do NOT strip leading/trailing hyphens (lychee behavior)
+
+    Args:
+        text: 見出しテキスト
+
+    Returns:
+        スラッグ化されたテキスト
+    """
+    # 小文字化
+    slug = text.lower()
+
+    # 特殊文字・絵文字を除去（日本語・英数字・スペース・ハイフンは保持）
+    # Letters (a-z), numbers (0-9), Japanese (hiragana, katakana, kanji), space, hyphen
+    # Note: underscore is kept per GitHub/lychee spec
+    # Katakana range split: U+30A0-30FA (letters), skip U+30FB (nakaguro), U+30FC-30FF (marks)
+    slug = re.sub(r"[^a-z0-9_\u3040-\u309F\u30A0-\u30FA\u30FC-\u30FF\u4E00-\u9FFF \-]", "", slug)
+
+    # スペースをハイフンに（各スペースを個別に置換）
+    slug = slug.replace(" ", "-")
+
+    # Note: lychee/GitHubは連続ハイフンを保持し、先頭・末尾も削除しない
+    # これにより「## 📥 必須パラメータ」は「-必須パラメータ」となり、
+    # リンク「#必須パラメータ」との不一致を正しく検出できる
+
+    return slug
+
+
+def find_code_spans(line: str) -> List[Tuple[int, int]]:
+    """
+    行内のインラインコードスパン（`...`）の位置を特定
+
+    Args:
+        line: 検査する行
+
+    Returns:
+        (start, end) タプルのリスト
+    """
+    spans = []
+    in_code = False
+    start = 0
+
+    for i, char in enumerate(line):
+        if char == "`":
+            if not in_code:
+                in_code = True
+                start = i
+            else:
+                spans.append((start, i + 1))
+                in_code = False
+
+    return spans
+
+
+def _in_code_span(start: int, code_spans: List[Tuple[int, int]]) -> bool:
+    return any(span_start <= start < span_end for span_start, span_end in code_spans)
+
+
+def parse_markdown(file_path: Path) -> Optional[ParsedMarkdown]:
+    """
+    Markdownファイルを1回だけ読み、リンクと見出しスラッグを抽出
+
+    プロセスプールから呼べるようモジュール関数にしている。
+    UTF-8 として読めないファイルはリンク・見出しなしとして扱う。
+
+    Args:
+        file_path: 対象ファイル
+
+    Returns:
+        解析結果（ファイルが存在しない・読めない場合は None）
+
+    Example:
+        >>> parse_markdown(Path("docs/index.md"))
+        ParsedMarkdown(links=[(3, 'Guide', 'guide.md')], headings={'index'}, sha256='...')
+    """
+    try:
+        raw = file_path.read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        # read_text() と同じく改行を \n にそろえる
+        content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    except UnicodeDecodeError:
+        return ParsedMarkdown(links=[], headings=set(), sha256=digest)
+
+    links: List[LinkRef] = []
+    in_code_block = False
+    for line_num, line in enumerate(content.split("\n"), start=1):
+        # コードブロック（```）の開始/終了を追跡
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+
+        # コードブロック内のリンクはスキップ
+        if in_code_block:
+            continue
+
+        # インラインコード内のリンクはスキップ
+        code_spans = find_code_spans(line) if "`" in line else []
+        for match in LINK_PATTERN.finditer(line):
+            if _in_code_span(match.start(), code_spans):
+                continue
+            links.append((line_num, match.group(1), match.group(2)))
+
+    headings = {slugify(match.group(1).strip()) for match in HEADING_PATTERN.finditer(content)}
+    headings.update(match.group(1).lower() for match in ID_PATTERN.finditer(content))
+    return ParsedMarkdown(links=links, headings=headings, sha256=digest)
+
+
+def _file_sha256(file_path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class LinkCheckCache:
+    """
+    解析結果の永続キャッシュ（ファイルの mtime / サイズ / SHA-256 で有効性を判定）
+
+    mtime とサイズが保存時と同じなら再読み込みせずに使う。
+    mtime だけが変わった場合（checkout や touch）は内容のハッシュを比べ、
+    同じなら解析結果を使い回す。
+    save() は今回の実行で参照したファイルだけを書き出す（削除されたファイルは消える）。
+
+    Example:
+        >>> cache = LinkCheckCache(Path(".cache/link_checker.json"))
+        >>> checker = MarkdownLinkChecker(Path("../docs"), cache=cache)
+        >>> checker.check_all()
+        >>> cache.hits, cache.misses
+        (41, 1)
+    """
+
+    def __init__(self, cache_file: Path):
+        """
+        Args:
+            cache_file: キャッシュファイルのパス（存在しなければ空で開始）
+        """
+        self.cache_file = cache_file
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._touched: Dict[str, Dict[str, Any]] = {}
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("format_version") == CACHE_FORMAT_VERSION:
+            files = data.get("files")
+            if isinstance(files, dict):
+                self._entries = files
+
+    def lookup(self, file_path: Path) -> Optional[ParsedMarkdown]:
+        """
+        キャッシュ済みの解析結果が現在のファイルと一致すれば返す
+
+        Returns:
+            解析結果（未登録・変更あり・ファイルなしの場合は None）
+        """
+        key = str(file_path)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            stat = file_path.stat()
+            parsed = ParsedMarkdown.from_dict(entry)
+            same_stat = (
+                entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+                and stat.st_mtime_ns < int(entry["checked_at_ns"]) - RACY_WINDOW_NS
+            )
+        except (OSError, KeyError, TypeError, ValueError):
+            self.misses += 1
+            return None
+        if not same_stat and (
+            entry["size"] != stat.st_size or _file_sha256(file_path) != parsed.sha256
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        if same_stat:
+            self._touched[key] = entry
+        else:
+            self.store(file_path, parsed, stat.st_mtime_ns, stat.st_size)
+        return parsed
+
+    def store(self, file_path: Path, parsed: ParsedMarkdown, mtime_ns: int, size: int) -> None:
+        """
+        解析結果を登録
+
+        Args:
+            file_path: 対象ファイル
+            parsed: 解析結果
+            mtime_ns / size: 解析前に取得した stat の値
+                （解析中に書き換えられた場合、次回は mtime の不一致で再確認される）
+        """
+        entry = dict(parsed.to_dict(), mtime_ns=mtime_ns, size=size, checked_at_ns=time.time_ns())
+        self._entries[str(file_path)] = entry
+        self._touched[str(file_path)] = entry
+
+    def save(self) -> None:
+        """今回参照したエントリを書き出す（失敗しても検証結果には影響しない）"""
+        data = {"format_version": CACHE_FORMAT_VERSION, "files": self._touched}
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"Warning: Failed to write link cache {self.cache_file}: {e}", file=sys.stderr)
+
+
 class MarkdownLinkChecker:
     """Markdownファイルのリンク検証"""
 
     # Markdownリンクパターン: [text](url)
-    LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+    LINK_PATTERN = LINK_PATTERN
 
     # 外部リンクパターン
     EXTERNAL_PATTERN = re.compile(r"^https?://", re.IGNORECASE)
@@ -93,30 +376,53 @@ class MarkdownLinkChecker:
         r"^#[-a-z0-9\u3040-\u309F\u30A0-\u30FA\u30FC-\u30FF\u4E00-\u9FFF]+$", re.IGNORECASE
     )
 
-    def __init__(self, docs_root: Path):
+    def __init__(
+        self,
+        docs_root: Path,
+        jobs: Optional[int] = None,
+        cache: Optional[LinkCheckCache] = None,
+    ):
         """
         Args:
             docs_root: ドキュメントルートディレクトリ
+            jobs: 解析の並列プロセス数（省略時は CPU 数、1 なら常に逐次）
+            cache: 解析結果の永続キャッシュ（省略時は毎回すべて解析）
         """
         self.docs_root = docs_root.resolve()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache = cache
         self.results: List[LinkCheckResult] = []
+        # スラッグ表（ファイル → 見出しスラッグ）とディレクトリ一覧（ディレクトリ → 名前）
         self._heading_cache: Dict[Path, Set[str]] = {}
+        self._dir_listing: Dict[Path, Optional[Set[str]]] = {}
 
     def check_all(self) -> List[LinkCheckResult]:
         """
         全.mdファイルを検証
 
+        1. 全ファイルを解析（キャッシュにないものだけ、必要なら並列で）
+        2. 解析済みのリンクをスラッグ表とディレクトリ一覧で解決
+
         Returns:
             検証結果のリスト
         """
         self.results = []
+        self._heading_cache = {}
+        self._dir_listing = {}
 
         if not self.docs_root.exists():
             return self.results
 
-        for md_file in self.docs_root.rglob("*.md"):
-            self.check_file(md_file)
+        md_files = list(self.docs_root.rglob("*.md"))
+        parsed = self._parse_all(md_files)
+
+        for md_file in md_files:
+            parsed_file = parsed.get(md_file)
+            if parsed_file is not None:
+                self._resolve_links(md_file, parsed_file.links)
 
+        if self.cache is not None:
+            self.cache.save()
         return self.results
 
     def check_file(self, file_path: Path) -> List[LinkCheckResult]:
@@ -129,44 +435,84 @@ class MarkdownLinkChecker:
         Returns:
             検証結果のリスト
         """
-        file_results: List[LinkCheckResult] = []
+        parsed = self._parse(file_path)
+        if parsed is None:
+            return []
+        return self._resolve_links(file_path, parsed.links)
 
-        if not file_path.exists():
-            return file_results
+    def _parse_all(self, md_files: List[Path]) -> Dict[Path, Optional[ParsedMarkdown]]:
+        """
+        解析フェーズ: キャッシュを引き、残りのファイルを解析してスラッグ表を作る
 
+        Returns:
+            ファイル → 解析結果
+        """
+        parsed: Dict[Path, Optional[ParsedMarkdown]] = {}
+        stale: List[Tuple[Path, Optional[os.stat_result]]] = []
+        for md_file in md_files:
+            hit = self.cache.lookup(md_file) if self.cache is not None else None
+            if hit is not None:
+                parsed[md_file] = hit
+            else:
+                stale.append((md_file, self._stat(md_file)))
+
+        stale_files = [md_file for md_file, _stat in stale]
+        for (md_file, stat), result in zip(stale, self._parse_many(stale_files)):
+            parsed[md_file] = result
+            self._store(md_file, result, stat)
+
+        for md_file, result in parsed.items():
+            if result is not None:
+                self._heading_cache[md_file] = result.headings
+        return parsed
+
+    def _parse_many(self, files: List[Path]) -> Iterable[Optional[ParsedMarkdown]]:
+        """ファイル群を解析（少数または jobs=1 なら逐次、それ以外はプロセスプール）"""
+        if self.jobs <= 1 or len(files) < PARALLEL_MIN_FILES:
+            return [parse_markdown(f) for f in files]
+        workers = min(self.jobs, len(files))
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return file_results
-
-        lines = content.split("\n")
-        in_code_block = False
-
-        for line_num, line in enumerate(lines, start=1):
-            # コードブロック（```）の開始/終了を追跡
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-
-            # コードブロック内のリンクはスキップ
-            if in_code_block:
-                continue
-
-            # インラインコードスパン（`...`）の位置を特定
-            code_spans = self._find_code_spans(line)
-
-            for match in self.LINK_PATTERN.finditer(line):
-                # インラインコード内のリンクはスキップ
-                if self._is_in_code_span(match.start(), match.end(), code_spans):
-                    continue
-
-                link_text = match.group(1)
-                link_target = match.group(2)
-
-                result = self._validate_link(file_path, line_num, link_text, link_target)
-                file_results.append(result)
-                self.results.append(result)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(files) // (workers * 4))
+                return list(pool.map(parse_markdown, files, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # プロセスを作れない環境（一部のサンドボックス等）では逐次に切り替える
+            return [parse_markdown(f) for f in files]
+
+    def _parse(self, file_path: Path) -> Optional[ParsedMarkdown]:
+        """1ファイルを解析（キャッシュ経由）し、スラッグ表に登録"""
+        parsed = self.cache.lookup(file_path) if self.cache is not None else None
+        if parsed is None:
+            stat = self._stat(file_path)
+            parsed = parse_markdown(file_path)
+            self._store(file_path, parsed, stat)
+        if parsed is not None:
+            self._heading_cache[file_path] = parsed.headings
+        return parsed
+
+    @staticmethod
+    def _stat(file_path: Path) -> Optional[os.stat_result]:
+        try:
+            return file_path.stat()
+        except OSError:
+            return None
 
+    def _store(
+        self,
+        file_path: Path,
+        parsed: Optional[ParsedMarkdown],
+        stat: Optional[os.stat_result],
+    ) -> None:
+        if self.cache is not None and parsed is not None and stat is not None:
+            self.cache.store(file_path, parsed, stat.st_mtime_ns, stat.st_size)
+
+    def _resolve_links(self, source_file: Path, links: List[LinkRef]) -> List[LinkCheckResult]:
+        """解決フェーズ: 解析済みのリンクを検証して results に追加"""
+        file_results = [
+            self._validate_link(source_file, line_num, link_text, link_target)
+            for line_num, link_text, link_target in links
+        ]
+        self.results.extend(file_results)
         return file_results
 
     def _validate_link(
@@ -228,7 +574,7 @@ class MarkdownLinkChecker:
         # ファイルパス解決
         target_path = self._resolve_path(source_file, file_part)
 
-        if target_path is None or not target_path.exists():
+        if target_path is None or not self._exists(target_path):
             suggestion = self._suggest_correction(source_file, file_part)
             return LinkCheckResult(
                 file_path=rel_path,
@@ -282,6 +628,27 @@ class MarkdownLinkChecker:
         # docs_root外へのアクセスは許可（プロジェクト内の他ファイル参照）
         return resolved
 
+    def _exists(self, path: Path) -> bool:
+        """
+        ディレクトリ一覧でパスの存在を確認
+
+        一覧にない場合だけ stat で確かめる（大文字小文字を区別しないファイルシステムでの
+        判定を従来の exists() とそろえるため。壊れたリンクでしか発生しない）。
+        """
+        listing = self._list_dir(path.parent)
+        if listing is not None and path.name in listing:
+            return True
+        return path.exists()
+
+    def _list_dir(self, dir_path: Path) -> Optional[Set[str]]:
+        """ディレクトリ内の名前の一覧（キャッシュ付き、存在しなければ None）"""
+        if dir_path not in self._dir_listing:
+            try:
+                self._dir_listing[dir_path] = set(os.listdir(dir_path))
+            except OSError:
+                self._dir_listing[dir_path] = None
+        return self._dir_listing[dir_path]
+
     def _validate_anchor(self, file_path: Path, anchor: str) -> bool:
         """
         アンカー（見出し）の存在確認
@@ -298,7 +665,7 @@ class MarkdownLinkChecker:
 
     def _get_headings(self, file_path: Path) -> Set[str]:
         """
-        ファイル内の見出しを取得（キャッシュ付き）
+        ファイル内の見出しを取得（スラッグ表から。未解析のファイルはここで解析する）
 
         Args:
             file_path: 対象ファイル
@@ -309,94 +676,16 @@ class MarkdownLinkChecker:
         if file_path in self._heading_cache:
             return self._heading_cache[file_path]
 
-        headings: Set[str] = set()
-
-        if not file_path.exists():
-            return headings
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return headings
-
-        # Markdown見出しパターン: # Heading
-        heading_pattern = re.compile(r"^#+\s+(.+)$", re.MULTILINE)
-
-        for match in heading_pattern.finditer(content):
-            heading_text = match.group(1).strip()
-            slug = self._slugify(heading_text)
-            headings.add(slug)
-
-        # HTML id属性も抽出（<details id="..."> 等、lychee互換）
-        id_pattern = re.compile(r'id=["\']([^"\']+)["\']')
-        for match in id_pattern.finditer(content):
-            headings.add(match.group(1).lower())
-
-        self._heading_cache[file_path] = headings
-        return headings
+        parsed = self._parse(file_path)
+        return parsed.headings if parsed is not None else set()
 
     def _slugify(self, text: str) -> str:
-        """
-        見出しテキストをスラッグ化（lychee/GitHub互換）
-
-        lychee/GitHub's algorithm (per github-slugger):
-        1. Lowercase
-        2. Remove punctuation, emojis, special chars (keep letters, numbers, spaces, hyphens)
-        3. Replace spaces with hyphens
-        4. Do NOT strip leading/trailing hyphens (lychee behavior)
-
-        Args:
-            text: 見出しテキスト
-
-        Returns:
-            スラッグ化されたテキスト
-        """
-        # 小文字化
-        slug = text.lower()
-
-        # 特殊文字・絵文字を除去（日本語・英数字・スペース・ハイフンは保持）
-        # Letters (a-z), numbers (0-9), Japanese (hiragana, katakana, kanji), space, hyphen
-        # Note: underscore is kept per GitHub/lychee spec
-        # Katakana range split: U+30A0-30FA (letters), skip U+30FB (nakaguro), U+30FC-30FF (marks)
-        slug = re.sub(
-            r"[^a-z0-9_\u3040-\u309F\u30A0-\u30FA\u30FC-\u30FF\u4E00-\u9FFF \-]", "", slug
-        )
-
-        # スペースをハイフンに（各スペースを個別に置換）
-        slug = slug.replace(" ", "-")
-
-        # Note: lychee/GitHubは連続ハイフンを保持し、先頭・末尾も削除しない
-        # これにより「## 📥 必須パラメータ」は「-必須パラメータ」となり、
-        # リンク「#必須パラメータ」との不一致を正しく検出できる
-
-        return slug
+        """見出しテキストをスラッグ化（slugify() を参照）"""
+        return slugify(text)
 
     def _find_code_spans(self, line: str) -> List[tuple]:
-        """
-        行内のインラインコードスパン（`...`）の位置を特定
-
-        Args:
-            line: 検査する行
-
-        Returns:
-            (start, end) タプルのリスト
-        """
-        spans = []
-        in_code = False
-        start = 0
-
-        i = 0
-        while i < len(line):
-            if line[i] == '`':
-                if not in_code:
-                    in_code = True
-                    start = i
-                else:
-                    spans.append((start, i + 1))
-                    in_code = False
-            i += 1
-
-        return spans
+        """行内のインラインコードスパン（`...`）の位置を特定（find_code_spans() を参照）"""
+        return find_code_spans(line)
 
     def _is_in_code_span(self, start: int, end: int, code_spans: List[tuple]) -> bool:
         """
@@ -410,10 +699,7 @@ class MarkdownLinkChecker:
         Returns:
             コードスパン内ならTrue
         """
-        for span_start, span_end in code_spans:
-            if span_start <= start < span_end:
-                return True
-        return False
+        return _in_code_span(start, code_spans)
 
     def _suggest_correction(self, source_file: Path, broken_target: str) -> Optional[str]:
         """
@@ -426,14 +712,11 @@ class MarkdownLinkChecker:
         Returns:
             修正案、または None
         """
-        # 同じディレクトリ内で類似ファイルを検索
+        # 同じディレクトリ内で類似ファイルを検索（ディレクトリ一覧を再利用）
         target_name = Path(broken_target).name
-        parent_dir = source_file.parent
-
-        if parent_dir.exists():
-            for f in parent_dir.glob("*.md"):
-                if f.name.lower() == target_name.lower() and f.name != target_name:
-                    return f"Did you mean '{f.name}'?"
+        for name in sorted(self._list_dir(source_file.parent) or ()):
+            if name.endswith(".md") and name.lower() == target_name.lower() and name != target_name:
+                return f"Did you mean '{name}'?"
 
         return f"File not found: {broken_target}"
 
@@ -497,6 +780,7 @@ Examples:
     python -m tools.link_checker ../docs
     python -m tools.link_checker ../docs --verbose
     python -m tools.link_checker ../docs --json > results.json
+    python -m tools.link_checker ../docs --cache .cache/link_checker.json
         """,
     )
 
@@ -528,6 +812,21 @@ Examples:
         help="エラーのみ表示",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="解析の並列プロセス数（デフォルト: CPU数、1で逐次）",
+    )
+
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="解析結果のキャッシュファイル（変更されたファイルだけを再解析）",
+    )
+
     args = parser.parse_args()
 
     # パス解決
@@ -538,7 +837,8 @@ Examples:
         sys.exit(1)
 
     # 検証実行
-    checker = MarkdownLinkChecker(docs_path)
+    cache = LinkCheckCache(args.cache) if args.cache else None
+    checker = MarkdownLinkChecker(docs_path, jobs=args.jobs, cache=cache)
     checker.check_all()
 
     summary = checker.get_summary()
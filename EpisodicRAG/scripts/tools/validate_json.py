@@ -9,20 +9,40 @@ Usage:
     python -m tools.validate_json config.json               # 基本検証
     python -m tools.validate_json config.json --template t.json  # テンプレート整合性
     python -m tools.validate_json config.json --check-paths # パス形式検証
+    python -m tools.validate_json --corpus ../data/Digests  # 全ダイジェストの構造検証
 
 Features:
     - JSON構文の検証
     - config.template.json との構造整合性チェック
     - パス形式の検証（相対パス/絶対パス）
+    - Digests/ 配下の全RegularDigest・Provisionalファイルの構造検証（--corpus）
+
+Corpus mode:
+    domain/types の TypedDict（RegularDigestData / ProvisionalDigestFile）を
+    compile_schema() で検証関数に1回だけコンパイルし、全ファイルを
+    プロセスプールで流して、エラーのあるファイルだけを1行ずつ報告する。
 """
 
 import argparse
 import json
+import os
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+from domain.file_constants import INDIVIDUAL_DIGEST_SUFFIX
+from domain.types import ProvisionalDigestFile, RegularDigestData, compile_schema
+from infrastructure.json_repository.codec import loads
+
+# この数未満のファイルはプロセスプールを使わずに検証する（起動コストの方が大きい）
+CORPUS_PARALLEL_MIN_FILES = 64
+
+# 1行の報告に含めるエラーの最大数
+MAX_REPORTED_ERRORS = 3
 
 
 class JSONStatus(Enum):
@@ -43,6 +63,115 @@ class ValidationResult:
     message: str = ""
 
 
+@dataclass
+class CorpusFileReport:
+    """コーパス検証の1ファイル分の結果"""
+
+    file_path: Path
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """エラーがなければ True"""
+        return not self.errors
+
+    def format(self, root: Optional[Path] = None) -> str:
+        """
+        1行の報告に整形
+
+        Example:
+            >>> report.format(digests_path)
+            '1_Weekly/W0003_x.txt: 2 error(s): overall_digest: missing; metadata: ...'
+        """
+        try:
+            name = str(self.file_path.relative_to(root)) if root else str(self.file_path)
+        except ValueError:
+            name = str(self.file_path)
+        shown = "; ".join(self.errors[:MAX_REPORTED_ERRORS])
+        more = len(self.errors) - MAX_REPORTED_ERRORS
+        suffix = f" (+{more} more)" if more > 0 else ""
+        return f"{name}: {len(self.errors)} error(s): {shown}{suffix}"
+
+
+def iter_corpus_files(digests_path: Path) -> Iterator[Path]:
+    """
+    Digests/ 配下のダイジェストファイル（*.txt）をパス順に列挙
+
+    Example:
+        >>> next(iter_corpus_files(Path("data/Digests")))
+        PosixPath('data/Digests/1_Weekly/W0001_第1週.txt')
+    """
+    for dir_path, dir_names, file_names in os.walk(digests_path):
+        dir_names.sort()
+        for name in sorted(file_names):
+            if name.endswith(".txt"):
+                yield Path(dir_path) / name
+
+
+def validate_corpus_file(file_path: Path) -> CorpusFileReport:
+    """
+    ダイジェストファイル1件を構造検証
+
+    _Individual.txt は ProvisionalDigestFile、それ以外は RegularDigestData として検証する。
+    プロセスプールから呼べるようモジュール関数にしている
+    （検証関数は compile_schema のキャッシュにより各プロセスで1回だけコンパイルされる）。
+    """
+    schema = (
+        ProvisionalDigestFile
+        if file_path.name.endswith(INDIVIDUAL_DIGEST_SUFFIX)
+        else RegularDigestData
+    )
+    try:
+        data = loads(file_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError) as e:
+        return CorpusFileReport(file_path, [f"unreadable: {e}"])
+    except json.JSONDecodeError as e:
+        return CorpusFileReport(file_path, [f"JSON syntax error: {e}"])
+    return CorpusFileReport(file_path, compile_schema(schema)(data))
+
+
+class CorpusValidator:
+    """
+    Digests/ 配下の全ダイジェストファイルの一括構造検証
+
+    Example:
+        >>> validator = CorpusValidator(jobs=4)
+        >>> invalid = [r for r in validator.validate(digests_path) if not r.valid]
+    """
+
+    def __init__(self, jobs: Optional[int] = None):
+        """
+        Args:
+            jobs: 検証の並列プロセス数（省略時は CPU 数、1 なら常に逐次）
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+
+    def validate(self, digests_path: Path) -> Iterator[CorpusFileReport]:
+        """
+        全ファイルを検証し、結果をパス順に逐次返す
+
+        Args:
+            digests_path: Digestsディレクトリ
+        """
+        files = list(iter_corpus_files(digests_path))
+        if self.jobs <= 1 or len(files) < CORPUS_PARALLEL_MIN_FILES:
+            return (validate_corpus_file(f) for f in files)
+        return self._validate_parallel(files)
+
+    def _validate_parallel(self, files: List[Path]) -> Iterator[CorpusFileReport]:
+        workers = min(self.jobs, len(files))
+        chunksize = max(1, min(256, len(files) // (workers * 8)))
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for report in pool.map(validate_corpus_file, files, chunksize=chunksize):
+                    done += 1
+                    yield report
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # プロセスを作れない環境では、残りのファイルを逐次で検証する
+            yield from (validate_corpus_file(f) for f in files[done:])
+
+
 class JSONValidator:
     """JSON検証クラス"""
 
@@ -234,6 +363,38 @@ class JSONValidator:
         return False
 
 
+def run_corpus(digests_path: Path, jobs: Optional[int] = None, quiet: bool = False) -> int:
+    """
+    --corpus モードの実行（エラーのあるファイルを1行ずつ stderr へ出力）
+
+    Args:
+        digests_path: Digestsディレクトリ
+        jobs: 並列プロセス数
+        quiet: エラー時のみ出力
+
+    Returns:
+        int: 終了コード（0=全ファイル適合、1=不適合またはディレクトリなし）
+    """
+    if not digests_path.is_dir():
+        print(f"ERROR: {digests_path}: Directory not found", file=sys.stderr)
+        return 1
+
+    total = 0
+    invalid = 0
+    for report in CorpusValidator(jobs).validate(digests_path):
+        total += 1
+        if not report.valid:
+            invalid += 1
+            print(f"ERROR: {report.format(digests_path)}", file=sys.stderr)
+
+    if invalid:
+        print(f"ERROR: corpus: {invalid} of {total} file(s) invalid", file=sys.stderr)
+        return 1
+    if not quiet:
+        print(f"OK: {digests_path} - {total} digest file(s) valid")
+    return 0
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     CLIエントリーポイント
@@ -265,6 +426,19 @@ def main(args: Optional[List[str]] = None) -> int:
         action="store_true",
         help="パス形式を検証（絶対パスの警告）",
     )
+    parser.add_argument(
+        "--corpus",
+        "-c",
+        metavar="DIR",
+        help="Digestsディレクトリ配下の全ダイジェストファイルを構造検証",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="--corpus の並列プロセス数（デフォルト: CPU数、1で逐次）",
+    )
     parser.add_argument(
         "--quiet",
         "-q",
@@ -274,6 +448,10 @@ def main(args: Optional[List[str]] = None) -> int:
 
     parsed_args = parser.parse_args(args)
 
+    # コーパス検証
+    if parsed_args.corpus:
+        return run_corpus(Path(parsed_args.corpus), parsed_args.jobs, parsed_args.quiet)
+
     # 引数なしの場合はヘルプを表示
     if not parsed_args.file:
         parser.print_usage()